@@ -1,15 +1,32 @@
 from typing import Dict, Any, List, Optional, Callable, Tuple
 from app.source.core.interfaces import DataEnricher, Repository
 from app.source.core.domain import Company, Employee, Research, Expert
+from app.source.core.exceptions import EnrichmentError
+from concurrent.futures import ThreadPoolExecutor, wait
+from contextlib import nullcontext
+from dataclasses import dataclass
 import logging
+import threading
 from app.source.infrastructure.repositories.company_repo_v2 import CompanyRepositoryV2
 from app.source.infrastructure.repositories.employee_repo_v2 import EmployeeRepositoryV2
 from app.source.infrastructure.repositories.research_repo_v2 import ResearchRepositoryV2
 from app.source.infrastructure.repositories.expert_repo_v2 import ExpertRepositoryV2
-from app.source.infrastructure.config.field_mapping_config import FieldMappingConfig
+from app.source.infrastructure.config.field_mapping_config import FieldMappingConfig, FieldPattern
+from app.source.application.services.enrichment_plan import EnrichmentPlanCompiler
 
 logger = logging.getLogger(__name__)
 
+
+@dataclass
+class PendingEnrichment:
+    """보강 대상 (필드 또는 리스트 항목과 조회 키)"""
+    field_name: str
+    target: Any
+    pattern: Any
+    key: str
+    is_list_item: bool = False
+
+
 class SelectiveFieldEnricher(DataEnricher):
     """필드 ID 패턴 기반 데이터 보강 - Jira 응답 구조 유지"""
     
@@ -20,13 +37,23 @@ class SelectiveFieldEnricher(DataEnricher):
         research_repo: ResearchRepositoryV2,
         expert_repo: ExpertRepositoryV2,
         field_mapping_config: Optional[FieldMappingConfig] = None,
-        logger: Optional[logging.Logger] = None
+        logger: Optional[logging.Logger] = None,
+        plan_compiler: Optional[EnrichmentPlanCompiler] = None,
+        max_workers: int = 4,
+        timeout_seconds: float = 10.0
     ):
         self.company_repo = company_repo
         self.employee_repo = employee_repo
         self.research_repo = research_repo
         self.expert_repo = expert_repo
         self.field_mapping_config = field_mapping_config or FieldMappingConfig()
+        # 문서 유형별 보강 계획 (없으면 설정된 전체 필드 보강)
+        self.plan_compiler = plan_compiler
+        # 도메인 타입별 조회를 동시에 실행할 스레드 수 (1이면 순차 실행)와 요청당 조회 제한 시간
+        self.max_workers = max_workers
+        self.timeout_seconds = timeout_seconds
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
         self.logger = logger or logging.getLogger(__name__)
         
         # 도메인 객체 타입별 리포지토리 매핑
@@ -80,146 +107,218 @@ class SelectiveFieldEnricher(DataEnricher):
             self.logger.error("Error finding %s with %s: %s", domain_type, query_key, str(e))
             return None
     
-    def _enrich_field(self, fields: Dict[str, Any], field_name: str, field_value: Any, pattern: Any) -> None:
-        """일반 필드 보강
+    def _collect_lookups(self, fields: Dict[str, Any], field_patterns: Dict[str, Any]) -> List[PendingEnrichment]:
+        """보강 대상 필드에서 조회 키 수집 (조회는 하지 않음)
         
         Args:
             fields: 필드 데이터 딕셔너리
-            field_name: 현재 처리 중인 필드 이름
-            field_value: 필드 값
-            pattern: 필드 패턴 설정
-        """
-        try:
-            self.logger.debug("Enriching field: %s (value: %s) with pattern type: %s", 
-                            field_name, field_value, pattern.type)
+            field_patterns: 필드 이름 -> 필드 패턴 설정
             
-            # 도메인 객체 조회
-            repo = self.repo_by_type.get(pattern.type)
-            if not repo:
+        Returns:
+            보강 대상 목록
+        """
+        pending = []
+        for field_name, field_value in fields.items():
+            # 필드 이름이 패턴 목록에 있는지 확인
+            pattern = field_patterns.get(field_name)
+            if not pattern:
+                continue
+            if pattern.type not in self.repo_by_type:
                 self.logger.error("No repository found for type: %s", pattern.type)
-                return
+                continue
             
-            # 필드가 딕셔너리이고 value_key가 지정된 경우 해당 키의 값 사용
-            actual_value = field_value
-            field_is_dict = isinstance(field_value, dict)
+            # 리스트 타입 필드: 각 항목의 ID 필드 값
+            if pattern.is_list and isinstance(field_value, list):
+                domain_config = self.field_mapping_config.get_domain_config(pattern.type)
+                if not domain_config:
+                    self.logger.error("No domain config found for type: %s", pattern.type)
+                    continue
+                for i, item in enumerate(field_value):
+                    if not isinstance(item, dict):
+                        self.logger.warning("List item %d of %s is not a dictionary, skipping", i, field_name)
+                        continue
+                    if domain_config.id_field not in item:
+                        self.logger.warning("No %s found in list item %d of %s", domain_config.id_field, i, field_name)
+                        continue
+                    pending.append(PendingEnrichment(field_name, item, pattern, str(item[domain_config.id_field]), True))
+                continue
             
-            if field_is_dict and pattern.value_key:
-                if pattern.value_key in field_value:
-                    actual_value = field_value[pattern.value_key]
-                    self.logger.debug("Using value from key '%s': %s", pattern.value_key, actual_value)
-                else:
+            # 일반 필드: 딕셔너리이고 value_key가 지정된 경우 해당 키의 값 사용
+            actual_value = field_value
+            if isinstance(field_value, dict) and pattern.value_key:
+                if pattern.value_key not in field_value:
                     self.logger.warning("Key '%s' not found in field value: %s", pattern.value_key, field_value)
-                    return
-            
-            # 도메인 객체 조회
-            entity = self._find_entity(repo, pattern.type, str(actual_value))
-            if not entity:
-                return
-            
-            # 보강 필드 추가
-            # 필드가 딕셔너리가 아니면 딕셔너리로 변환
-            if not field_is_dict:
-                # 원본 값 저장
-                enriched_dict = {
-                    "value": field_value,
-                    "id": getattr(entity, "id", None)
-                }
-                # fields 딕셔너리에 업데이트된 값 설정
-                fields[field_name] = enriched_dict
-                self.logger.debug("Converted field %s to dictionary: %s", field_name, enriched_dict)
-            else:
-                enriched_dict = field_value
+                    continue
+                actual_value = field_value[pattern.value_key]
+            pending.append(PendingEnrichment(field_name, field_value, pattern, str(actual_value), False))
+        
+        return pending
+    
+    def _resolve_entities(self, pending: List[PendingEnrichment]) -> Dict[Tuple[str, str], Any]:
+        """도메인 타입별로 조회 키를 모아 한 번에 조회
+        
+        도메인 타입이 여러 개이면 타입별 조회를 스레드 풀에서 동시에 실행하고(각 작업은 풀 연결 사용),
+        timeout_seconds 안에 끝나지 않은 타입이 있으면 보강 없이 문서를 만들지 않도록 오류를 발생시킨다.
+        결과는 완료 순서와 관계없이 보강 대상 수집 순서로 합친다.
+        
+        Args:
+            pending: 보강 대상 목록
             
-            # 보강 필드 추가 (딕셔너리 내부에 추가)
-            for enrich_field in pattern.enrich_fields:
-                field_value = getattr(entity, enrich_field.name, None)
-                if field_value is not None:
-                    enriched_dict[enrich_field.name] = field_value
-                    self.logger.debug("Added enriched field: %s = %s", enrich_field.name, field_value)
+        Returns:
+            (도메인 타입, 조회 키) -> 도메인 객체
+        
+        Raises:
+            EnrichmentError: 제한 시간 안에 조회가 끝나지 않은 도메인 타입이 있는 경우
+        """
+        keys_by_type: Dict[str, List[str]] = {}
+        for entry in pending:
+            keys = keys_by_type.setdefault(entry.pattern.type, [])
+            if entry.key not in keys:
+                keys.append(entry.key)
+        
+        if len(keys_by_type) > 1 and self.max_workers > 1:
+            executor = self._get_executor()
+            futures = {domain_type: executor.submit(self._lookup_domain, domain_type, keys, True)
+                       for domain_type, keys in keys_by_type.items()}
+            _, not_done = wait(futures.values(), timeout=self.timeout_seconds)
+            if not_done:
+                # 이미 실행 중인 조회는 취소되지 않으며, 끝나면 연결을 풀에 반납한다
+                timed_out = [domain_type for domain_type, future in futures.items() if future in not_done]
+                for future in not_done:
+                    future.cancel()
+                raise EnrichmentError(
+                    f"Timed out after {self.timeout_seconds}s finding {', '.join(timed_out)}")
+            found_by_type = {domain_type: future.result() for domain_type, future in futures.items()}
+        else:
+            found_by_type = {domain_type: self._lookup_domain(domain_type, keys)
+                             for domain_type, keys in keys_by_type.items()}
+        
+        entities = {}
+        for domain_type, keys in keys_by_type.items():
+            found = found_by_type[domain_type]
+            if found is None:
+                continue
+            domain_config = self.field_mapping_config.get_domain_config(domain_type)
+            self.logger.debug("Resolved %d of %d %s lookup(s)", len(found), len(keys), domain_type)
+            for key in keys:
+                if key in found:
+                    entities[(domain_type, key)] = found[key]
                 else:
-                    self.logger.debug("No value found for field: %s", enrich_field.name)
-            
-            self.logger.debug("Completed enriching %s info for %s", pattern.type, field_name)
+                    self.logger.warning("No %s found with %s: %s", domain_type, domain_config.query_key, key)
+        
+        return entities
+    
+    def _lookup_domain(self, domain_type: str, keys: List[str], pooled: bool = False) -> Optional[Dict[str, Any]]:
+        """한 도메인 타입의 조회 키를 조회
+        
+        리포지토리에 find_many_by_<query_key> 메서드가 있으면 한 번의 쿼리로 조회하고,
+        없으면 키마다 find_by_<query_key>로 조회한다.
+        
+        Args:
+            domain_type: 도메인 타입
+            keys: 조회 키 목록
+            pooled: True이면 리포지토리의 connection_scope 안에서 조회 (작업 스레드용)
             
+        Returns:
+            조회 키 -> 도메인 객체 (도메인 설정이 없으면 None)
+        """
+        repo = self.repo_by_type[domain_type]
+        domain_config = self.field_mapping_config.get_domain_config(domain_type)
+        if not domain_config:
+            self.logger.error("No domain config found for type: %s", domain_type)
+            return None
+        
+        scope = getattr(repo, "connection_scope", None) if pooled else None
+        try:
+            with scope() if scope else nullcontext():
+                find_many = getattr(repo, f"find_many_by_{domain_config.query_key}", None)
+                if find_many is None:
+                    found = {}
+                    for key in keys:
+                        entity = self._find_entity(repo, domain_type, key)
+                        if entity:
+                            found[key] = entity
+                    return found
+                return find_many(keys)
         except Exception as e:
-            self.logger.error("Error enriching field %s: %s", field_name, str(e))
+            self.logger.error("Error finding %s with %s: %s", domain_type, domain_config.query_key, str(e))
+            return {}
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """도메인 타입별 조회용 스레드 풀 (처음 사용할 때 생성)"""
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="enrich")
+        return self._executor
     
-    def _enrich_list_field(self, fields: Dict[str, Any], field_name: str, field_value: List[Any], pattern: Any) -> None:
-        """리스트 타입 필드 보강
+    def _apply_enrichment(self, fields: Dict[str, Any], entry: PendingEnrichment, entity: Any) -> None:
+        """조회한 도메인 객체의 보강 필드 추가
         
         Args:
             fields: 필드 데이터 딕셔너리
-            field_name: 현재 처리 중인 필드 이름
-            field_value: 필드 값 (리스트)
-            pattern: 필드 패턴 설정
+            entry: 보강 대상
+            entity: 도메인 객체
         """
-        try:
-            self.logger.debug("Enriching list field: %s with %d items", field_name, len(field_value))
-            
-            # 도메인 객체 조회를 위한 리포지토리 가져오기
-            repo = self.repo_by_type.get(pattern.type)
-            if not repo:
-                self.logger.error("No repository found for type: %s", pattern.type)
-                return
-            
-            # 도메인 설정 가져오기
-            domain_config = self.field_mapping_config.get_domain_config(pattern.type)
-            if not domain_config:
-                self.logger.error("No domain config found for type: %s", pattern.type)
-                return
-            
-            # 리스트의 각 항목에 대해 보강 수행
-            for i, item in enumerate(field_value):
-                self.logger.debug("Processing list item %d: %s", i, item)
-                
-                if not isinstance(item, dict):
-                    self.logger.warning("List item %d is not a dictionary, skipping", i)
-                    continue
-                
-                # ID 필드가 있는지 확인
-                if domain_config.id_field not in item:
-                    self.logger.warning("No %s found in list item %d", domain_config.id_field, i)
-                    continue
-                
-                # 도메인 객체 조회
-                entity = self._find_entity(repo, pattern.type, str(item[domain_config.id_field]))
-                if not entity:
-                    continue
-                
-                # 보강 필드 추가
-                for enrich_field in pattern.enrich_fields:
-                    field_value = getattr(entity, enrich_field.name, None)
-                    if field_value is not None:
-                        item[enrich_field.name] = field_value
-                        self.logger.debug("Added enriched field: %s = %s", enrich_field.name, field_value)
-                    else:
-                        self.logger.debug("No value found for field: %s", enrich_field.name)
-            
-            self.logger.debug("Completed enriching list field: %s", field_name)
+        if entry.is_list_item or isinstance(entry.target, dict):
+            enriched_dict = entry.target
+        else:
+            # 필드가 딕셔너리가 아니면 원본 값을 보존한 딕셔너리로 변환
+            enriched_dict = {
+                "value": entry.target,
+                "id": getattr(entity, "id", None)
+            }
+            fields[entry.field_name] = enriched_dict
+        
+        for enrich_field in entry.pattern.enrich_fields:
+            value = getattr(entity, enrich_field.name, None)
+            if value is not None:
+                enriched_dict[enrich_field.name] = value
+    
+    def _get_field_patterns(self, document_type: str) -> Optional[Dict[str, FieldPattern]]:
+        """문서 유형의 보강 계획에 따른 필드 패턴 (계획이 없으면 None)
+        
+        Args:
+            document_type: 문서 타입
             
-        except Exception as e:
-            self.logger.error("Error enriching list field %s: %s", field_name, str(e))
-
+        Returns:
+            필드 이름 -> 템플릿에서 사용하는 컬럼만 남긴 필드 패턴, 또는 None
+        """
+        if self.plan_compiler is None or not document_type:
+            return None
+        plan = self.plan_compiler.get_plan(document_type)
+        return plan.field_patterns if plan is not None else None
+    
     def enrich(self, document_type: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """문서 데이터 보강
         
+        조회 키를 먼저 모두 수집한 뒤 도메인 타입별로 한 번씩 조회하고, 결과를 각 필드에 반영한다.
+        보강 계획이 있으면 문서 유형의 템플릿에서 사용하는 필드와 컬럼만 보강한다.
+        
         Args:
-            document_type: 문서 타입 (사용하지 않음)
+            document_type: 문서 타입 (보강 계획 선택에 사용, 빈 값이면 전체 필드 보강)
             data: 보강할 데이터
             
         Returns:
             보강된 데이터
+        
+        Raises:
+            EnrichmentError: 기준 데이터 조회가 제한 시간 안에 끝나지 않은 경우
         """
         try:
             self.logger.debug("Starting data enrichment")
             
-            # 모든 필드 패턴 가져오기
-            field_patterns = self.field_mapping_config.get_all_field_patterns()
-            if not field_patterns:
-                self.logger.warning("No field patterns found in configuration")
-                return data
-            
-            self.logger.debug("Field patterns loaded: %d patterns", len(field_patterns))
+            field_patterns = self._get_field_patterns(document_type)
+            if field_patterns is not None:
+                if not field_patterns:
+                    self.logger.debug("Enrichment plan for %s has no fields, skipping", document_type)
+                    return data
+            else:
+                # 모든 필드 패턴 가져오기
+                field_patterns = self.field_mapping_config.get_all_field_patterns()
+                if not field_patterns:
+                    self.logger.warning("No field patterns found in configuration")
+                    return data
             
             # 데이터 복사본 생성
             enriched_data = data.copy()
@@ -227,27 +326,20 @@ class SelectiveFieldEnricher(DataEnricher):
             # 필드에 직접 접근할지 또는 'fields' 키를 통해 접근할지 결정
             fields_dict = enriched_data.get('fields', enriched_data)
             
-            # 각 필드에 대해 보강 수행
-            for field_name, field_value in fields_dict.items():
-                # 필드 이름이 패턴 목록에 있는지 확인
-                pattern = field_patterns.get(field_name)
-                if not pattern:
-                    self.logger.debug("No pattern found for field: %s", field_name)
-                    continue
-                
-                self.logger.debug("Pattern found for field %s: type=%s, is_list=%s, value_key=%s", 
-                               field_name, pattern.type, pattern.is_list, pattern.value_key)
-                
-                # 리스트 타입 필드 처리
-                if pattern.is_list and isinstance(field_value, list):
-                    self._enrich_list_field(fields_dict, field_name, field_value, pattern)
-                # 일반 필드 처리
-                else:
-                    self._enrich_field(fields_dict, field_name, field_value, pattern)
+            pending = self._collect_lookups(fields_dict, field_patterns)
+            entities = self._resolve_entities(pending)
+            
+            for entry in pending:
+                entity = entities.get((entry.pattern.type, entry.key))
+                if entity is not None:
+                    self._apply_enrichment(fields_dict, entry, entity)
             
-            self.logger.debug("Completed data enrichment")
+            self.logger.debug("Completed data enrichment: %d of %d field(s) enriched", 
+                            sum(1 for entry in pending if (entry.pattern.type, entry.key) in entities), len(pending))
             return enriched_data
             
+        except EnrichmentError:
+            raise
         except Exception as e:
             self.logger.error("Error during data enrichment: %s", str(e))
             return data
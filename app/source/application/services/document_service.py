@@ -5,7 +5,7 @@ from datetime import datetime
 from app.source.core.interfaces import SchemaValidator, DataEnricher, DocumentRenderer, PdfGenerator
 from app.source.core.exceptions import ValidationError, RenderingError, PdfGenerationError
 import logging
-from app.source.core.exceptions import DocumentAutomationError
+from app.source.core.exceptions import DocumentAutomationError, EnrichmentError
 from app.source.application.services.preprocessor import JiraPreprocessor
 from app.source.application.services.document_strategies.document_strategy_factory import DocumentStrategyFactory
 
@@ -80,8 +80,10 @@ class DocumentService:
         if self.data_enricher:
             try:
                 self.logger.debug("Enriching data")
-                data = self.data_enricher.enrich("",data)
+                data = self.data_enricher.enrich(document_type, data)
                 self.logger.debug("Data enriched successfully")
+            except EnrichmentError:
+                raise
             except Exception as e:
                 self.logger.error("Data enrichment failed: %s", str(e))
         
@@ -2,7 +2,7 @@ from typing import Dict, Any
 import uuid
 from datetime import datetime
 from app.source.core.interfaces import DocumentGenerationStrategy, DataEnricher, DocumentRenderer, PdfGenerator, JiraClient
-from app.source.core.exceptions import RenderingError, PdfGenerationError, DocumentAutomationError
+from app.source.core.exceptions import RenderingError, PdfGenerationError, DocumentAutomationError, EnrichmentError
 import logging
 import os
 import tempfile
@@ -51,6 +51,8 @@ class DefaultDocumentGenerationStrategy(DocumentGenerationStrategy):
                 enriched_data = self.data_enricher.enrich(data["document_type"], data)
                 if enriched_data:
                     render_data = enriched_data
+            except EnrichmentError:
+                raise
             except Exception as e:
                 self.logger.error("Data enrichment failed: %s", str(e))
         else:
@@ -225,6 +227,8 @@ class PictureAttatchedDocumentStrategy(DefaultDocumentGenerationStrategy):
                 enriched = self.data_enricher.enrich(data["document_type"], data)
                 if enriched:
                     render_data = enriched
+            except EnrichmentError:
+                raise
             except Exception as e:
                 self.logger.exception("Data enrichment failed: %s", e)
 
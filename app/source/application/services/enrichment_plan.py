@@ -0,0 +1,200 @@
+from typing import Dict, Any, FrozenSet, List, Optional, Set, Callable
+from dataclasses import dataclass, replace
+import logging
+import threading
+from jinja2 import Environment, TemplateNotFound, TemplateSyntaxError, meta, nodes
+from app.source.infrastructure.config.field_mapping_config import FieldMappingConfig, FieldPattern
+
+# 객체 전체가 사용되는 경우 (출력, 필터 인자 등) - 모든 보강 컬럼 필요
+ALL_COLUMNS = "*"
+
+# 객체 내용을 보지 않는 필터/테스트 (보강 컬럼 불필요)
+_COUNT_FILTERS = frozenset({"length", "count"})
+_PRESENCE_TESTS = frozenset({"none", "defined", "undefined"})
+
+# 전처리 단계가 원본 필드에서 만드는 필드의 접미사 (예: 외부_인원 -> 외부_인원_data, 연구과제_선택 -> 연구과제_선택_key)
+DERIVED_FIELD_SUFFIXES = ("_data", "_key")
+
+
+def _strip_filters(node: nodes.Node) -> nodes.Node:
+    """필터 체인 안쪽의 원래 식 반환 (예: 내부_인원|sort -> 내부_인원)"""
+    while isinstance(node, nodes.Filter) and node.node is not None:
+        node = node.node
+    return node
+
+
+def _collect_usage(node: nodes.Node, aliases: Dict[str, str], usage: Dict[str, Set[str]]) -> None:
+    """템플릿 AST에서 최상위 변수별 속성 접근 수집
+
+    루프 변수와 단순 대입({% set x = 서명인 %})은 원래 변수의 별칭으로 추적한다.
+    """
+    if isinstance(node, nodes.Name):
+        root = aliases.get(node.name, node.name)
+        if node.ctx == "load" and root in usage:
+            usage[root].add(ALL_COLUMNS)
+        return
+
+    if isinstance(node, (nodes.Getattr, nodes.Getitem)) and isinstance(node.node, nodes.Name):
+        root = aliases.get(node.node.name, node.node.name)
+        if root in usage:
+            if isinstance(node, nodes.Getattr):
+                usage[root].add(node.attr)
+            elif isinstance(node.arg, nodes.Const) and isinstance(node.arg.value, str):
+                usage[root].add(node.arg.value)
+            else:
+                usage[root].add(ALL_COLUMNS)
+        if isinstance(node, nodes.Getitem):
+            _collect_usage(node.arg, aliases, usage)
+        return
+
+    if isinstance(node, nodes.Filter) and node.name in _COUNT_FILTERS and isinstance(node.node, nodes.Name):
+        for child in node.args + [kwarg.value for kwarg in node.kwargs]:
+            _collect_usage(child, aliases, usage)
+        return
+
+    if isinstance(node, nodes.Test) and node.name in _PRESENCE_TESTS and isinstance(node.node, nodes.Name):
+        return
+
+    if isinstance(node, nodes.For):
+        source = _strip_filters(node.iter)
+        loop_aliases = dict(aliases)
+        if isinstance(source, nodes.Name) and isinstance(node.target, nodes.Name):
+            # 반복 대상 자체는 사용으로 보지 않고 루프 변수의 속성 접근으로 판단
+            loop_aliases[node.target.name] = aliases.get(source.name, source.name)
+            iterated = node.iter
+            while iterated is not source:
+                for child in iterated.args + [kwarg.value for kwarg in iterated.kwargs]:
+                    _collect_usage(child, aliases, usage)
+                iterated = iterated.node
+        else:
+            _collect_usage(node.iter, aliases, usage)
+        for child in node.body + node.else_ + ([node.test] if node.test else []):
+            _collect_usage(child, loop_aliases, usage)
+        return
+
+    if isinstance(node, nodes.Assign) and isinstance(node.target, nodes.Name) and isinstance(node.node, nodes.Name):
+        aliases[node.target.name] = aliases.get(node.node.name, node.node.name)
+        return
+
+    for child in node.iter_child_nodes():
+        _collect_usage(child, aliases, usage)
+
+
+def analyze_template(env: Environment, source: str) -> Dict[str, Set[str]]:
+    """템플릿의 선언되지 않은 변수와 변수별 접근 속성 분석
+
+    Args:
+        env (Environment): Jinja2 환경
+        source (str): 템플릿 소스
+
+    Returns:
+        Dict[str, Set[str]]: 변수 이름 -> 접근한 속성 이름 (객체 전체 사용 시 ALL_COLUMNS 포함)
+
+    Raises:
+        TemplateSyntaxError: 템플릿 문법 오류 시
+    """
+    ast = env.parse(source)
+    usage: Dict[str, Set[str]] = {name: set() for name in meta.find_undeclared_variables(ast)}
+    _collect_usage(ast, {}, usage)
+    return usage
+
+
+@dataclass(frozen=True)
+class EnrichmentPlan:
+    """문서 유형별 보강 계획 (보강할 필드와 필드별 컬럼)"""
+    document_type: str
+    template_name: str
+    field_patterns: Dict[str, FieldPattern]
+    template_variables: FrozenSet[str] = frozenset()
+
+    def columns(self) -> Dict[str, List[str]]:
+        """필드 이름 -> 보강 컬럼 목록"""
+        return {name: [field.name for field in pattern.enrich_fields]
+                for name, pattern in self.field_patterns.items()}
+
+    def issue_fields(self) -> List[str]:
+        """템플릿과 보강에 필요한 Jira 원본 필드 이름 (전처리 결과 필드는 원본 필드 이름으로 바꿈)"""
+        names = set()
+        for name in self.template_variables | set(self.field_patterns):
+            for suffix in DERIVED_FIELD_SUFFIXES:
+                if name.endswith(suffix) and len(name) > len(suffix):
+                    name = name[:-len(suffix)]
+                    break
+            names.add(name)
+        return sorted(names)
+
+
+class EnrichmentPlanCompiler:
+    """템플릿 분석 결과와 FieldMappingConfig를 교차해 문서 유형별 보강 계획을 만드는 클래스
+
+    템플릿을 찾지 못하거나 파싱할 수 없는 문서 유형은 계획 없음(None)으로 처리해
+    호출자가 설정된 전체 필드를 보강하도록 한다.
+    """
+
+    def __init__(self, template_env: Environment, field_mapping_config: FieldMappingConfig,
+                 resolve_template: Optional[Callable[[str], str]] = None,
+                 logger: Optional[logging.Logger] = None):
+        """EnrichmentPlanCompiler 초기화
+
+        Args:
+            template_env (Environment): 템플릿을 읽을 Jinja2 환경 (렌더러와 같은 로더)
+            field_mapping_config (FieldMappingConfig): 보강 필드 설정
+            resolve_template (Callable[[str], str], optional): 문서 유형 -> 템플릿 이름 (기본값: '<문서 유형>.html')
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        self.template_env = template_env
+        self.field_mapping_config = field_mapping_config
+        self.resolve_template = resolve_template or (lambda document_type: f"{document_type}.html")
+        self.logger = logger or logging.getLogger(__name__)
+        self._plans: Dict[str, Optional[EnrichmentPlan]] = {}
+        self._lock = threading.Lock()
+
+    def get_plan(self, document_type: str) -> Optional[EnrichmentPlan]:
+        """문서 유형의 보강 계획 반환 (문서 유형별로 한 번만 컴파일)
+
+        Args:
+            document_type (str): 문서 유형
+
+        Returns:
+            Optional[EnrichmentPlan]: 보강 계획, 템플릿을 분석할 수 없으면 None
+        """
+        with self._lock:
+            if document_type not in self._plans:
+                self._plans[document_type] = self.compile(document_type)
+            return self._plans[document_type]
+
+    def compile(self, document_type: str) -> Optional[EnrichmentPlan]:
+        """문서 유형의 템플릿을 분석해 보강 계획 생성
+
+        Args:
+            document_type (str): 문서 유형
+
+        Returns:
+            Optional[EnrichmentPlan]: 보강 계획, 템플릿을 찾지 못하거나 문법 오류가 있으면 None
+        """
+        try:
+            template_name = self.resolve_template(document_type)
+            source, _, _ = self.template_env.loader.get_source(self.template_env, template_name)
+            usage = analyze_template(self.template_env, source)
+        except TemplateNotFound as e:
+            self.logger.warning("No template for %s (%s), enriching all configured fields", document_type, str(e))
+            return None
+        except TemplateSyntaxError as e:
+            self.logger.warning("Cannot analyze template for %s (line %s: %s), enriching all configured fields",
+                                document_type, e.lineno, e.message)
+            return None
+
+        always_enriched = self.field_mapping_config.get_always_enriched_fields()
+        field_patterns = {}
+        for field_name, pattern in self.field_mapping_config.get_all_field_patterns().items():
+            used = set(usage.get(field_name, ())) | set(always_enriched.get(field_name, ()))
+            if ALL_COLUMNS in used:
+                enrich_fields = list(pattern.enrich_fields)
+            else:
+                enrich_fields = [field for field in pattern.enrich_fields if field.name in used]
+            if enrich_fields:
+                field_patterns[field_name] = replace(pattern, enrich_fields=enrich_fields)
+
+        plan = EnrichmentPlan(document_type, template_name, field_patterns, frozenset(usage))
+        self.logger.info("Enrichment plan for %s (%s): %s", document_type, template_name, plan.columns())
+        return plan
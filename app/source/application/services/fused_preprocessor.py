@@ -0,0 +1,134 @@
+from typing import Dict, Any, Optional
+import re
+import logging
+from app.source.core.exceptions import MappingError
+from app.source.application.services.preprocessor import JiraPreprocessor
+
+# JiraDocumentMapper가 처리하던 마크다운 테이블 필드 (원본 필드 -> 결과 필드)
+MAPPER_TABLE_FIELDS = (
+    ("internal_participants_table", "internal_participants"),
+    ("external_participants_table", "external_participants"),
+    ("items_table", "items"),
+)
+
+RESEARCH_FIELD = "연구과제_선택"
+RESEARCH_KEY_PATTERN = re.compile(r'\(([^)]+)\)')
+
+
+class FusedJiraPreprocessor(JiraPreprocessor):
+    """JiraDocumentMapper.preprocess_fields + JiraPreprocessor.preprocess 를 한 번에 처리하는 전처리기
+
+    fields의 각 필드를 정확히 한 번만 방문하고, 마크다운 테이블 여부는 '|' 와 줄바꿈 위치만으로
+    판단하며, 로그 메시지는 해당 레벨이 켜져 있을 때만 만든다. 결과(필드 추가 순서, 원본 fields
+    딕셔너리를 직접 수정하는 동작 포함)는 기존 2단계 처리와 동일하다.
+    """
+
+    def __init__(self, schema_validator=None, logger: Optional[logging.Logger] = None, table_schemas=None):
+        super().__init__(schema_validator, table_schemas)
+        if logger:
+            self.logger = logger
+
+    def preprocess(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Jira 데이터 전처리
+
+        Args:
+            data (Dict[str, Any]): 필드 매핑이 적용된 Jira 이슈 데이터
+
+        Returns:
+            Dict[str, Any]: 전처리된 데이터
+
+        Raises:
+            MappingError: 테이블 필드 전처리(기존 JiraDocumentMapper 단계) 실패 시
+        """
+        if data is None:
+            raise MappingError("필드 전처리 중 오류 발생: 'NoneType' object has no attribute 'copy'")
+
+        processed_data = data.copy()
+        fields = processed_data.get("fields", {})
+
+        # 기존 JiraDocumentMapper 단계: 고정된 테이블 필드만 조회 (필드 순회 없음)
+        try:
+            for source_name, target_name in MAPPER_TABLE_FIELDS:
+                if source_name in fields:
+                    fields[target_name] = self._parse_mapper_table(fields[source_name])
+        except Exception as e:
+            self.logger.error("Error preprocessing fields: %s", str(e), exc_info=True)
+            raise MappingError(f"필드 전처리 중 오류 발생: {str(e)}")
+        processed_data["fields"] = fields
+
+        debug = self.logger.isEnabledFor(logging.DEBUG)
+        parse_table = self._parse_markdown_table
+        is_table = self._is_markdown_table
+
+        # fields 단일 순회 (순회 중 추가되는 필드는 제외하기 위해 목록을 미리 복사)
+        table_count = 0
+        for field_name, field_value in list(fields.items()):
+            if isinstance(field_value, str) and is_table(field_value):
+                if self._parse_into(fields, field_name, field_value, parse_table, debug):
+                    table_count += 1
+            if field_name == RESEARCH_FIELD:
+                value = field_value["value"]
+                if value:
+                    match = RESEARCH_KEY_PATTERN.search(value)
+                    if not match:
+                        raise ValueError(f"Research key not found in {RESEARCH_FIELD}: {value}")
+                    fields[f"{RESEARCH_FIELD}_key"] = match.group(1)
+
+        # fields 외의 최상위 필드
+        for field_name, field_value in list(processed_data.items()):
+            if field_name != 'fields' and isinstance(field_value, str) and is_table(field_value):
+                if self._parse_into(processed_data, field_name, field_value, parse_table, debug):
+                    table_count += 1
+
+        if 'item_list_data' in fields:
+            self._calculate_item_amounts(fields['item_list_data'])
+        elif 'item_list_data' in processed_data:
+            self._calculate_item_amounts(processed_data['item_list_data'])
+
+        processed_data = self.calculate_amount_summary(processed_data)
+
+        if debug:
+            self.logger.debug("Fused preprocessing parsed %d markdown tables (%d fields)", table_count, len(fields))
+        return processed_data
+
+    def _parse_into(self, target: Dict[str, Any], field_name: str, text: str, parse_table, debug: bool) -> bool:
+        """마크다운 테이블을 파싱해 <field_name>_data 로 저장"""
+        try:
+            parsed_table = parse_table(field_name, text)
+        except Exception as e:
+            self.logger.error("Error parsing markdown table for field '%s': %s", field_name, str(e), exc_info=True)
+            return False
+        if not parsed_table:
+            self.logger.warning("Parser returned empty result for '%s' despite looking like a table", field_name)
+            return False
+        target[f"{field_name}_data"] = parsed_table
+        if debug:
+            self.logger.debug("Created '%s_data' with %d items", field_name, len(parsed_table))
+        return True
+
+    def _parse_mapper_table(self, table_content: Any) -> list:
+        """JiraDocumentMapper._preprocess_markdown_table 과 동일 (실패 시 빈 목록)"""
+        try:
+            if not table_content:
+                return []
+            return self.markdown_parser.parse_table(table_content)
+        except Exception as e:
+            self.logger.error("Error parsing markdown table: %s", str(e))
+            return []
+
+    @staticmethod
+    def _is_markdown_table(text: str) -> bool:
+        """_looks_like_markdown_table 과 같은 판정을 문자열 분할 없이 수행
+
+        앞뒤 공백을 제외하고 3줄 이상이며 첫 두 줄에 '|' 가 있는 경우 True.
+        """
+        if '|' not in text:
+            return False
+        text = text.strip()
+        first_break = text.find('\n')
+        if first_break < 0:
+            return False
+        second_break = text.find('\n', first_break + 1)
+        if second_break < 0:
+            return False
+        return text.find('|', 0, first_break) >= 0 and text.find('|', first_break + 1, second_break) >= 0
@@ -0,0 +1,122 @@
+from typing import Dict, Any, List, Iterable, Union
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal, ROUND_DOWN
+from itertools import compress
+from operator import mul, and_, or_
+
+Number = Union[int, float, Decimal]
+
+# 부가세율 (10%)
+VAT_RATE = Decimal("0.1")
+
+
+def calculate_vat(total: Number) -> int:
+    """부가세 계산 - 원 미만 절사 (부동소수점 오차 없이 계산)
+
+    Args:
+        total (Number): 공급가액 합계
+
+    Returns:
+        int: 부가세
+    """
+    return int((Decimal(total) * VAT_RATE).to_integral_value(rounding=ROUND_DOWN))
+
+
+def _coerce_number(value: Any):
+    """셀 값을 숫자로 변환 (변환할 수 없으면 None) - 기존 int(value.replace(',', '')) 규칙과 동일"""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return int(value.replace(',', ''))
+        except ValueError:
+            return None
+    return None
+
+
+def _pack_numbers(numbers: List[Number]) -> Union[array, List[Number]]:
+    """모두 64비트 정수면 array('q'), 아니면 list 로 저장"""
+    if all(type(number) is int for number in numbers):
+        try:
+            return array('q', numbers)
+        except OverflowError:
+            pass
+    return numbers
+
+
+@dataclass
+class NumericColumn:
+    """숫자 컬럼 (값 + 유효 여부 마스크)
+
+    모든 값이 64비트 정수면 array('q'), 아니면(Decimal, 큰 정수 등) list에 저장한다.
+    유효하지 않은 자리의 값은 0이다.
+    """
+    values: Union[array, List[Number]]
+    valid: bytearray
+
+    @classmethod
+    def from_values(cls, values: Iterable[Any]) -> "NumericColumn":
+        numbers = [_coerce_number(value) for value in values]
+        valid = bytearray(number is not None for number in numbers)
+        filled = [0 if number is None else number for number in numbers]
+        return cls(_pack_numbers(filled), valid)
+
+    def total(self) -> Number:
+        """유효한 값의 합계"""
+        return sum(compress(self.values, self.valid))
+
+
+class ItemTable(list):
+    """품목/지출 목록의 컬럼 기반 표현
+
+    템플릿과 JSON 직렬화에는 기존과 같은 행 딕셔너리 목록(list)으로 보이고, 금액 계산은
+    quantity/unit_price/amount 컬럼 단위로 한 번에 수행한다. 계산 결과는 같은 행 딕셔너리에
+    반영되므로 두 표현은 항상 같은 데이터를 가리킨다.
+    """
+
+    NUMERIC_COLUMNS = ("quantity", "unit_price", "amount")
+
+    def __init__(self, rows: Iterable[Dict[str, Any]] = ()):
+        super().__init__(rows)
+        self.columns: Dict[str, NumericColumn] = {
+            name: NumericColumn.from_values([row.get(name) for row in self]) for name in self.NUMERIC_COLUMNS
+        }
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[Dict[str, Any]]) -> "ItemTable":
+        """행 목록에서 생성 (이미 ItemTable이면 그대로 반환, 행 딕셔너리는 복사하지 않음)"""
+        if isinstance(rows, cls):
+            return rows
+        return cls(rows)
+
+    def calculate_amounts(self) -> int:
+        """수량 * 단가로 amount 컬럼 계산
+
+        quantity와 unit_price가 모두 유효한 행만 계산하며, 해당 행의 딕셔너리에도 amount를 기록한다.
+
+        Returns:
+            int: 금액을 계산한 행 수
+        """
+        quantity = self.columns["quantity"]
+        unit_price = self.columns["unit_price"]
+        amount = self.columns["amount"]
+
+        computed = bytearray(map(and_, quantity.valid, unit_price.valid))
+        products = list(map(mul, quantity.values, unit_price.values))
+        amounts = [product if ok else value for product, ok, value in zip(products, computed, amount.values)]
+        self.columns["amount"] = NumericColumn(_pack_numbers(amounts), bytearray(map(or_, computed, amount.valid)))
+
+        for row, value in compress(zip(self, products), computed):
+            row["amount"] = value
+        return sum(computed)
+
+    def amount_summary(self) -> Dict[str, Number]:
+        """금액 합계, 부가세(원 미만 절사), 총액
+
+        Returns:
+            Dict[str, Number]: total_amount, vat, grand_total
+        """
+        total_amount = self.columns["amount"].total()
+        vat = calculate_vat(total_amount)
+        return {"total_amount": total_amount, "vat": vat, "grand_total": total_amount + vat}
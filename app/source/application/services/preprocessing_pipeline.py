@@ -0,0 +1,266 @@
+from typing import Dict, Any, List, Optional, Tuple
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import logging
+import threading
+import time
+from app.source.core.exceptions import ConfigurationError, MappingError
+from app.source.application.services.fused_preprocessor import (
+    FusedJiraPreprocessor, MAPPER_TABLE_FIELDS, RESEARCH_FIELD, RESEARCH_KEY_PATTERN
+)
+
+DEFAULT_PLAN = "default"
+
+
+@dataclass(frozen=True)
+class PreprocessingStage:
+    """전처리 단계 정의
+
+    reads/writes는 fields(또는 최상위) 키 이름이며 '*' 패턴을 쓸 수 있다.
+    reads 중 하나도 데이터에 없으면 단계를 건너뛴다('*' 는 항상 실행).
+    """
+    name: str
+    reads: Tuple[str, ...]
+    writes: Tuple[str, ...]
+    handler: str
+
+
+@dataclass
+class PreprocessingContext:
+    """한 요청의 전처리 상태"""
+    data: Dict[str, Any]
+    fields: Dict[str, Any]
+    document_type: str
+    debug: bool = False
+
+
+@dataclass
+class StageTiming:
+    """단계별 실행 시간"""
+    stage: str
+    seconds: float
+    skipped: bool = False
+
+
+# 전처리 단계 레지스트리 (기본 실행 순서)
+STAGE_REGISTRY: Dict[str, PreprocessingStage] = {
+    stage.name: stage for stage in (
+        PreprocessingStage(
+            name="mapper_tables",
+            reads=tuple(source for source, _ in MAPPER_TABLE_FIELDS),
+            writes=tuple(target for _, target in MAPPER_TABLE_FIELDS),
+            handler="_stage_mapper_tables",
+        ),
+        PreprocessingStage(
+            name="markdown_tables",
+            reads=("*",),
+            writes=("*_data",),
+            handler="_stage_markdown_tables",
+        ),
+        PreprocessingStage(
+            name="research_key",
+            reads=(RESEARCH_FIELD,),
+            writes=(f"{RESEARCH_FIELD}_key",),
+            handler="_stage_research_key",
+        ),
+        PreprocessingStage(
+            name="item_amounts",
+            reads=("item_list_data",),
+            writes=("item_list_data",),
+            handler="_stage_item_amounts",
+        ),
+        PreprocessingStage(
+            name="amount_summary",
+            reads=("item_list_data", "expense_list_data"),
+            writes=("amount_summary",),
+            handler="_stage_amount_summary",
+        ),
+    )
+}
+
+
+def compile_plan(stage_names: List[str]) -> List[PreprocessingStage]:
+    """단계 이름 목록을 실행 계획으로 변환
+
+    Args:
+        stage_names (List[str]): 실행할 단계 이름 (실행 순서)
+
+    Returns:
+        List[PreprocessingStage]: 단계 목록
+
+    Raises:
+        ConfigurationError: 등록되지 않은 단계이거나, 뒤 단계가 쓰는 필드를 앞 단계가 읽는 경우
+    """
+    plan = []
+    for name in stage_names:
+        if name not in STAGE_REGISTRY:
+            raise ConfigurationError(f"Unknown preprocessing stage: {name}")
+        plan.append(STAGE_REGISTRY[name])
+
+    for index, stage in enumerate(plan):
+        for later in plan[index + 1:]:
+            for read in stage.reads:
+                if any(fnmatchcase(read, write) for write in later.writes):
+                    raise ConfigurationError(
+                        f"Stage '{stage.name}' reads '{read}' which is written by later stage '{later.name}'")
+    return plan
+
+
+class PipelineJiraPreprocessor(FusedJiraPreprocessor):
+    """문서 유형별로 설정된 단계만 실행하는 전처리기
+
+    단계 목록은 mapping_config.yaml의 preprocessing 섹션에서 읽으며(없으면 레지스트리의 전체 단계),
+    요청마다 단계별 실행 시간을 기록하고 문서 유형별로 누적한다.
+    """
+
+    def __init__(self, config_loader=None, schema_validator=None, logger: Optional[logging.Logger] = None,
+                 table_schemas=None):
+        super().__init__(schema_validator, logger, table_schemas)
+        self.plans = self._load_plans(config_loader)
+        self._local = threading.local()
+        self._stats_lock = threading.Lock()
+        self._stats: Dict[str, Dict[str, Dict[str, float]]] = {}
+
+    def _load_plans(self, config_loader) -> Dict[str, List[PreprocessingStage]]:
+        """설정에서 문서 유형별 실행 계획 생성"""
+        config = config_loader.get_preprocessing_config() if config_loader else {}
+        plans = {document_type: compile_plan(entry.get("stages") or [])
+                 for document_type, entry in (config or {}).items()}
+        plans.setdefault(DEFAULT_PLAN, list(STAGE_REGISTRY.values()))
+        self.logger.debug("Preprocessing plans: %s",
+                          {document_type: [stage.name for stage in plan] for document_type, plan in plans.items()})
+        return plans
+
+    def get_plan(self, document_type: Optional[str]) -> List[PreprocessingStage]:
+        """문서 유형의 실행 계획 (설정이 없으면 default)"""
+        return self.plans.get(document_type) or self.plans[DEFAULT_PLAN]
+
+    def preprocess(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """문서 유형에 맞는 단계로 Jira 데이터 전처리
+
+        Args:
+            data (Dict[str, Any]): 필드 매핑이 적용된 Jira 이슈 데이터
+
+        Returns:
+            Dict[str, Any]: 전처리된 데이터
+
+        Raises:
+            MappingError: 테이블 필드 전처리(mapper_tables 단계) 실패 시
+        """
+        if data is None:
+            raise MappingError("필드 전처리 중 오류 발생: 'NoneType' object has no attribute 'copy'")
+
+        processed_data = data.copy()
+        fields = processed_data.get("fields", {})
+        processed_data["fields"] = fields
+        document_type = self._document_type(processed_data)
+        context = PreprocessingContext(processed_data, fields, document_type,
+                                       debug=self.logger.isEnabledFor(logging.DEBUG))
+
+        timings = []
+        try:
+            for stage in self.get_plan(document_type):
+                if not self._has_inputs(stage, context):
+                    timings.append(StageTiming(stage.name, 0.0, skipped=True))
+                    continue
+                start = time.perf_counter()
+                getattr(self, stage.handler)(context)
+                timings.append(StageTiming(stage.name, time.perf_counter() - start))
+        finally:
+            self._record(document_type, timings)
+
+        return context.data
+
+    def last_timings(self) -> List[StageTiming]:
+        """현재 스레드에서 마지막으로 처리한 요청의 단계별 실행 시간"""
+        return list(getattr(self._local, "timings", []))
+
+    def get_stats(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """문서 유형별, 단계별 누적 실행 통계 반환"""
+        with self._stats_lock:
+            return {
+                document_type: {
+                    stage: {
+                        "runs": entry["runs"],
+                        "skipped": entry["skipped"],
+                        "total_ms": entry["total_seconds"] * 1000,
+                        "avg_ms": (entry["total_seconds"] * 1000 / entry["runs"]) if entry["runs"] else 0.0,
+                    }
+                    for stage, entry in stages.items()
+                }
+                for document_type, stages in self._stats.items()
+            }
+
+    def _record(self, document_type: str, timings: List[StageTiming]) -> None:
+        """요청의 단계별 실행 시간 기록"""
+        self._local.timings = timings
+        with self._stats_lock:
+            stages = self._stats.setdefault(document_type, {})
+            for timing in timings:
+                entry = stages.setdefault(timing.stage, {"runs": 0, "skipped": 0, "total_seconds": 0.0})
+                if timing.skipped:
+                    entry["skipped"] += 1
+                else:
+                    entry["runs"] += 1
+                    entry["total_seconds"] += timing.seconds
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Preprocessing stages for %s: %s", document_type, ", ".join(
+                f"{timing.stage}=skipped" if timing.skipped else f"{timing.stage}={timing.seconds * 1000:.3f}ms"
+                for timing in timings))
+
+    @staticmethod
+    def _document_type(data: Dict[str, Any]) -> str:
+        """fields.issuetype.name 또는 document_type 키 (없으면 default)"""
+        issuetype = data["fields"].get("issuetype")
+        if isinstance(issuetype, dict) and issuetype.get("name"):
+            return issuetype["name"]
+        return data.get("document_type") or DEFAULT_PLAN
+
+    @staticmethod
+    def _has_inputs(stage: PreprocessingStage, context: PreprocessingContext) -> bool:
+        if "*" in stage.reads:
+            return True
+        return any(name in context.fields or name in context.data for name in stage.reads)
+
+    def _stage_mapper_tables(self, context: PreprocessingContext) -> None:
+        """고정 테이블 필드 파싱 (기존 JiraDocumentMapper 단계)"""
+        fields = context.fields
+        try:
+            for source_name, target_name in MAPPER_TABLE_FIELDS:
+                if source_name in fields:
+                    fields[target_name] = self._parse_mapper_table(fields[source_name])
+        except Exception as e:
+            self.logger.error("Error preprocessing fields: %s", str(e), exc_info=True)
+            raise MappingError(f"필드 전처리 중 오류 발생: {str(e)}")
+
+    def _stage_markdown_tables(self, context: PreprocessingContext) -> None:
+        """마크다운 테이블로 보이는 모든 문자열 필드를 <필드>_data 로 파싱"""
+        parse_table = self._parse_markdown_table
+        is_table = self._is_markdown_table
+        for target in (context.fields, context.data):
+            for field_name, field_value in list(target.items()):
+                if field_name != 'fields' and isinstance(field_value, str) and is_table(field_value):
+                    self._parse_into(target, field_name, field_value, parse_table, context.debug)
+
+    def _stage_research_key(self, context: PreprocessingContext) -> None:
+        """연구과제_선택 값의 괄호 안 키 추출"""
+        field_value = context.fields.get(RESEARCH_FIELD)
+        if field_value is None:
+            return
+        value = field_value["value"]
+        if value:
+            match = RESEARCH_KEY_PATTERN.search(value)
+            if not match:
+                raise ValueError(f"Research key not found in {RESEARCH_FIELD}: {value}")
+            context.fields[f"{RESEARCH_FIELD}_key"] = match.group(1)
+
+    def _stage_item_amounts(self, context: PreprocessingContext) -> None:
+        """품목별 금액 계산"""
+        if 'item_list_data' in context.fields:
+            self._calculate_item_amounts(context.fields['item_list_data'])
+        elif 'item_list_data' in context.data:
+            self._calculate_item_amounts(context.data['item_list_data'])
+
+    def _stage_amount_summary(self, context: PreprocessingContext) -> None:
+        """금액 합계/부가세 계산"""
+        context.data = self.calculate_amount_summary(context.data)
@@ -1,20 +1,36 @@
 import re
-from typing import Dict, Any, List, Optional, TypedDict, Union
+from typing import Dict, Any, List, Optional, Union
 import json
-from app.source.infrastructure.mapping.markdown_parser import MarkdownTableParser
+from app.source.infrastructure.mapping.markdown_parser import MarkdownTableParser, TableColumn
+from app.source.application.services.item_table import ItemTable
 import logging
 
-class TableColumn(TypedDict):
-    name: str
-    key: str
-    type: str
-
 class JiraPreprocessor:
     """Jira에서 전달받은 데이터를 전처리하는 클래스"""
+
+    # 필드별 마크다운 테이블 컬럼 스키마 (지정된 컬럼만 파싱 시 타입 변환)
+    TABLE_SCHEMAS: Dict[str, List[TableColumn]] = {
+        "item_list": [
+            {"name": "quantity", "key": "quantity", "type": "int"},
+            {"name": "unit_price", "key": "unit_price", "type": "int"},
+            {"name": "amount", "key": "amount", "type": "int"},
+        ],
+        "expense_list": [
+            {"name": "amount", "key": "amount", "type": "int"},
+        ],
+        "발주_물품": [
+            {"name": "수량", "key": "수량", "type": "int"},
+            {"name": "단가", "key": "단가", "type": "int"},
+        ],
+    }
     
-    def __init__(self, schema_validator=None):
+    # 금액 계산 대상 테이블 (컬럼 기반 ItemTable로 파싱)
+    ITEM_TABLE_FIELDS = ("item_list", "expense_list")
+    
+    def __init__(self, schema_validator=None, table_schemas: Optional[Dict[str, List[TableColumn]]] = None):
         """초기화"""
         self.schema_validator = schema_validator
+        self.table_schemas = self.TABLE_SCHEMAS if table_schemas is None else table_schemas
         self.markdown_parser = MarkdownTableParser()
         self.logger = logging.getLogger(__name__)
         self.logger.debug("JiraPreprocessor initialized")
@@ -35,9 +51,9 @@ class JiraPreprocessor:
             self.logger.warning("Input data is None")
             return {}
             
-        self.logger.debug(f"Input data has {len(data)} top-level keys: {list(data.keys())}")
+        self.logger.debug("Input data has %s top-level keys: %s", len(data), list(data.keys()))
         if 'fields' in data:
-            self.logger.debug(f"Input 'fields' has {len(data['fields'])} keys: {list(data['fields'].keys())}")
+            self.logger.debug("Input 'fields' has %s keys: %s", len(data['fields']), list(data['fields'].keys()))
         
         # 데이터 복사
         processed_data = data.copy()
@@ -51,39 +67,39 @@ class JiraPreprocessor:
             markdown_field_count = 0
             for field_name, field_value in field_items:
                 if isinstance(field_value, str):
-                    self.logger.debug(f"Checking if field '{field_name}' contains markdown table (length: {len(field_value)})")
+                    self.logger.debug("Checking if field '%s' contains markdown table (length: %s)", field_name, len(field_value))
                     if self._looks_like_markdown_table(field_value):
-                        self.logger.debug(f"Field '{field_name}' looks like a markdown table")
+                        self.logger.debug("Field '%s' looks like a markdown table", field_name)
                         try:
-                            parsed_table = self.markdown_parser.parse_table(field_value)
+                            parsed_table = self._parse_markdown_table(field_name, field_value)
                             if parsed_table:
-                                self.logger.debug(f"Successfully parsed markdown table for '{field_name}': {len(parsed_table)} rows")
+                                self.logger.debug("Successfully parsed markdown table for '%s': %s rows", field_name, len(parsed_table))
                                 # 파싱된 결과를 원래 필드_data에 삽입
                                 fields[f"{field_name}_data"] = parsed_table
-                                self.logger.info(f"Created '{field_name}_data' with {len(parsed_table)} items")
+                                self.logger.info("Created '%s_data' with %s items", field_name, len(parsed_table))
                                 markdown_field_count += 1
                                 
                                 # 첫 번째 행 로깅 (디버깅용)
                                 if parsed_table and len(parsed_table) > 0:
-                                    self.logger.debug(f"First row of '{field_name}_data': {parsed_table[0]}")
+                                    self.logger.debug("First row of '%s_data': %s", field_name, parsed_table[0])
                             else:
-                                self.logger.warning(f"Parser returned empty result for '{field_name}' despite looking like a table")
+                                self.logger.warning("Parser returned empty result for '%s' despite looking like a table", field_name)
                         except Exception as e:
-                            self.logger.error(f"Error parsing markdown table for field '{field_name}': {str(e)}", exc_info=True)
+                            self.logger.error("Error parsing markdown table for field '%s': %s", field_name, str(e), exc_info=True)
                 if field_name == "연구과제_선택":
                     value = field_value["value"]
-                    self.logger.debug(f"Field '{field_name}' value: {value}")
+                    self.logger.debug("Field '%s' value: %s", field_name, value)
                     if value:
                         # 괄호 안의 키를 추출
                         match = re.search(r'\(([^)]+)\)', value)
                         if match:
                             key = match.group(1)
-                            self.logger.debug(f"Extracted key: {key}")
+                            self.logger.debug("Extracted key: %s", key)
                         fields[f"연구과제_선택_key"] = key
-                        self.logger.debug(f"Added '{field_name}_key' with value: {key}")
+                        self.logger.debug("Added '%s_key' with value: %s", field_name, key)
                 
 
-            self.logger.info(f"Processed {markdown_field_count} markdown tables in 'fields' object")
+            self.logger.info("Processed %s markdown tables in 'fields' object", markdown_field_count)
         
         # fields 외의 최상위 필드 처리 - 필드 목록을 미리 복사
         self.logger.debug("Processing top-level fields")
@@ -91,27 +107,27 @@ class JiraPreprocessor:
         top_level_markdown_count = 0
         for field_name, field_value in top_level_items:
             if field_name != 'fields' and isinstance(field_value, str):
-                self.logger.debug(f"Checking if top-level field '{field_name}' contains markdown table (length: {len(field_value)})")
+                self.logger.debug("Checking if top-level field '%s' contains markdown table (length: %s)", field_name, len(field_value))
                 if self._looks_like_markdown_table(field_value):
-                    self.logger.debug(f"Top-level field '{field_name}' looks like a markdown table")
+                    self.logger.debug("Top-level field '%s' looks like a markdown table", field_name)
                     try:
-                        parsed_table = self.markdown_parser.parse_table(field_value)
+                        parsed_table = self._parse_markdown_table(field_name, field_value)
                         if parsed_table:
-                            self.logger.debug(f"Successfully parsed top-level markdown table for '{field_name}': {len(parsed_table)} rows")
+                            self.logger.debug("Successfully parsed top-level markdown table for '%s': %s rows", field_name, len(parsed_table))
                             # 원본 필드를 덮어쓰기 대신 새 필드로 저장
                             processed_data[f"{field_name}_data"] = parsed_table
-                            self.logger.info(f"Created top-level '{field_name}_data' with {len(parsed_table)} items")
+                            self.logger.info("Created top-level '%s_data' with %s items", field_name, len(parsed_table))
                             top_level_markdown_count += 1
                             
                             # 첫 번째 행 로깅 (디버깅용)
                             if parsed_table and len(parsed_table) > 0:
-                                self.logger.debug(f"First row of top-level '{field_name}_data': {parsed_table[0]}")
+                                self.logger.debug("First row of top-level '%s_data': %s", field_name, parsed_table[0])
                         else:
-                            self.logger.warning(f"Parser returned empty result for top-level '{field_name}' despite looking like a table")
+                            self.logger.warning("Parser returned empty result for top-level '%s' despite looking like a table", field_name)
                     except Exception as e:
-                        self.logger.error(f"Error parsing top-level markdown table for field '{field_name}': {str(e)}", exc_info=True)
+                        self.logger.error("Error parsing top-level markdown table for field '%s': %s", field_name, str(e), exc_info=True)
         
-        self.logger.info(f"Processed {top_level_markdown_count} markdown tables in top-level fields")
+        self.logger.info("Processed %s markdown tables in top-level fields", top_level_markdown_count)
         
         # 수량*단가 계산 필드 추가 (item_list_data 필드가 있는 경우)
         self.logger.debug("Checking for item list to calculate amounts")
@@ -129,23 +145,40 @@ class JiraPreprocessor:
         processed_data = self.calculate_amount_summary(processed_data)
         
         # 결과 데이터 로깅
-        self.logger.debug(f"After preprocessing, data has {len(processed_data)} top-level keys: {list(processed_data.keys())}")
+        self.logger.debug("After preprocessing, data has %s top-level keys: %s", len(processed_data), list(processed_data.keys()))
         if 'fields' in processed_data:
-            self.logger.debug(f"After preprocessing, 'fields' has {len(processed_data['fields'])} keys: {list(processed_data['fields'].keys())}")
+            self.logger.debug("After preprocessing, 'fields' has %s keys: %s", len(processed_data['fields']), list(processed_data['fields'].keys()))
         
         # 새로 추가된 필드 로깅
         new_fields = [k for k in processed_data.keys() if k not in data.keys()]
         if new_fields:
-            self.logger.info(f"Added {len(new_fields)} new top-level fields: {new_fields}")
+            self.logger.info("Added %s new top-level fields: %s", len(new_fields), new_fields)
         
         if 'fields' in processed_data and 'fields' in data:
             new_nested_fields = [k for k in processed_data['fields'].keys() if k not in data['fields'].keys()]
             if new_nested_fields:
-                self.logger.info(f"Added {len(new_nested_fields)} new fields in 'fields': {new_nested_fields}")
+                self.logger.info("Added %s new fields in 'fields': %s", len(new_nested_fields), new_nested_fields)
         
         self.logger.info("=== Data preprocessing completed ===")
         return processed_data
     
+    def _parse_markdown_table(self, field_name: str, text: str) -> List[Dict[str, Any]]:
+        """필드의 컬럼 스키마를 적용해 마크다운 테이블 파싱 (문제 행은 경고로 기록)
+        
+        Args:
+            field_name (str): 필드 이름
+            text (str): 마크다운 테이블 텍스트
+            
+        Returns:
+            List[Dict[str, Any]]: 파싱된 행 목록
+        """
+        result = self.markdown_parser.parse_lines(text.splitlines(), self.table_schemas.get(field_name))
+        for error in result.errors:
+            self.logger.warning("Malformed row in '%s' (line %s): %s", field_name, error.line_number, error.reason)
+        if field_name in self.ITEM_TABLE_FIELDS:
+            return ItemTable(result.rows)
+        return result.rows
+    
     def _looks_like_markdown_table(self, text: str) -> bool:
         """문자열이 마크다운 테이블인지 확인
         
@@ -162,7 +195,7 @@ class JiraPreprocessor:
         
         # 최소 3줄 이상 (헤더, 구분선, 데이터)
         if len(lines) < 3:
-            self.logger.debug(f"Text has less than 3 lines ({len(lines)}), not a markdown table")
+            self.logger.debug("Text has less than 3 lines (%s), not a markdown table", len(lines))
             return False
             
         # 첫 번째 줄과 두 번째 줄에 | 문자가 있어야 함
@@ -171,44 +204,17 @@ class JiraPreprocessor:
             return False
             
         
-        self.logger.debug(f"Text appears to be a valid markdown table with {len(lines)} lines")
+        self.logger.debug("Text appears to be a valid markdown table with %s lines", len(lines))
         return True
     
     def _calculate_item_amounts(self, items: List[Dict[str, Any]]) -> None:
-        """아이템 리스트에 금액 계산 필드 추가
+        """아이템 리스트에 금액 계산 필드 추가 (컬럼 단위 계산)
         
         Args:
-            items (List[Dict[str, Any]]): 아이템 리스트
+            items (List[Dict[str, Any]]): 아이템 리스트 (ItemTable 또는 행 딕셔너리 목록)
         """
-        self.logger.debug(f"Calculating amounts for {len(items)} items")
-        calculated_count = 0
-        
-        for i, item in enumerate(items):
-            # quantity와 unit_price 필드가 있는지 확인하고 amount 계산
-            quantity = item.get('quantity')
-            unit_price = item.get('unit_price')
-            
-            self.logger.debug(f"Item {i+1}: quantity={quantity}, unit_price={unit_price}")
-            
-            if quantity is not None and unit_price is not None:
-                try:
-                    # 문자열인 경우 숫자로 변환
-                    if isinstance(quantity, str):
-                        quantity = int(quantity.replace(',', ''))
-                        self.logger.debug(f"Converted string quantity '{item.get('quantity')}' to {quantity}")
-                    if isinstance(unit_price, str):
-                        unit_price = int(unit_price.replace(',', ''))
-                        self.logger.debug(f"Converted string unit_price '{item.get('unit_price')}' to {unit_price}")
-                        
-                    item['amount'] = quantity * unit_price
-                    self.logger.debug(f"Calculated amount for item {i+1}: {item['amount']}")
-                    calculated_count += 1
-                except (ValueError, TypeError) as e:
-                    self.logger.warning(f"Failed to calculate amount for item {i+1}: {str(e)}")
-            else:
-                self.logger.debug(f"Item {i+1} is missing quantity or unit_price, skipping amount calculation")
-        
-        self.logger.info(f"Successfully calculated amounts for {calculated_count} out of {len(items)} items")
+        calculated_count = ItemTable.from_rows(items).calculate_amounts()
+        self.logger.info("Successfully calculated amounts for %s out of %s items", calculated_count, len(items))
     
     def calculate_amount_summary(self, data: Dict[str, Any]) -> Dict[str, Any]:
         """금액 합계 계산 - 문서 유형에 관계없이 공통 처리
@@ -219,8 +225,6 @@ class JiraPreprocessor:
         Returns:
             Dict[str, Any]: 금액 합계가 추가된 데이터
         """
-        self.logger.debug("Calculating amount summary")
-        
         # 항목 리스트 찾기 (fields 내부 또는 최상위)
         item_list = None
         item_list_source = None
@@ -240,55 +244,20 @@ class JiraPreprocessor:
                 item_list = data['expense_list_data']
                 item_list_source = "expense_list_data"
         
-        if item_list_source:
-            self.logger.debug(f"Found item list source: {item_list_source} with {len(item_list)} items")
-        else:
+        if not item_list_source:
             self.logger.debug("No item list found for amount summary calculation")
             return data
         
-        # 항목 리스트가 있으면 금액 합계 계산
+        # 항목 리스트가 있으면 금액 합계 계산 (부가세는 원 미만 절사)
         if item_list and isinstance(item_list, list):
-            # 합계 계산
-            total_amount = 0
-            items_with_amount = 0
-            
-            for i, item in enumerate(item_list):
-                # 항목의 금액 필드 (amount 또는 다른 필드)
-                amount = 0
-                if 'amount' in item:
-                    try:
-                        if isinstance(item['amount'], str):
-                            amount = int(item['amount'].replace(',', ''))
-                            self.logger.debug(f"Converted string amount '{item['amount']}' to {amount} for item {i+1}")
-                        else:
-                            amount = item['amount']
-                            
-                        total_amount += amount
-                        items_with_amount += 1
-                        self.logger.debug(f"Added amount {amount} from item {i+1}, running total: {total_amount}")
-                    except (ValueError, TypeError) as e:
-                        self.logger.warning(f"Error processing amount for item {i+1}: {str(e)}")
-                else:
-                    self.logger.debug(f"Item {i+1} has no 'amount' field")
-            
-            self.logger.info(f"Calculated total amount: {total_amount} from {items_with_amount} items with amount")
-            
-            # 계산된 합계 저장
-            amount_summary = {'total_amount': total_amount}
-            
-            # 부가세 계산 (10%)
-            vat = int(total_amount * 0.1)
-            amount_summary['vat'] = vat
-            amount_summary['grand_total'] = total_amount + vat
-            
-            self.logger.debug(f"Amount summary calculated: total={total_amount}, vat={vat}, grand_total={total_amount + vat}")
+            amount_summary = ItemTable.from_rows(item_list).amount_summary()
+            self.logger.info("Calculated amount summary from %s: total=%s, vat=%s, grand_total=%s", item_list_source,
+                             amount_summary['total_amount'], amount_summary['vat'], amount_summary['grand_total'])
             
             # 데이터에 저장
             if 'fields' in data:
                 data['fields']['amount_summary'] = amount_summary
-                self.logger.info("Added amount_summary to fields")
             else:
                 data['amount_summary'] = amount_summary
-                self.logger.info("Added amount_summary to top level")
         
-        return data 
\ No newline at end of file
+        return data
@@ -0,0 +1,89 @@
+"""
+애플리케이션 설정
+
+환경 변수에서 설정 딕셔너리를 만든다. 앱(main), CLI(bulk_import, db_helper)가 함께 사용하므로
+이 모듈은 가져올 때 아무 부수 효과(앱 생성, 연결 등)도 없어야 한다.
+"""
+
+import os
+from typing import Any, Dict
+
+
+def load_config() -> Dict[str, Any]:
+    """설정 로드"""
+    config = {
+        "schema_path": os.path.join("app", "source", "schemas", "IntegratedDocumentSchema.json"),
+        "template_dir": os.path.join("app", "source", "templates"),
+        "static_dir": os.path.abspath(os.path.join("app", "resources")),
+        "output_dir": os.path.join("output/Paperworks/Paperworks/00. 연구비 증빙서류"),
+        "dir_name_format": "{research_project}/{parent_issue_subject}/{date}_{parent_issue_key}_{parent_title}",
+        "file_name_format": "{summary}",
+        "database": {
+            "host": os.environ.get("DB_HOST", "db"),
+            "port": int(os.environ.get("DB_PORT", 5432)),
+            "user": os.environ.get("DB_USER", "myuser"),
+            "password": os.environ.get("DB_PASSWORD", "mypassword"),
+            "database": os.environ.get("DB_NAME", "mydb"),
+            # 레포지토리 반복 쿼리를 연결마다 PREPARE 해 두고 EXECUTE로 재사용
+            # (PgBouncer transaction 모드처럼 세션이 유지되지 않는 환경에서는 끌 것)
+            "prepared_statements": os.environ.get("DB_PREPARED_STATEMENTS", "false").lower() == "true",
+            # 연결 풀 (요청/단위 작업/보강 작업 스레드마다 연결을 빌려 사용)
+            "pool": {
+                "min_size": int(os.environ.get("DB_POOL_MIN_SIZE", 1)),
+                "max_size": int(os.environ.get("DB_POOL_MAX_SIZE", 10)),
+                "checkout_timeout": float(os.environ.get("DB_POOL_CHECKOUT_TIMEOUT", 30)),
+                # 최대 수명(초)이 지난 연결은 반납 시 닫고 새로 연결
+                "max_lifetime": float(os.environ.get("DB_POOL_MAX_LIFETIME", 1800)),
+                # 이 시간(초) 이상 쉬었던 연결은 빌려주기 전에 SELECT 1로 확인
+                "health_check_after": float(os.environ.get("DB_POOL_HEALTH_CHECK_AFTER", 5))
+            },
+            # 기준 데이터(직원/회사/연구 과제/전문가) 읽기 캐시, LISTEN/NOTIFY로 무효화
+            "reference_cache": {
+                "enabled": os.environ.get("DB_REFERENCE_CACHE_ENABLED", "true").lower() == "true",
+                "ttl_seconds": float(os.environ.get("DB_REFERENCE_CACHE_TTL", 300)),
+                "max_entries": int(os.environ.get("DB_REFERENCE_CACHE_MAX_ENTRIES", 10000)),
+                # LISTEN 무효화는 db_helper.install_reference_triggers()로 트리거를 설치한 뒤에 켤 것
+                "listen": os.environ.get("DB_REFERENCE_CACHE_LISTEN", "false").lower() == "true",
+                "warm_on_startup": os.environ.get("DB_REFERENCE_CACHE_WARM", "false").lower() == "true"
+            }
+        },
+        # 도메인 타입별 보강 조회 동시 실행 (max_workers=1이면 순차 실행)
+        "enrichment": {
+            "max_workers": int(os.environ.get("ENRICHMENT_MAX_WORKERS", 4)),
+            "timeout_seconds": float(os.environ.get("ENRICHMENT_TIMEOUT", 10))
+        },
+        "jira": {
+            "base_url": os.environ.get("JIRA_BASE_URL"),
+            "username": os.environ.get("JIRA_USERNAME"),
+            "api_token": os.environ.get("JIRA_API_TOKEN"),
+            "download_dir": os.path.join("downloads"),
+            "field_mapping_source": "api",  # or "file"
+            "field_mapping_cache": {
+                "file": os.environ.get("JIRA_FIELD_MAPPING_CACHE", os.path.join("downloads", "jira_field_mapping.json")),
+                "ttl_seconds": float(os.environ.get("JIRA_FIELD_MAPPING_TTL", 3600))
+            },
+            "max_concurrent_downloads": int(os.environ.get("JIRA_MAX_CONCURRENT_DOWNLOADS", 4)),
+            "download_chunk_size": int(os.environ.get("JIRA_DOWNLOAD_CHUNK_SIZE", 64 * 1024)),
+            "attachment_cache": {
+                "dir": os.environ.get("JIRA_ATTACHMENT_CACHE_DIR", os.path.join("downloads", "attachment_cache")),
+                "max_bytes": int(os.environ.get("JIRA_ATTACHMENT_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+            },
+            "issue_cache": {
+                "ttl_seconds": float(os.environ.get("JIRA_ISSUE_CACHE_TTL", 60)),
+                "max_entries": int(os.environ.get("JIRA_ISSUE_CACHE_MAX_ENTRIES", 512))
+            },
+            "http": {
+                "pool_maxsize": int(os.environ.get("JIRA_POOL_MAXSIZE", 20)),
+                "max_retries": int(os.environ.get("JIRA_MAX_RETRIES", 3)),
+                "backoff_factor": float(os.environ.get("JIRA_BACKOFF_FACTOR", 0.5))
+            },
+            "rate_limit": {
+                "requests_per_second": float(os.environ.get("JIRA_RATE_LIMIT_RPS", 10)),
+                "burst": int(os.environ.get("JIRA_RATE_LIMIT_BURST", 20)),
+                "max_concurrency": int(os.environ.get("JIRA_RATE_LIMIT_MAX_CONCURRENCY", 8)),
+                # 여러 워커 프로세스가 할당량을 공유하려면 상태 파일 지정
+                "state_file": os.environ.get("JIRA_RATE_LIMIT_STATE_FILE")
+            }
+        }
+    }
+    return config
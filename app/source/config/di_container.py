@@ -5,6 +5,9 @@ from app.source.core.interfaces import (
 )
 from app.source.core.domain import Company, Employee, Research, Expert
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection, DatabaseUnitOfWork
+from app.source.infrastructure.persistence.reference_cache import (
+    ReferenceDataCache, ReferenceDataListener
+)
 from app.source.infrastructure.repositories.company_repo_v2 import CompanyRepositoryV2
 from app.source.infrastructure.repositories.employee_repo_v2 import EmployeeRepositoryV2
 from app.source.infrastructure.repositories.research_repo_v2 import ResearchRepositoryV2
@@ -12,19 +15,33 @@ from app.source.infrastructure.repositories.expert_repo_v2 import ExpertReposito
 from app.source.infrastructure.rendering.document_renderer import JinjaDocumentRenderer
 from app.source.infrastructure.rendering.pdf_generator import WeasyPrintPdfGenerator
 from app.source.application.services.data_enricher import SelectiveFieldEnricher
+from app.source.application.services.enrichment_plan import EnrichmentPlanCompiler
+from app.source.infrastructure.config.field_mapping_config import FieldMappingConfig
 from app.source.application.services.document_service import DocumentService
 from app.source.application.services.signature_service import SignatureService
 from app.source.infrastructure.integrations.jira_client import JiraClient
-from app.source.infrastructure.mapping.jira_field_mapper import ApiJiraFieldMappingProvider, FileJiraFieldMappingProvider, JiraFieldMapperimpl
+from app.source.infrastructure.integrations.http_session import HttpPoolConfig, PooledHttpSession
+from app.source.infrastructure.integrations.rate_limiter import RateLimitConfig, RateLimiter
+from app.source.infrastructure.integrations.async_jira_client import ConcurrentJiraClient
+from app.source.infrastructure.integrations.attachment_cache import AttachmentCache
+from app.source.infrastructure.integrations.issue_cache import IssueCache
+from app.source.infrastructure.mapping.jira_field_mapper import ApiJiraFieldMappingProvider, CachedJiraFieldMappingProvider, FileJiraFieldMappingProvider, JiraFieldMapperimpl
 from app.source.infrastructure.mapping.jira_document_mapper import JiraDocumentMapper
+from app.source.infrastructure.mapping.mapping_config_loader import MappingConfigLoader
 from app.source.application.services.preprocessor import JiraPreprocessor
+from app.source.application.services.preprocessing_pipeline import PipelineJiraPreprocessor
 from app.source.application.services.document_strategies.document_strategy_factory import DocumentStrategyFactory
+from typing import Optional
 import logging
 import os
+import threading
 
 class DIContainer:
     """의존성 주입 컨테이너"""
     
+    # 캐시 대상 기준 데이터 테이블
+    REFERENCE_TABLES = ("companies", "employees", "research_projects", "experts")
+    
     def __init__(self, config: dict, logger: logging.Logger = None):
         self.config = config
         self.logger = logger or logging.getLogger(__name__)
@@ -39,6 +56,10 @@ class DIContainer:
         self._research_repo = None
         self._expert_repo = None
         
+        # 기준 데이터 캐시
+        self._reference_caches = None
+        self._reference_data_listener = None
+        
         # 유닛 오브 워크
         self._unit_of_work = None
         
@@ -51,6 +72,8 @@ class DIContainer:
         
         # 서비스
         self._data_enricher = None
+        self._field_mapping_config = None
+        self._enrichment_plan_compiler = None
         self._document_service = None
         self._signature_service = None
 
@@ -59,9 +82,14 @@ class DIContainer:
 
         # Jira
         self._jira_client = None
+        self._jira_http_session = None
+        self._jira_rate_limiter = None
+        self._attachment_cache = None
+        self._issue_cache = None
         self._jira_field_mapper = None
         self._jira_field_mapping_provider = None
         self._jira_document_mapper = None
+        self._mapping_config_loader = None
     
     @property
     def db_connection(self) -> DatabaseConnection:
@@ -83,7 +111,7 @@ class DIContainer:
     def company_repo(self) -> Repository[Company]:
         """회사 저장소 인스턴스 반환"""
         if self._company_repo is None:
-            self._company_repo = CompanyRepositoryV2(self.db_connection)
+            self._company_repo = CompanyRepositoryV2(self.db_connection, cache=self.reference_caches.get("companies"))
             self.logger.debug("CompanyRepository created")
         return self._company_repo
     
@@ -91,7 +119,7 @@ class DIContainer:
     def employee_repo(self) -> Repository[Employee]:
         """직원 저장소 인스턴스 반환"""
         if self._employee_repo is None:
-            self._employee_repo = EmployeeRepositoryV2(self.db_connection, logger=self.logger)
+            self._employee_repo = EmployeeRepositoryV2(self.db_connection, logger=self.logger, cache=self.reference_caches.get("employees"))
             self.logger.debug("EmployeeRepository created")
         return self._employee_repo
     
@@ -99,7 +127,7 @@ class DIContainer:
     def research_repo(self) -> Repository[Research]:
         """연구 과제 저장소 인스턴스 반환"""
         if self._research_repo is None:
-            self._research_repo = ResearchRepositoryV2(self.db_connection, logger=self.logger)
+            self._research_repo = ResearchRepositoryV2(self.db_connection, logger=self.logger, cache=self.reference_caches.get("research_projects"))
             self.logger.debug("ResearchRepository created")
         return self._research_repo
     
@@ -107,10 +135,78 @@ class DIContainer:
     def expert_repo(self) -> Repository[Expert]:
         """전문가 저장소 인스턴스 반환"""
         if self._expert_repo is None:
-            self._expert_repo = ExpertRepositoryV2(self.db_connection, logger=self.logger)
+            self._expert_repo = ExpertRepositoryV2(self.db_connection, logger=self.logger, cache=self.reference_caches.get("experts"))
             self.logger.debug("ExpertRepository created")
         return self._expert_repo
     
+    @property
+    def reference_caches(self) -> dict:
+        """테이블 이름 -> 기준 데이터 캐시 (비활성화 시 빈 딕셔너리)"""
+        if self._reference_caches is None:
+            cache_config = self.config.get("database", {}).get("reference_cache", {})
+            self._reference_caches = {}
+            if cache_config.get("enabled", False):
+                for table_name in self.REFERENCE_TABLES:
+                    self._reference_caches[table_name] = ReferenceDataCache(
+                        table_name,
+                        ttl_seconds=cache_config.get("ttl_seconds", 300),
+                        max_entries=cache_config.get("max_entries", 10000),
+                        logger=self.logger
+                    )
+                self.logger.debug("ReferenceDataCaches created")
+        return self._reference_caches
+    
+    @property
+    def reference_data_listener(self) -> ReferenceDataListener:
+        """기준 데이터 변경 알림 리스너 반환"""
+        if self._reference_data_listener is None:
+            self._reference_data_listener = ReferenceDataListener(
+                self.config["database"], self.reference_caches, logger=self.logger
+            )
+            self.logger.debug("ReferenceDataListener created")
+        return self._reference_data_listener
+    
+    def initialize_reference_cache(self, background: bool = True) -> Optional[threading.Thread]:
+        """기준 데이터 캐시 시작 (설정 시): 리스너 시작, 테이블별 일괄 로드
+        
+        앱 생성을 막지 않도록 기본적으로 백그라운드 스레드에서 실행한다.
+        NOTIFY 트리거 설치는 마이그레이션 단계(db_helper.install_reference_triggers)에서 한 번만 실행한다.
+        데이터베이스를 사용할 수 없어도 애플리케이션은 계속 동작해야 하므로 각 단계의 실패는 경고로만 기록한다.
+        (워밍에 실패한 테이블은 조회 시점에 채워진다)
+        
+        Args:
+            background (bool): 백그라운드 스레드에서 실행할지 여부
+        
+        Returns:
+            Optional[threading.Thread]: 백그라운드로 실행한 경우 그 스레드, 할 일이 없거나 동기 실행이면 None
+        """
+        cache_config = self.config.get("database", {}).get("reference_cache", {})
+        listen = cache_config.get("listen", False)
+        warm = cache_config.get("warm_on_startup", False)
+        if not self.reference_caches or not (listen or warm):
+            return None
+        
+        def run():
+            # 리스너가 LISTEN을 등록한 뒤에 워밍해야 그 사이의 변경을 놓치지 않는다
+            if listen and not self.reference_data_listener.start():
+                self.logger.warning("Reference data listener is not connected yet; relying on cache TTL")
+            if warm:
+                for repo in (self.company_repo, self.employee_repo, self.research_repo, self.expert_repo):
+                    try:
+                        repo.warm()
+                    except Exception as e:
+                        self.logger.warning("Could not warm reference data cache for %s: %s", repo.schema.table_name, str(e))
+        
+        if not background:
+            run()
+            return None
+        thread = threading.Thread(target=run, name="reference-cache-init", daemon=True)
+        thread.start()
+        return thread
+    
+    def get_reference_cache_stats(self) -> dict:
+        """테이블별 기준 데이터 캐시 통계 반환"""
+        return {table_name: cache.get_stats() for table_name, cache in self.reference_caches.items()}
   
     @property
     def document_renderer(self) -> DocumentRenderer:
@@ -134,6 +230,27 @@ class DIContainer:
             )
         return self._pdf_generator
     
+    @property
+    def field_mapping_config(self) -> FieldMappingConfig:
+        """보강 필드 매핑 설정 반환"""
+        if self._field_mapping_config is None:
+            self._field_mapping_config = FieldMappingConfig()
+            self.logger.debug("FieldMappingConfig loaded")
+        return self._field_mapping_config
+    
+    @property
+    def enrichment_plan_compiler(self) -> EnrichmentPlanCompiler:
+        """문서 유형별 보강 계획 컴파일러 반환 (렌더러와 같은 템플릿 환경 사용)"""
+        if self._enrichment_plan_compiler is None:
+            self._enrichment_plan_compiler = EnrichmentPlanCompiler(
+                self.document_renderer.template_env,
+                self.field_mapping_config,
+                resolve_template=self.document_renderer.resolve_template,
+                logger=self.logger
+            )
+            self.logger.debug("EnrichmentPlanCompiler created")
+        return self._enrichment_plan_compiler
+    
     @property
     def data_enricher(self) -> DataEnricher:
         """데이터 보강 서비스 인스턴스 반환"""
@@ -143,7 +260,11 @@ class DIContainer:
                 self.employee_repo,
                 self.research_repo,
                 self.expert_repo,
-                logger=self.logger
+                field_mapping_config=self.field_mapping_config,
+                logger=self.logger,
+                plan_compiler=self.enrichment_plan_compiler,
+                max_workers=self.config.get("enrichment", {}).get("max_workers", 4),
+                timeout_seconds=self.config.get("enrichment", {}).get("timeout_seconds", 10.0)
             )
             self.logger.debug("SelectiveFieldEnricher created")
         return self._data_enricher
@@ -170,6 +291,8 @@ class DIContainer:
                 self.document_renderer,
                 self.pdf_generator,
                 self.document_strategy_factory,
+                # 테이블 필드 전처리(JiraDocumentMapper)까지 한 번에 수행
+                preprocessor=PipelineJiraPreprocessor(config_loader=self.mapping_config_loader, logger=self.logger),
                 logger=self.logger
             )
             self.logger.debug("DocumentService created")
@@ -189,17 +312,75 @@ class DIContainer:
             self.logger.debug("DocumentStrategyFactory created")
         return self._document_strategy_factory
 
+    @property
+    def jira_http_session(self) -> PooledHttpSession:
+        """Jira 클라이언트들이 공유하는 HTTP 커넥션 풀 반환"""
+        if self._jira_http_session is None:
+            http_config = self.config.get("jira", {}).get("http")
+            self._jira_http_session = PooledHttpSession(
+                HttpPoolConfig.from_dict(http_config),
+                logger=self.logger,
+                rate_limiter=self.jira_rate_limiter
+            )
+            self.logger.debug("PooledHttpSession created")
+        return self._jira_http_session
+
+    @property
+    def jira_rate_limiter(self) -> RateLimiter:
+        """모든 Jira 요청이 공유하는 속도 제한기 반환"""
+        if self._jira_rate_limiter is None:
+            rate_limit_config = self.config.get("jira", {}).get("rate_limit")
+            self._jira_rate_limiter = RateLimiter(
+                RateLimitConfig.from_dict(rate_limit_config),
+                logger=self.logger
+            )
+            self.logger.debug("RateLimiter created")
+        return self._jira_rate_limiter
+
+    @property
+    def attachment_cache(self) -> AttachmentCache:
+        """Jira 첨부 파일 디스크 캐시 반환 (설정이 없으면 None)"""
+        if self._attachment_cache is None:
+            cache_config = self.config.get("jira", {}).get("attachment_cache")
+            if cache_config and cache_config.get("dir"):
+                self._attachment_cache = AttachmentCache(
+                    cache_config["dir"],
+                    max_bytes=cache_config.get("max_bytes", 1024 * 1024 * 1024),
+                    logger=self.logger
+                )
+                self.logger.debug("AttachmentCache created")
+        return self._attachment_cache
+
+    @property
+    def issue_cache(self) -> IssueCache:
+        """Jira 이슈 TTL 캐시 반환"""
+        if self._issue_cache is None:
+            cache_config = self.config.get("jira", {}).get("issue_cache", {})
+            self._issue_cache = IssueCache(
+                ttl_seconds=cache_config.get("ttl_seconds", 60),
+                max_entries=cache_config.get("max_entries", 512),
+                logger=self.logger
+            )
+            self.logger.debug("IssueCache created")
+        return self._issue_cache
+
     @property
     def jira_client(self) -> JiraClient:
         """Jira 클라이언트 인스턴스 반환"""
         if self._jira_client is None:
-            self._jira_client = JiraClient(
+            # 첨부 파일은 병렬 다운로드 (동기 인터페이스 유지)
+            self._jira_client = ConcurrentJiraClient(
                 jira_base_url=self.config["jira"]["base_url"],
                 username=self.config["jira"]["username"],
                 api_token=self.config["jira"]["api_token"],
                 download_dir=self.config["jira"]["download_dir"],
                 field_mapper=self.jira_field_mapper,
-                logger=self.logger
+                logger=self.logger,
+                http_session=self.jira_http_session,
+                max_concurrency=self.config["jira"].get("max_concurrent_downloads", 4),
+                download_chunk_size=self.config["jira"].get("download_chunk_size", 64 * 1024),
+                attachment_cache=self.attachment_cache,
+                issue_cache=self.issue_cache
             )
             self.logger.debug("JiraClient created")
         return self._jira_client
@@ -217,10 +398,22 @@ class DIContainer:
                     jira_base_url=jira_config.get("base_url"),
                     username=jira_config.get("username"),
                     api_token=jira_config.get("api_token"),
-                    download_dir=jira_config.get("download_dir")
+                    download_dir=jira_config.get("download_dir"),
+                    http_session=self.jira_http_session
                 )
-                self._jira_field_mapping_provider = ApiJiraFieldMappingProvider(jira_client)
-                self.logger.debug("ApiJiraFieldMappingProvider created")
+                provider = ApiJiraFieldMappingProvider(jira_client)
+                cache_config = jira_config.get("field_mapping_cache")
+                if cache_config and cache_config.get("file"):
+                    # 파일 캐시에서 즉시 로드하고 백그라운드에서 갱신
+                    provider = CachedJiraFieldMappingProvider(
+                        provider,
+                        cache_config["file"],
+                        ttl_seconds=cache_config.get("ttl_seconds", 3600),
+                        logger=self.logger
+                    )
+                    provider.start()
+                self._jira_field_mapping_provider = provider
+                self.logger.debug("%s created", type(provider).__name__)
             else:
                 mapping_file = jira_config.get("field_mapping_file")
                 self._jira_field_mapping_provider = FileJiraFieldMappingProvider(mapping_file)
@@ -246,6 +439,14 @@ class DIContainer:
             self.logger.debug("JiraDocumentMapper created")
         return self._jira_document_mapper
 
+    @property
+    def mapping_config_loader(self) -> MappingConfigLoader:
+        """매핑 설정 로더 인스턴스 반환 (문서 유형별 Jira 조회 필드 포함)"""
+        if self._mapping_config_loader is None:
+            self._mapping_config_loader = MappingConfigLoader(self.logger)
+            self.logger.debug("MappingConfigLoader created")
+        return self._mapping_config_loader
+
     def initialize_jira_client(self):
         """Jira 클라이언트 초기화 완료"""
         if self._jira_client is not None:
@@ -26,6 +26,10 @@ class DatabaseError(RepositoryError):
     """데이터베이스 오류"""
     pass
 
+class EnrichmentError(DocumentAutomationError):
+    """데이터 보강 오류 (기준 데이터 조회 시간 초과 등)"""
+    pass
+
 class SchemaError(DocumentAutomationError):
     """스키마 오류"""
     pass
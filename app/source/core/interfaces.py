@@ -7,8 +7,8 @@ class JiraClient(ABC):
     """Jira 클라이언트 인터페이스"""
     
     @abstractmethod
-    def get_issue(self, issue_key: str) -> Dict[str, Any]:
-        """이슈 정보 조회"""
+    def get_issue(self, issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Dict[str, Any]:
+        """이슈 정보 조회 (fields/expand로 응답 범위 지정 가능)"""
         pass
     
     @abstractmethod
@@ -39,6 +39,11 @@ class JiraFieldMapper(ABC):
         """응답 데이터 변환"""
         pass
 
+    @abstractmethod
+    def transform_many(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 이슈 응답 데이터 일괄 변환"""
+        pass
+
     @abstractmethod
     def set_mapping_provider(self, provider):
         """매핑 제공자 설정"""
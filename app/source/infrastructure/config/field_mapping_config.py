@@ -37,6 +37,7 @@ class FieldMappingConfig:
         self.config_path = config_path
         self.field_patterns: Dict[str, FieldPattern] = {}
         self.domain_configs: Dict[str, DomainConfig] = {}
+        self.always_enriched_fields: Dict[str, List[str]] = {}
         self._load_config()
     
     def _load_config(self) -> None:
@@ -64,6 +65,10 @@ class FieldMappingConfig:
                     is_list=pattern_data.get('is_list', False),
                     value_key=pattern_data.get('value_key')  # 값 키 파싱 추가
                 )
+            
+            # 템플릿과 관계없이 항상 보강할 컬럼 (저장 경로 생성 등)
+            for field_name, columns in (config.get('enrichment_plan') or {}).get('always_include', {}).items():
+                self.always_enriched_fields[field_name] = list(columns or [])
                 
         except Exception as e:
             raise RuntimeError(f"Failed to load field mapping config from {self.config_path}: {str(e)}")
@@ -104,4 +109,12 @@ class FieldMappingConfig:
         Returns:
             도메인 설정 딕셔너리
         """
-        return self.domain_configs 
\ No newline at end of file
+        return self.domain_configs
+    
+    def get_always_enriched_fields(self) -> Dict[str, List[str]]:
+        """템플릿 사용 여부와 관계없이 항상 보강할 필드별 컬럼 조회
+        
+        Returns:
+            필드 이름 -> 컬럼 이름 목록
+        """
+        return self.always_enriched_fields
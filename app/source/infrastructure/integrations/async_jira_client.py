@@ -0,0 +1,134 @@
+"""
+asyncio 기반 Jira 클라이언트
+
+JiraClient의 풀링 세션(keep-alive, 재시도)을 그대로 사용하면서 블로킹 HTTP 호출을
+전용 스레드 풀에서 실행한다. 첨부 파일은 세마포어로 동시 요청 수를 제한하며
+병렬로 다운로드한다.
+"""
+
+from typing import Dict, Any, List, Optional, Callable
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import functools
+import threading
+import tempfile
+import logging
+from app.source.core.interfaces import JiraClient as JiraClientInterface
+from app.source.infrastructure.integrations.jira_client import JiraClient
+
+
+class AsyncJiraClient(JiraClientInterface):
+    """비동기 Jira 클라이언트 (core.interfaces.JiraClient 계약의 async 버전)"""
+
+    def __init__(self, jira_client: JiraClient, max_concurrency: int = 4, logger: logging.Logger = None):
+        """AsyncJiraClient 초기화
+
+        Args:
+            jira_client (JiraClient): HTTP 호출에 사용할 동기 클라이언트 (풀링 세션 공유)
+            max_concurrency (int): 동시에 진행할 최대 요청 수
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        self.jira_client = jira_client
+        self.max_concurrency = max(1, max_concurrency)
+        self.logger = logger or jira_client.logger
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_concurrency,
+            thread_name_prefix="jira-async"
+        )
+        self.logger.debug("AsyncJiraClient initialized (max_concurrency=%d)", self.max_concurrency)
+
+    async def _run(self, func: Callable, *args, **kwargs) -> Any:
+        """블로킹 호출을 전용 스레드 풀에서 실행"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def get_issue(self, issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Dict[str, Any]:
+        """이슈 정보 조회"""
+        return await self._run(self.jira_client.get_issue, issue_key, fields=fields, expand=expand)
+
+    async def get_issue_fields(self, issue_key: str, fields: List[str] = None) -> Dict[str, Any]:
+        """이슈 필드 조회"""
+        return await self._run(self.jira_client.get_issue_fields, issue_key, fields)
+
+    async def upload_attachment(self, issue_key: str, file_path: str) -> Dict[str, Any]:
+        """이슈에 첨부 파일 업로드"""
+        return await self._run(self.jira_client.upload_attachment, issue_key, file_path)
+
+    async def download_attachments(self, issue_key: str) -> List[str]:
+        """이슈 첨부 파일을 병렬로 다운로드
+
+        Args:
+            issue_key (str): 이슈 키 (예: "PROJ-123")
+
+        Returns:
+            List[str]: 다운로드된 파일 경로 목록 (첨부 순서 유지, 실패한 파일 제외)
+        """
+        issue_data = await self.get_issue(issue_key, fields=["attachment"])
+        attachments = issue_data["fields"]["attachment"]
+
+        if not attachments:
+            self.logger.info("No attachments found for issue %s.", issue_key)
+            return []
+        save_dir = None if self.jira_client.attachment_cache else tempfile.mkdtemp()
+
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def download(attachment: Dict[str, Any]) -> Optional[str]:
+            async with semaphore:
+                return await self._run(self.jira_client._download_attachment, attachment, save_dir)
+
+        results = await asyncio.gather(*(download(attachment) for attachment in attachments))
+        downloaded_files = [path for path in results if path]
+        self.logger.info("Downloaded %d/%d attachments for issue %s",
+                         len(downloaded_files), len(attachments), issue_key)
+        return downloaded_files
+
+    def close(self) -> None:
+        """스레드 풀 종료"""
+        self._executor.shutdown(wait=False)
+
+
+class ConcurrentJiraClient(JiraClient):
+    """동기 인터페이스를 유지하면서 첨부 파일 다운로드를 병렬화한 JiraClient
+
+    DownloadDocumentStrategy, PictureAttatchedDocumentStrategy 등 기존 호출부는
+    수정 없이 그대로 사용한다.
+    """
+
+    def __init__(self, *args, max_concurrency: int = 4, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.async_client = AsyncJiraClient(self, max_concurrency=max_concurrency, logger=self.logger)
+
+    def download_attachments(self, issue_key: str) -> List[str]:
+        """이슈 첨부 파일 병렬 다운로드 (동기 래퍼)"""
+        return self._run_sync(self.async_client.download_attachments(issue_key))
+
+    def _run_sync(self, coroutine) -> Any:
+        """코루틴을 동기적으로 실행
+
+        이미 이벤트 루프가 실행 중인 스레드에서 호출되면 별도 스레드에서 실행한다.
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+
+        result = {}
+
+        def runner():
+            try:
+                result["value"] = asyncio.run(coroutine)
+            except BaseException as e:
+                result["error"] = e
+
+        thread = threading.Thread(target=runner, name="jira-sync-bridge")
+        thread.start()
+        thread.join()
+        if "error" in result:
+            raise result["error"]
+        return result["value"]
+
+    def close(self) -> None:
+        """스레드 풀과 HTTP 커넥션 풀 종료"""
+        self.async_client.close()
+        super().close()
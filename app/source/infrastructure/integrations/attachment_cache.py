@@ -0,0 +1,198 @@
+"""
+Jira 첨부 파일 로컬 캐시
+
+첨부 파일 id + size + created 로 만든 키를 디렉토리 이름으로 사용하는 디스크 캐시.
+같은 첨부 파일(예: 상위 이슈 사진)을 여러 문서가 사용해도 한 번만 내려받는다.
+
+- 바이트 예산을 넘으면 가장 오래 사용되지 않은 항목부터 삭제 (mtime 기반 LRU)
+- 항목별/eviction용 파일 잠금(fcntl)으로 여러 프로세스가 동시에 읽고 써도 안전
+- 파일은 임시 이름으로 받은 뒤 원자적으로 rename 되므로 읽는 쪽은 완성된 파일만 본다
+"""
+
+from typing import Dict, Any, Optional, Callable, Iterator
+from contextlib import contextmanager
+import hashlib
+import os
+import shutil
+import threading
+import time
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
+
+class AttachmentCache:
+    """첨부 파일 디스크 캐시 (LRU, 프로세스 간 안전)"""
+
+    def __init__(self, cache_dir: str, max_bytes: int = 1024 * 1024 * 1024,
+                 min_age_seconds: float = 60.0, logger: logging.Logger = None):
+        """AttachmentCache 초기화
+
+        Args:
+            cache_dir (str): 캐시 루트 디렉토리
+            max_bytes (int): 캐시 바이트 예산
+            min_age_seconds (float): 최근 사용된 항목은 이 시간 동안 삭제하지 않음
+                                     (다른 요청이 막 받은 경로를 복사하기 전에 지워지지 않도록)
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.min_age_seconds = min_age_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self.objects_dir = os.path.join(cache_dir, "objects")
+        self.locks_dir = os.path.join(cache_dir, "locks")
+        os.makedirs(self.objects_dir, exist_ok=True)
+        os.makedirs(self.locks_dir, exist_ok=True)
+
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self.logger.debug("AttachmentCache initialized at %s (max_bytes=%d)", cache_dir, max_bytes)
+
+    @staticmethod
+    def cache_key(attachment: Dict[str, Any]) -> Optional[str]:
+        """attachment 메타데이터로 캐시 키 생성 (id가 없으면 None)"""
+        attachment_id = attachment.get("id")
+        if not attachment_id:
+            return None
+        raw = f"{attachment_id}:{attachment.get('size')}:{attachment.get('created')}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get_or_fetch(self, attachment: Dict[str, Any], fetch: Callable[[str], None]) -> str:
+        """캐시된 파일 경로 반환, 없으면 fetch로 내려받아 저장
+
+        Args:
+            attachment (Dict[str, Any]): 이슈의 attachment 메타데이터
+            fetch (Callable[[str], None]): 주어진 경로에 파일을 저장하는 함수
+
+        Returns:
+            str: 캐시 내 파일 경로 (원본 파일명 유지)
+        """
+        key = self.cache_key(attachment)
+        if key is None:
+            raise ValueError("Attachment has no id, cannot be cached")
+
+        entry_dir = os.path.join(self.objects_dir, key[:2], key)
+        path = os.path.join(entry_dir, os.path.basename(attachment["filename"]))
+
+        if self._lookup(path):
+            return path
+
+        with self._file_lock(os.path.join(self.locks_dir, f"{key}.lock")):
+            # 잠금을 기다리는 동안 다른 프로세스가 받았을 수 있음
+            if self._lookup(path):
+                return path
+            self._record("misses")
+            os.makedirs(entry_dir, exist_ok=True)
+            fetch(path)
+            self.logger.debug("Attachment cached: %s", path)
+
+        self.evict()
+        return path
+
+    def _lookup(self, path: str) -> bool:
+        """캐시 적중 여부 확인 및 LRU 시각 갱신"""
+        if not os.path.exists(path):
+            return False
+        try:
+            os.utime(path)
+        except OSError:
+            return False
+        self._record("hits")
+        self.logger.debug("Attachment cache hit: %s", path)
+        return True
+
+    def evict(self) -> int:
+        """바이트 예산을 초과한 만큼 오래된 항목 삭제
+
+        Returns:
+            int: 삭제한 항목 수
+        """
+        with self._file_lock(os.path.join(self.locks_dir, ".evict.lock")):
+            entries = []
+            total = 0
+            for entry_dir, size, last_used in self._iter_entries():
+                entries.append((last_used, size, entry_dir))
+                total += size
+            if total <= self.max_bytes:
+                return 0
+
+            entries.sort()
+            now = time.time()
+            removed = 0
+            for last_used, size, entry_dir in entries:
+                if total <= self.max_bytes:
+                    break
+                if now - last_used < self.min_age_seconds:
+                    continue
+                key = os.path.basename(entry_dir)
+                # 다운로드 중인 항목은 건너뜀
+                with self._file_lock(os.path.join(self.locks_dir, f"{key}.lock"), blocking=False) as acquired:
+                    if not acquired:
+                        continue
+                    shutil.rmtree(entry_dir, ignore_errors=True)
+                total -= size
+                removed += 1
+
+        if removed:
+            self._record("evictions", removed)
+            self.logger.info("Evicted %d attachment cache entries (now %d bytes)", removed, total)
+        return removed
+
+    def _iter_entries(self) -> Iterator:
+        """(항목 디렉토리, 바이트 수, 마지막 사용 시각) 순회"""
+        for prefix in os.scandir(self.objects_dir):
+            if not prefix.is_dir():
+                continue
+            for entry in os.scandir(prefix.path):
+                if not entry.is_dir():
+                    continue
+                size = 0
+                last_used = 0.0
+                for item in os.scandir(entry.path):
+                    try:
+                        stat = item.stat()
+                    except FileNotFoundError:
+                        continue
+                    size += stat.st_size
+                    last_used = max(last_used, stat.st_mtime)
+                yield entry.path, size, last_used
+
+    @contextmanager
+    def _file_lock(self, lock_path: str, blocking: bool = True):
+        """프로세스 간 배타 잠금 (fcntl.flock)"""
+        if fcntl is None:
+            yield True
+            return
+        with open(lock_path, "a") as lock_file:
+            flags = fcntl.LOCK_EX if blocking else fcntl.LOCK_EX | fcntl.LOCK_NB
+            try:
+                fcntl.flock(lock_file.fileno(), flags)
+            except BlockingIOError:
+                yield False
+                return
+            try:
+                yield True
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+    def _record(self, counter: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            setattr(self, f"_{counter}", getattr(self, f"_{counter}") + amount)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 적중률 통계 반환 (현재 프로세스 기준)"""
+        with self._stats_lock:
+            hits, misses, evictions = self._hits, self._misses, self._evictions
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "evictions": evictions,
+            "hit_rate": (hits / lookups) if lookups else 0.0,
+            "max_bytes": self.max_bytes,
+        }
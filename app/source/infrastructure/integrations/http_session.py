@@ -0,0 +1,198 @@
+"""
+Jira 통신용 HTTP 세션 풀
+
+커넥션 풀(keep-alive)과 재시도/백오프 정책을 가진 requests 어댑터를 하나 만들어
+스레드별 세션이 공유하도록 한다. Flask 워커 스레드마다 TCP+TLS 핸드셰이크를
+반복하지 않도록 하는 것이 목적이다. RateLimiter를 지정하면 모든 요청이 공용
+속도 제한기를 거치며, 429 응답은 서버가 알려 준 시간만큼 기다린 뒤 재시도한다.
+"""
+
+from contextlib import ExitStack
+from dataclasses import dataclass, fields
+from typing import Dict, Any, Optional, Tuple
+import threading
+import time
+import logging
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from app.source.infrastructure.integrations.rate_limiter import RateLimiter
+
+
+@dataclass
+class HttpPoolConfig:
+    """HTTP 커넥션 풀 설정"""
+    pool_connections: int = 10          # 호스트별 풀 개수 (PoolManager 캐시 크기)
+    pool_maxsize: int = 20              # 호스트당 최대 유지 커넥션 수
+    pool_block: bool = False            # 풀이 가득 찼을 때 대기 여부
+    max_retries: int = 3                # 5xx/연결 오류 재시도 횟수
+    backoff_factor: float = 0.5         # 지수 백오프 계수 (0.5, 1, 2, ...초)
+    status_forcelist: Tuple[int, ...] = (500, 502, 503, 504)
+    connect_timeout: float = 5.0
+    read_timeout: float = 30.0
+    keep_alive: bool = True
+
+    @classmethod
+    def from_dict(cls, config: Optional[Dict[str, Any]]) -> "HttpPoolConfig":
+        """설정 딕셔너리에서 생성 (알 수 없는 키는 무시)"""
+        if not config:
+            return cls()
+        known = {f.name for f in fields(cls)}
+        values = {k: v for k, v in config.items() if k in known}
+        if "status_forcelist" in values:
+            values["status_forcelist"] = tuple(values["status_forcelist"])
+        return cls(**values)
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """requests timeout 인자 (connect, read)"""
+        return (self.connect_timeout, self.read_timeout)
+
+
+class PooledHttpSession:
+    """스레드 안전한 풀링 HTTP 세션
+
+    커넥션 풀은 하나의 HTTPAdapter(urllib3 PoolManager)에 있고, requests.Session은
+    스레드마다 따로 만들어 같은 어댑터를 마운트한다. 세션의 쿠키/헤더 상태는
+    스레드 간에 공유되지 않고, 커넥션만 공유된다.
+    """
+
+    def __init__(self, config: Optional[HttpPoolConfig] = None, logger: logging.Logger = None,
+                 rate_limiter: Optional[RateLimiter] = None):
+        self.config = config or HttpPoolConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self.rate_limiter = rate_limiter
+        self.adapter = HTTPAdapter(
+            pool_connections=self.config.pool_connections,
+            pool_maxsize=self.config.pool_maxsize,
+            pool_block=self.config.pool_block,
+            max_retries=self._build_retry(),
+        )
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+        self.logger.debug(
+            "PooledHttpSession initialized (pool_connections=%d, pool_maxsize=%d, max_retries=%d)",
+            self.config.pool_connections, self.config.pool_maxsize, self.config.max_retries
+        )
+
+    def _build_retry(self) -> Retry:
+        """5xx 응답과 연결 재설정에 대한 재시도 정책 생성"""
+        return Retry(
+            total=self.config.max_retries,
+            connect=self.config.max_retries,
+            read=self.config.max_retries,
+            status=self.config.max_retries,
+            backoff_factor=self.config.backoff_factor,
+            status_forcelist=self.config.status_forcelist,
+            raise_on_status=False,
+            # 속도 제한기가 있으면 429/Retry-After는 제한기가 처리 (urllib3가 숨기지 않도록)
+            respect_retry_after_header=self.rate_limiter is None,
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """현재 스레드의 세션 반환 (없으면 생성)"""
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.mount("https://", self.adapter)
+            session.mount("http://", self.adapter)
+            if self.config.keep_alive:
+                session.headers["Connection"] = "keep-alive"
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """풀링된 커넥션으로 요청 수행 (속도 제한기가 있으면 거쳐서 전송)
+        
+        stream=True 요청은 본문을 다 읽을 때까지 동시성 슬롯을 점유하므로
+        호출자는 반드시 response.close()(또는 with 문)로 응답을 닫아야 한다.
+        """
+        kwargs.setdefault("timeout", self.config.timeout)
+        if self.rate_limiter is None:
+            return self.session.request(method, url, **kwargs)
+        
+        attempt = 0
+        while True:
+            with ExitStack() as slot:
+                slot.enter_context(self.rate_limiter.slot())
+                started = time.monotonic()
+                response = self.session.request(method, url, **kwargs)
+                throttled = self.rate_limiter.observe(response, time.monotonic() - started)
+                done = not throttled or attempt >= self.rate_limiter.config.max_retries
+                if done and kwargs.get("stream"):
+                    # 헤더만 받은 상태이므로 본문 다운로드가 끝나 응답을 닫을 때 슬롯 반납
+                    self._release_on_close(response, slot.pop_all())
+            if done:
+                return response
+            attempt += 1
+            response.close()
+            # 스트리밍 본문은 처음부터 다시 전송
+            body = kwargs.get("data")
+            if hasattr(body, "seek"):
+                body.seek(0)
+            self.logger.debug("Retrying %s %s after rate limit (attempt %d)", method, url, attempt)
+
+    @staticmethod
+    def _release_on_close(response: requests.Response, slot: ExitStack) -> None:
+        """응답을 닫을 때 슬롯도 반납하도록 close 교체 (여러 번 닫아도 한 번만 반납)"""
+        close = response.close
+        
+        def close_and_release():
+            try:
+                close()
+            finally:
+                slot.close()
+        
+        response.close = close_and_release
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """풀 사용 통계 반환
+
+        hits는 기존 커넥션을 재사용한 요청 수, misses는 새 커넥션을 연 횟수이다.
+        """
+        hosts = {}
+        total_requests = 0
+        total_connections = 0
+        pools = self.adapter.poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            requests_made = getattr(pool, "num_requests", 0)
+            connections = getattr(pool, "num_connections", 0)
+            total_requests += requests_made
+            total_connections += connections
+            hosts[f"{pool.scheme}://{pool.host}:{pool.port}"] = {
+                "requests": requests_made,
+                "connections": connections,
+                "idle": pool.pool.qsize() if pool.pool is not None else 0,
+            }
+        hits = max(total_requests - total_connections, 0)
+        return {
+            "requests": total_requests,
+            "hits": hits,
+            "misses": total_connections,
+            "hit_rate": (hits / total_requests) if total_requests else 0.0,
+            "pool_maxsize": self.config.pool_maxsize,
+            "hosts": hosts,
+        }
+
+    def close(self) -> None:
+        """모든 스레드 세션과 커넥션 풀 종료"""
+        with self._lock:
+            for session in self._sessions:
+                session.close()
+            self._sessions.clear()
+        self.adapter.close()
+        self._local = threading.local()
+        self.logger.debug("PooledHttpSession closed")
@@ -0,0 +1,166 @@
+"""
+Jira 이슈 TTL 캐시
+
+웹훅으로 받은 이슈와 API로 조회한 이슈를 원본(필드 매핑 전) 형태로 보관한다.
+항목은 이슈 키 + fields.updated 로 식별되며, 더 오래된 updated 값으로는 덮어쓰지 않는다.
+fields=/expand= 로 일부만 조회한 결과는 같은 이슈의 별도 변형(variant)으로 보관한다.
+TTL이 지난 항목은 ETag가 있으면 조건부 요청으로 재검증할 수 있도록 남겨 둔다.
+"""
+
+from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import copy
+import threading
+import time
+import logging
+
+
+@dataclass
+class IssueCacheEntry:
+    """이슈 캐시 항목"""
+    issue_key: str
+    updated: Optional[str]
+    data: Dict[str, Any]
+    etag: Optional[str]
+    stored_at: float
+
+    def is_fresh(self, ttl_seconds: float, now: float = None) -> bool:
+        """TTL 이내인지 여부"""
+        return ((now or time.monotonic()) - self.stored_at) < ttl_seconds
+
+
+class IssueCache:
+    """크기 제한이 있는 스레드 안전 이슈 캐시 (LRU + TTL)"""
+
+    def __init__(self, ttl_seconds: float = 60.0, max_entries: int = 512, logger: logging.Logger = None):
+        """IssueCache 초기화
+
+        Args:
+            ttl_seconds (float): 재조회 없이 사용할 수 있는 시간 (초)
+            max_entries (int): 최대 보관 이슈 수
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.logger = logger or logging.getLogger(__name__)
+        self._entries: "OrderedDict[Tuple[str, str], IssueCacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._revalidations = 0
+
+    def lookup(self, issue_key: str, variant: str = "") -> Optional[IssueCacheEntry]:
+        """캐시 항목 조회 (TTL이 지난 항목도 반환 - 재검증용)
+
+        Args:
+            issue_key (str): 이슈 키
+            variant (str): 조회 파라미터 식별자 (전체 이슈는 빈 문자열)
+        """
+        key = (issue_key, variant)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry.is_fresh(self.ttl_seconds):
+                self._hits += 1
+            else:
+                self._misses += 1
+            return entry
+
+    def lookup_projection(self, issue_key: str, variant: str) -> Tuple[Optional[IssueCacheEntry], bool]:
+        """필드 일부 조회용 항목 조회 (적중/실패는 한 번만 기록)
+
+        유효한 전체 이슈가 있으면 그 항목을, 없으면 변형 항목을 반환한다 (TTL이 지난 변형 항목 포함 - 재검증용).
+
+        Args:
+            issue_key (str): 이슈 키
+            variant (str): 조회 파라미터 식별자
+
+        Returns:
+            Tuple[Optional[IssueCacheEntry], bool]: (항목, 전체 이슈 항목 여부)
+        """
+        with self._lock:
+            full = self._entries.get((issue_key, ""))
+            if full is not None and full.is_fresh(self.ttl_seconds):
+                self._entries.move_to_end((issue_key, ""))
+                self._hits += 1
+                return full, True
+            entry = self._entries.get((issue_key, variant))
+            if entry is None:
+                self._misses += 1
+                return None, False
+            self._entries.move_to_end((issue_key, variant))
+            if entry.is_fresh(self.ttl_seconds):
+                self._hits += 1
+            else:
+                self._misses += 1
+            return entry, False
+
+    def put(self, issue_data: Dict[str, Any], etag: Optional[str] = None, variant: str = "") -> bool:
+        """원본 이슈 데이터 저장
+
+        Args:
+            issue_data (Dict[str, Any]): Jira 원본 이슈 데이터 (key, fields.updated 포함)
+            etag (str, optional): 응답의 ETag 헤더
+            variant (str): 조회 파라미터 식별자 (전체 이슈는 빈 문자열)
+
+        Returns:
+            bool: 저장 여부 (이미 더 최신 버전이 있으면 False)
+        """
+        issue_key = issue_data.get("key")
+        if not issue_key:
+            return False
+        updated = (issue_data.get("fields") or {}).get("updated")
+
+        key = (issue_key, variant)
+        with self._lock:
+            current = self._entries.get(key)
+            if current is not None and current.updated and updated and updated < current.updated:
+                self.logger.debug("Ignoring stale issue data for %s (updated=%s < %s)",
+                                  issue_key, updated, current.updated)
+                return False
+            self._entries[key] = IssueCacheEntry(
+                issue_key=issue_key,
+                updated=updated,
+                data=copy.deepcopy(issue_data),
+                etag=etag,
+                stored_at=time.monotonic(),
+            )
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return True
+
+    def mark_revalidated(self, issue_key: str, variant: str = "") -> None:
+        """304 응답 후 항목의 TTL 갱신"""
+        with self._lock:
+            entry = self._entries.get((issue_key, variant))
+            if entry is not None:
+                entry.stored_at = time.monotonic()
+                self._revalidations += 1
+
+    def invalidate(self, issue_key: str) -> None:
+        """이슈의 모든 변형 제거 (이슈가 변경된 경우)"""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == issue_key]:
+                del self._entries[key]
+
+    def clear(self) -> None:
+        """모든 항목 제거"""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "revalidations": self._revalidations,
+                "hit_rate": (self._hits / lookups) if lookups else 0.0,
+            }
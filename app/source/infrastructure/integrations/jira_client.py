@@ -1,17 +1,25 @@
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Iterator
+from concurrent.futures import ThreadPoolExecutor
 import requests
 from requests.auth import HTTPBasicAuth
 import os
+import copy
 import json
 import re
+import hashlib
+import tempfile
 import logging
 from app.source.core.interfaces import JiraClient, JiraFieldMapper
 from app.source.infrastructure.mapping.jira_field_mapper import ApiJiraFieldMappingProvider, JiraFieldMapperimpl
+from app.source.infrastructure.integrations.http_session import HttpPoolConfig, PooledHttpSession
+from app.source.infrastructure.integrations.attachment_cache import AttachmentCache
+from app.source.infrastructure.integrations.issue_cache import IssueCache
+from app.source.infrastructure.integrations.multipart import StreamingMultipartBody
 
 class JiraClient(JiraClient):
     """Jira API와 통신하는 클라이언트"""
     
-    def __init__(self, jira_base_url = os.getenv("JIRA_BASE_URL"), username = os.getenv("JIRA_USERNAME"), api_token = os.getenv("JIRA_API_TOKEN"), download_dir: str = None, field_mapper: Optional[JiraFieldMapper] = None, logger: logging.Logger = None):
+    def __init__(self, jira_base_url = os.getenv("JIRA_BASE_URL"), username = os.getenv("JIRA_USERNAME"), api_token = os.getenv("JIRA_API_TOKEN"), download_dir: str = None, field_mapper: Optional[JiraFieldMapper] = None, logger: logging.Logger = None, http_config: Optional[Dict[str, Any]] = None, http_session: Optional[PooledHttpSession] = None, download_chunk_size: int = 64 * 1024, max_resume_attempts: int = 3, attachment_cache: Optional[AttachmentCache] = None, issue_cache: Optional[IssueCache] = None):
         """JiraClient 초기화
         
         Args:
@@ -21,14 +29,27 @@ class JiraClient(JiraClient):
             download_dir (str, optional): 첨부 파일 다운로드 기본 경로
             field_mapper (JiraFieldMapper, optional): Jira 필드 매퍼
             logger (logging.Logger, optional): 로거 인스턴스
+            http_config (Dict[str, Any], optional): 커넥션 풀/재시도 설정 (HttpPoolConfig 필드)
+            http_session (PooledHttpSession, optional): 공유할 풀링 세션 (없으면 새로 생성)
+            download_chunk_size (int): 첨부 파일 스트리밍 청크 크기 (바이트)
+            max_resume_attempts (int): 다운로드 중단 시 Range 요청으로 이어받기 재시도 횟수
+            attachment_cache (AttachmentCache, optional): 첨부 파일 디스크 캐시
+            issue_cache (IssueCache, optional): 이슈 조회 TTL 캐시
         """
         self.jira_base_url = jira_base_url
         self.auth = HTTPBasicAuth(username, api_token)
         self.headers = {"Accept": "application/json"}
         self.download_dir = download_dir or os.path.join(os.getcwd(), "downloads")
         self.field_mapper = field_mapper
+        self.download_chunk_size = download_chunk_size
+        self.max_resume_attempts = max_resume_attempts
+        self.attachment_cache = attachment_cache
+        self.issue_cache = issue_cache
         self.logger = logger or logging.getLogger(__name__)
         
+        # 워커 스레드 간에 공유되는 keep-alive 커넥션 풀
+        self.http = http_session or PooledHttpSession(HttpPoolConfig.from_dict(http_config), logger=self.logger)
+        
         # 다운로드 디렉토리 생성
         os.makedirs(self.download_dir, exist_ok=True)
         
@@ -52,11 +73,13 @@ class JiraClient(JiraClient):
             raise Exception("Field mapper is not set")
 
     
-    def get_issue(self, issue_key: str) -> Dict[str, Any]:
+    def get_issue(self, issue_key: str, fields: Optional[List[str]] = None, expand: Optional[List[str]] = None) -> Dict[str, Any]:
         """이슈 정보 조회
         
         Args:
             issue_key (str): 이슈 키 (예: "PROJ-123")
+            fields (List[str], optional): 조회할 필드 (매핑된 이름 또는 Jira 필드 ID, 없으면 전체)
+            expand (List[str], optional): expand 파라미터 (예: ["renderedFields"])
             
         Returns:
             Dict[str, Any]: 이슈 정보
@@ -64,24 +87,96 @@ class JiraClient(JiraClient):
         Raises:
             Exception: API 호출 실패 시
         """
+        params = self._build_issue_params(fields, expand)
+        variant = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        
+        headers = self.headers
+        cached_entry = None
+        if self.issue_cache:
+            # 전체 이슈가 캐시에 있으면 요청한 필드만 잘라서 반환 (캐시 통계는 조회당 한 번만 기록)
+            if variant and not params.get("expand") and self._is_plain_projection(params):
+                cached_entry, is_full = self.issue_cache.lookup_projection(issue_key, variant)
+                if is_full:
+                    self.logger.debug("Issue cache hit (projected from full issue): %s", issue_key)
+                    return self._transform_issue(self._project_issue(cached_entry.data, params["fields"].split(",")))
+            else:
+                cached_entry = self.issue_cache.lookup(issue_key, variant)
+            if cached_entry and cached_entry.is_fresh(self.issue_cache.ttl_seconds):
+                self.logger.debug("Issue cache hit: %s (updated=%s)", issue_key, cached_entry.updated)
+                return self._transform_issue(copy.deepcopy(cached_entry.data))
+            if cached_entry and cached_entry.etag:
+                # ETag가 있으면 조건부 요청으로 재검증
+                headers = {**self.headers, "If-None-Match": cached_entry.etag}
+        
         issue_url = f"{self.jira_base_url}/rest/api/2/issue/{issue_key}"
-        response = requests.get(issue_url, headers=self.headers, auth=self.auth)
+        response = self.http.get(issue_url, headers=headers, auth=self.auth, params=params or None)
         
-        if response.status_code == 200:
+        if response.status_code == 304 and cached_entry is not None:
+            self.logger.debug("Issue not modified: %s", issue_key)
+            self.issue_cache.mark_revalidated(issue_key, variant)
+            return self._transform_issue(copy.deepcopy(cached_entry.data))
+        elif response.status_code == 200:
             self.logger.info(f"Successfully fetched issue: {issue_key}")
             data = response.json()
             
-            # 필드 매퍼가 설정된 경우 응답 변환
-            if self.field_mapper:
-                data = self.field_mapper.transform_response(data)
+            if self.issue_cache:
+                self.issue_cache.put(data, etag=response.headers.get("ETag"), variant=variant)
             
-            return data
+            return self._transform_issue(data)
         else:
             error_msg = f"Failed to fetch issue {issue_key}: {response.status_code} - {response.text}"
             self.logger.error(error_msg)
             raise Exception(error_msg)
+    
+    def _build_issue_params(self, fields: Optional[List[str]], expand: Optional[List[str]]) -> Dict[str, str]:
+        """fields=/expand= 쿼리 파라미터 생성 (매핑된 필드 이름은 Jira 필드 ID로 변환)
         
+        Args:
+            fields (List[str], optional): 필드 이름 또는 ID 목록
+            expand (List[str], optional): expand 항목 목록
+            
+        Returns:
+            Dict[str, str]: 쿼리 파라미터
+        """
+        params = {}
+        if fields:
+            field_ids = []
+            for field in fields:
+                field_id = self.field_mapper.map_field_name_to_id(field) if self.field_mapper else field
+                if field_id not in field_ids:
+                    field_ids.append(field_id)
+            params["fields"] = ",".join(field_ids)
+        if expand:
+            params["expand"] = ",".join(expand)
+        return params
+    
+    @staticmethod
+    def _is_plain_projection(params: Dict[str, str]) -> bool:
+        """`*all`, `-comment` 같은 특수 문법 없이 필드 ID만 나열된 경우"""
+        return "fields" in params and not any(f.startswith(("*", "-")) for f in params["fields"].split(","))
     
+    @staticmethod
+    def _project_issue(data: Dict[str, Any], field_ids: List[str]) -> Dict[str, Any]:
+        """원본 이슈에서 지정한 필드만 남긴 사본 생성"""
+        source_fields = data.get("fields") or {}
+        projected = {k: v for k, v in data.items() if k != "fields"}
+        projected["fields"] = {k: source_fields[k] for k in field_ids if k in source_fields}
+        return copy.deepcopy(projected)
+    
+    def _transform_issue(self, data: Dict[str, Any]) -> Dict[str, Any]:
+        """필드 매퍼가 설정된 경우 응답 변환"""
+        if self.field_mapper:
+            data = self.field_mapper.transform_response(data)
+        return data
+    
+    def seed_issue(self, issue_data: Dict[str, Any]) -> None:
+        """웹훅 등으로 이미 받은 원본 이슈 데이터를 캐시에 등록
+        
+        Args:
+            issue_data (Dict[str, Any]): 필드 매핑 전 Jira 이슈 데이터
+        """
+        if self.issue_cache and issue_data:
+            self.issue_cache.put(issue_data)
     
     def download_attachments(self, issue_key: str, ) -> List[str]:
         """이슈 첨부 파일 다운로드
@@ -92,30 +187,75 @@ class JiraClient(JiraClient):
         Returns:
             List[str]: 다운로드된 파일 경로 목록
         """
-        issue_data = self.get_issue(issue_key)
+        issue_data = self.get_issue(issue_key, fields=["attachment"])
         attachments = issue_data["fields"]["attachment"]
         
         if not attachments:
             self.logger.info(f"No attachments found for issue {issue_key}.")
             return []
-        import tempfile
-        save_dir = os.path.join(tempfile.mkdtemp())
+        # 캐시를 쓰는 경우 임시 디렉토리는 필요할 때만 생성
+        save_dir = None if self.attachment_cache else tempfile.mkdtemp()
         
         # 첨부 파일 다운로드
         downloaded_files = []
         for attachment in attachments:
-            attachment_url = attachment["content"]
-            file_name = attachment["filename"]
-            save_path = os.path.join(save_dir, file_name)
-            
-            try:
-                self._download_file(attachment_url, save_path)
+            save_path = self._download_attachment(attachment, save_dir)
+            if save_path:
                 downloaded_files.append(save_path)
-            except Exception as e:
-                self.logger.error(f"Failed to download attachment {file_name}: {str(e)}")
         
         return downloaded_files
     
+    def _download_attachment(self, attachment: Dict[str, Any], save_dir: Optional[str] = None) -> Optional[str]:
+        """첨부 파일 하나 다운로드
+        
+        캐시가 설정되어 있으면 캐시 경로를 반환하며, 적중 시 네트워크 요청을 하지 않는다.
+        
+        Args:
+            attachment (Dict[str, Any]): 이슈의 attachment 메타데이터
+            save_dir (str, optional): 저장 디렉토리 (캐시 미사용 시, 없으면 임시 디렉토리)
+            
+        Returns:
+            Optional[str]: 저장된 파일 경로 (실패 시 None)
+        """
+        attachment_url = attachment["content"]
+        file_name = attachment["filename"]
+        
+        def fetch(save_path: str) -> None:
+            self._download_file(
+                attachment_url,
+                save_path,
+                expected_size=attachment.get("size"),
+                expected_checksum=attachment.get("checksum")
+            )
+        
+        try:
+            if self.attachment_cache and AttachmentCache.cache_key(attachment):
+                return self.attachment_cache.get_or_fetch(attachment, fetch)
+            
+            save_path = self._attachment_save_path(attachment, save_dir)
+            fetch(save_path)
+            return save_path
+        except Exception as e:
+            self.logger.error(f"Failed to download attachment {file_name}: {str(e)}")
+            return None
+    
+    @staticmethod
+    def _attachment_save_path(attachment: Dict[str, Any], save_dir: Optional[str] = None) -> str:
+        """첨부 파일별 저장 경로 (캐시 미사용 시)
+        
+        같은 이슈에 파일명이 같은 첨부가 여러 개일 수 있으므로 첨부 id별 하위 디렉토리에 저장한다.
+        (병렬 다운로드 시 같은 경로나 .part 파일을 공유해 이어받기가 서로의 파일에 덧붙이지 않도록)
+        id가 없으면 고유한 임시 하위 디렉토리를 사용한다.
+        """
+        base_dir = save_dir or tempfile.mkdtemp()
+        attachment_id = attachment.get("id")
+        if attachment_id:
+            target_dir = os.path.join(base_dir, os.path.basename(str(attachment_id)))
+            os.makedirs(target_dir, exist_ok=True)
+        else:
+            target_dir = tempfile.mkdtemp(dir=base_dir)
+        return os.path.join(target_dir, os.path.basename(attachment["filename"]))
+    
     def get_issue_fields(self, issue_key: str, fields: List[str] = None) -> Dict[str, Any]:
         """특정 이슈의 필드 값 조회
         
@@ -126,7 +266,8 @@ class JiraClient(JiraClient):
         Returns:
             Dict[str, Any]: 필드 이름과 값으로 구성된 딕셔너리
         """
-        issue_data = self.get_issue(issue_key)
+        # 요청한 필드만 서버에서 받아옴
+        issue_data = self.get_issue(issue_key, fields=fields)
         issue_fields = issue_data["fields"]
         
         if not fields:
@@ -142,6 +283,66 @@ class JiraClient(JiraClient):
         
         return result
     
+    def search(self, jql: str, fields: Optional[List[str]] = None, page_size: int = 100, expand: Optional[List[str]] = None) -> Iterator[Dict[str, Any]]:
+        """JQL로 이슈를 페이지 단위로 조회하는 제너레이터
+        
+        현재 페이지를 호출부가 처리하는 동안 다음 페이지를 미리 요청하며,
+        한 번에 한 페이지(최대 두 페이지)만 메모리에 유지한다.
+        
+        Args:
+            jql (str): JQL 쿼리 (예: 'project = ACCO AND "연구과제 선택" ~ "R-001"')
+            fields (List[str], optional): 조회할 필드 (매핑된 이름 또는 Jira 필드 ID, 없으면 전체)
+            page_size (int): 페이지당 이슈 수 (Jira 서버 최대값으로 제한될 수 있음)
+            expand (List[str], optional): expand 항목 목록
+            
+        Yields:
+            Dict[str, Any]: 필드 매핑이 적용된 이슈 정보
+            
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        params = self._build_issue_params(fields, expand)
+        variant = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
+        body = {"jql": jql, "maxResults": page_size}
+        # 캐시된 전체 이슈와 같은 내용이 되도록 필드 미지정 시 *all 요청 (기본값은 *navigable)
+        body["fields"] = params["fields"].split(",") if "fields" in params else ["*all"]
+        if "expand" in params:
+            body["expand"] = params["expand"].split(",")
+        
+        def fetch_page(start_at: int) -> Dict[str, Any]:
+            return self._make_request('POST', '/rest/api/2/search', {**body, "startAt": start_at})
+        
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="jira-search")
+        try:
+            pending = executor.submit(fetch_page, 0)
+            fetched = 0
+            while pending is not None:
+                page = pending.result() or {}
+                issues = page.get("issues") or []
+                fetched += len(issues)
+                total = page.get("total", fetched)
+                
+                # 다음 페이지 미리 요청
+                next_start = page.get("startAt", fetched - len(issues)) + len(issues)
+                pending = executor.submit(fetch_page, next_start) if issues and next_start < total else None
+                self.logger.debug("Search page fetched: %d issues (%d/%d)", len(issues), fetched, total)
+                
+                if self.issue_cache:
+                    for issue in issues:
+                        self.issue_cache.put(issue, variant=variant)
+                for issue in self._transform_issues(issues):
+                    yield issue
+            self.logger.info("Search completed: %d issues for JQL: %s", fetched, jql)
+        finally:
+            # 호출부가 중간에 순회를 멈춘 경우 대기 중인 요청은 버림
+            executor.shutdown(wait=False, cancel_futures=True)
+    
+    def _transform_issues(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """한 페이지의 이슈에 필드 매핑 일괄 적용"""
+        if self.field_mapper:
+            return self.field_mapper.transform_many(issues)
+        return issues
+    
     def _clean_folder_name(self, folder_name: str) -> str:
         """폴더명에서 유효하지 않은 문자 제거
         
@@ -155,33 +356,133 @@ class JiraClient(JiraClient):
         clean_name = re.sub(invalid_chars, '', folder_name).strip()
         return clean_name
     
-    def _download_file(self, url: str, save_path: str) -> None:
-        """파일 다운로드
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """HTTP 커넥션 풀 사용 통계 (hit/miss) 반환"""
+        return self.http.get_pool_stats()
+    
+    def get_attachment_cache_stats(self) -> Dict[str, Any]:
+        """첨부 파일 캐시 적중률 통계 반환 (캐시 미사용 시 빈 딕셔너리)"""
+        return self.attachment_cache.get_stats() if self.attachment_cache else {}
+    
+    def close(self) -> None:
+        """HTTP 커넥션 풀 종료"""
+        self.http.close()
+    
+    def _download_file(self, url: str, save_path: str, expected_size: Optional[int] = None, expected_checksum: Optional[str] = None) -> None:
+        """파일 스트리밍 다운로드
+        
+        청크 단위로 `<save_path>.part`에 기록하고, 연결이 끊기면 HTTP Range 요청으로
+        이어받는다. 크기/체크섬 검증 후 원자적으로 이름을 바꾼다.
         
         Args:
             url (str): 다운로드 URL
             save_path (str): 저장 경로
+            expected_size (int, optional): attachment 메타데이터의 파일 크기
+            expected_checksum (str, optional): "알고리즘:hex" 형식의 체크섬 (알고리즘 생략 시 sha256)
+            
+        Raises:
+            Exception: 다운로드 또는 검증 실패 시
+        """
+        part_path = f"{save_path}.part"
+        attempts = 0
+        while True:
+            try:
+                self._stream_to_file(url, part_path)
+                break
+            except (requests.exceptions.ConnectionError,
+                    requests.exceptions.ChunkedEncodingError,
+                    requests.exceptions.Timeout) as e:
+                attempts += 1
+                if attempts > self.max_resume_attempts:
+                    self.logger.error("Download interrupted too many times: %s (%s)", url, str(e))
+                    raise
+                self.logger.warning("Download interrupted, resuming (%d/%d): %s",
+                                    attempts, self.max_resume_attempts, str(e))
+        
+        try:
+            self._verify_download(part_path, expected_size, expected_checksum)
+        except Exception:
+            os.remove(part_path)
+            raise
+        
+        os.replace(part_path, save_path)
+        self.logger.debug("File downloaded: %s", save_path)
+    
+    def _stream_to_file(self, url: str, part_path: str) -> None:
+        """응답 본문을 청크 단위로 파일에 기록 (기존 부분 파일이 있으면 이어받기)
+        
+        Args:
+            url (str): 다운로드 URL
+            part_path (str): 임시 파일 경로
             
         Raises:
             Exception: 다운로드 실패 시
         """
-        response = requests.get(url, headers=self.headers, auth=self.auth, stream=True)
-        if response.status_code == 200:
-            with open(save_path, 'wb') as file:
-                file.write(response.content)
-            self.logger.debug(f"File downloaded: {save_path}")
-        else:
-            error_msg = f"Failed to download file: {response.status_code} - {response.text}"
-            self.logger.error(error_msg)
-            raise Exception(error_msg)
+        offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+        headers = dict(self.headers)
+        if offset:
+            headers["Range"] = f"bytes={offset}-"
+        
+        response = self.http.get(url, headers=headers, auth=self.auth, stream=True)
+        try:
+            if response.status_code == 206:
+                mode = 'ab'
+                self.logger.debug("Resuming download at byte %d: %s", offset, part_path)
+            elif response.status_code == 200:
+                # 서버가 Range를 무시한 경우 처음부터 다시 받음
+                mode = 'wb'
+            elif response.status_code == 416 and offset:
+                # 이미 전체를 받은 상태
+                return
+            else:
+                error_msg = f"Failed to download file: {response.status_code} - {response.text}"
+                self.logger.error(error_msg)
+                raise Exception(error_msg)
+            
+            with open(part_path, mode) as file:
+                for chunk in response.iter_content(chunk_size=self.download_chunk_size):
+                    if chunk:
+                        file.write(chunk)
+        finally:
+            response.close()
+    
+    def _verify_download(self, path: str, expected_size: Optional[int], expected_checksum: Optional[str]) -> None:
+        """다운로드 파일의 크기와 체크섬 검증
+        
+        Args:
+            path (str): 검증할 파일 경로
+            expected_size (int, optional): 기대 크기 (바이트)
+            expected_checksum (str, optional): 기대 체크섬
+            
+        Raises:
+            Exception: 검증 실패 시
+        """
+        if expected_size is not None:
+            actual_size = os.path.getsize(path)
+            if actual_size != int(expected_size):
+                error_msg = f"Downloaded size mismatch: expected {expected_size}, got {actual_size}"
+                self.logger.error(error_msg)
+                raise Exception(error_msg)
+        
+        if expected_checksum:
+            algorithm, _, expected_hex = expected_checksum.rpartition(':')
+            digest = hashlib.new(algorithm or 'sha256')
+            with open(path, 'rb') as file:
+                for chunk in iter(lambda: file.read(self.download_chunk_size), b''):
+                    digest.update(chunk)
+            if digest.hexdigest().lower() != expected_hex.lower():
+                error_msg = f"Downloaded checksum mismatch for {os.path.basename(path)}"
+                self.logger.error(error_msg)
+                raise Exception(error_msg)
 
-    def _make_request(self, method: str, path: str, data=None) -> Any:
+    def _make_request(self, method: str, path: str, data=None, params: Optional[Dict[str, Any]] = None) -> Any:
         """API 요청 메서드
         
         Args:
             method (str): HTTP 메서드 (GET, POST 등)
             path (str): API 경로
             data (dict, optional): 요청 데이터
+            params (dict, optional): 쿼리 파라미터 (fields, expand 등)
             
         Returns:
             Any: API 응답 데이터
@@ -193,9 +494,9 @@ class JiraClient(JiraClient):
         
         try:
             if method.upper() == 'GET':
-                response = requests.get(url, headers=self.headers, auth=self.auth, json=data)
+                response = self.http.get(url, headers=self.headers, auth=self.auth, json=data, params=params)
             elif method.upper() == 'POST':
-                response = requests.post(url, headers=self.headers, auth=self.auth, json=data)
+                response = self.http.post(url, headers=self.headers, auth=self.auth, json=data, params=params)
             else:
                 raise ValueError(f"Unsupported HTTP method: {method}")
             
@@ -230,17 +531,20 @@ class JiraClient(JiraClient):
         }
         
         try:
-            with open(file_path, 'rb') as file:
-                files = {'file': (os.path.basename(file_path), file)}
-                response = requests.post(
+            # 파일을 메모리에 올리지 않고 디스크에서 읽으며 전송
+            with StreamingMultipartBody('file', file_path) as body:
+                response = self.http.post(
                     upload_url,
-                    headers=headers,
+                    headers={**headers, **body.headers},
                     auth=self.auth,
-                    files=files
+                    data=body
                 )
             
             if response.status_code == 200:
                 self.logger.info(f"Successfully uploaded {file_path} to {issue_key}")
+                # 첨부 목록이 바뀌었으므로 캐시된 이슈는 무효화
+                if self.issue_cache:
+                    self.issue_cache.invalidate(issue_key)
                 return response.json()
             else:
                 error_msg = f"Failed to upload attachment: {response.status_code} - {response.text}"
@@ -0,0 +1,119 @@
+"""
+스트리밍 multipart/form-data 본문
+
+requests의 files= 인자는 전체 본문을 메모리에 만든 뒤 전송한다. 이 모듈의 본문 객체는
+헤더/꼬리 바이트와 디스크의 파일을 순서대로 읽어 주는 file-like 객체로, 길이를 미리
+알 수 있으므로 Content-Length를 유지한 채 청크 단위로 전송된다.
+seek/tell을 지원하므로 urllib3 재시도 시 처음부터 다시 보낼 수 있다.
+"""
+
+from typing import Dict, Optional
+import mimetypes
+import os
+import uuid
+
+
+class StreamingMultipartBody:
+    """파일 하나를 담는 스트리밍 multipart 본문"""
+
+    def __init__(self, field_name: str, file_path: str, file_name: Optional[str] = None,
+                 content_type: Optional[str] = None, boundary: Optional[str] = None):
+        """StreamingMultipartBody 초기화
+
+        Args:
+            field_name (str): 폼 필드 이름 (Jira 첨부는 "file")
+            file_path (str): 전송할 파일 경로
+            file_name (str, optional): 전송할 파일 이름 (기본값: 파일 경로의 basename)
+            content_type (str, optional): 파일 MIME 타입 (기본값: 확장자로 추정)
+            boundary (str, optional): multipart 경계 문자열
+
+        Raises:
+            FileNotFoundError: 파일이 없는 경우
+        """
+        self.file_path = file_path
+        self.boundary = boundary or uuid.uuid4().hex
+        file_name = file_name or os.path.basename(file_path)
+        content_type = content_type or mimetypes.guess_type(file_name)[0] or "application/octet-stream"
+        # RFC 7578: 비ASCII 파일명은 UTF-8 그대로 전송 (Jira/브라우저 동작과 동일)
+        escaped_name = file_name.replace('"', '%22')
+
+        self._head = (
+            f"--{self.boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{escaped_name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        self._tail = f"\r\n--{self.boundary}--\r\n".encode("utf-8")
+        self._file_size = os.path.getsize(file_path)
+        self._file = open(file_path, "rb")
+        self._length = len(self._head) + self._file_size + len(self._tail)
+        self._position = 0
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type 헤더 값"""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        """요청에 추가할 헤더"""
+        return {"Content-Type": self.content_type, "Content-Length": str(self._length)}
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        # requests가 본문을 스트림으로 처리하도록 iterable 표시 (실제 전송은 read 사용)
+        while True:
+            chunk = self.read(64 * 1024)
+            if not chunk:
+                return
+            yield chunk
+
+    def read(self, size: int = -1) -> bytes:
+        """현재 위치부터 최대 size 바이트 읽기"""
+        if size is None or size < 0:
+            size = self._length - self._position
+        chunks = []
+        while size > 0 and self._position < self._length:
+            chunk = self._read_segment(size)
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b"".join(chunks)
+
+    def _read_segment(self, size: int) -> bytes:
+        """현재 위치가 속한 구간(헤더/파일/꼬리)에서 읽기"""
+        head_end = len(self._head)
+        file_end = head_end + self._file_size
+        if self._position < head_end:
+            chunk = self._head[self._position:self._position + size]
+        elif self._position < file_end:
+            self._file.seek(self._position - head_end)
+            chunk = self._file.read(min(size, file_end - self._position))
+            if not chunk:
+                raise IOError(f"File changed while uploading: {self.file_path}")
+        else:
+            offset = self._position - file_end
+            chunk = self._tail[offset:offset + size]
+        self._position += len(chunk)
+        return chunk
+
+    def tell(self) -> int:
+        return self._position
+
+    def seek(self, offset: int, whence: int = os.SEEK_SET) -> int:
+        """재시도 시 본문을 되감기 위한 seek"""
+        if whence == os.SEEK_CUR:
+            offset += self._position
+        elif whence == os.SEEK_END:
+            offset += self._length
+        self._position = max(0, min(offset, self._length))
+        return self._position
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self) -> "StreamingMultipartBody":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
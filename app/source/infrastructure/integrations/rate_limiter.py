@@ -0,0 +1,290 @@
+"""
+Jira 호출 속도 제한기
+
+모든 Jira 요청이 거쳐 가는 공용 스케줄러.
+
+- 토큰 버킷: 초당 요청 수와 버스트를 제한 (스레드 간 공유, state_file 지정 시 프로세스 간 공유)
+- 서버 신호: 429/503의 Retry-After, X-RateLimit-Remaining/Reset 헤더를 보고 전체 요청을 일시 정지
+- 적응형 동시성: 응답 지연이 목표보다 길어지거나 429를 받으면 동시 요청 수를 절반으로 줄이고,
+  정상 응답이 이어지면 하나씩 늘린다 (AIMD)
+"""
+
+from dataclasses import dataclass, fields
+from contextlib import contextmanager
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Any, Optional
+import json
+import os
+import threading
+import time
+import logging
+
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경: 프로세스 간 공유 없이 동작
+    fcntl = None
+
+
+@dataclass
+class RateLimitConfig:
+    """속도 제한 설정"""
+    requests_per_second: float = 10.0   # 토큰 충전 속도
+    burst: int = 20                     # 토큰 버킷 크기
+    max_concurrency: int = 8            # 동시 요청 상한
+    min_concurrency: int = 1            # 동시 요청 하한
+    target_latency: float = 2.0         # 이 시간(초)보다 느리면 동시성 감소
+    max_retries: int = 5                # 429 응답 재시도 횟수
+    default_retry_after: float = 5.0    # Retry-After 헤더가 없을 때 대기 시간
+    state_file: Optional[str] = None    # 프로세스 간 공유 상태 파일 (없으면 프로세스 내부만)
+
+    @classmethod
+    def from_dict(cls, config: Optional[Dict[str, Any]]) -> "RateLimitConfig":
+        """설정 딕셔너리에서 생성 (알 수 없는 키는 무시)"""
+        if not config:
+            return cls()
+        known = {f.name for f in fields(cls)}
+        return cls(**{k: v for k, v in config.items() if k in known})
+
+
+class TokenBucket:
+    """스레드 안전 토큰 버킷 (state_file 지정 시 fcntl 잠금으로 프로세스 간 공유)"""
+
+    def __init__(self, rate: float, capacity: int, state_file: Optional[str] = None):
+        self.rate = rate
+        self.capacity = capacity
+        self.state_file = state_file if fcntl is not None else None
+        self._lock = threading.Lock()
+        self._state = {"tokens": float(capacity), "updated": time.time(), "blocked_until": 0.0}
+        if self.state_file:
+            os.makedirs(os.path.dirname(os.path.abspath(self.state_file)), exist_ok=True)
+
+    def acquire(self) -> float:
+        """토큰 하나를 얻을 때까지 대기
+
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        waited = 0.0
+        while True:
+            delay = self._try_acquire()
+            if delay <= 0:
+                return waited
+            time.sleep(delay)
+            waited += delay
+
+    def _try_acquire(self) -> float:
+        """토큰을 얻으면 0, 아니면 다시 시도하기까지 기다릴 시간 반환"""
+        with self._shared_state() as state:
+            now = time.time()
+            if state["blocked_until"] > now:
+                return state["blocked_until"] - now
+            elapsed = max(0.0, now - state["updated"])
+            state["tokens"] = min(float(self.capacity), state["tokens"] + elapsed * self.rate)
+            state["updated"] = now
+            if state["tokens"] >= 1.0:
+                state["tokens"] -= 1.0
+                return 0.0
+            return (1.0 - state["tokens"]) / self.rate
+
+    def block_until(self, until: float) -> None:
+        """서버가 알려 준 시각(epoch 초)까지 모든 요청 정지"""
+        with self._shared_state() as state:
+            if until > state["blocked_until"]:
+                state["blocked_until"] = until
+                # 정지가 끝난 뒤부터 다시 충전
+                state["tokens"] = 0.0
+                state["updated"] = until
+
+    @contextmanager
+    def _shared_state(self):
+        """버킷 상태 읽기/쓰기 (프로세스 간 공유 시 파일 잠금)"""
+        with self._lock:
+            if not self.state_file:
+                yield self._state
+                return
+            with open(self.state_file, "a+") as f:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        state = {**self._state, **json.loads(f.read() or "{}")}
+                    except ValueError:
+                        state = dict(self._state)
+                    yield state
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(state))
+                    f.flush()
+                    self._state = state
+                finally:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+
+
+class AdaptiveConcurrencyLimiter:
+    """지연 시간에 따라 상한이 바뀌는 세마포어 (AIMD)"""
+
+    def __init__(self, max_limit: int, min_limit: int = 1, target_latency: float = 2.0):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.target_latency = target_latency
+        self.limit = self.max_limit
+        self._in_flight = 0
+        self._condition = threading.Condition()
+
+    @contextmanager
+    def slot(self):
+        """동시 요청 슬롯 점유"""
+        with self._condition:
+            while self._in_flight >= int(self.limit):
+                self._condition.wait()
+            self._in_flight += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._in_flight -= 1
+                self._condition.notify()
+
+    def on_success(self, latency: float) -> None:
+        """정상 응답: 느리면 감소, 빠르면 천천히 증가"""
+        with self._condition:
+            if latency > self.target_latency:
+                self._decrease()
+            else:
+                # 현재 상한만큼 응답이 오면 1 증가
+                self.limit = min(float(self.max_limit), self.limit + 1.0 / max(self.limit, 1.0))
+            self._condition.notify_all()
+
+    def on_throttled(self) -> None:
+        """429 응답: 즉시 절반으로 감소"""
+        with self._condition:
+            self._decrease()
+
+    def _decrease(self) -> None:
+        self.limit = max(float(self.min_limit), self.limit / 2)
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+
+class RateLimiter:
+    """Jira 요청 공용 스케줄러 (토큰 버킷 + 서버 신호 + 적응형 동시성)"""
+
+    def __init__(self, config: Optional[RateLimitConfig] = None, logger: logging.Logger = None):
+        """RateLimiter 초기화
+
+        Args:
+            config (RateLimitConfig, optional): 속도 제한 설정
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        self.config = config or RateLimitConfig()
+        self.logger = logger or logging.getLogger(__name__)
+        self.bucket = TokenBucket(self.config.requests_per_second, self.config.burst, self.config.state_file)
+        self.concurrency = AdaptiveConcurrencyLimiter(
+            self.config.max_concurrency, self.config.min_concurrency, self.config.target_latency
+        )
+        self._stats_lock = threading.Lock()
+        self._stats = {"requests": 0, "throttled": 0, "waited_seconds": 0.0}
+        self.logger.debug("RateLimiter initialized (rps=%s, burst=%d, max_concurrency=%d, shared=%s)",
+                          self.config.requests_per_second, self.config.burst,
+                          self.config.max_concurrency, bool(self.bucket.state_file))
+
+    @contextmanager
+    def slot(self):
+        """요청 하나를 보낼 수 있을 때까지 대기 후 동시성 슬롯 점유"""
+        with self.concurrency.slot():
+            waited = self.bucket.acquire()
+            with self._stats_lock:
+                self._stats["requests"] += 1
+                self._stats["waited_seconds"] += waited
+            yield
+
+    def observe(self, response, latency: float) -> bool:
+        """응답 헤더를 반영
+
+        Args:
+            response: requests.Response
+            latency (float): 응답까지 걸린 시간 (초)
+
+        Returns:
+            bool: 속도 제한으로 거절된 응답이면 True (재시도 필요)
+        """
+        headers = response.headers or {}
+        now = time.time()
+
+        if response.status_code == 429:
+            delay = self._parse_retry_after(headers.get("Retry-After"), now)
+            if delay is None:
+                delay = self.config.default_retry_after
+            self.bucket.block_until(now + delay)
+            self.concurrency.on_throttled()
+            with self._stats_lock:
+                self._stats["throttled"] += 1
+            self.logger.warning("Jira rate limit hit, pausing %.1fs (concurrency limit -> %.1f)",
+                                delay, self.concurrency.limit)
+            return True
+
+        # 할당량을 다 쓴 경우 리셋 시각까지 정지
+        remaining = headers.get("X-RateLimit-Remaining")
+        if remaining is not None and self._to_float(remaining) == 0:
+            reset_at = self._parse_reset(headers.get("X-RateLimit-Reset"), now)
+            if reset_at:
+                self.bucket.block_until(reset_at)
+                self.logger.info("Jira rate limit quota exhausted, pausing until reset (%.1fs)", reset_at - now)
+        elif response.status_code == 503 and headers.get("Retry-After"):
+            delay = self._parse_retry_after(headers.get("Retry-After"), now)
+            if delay:
+                self.bucket.block_until(now + delay)
+
+        if response.status_code < 500:
+            self.concurrency.on_success(latency)
+        else:
+            self.concurrency.on_throttled()
+        return False
+
+    @staticmethod
+    def _to_float(value: Any) -> Optional[float]:
+        try:
+            return float(value)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _parse_retry_after(cls, value: Optional[str], now: float) -> Optional[float]:
+        """Retry-After 헤더 (초 또는 HTTP 날짜) -> 대기 시간"""
+        if not value:
+            return None
+        seconds = cls._to_float(value)
+        if seconds is not None:
+            return max(0.0, seconds)
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - now)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def _parse_reset(cls, value: Optional[str], now: float) -> Optional[float]:
+        """X-RateLimit-Reset 헤더 (ISO 8601 시각 또는 epoch 초) -> epoch 초"""
+        if not value:
+            return None
+        seconds = cls._to_float(value)
+        if seconds is not None:
+            # 작은 값은 남은 초로 해석
+            return seconds if seconds > 1e9 else now + seconds
+        try:
+            reset = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+        if reset.tzinfo is None:
+            reset = reset.replace(tzinfo=timezone.utc)
+        return reset.timestamp()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """속도 제한 통계 반환"""
+        with self._stats_lock:
+            stats = dict(self._stats)
+        stats["concurrency_limit"] = self.concurrency.limit
+        stats["in_flight"] = self.concurrency.in_flight
+        return stats
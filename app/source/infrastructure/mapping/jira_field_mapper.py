@@ -1,9 +1,20 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass
+from types import MappingProxyType
 import os
 import json
+import tempfile
+import threading
+import time
 import logging
 from app.source.core.interfaces import JiraFieldMappingProvider, JiraFieldMapper
 
+try:
+    import fcntl
+except ImportError:  # Windows 개발 환경: 프로세스 간 잠금 없이 동작
+    fcntl = None
+
 logger = logging.getLogger(__name__)
 class ApiJiraFieldMappingProvider(JiraFieldMappingProvider):
     """Jira API에서 필드 매핑 데이터를 가져오는 제공자"""
@@ -19,28 +30,37 @@ class ApiJiraFieldMappingProvider(JiraFieldMappingProvider):
             self.refresh()
         return self.field_mappings
     
+    def fetch_field_mapping(self) -> Dict[str, str]:
+        """Jira API에서 필드 매핑 조회
+        
+        Returns:
+            Dict[str, str]: 필드 ID -> 필드 이름
+            
+        Raises:
+            Exception: API 호출 실패 시
+        """
+        # Jira API를 통해 필드 정보 가져오기
+        response = self.jira_api_client._make_request('GET', '/rest/api/2/field')
+        
+        # 매핑 구성
+        mappings = {}
+        for field in response:
+            if 'key' in field and 'name' in field:
+                field_id = field['key']
+                # 사람이 읽기 쉬운 형식으로 변환
+                field_name = field['name'].lower().replace(' ', '_')
+                mappings[field_id] = field_name
+        return mappings
+    
     def refresh(self) -> None:
         try:
-            # Jira API를 통해 필드 정보 가져오기
-            response = self.jira_api_client._make_request('GET', '/rest/api/2/field')
-            
-            # 매핑 구성
-            mappings = {}
-            for field in response:
-                if 'key' in field and 'name' in field:
-                    field_id = field['key']
-                    # 사람이 읽기 쉬운 형식으로 변환
-                    field_name = field['name'].lower().replace(' ', '_')
-                    mappings[field_id] = field_name
-            
-            self.field_mappings = mappings
+            self.field_mappings = self.fetch_field_mapping()
             self.initialized = True
             self.logger.info("Field mappings loaded from Jira API")
             
         except Exception as e:
+            # 실패 시 기존 매핑 유지 (처음이면 빈 매핑)
             self.logger.error("Failed to load field mappings from API: %s", str(e))
-            # 실패 시 빈 매핑 사용
-            self.field_mappings = {}
             self.initialized = True
 
     def get_field_mapping_file_path(self) -> str:
@@ -85,49 +105,243 @@ class FileJiraFieldMappingProvider(JiraFieldMappingProvider):
             self.field_mappings = {}
             self.initialized = True
 
+class CachedJiraFieldMappingProvider(JiraFieldMappingProvider):
+    """필드 매핑을 로컬 파일에 보관하고 백그라운드에서 갱신하는 제공자
+    
+    - 시작 시 캐시 파일에서 즉시 로드 (API 호출 없음)
+    - TTL이 지나면 백그라운드 스레드에서 원본 제공자로 다시 가져와 통째로 교체
+    - 갱신 실패 시 기존(오래된) 매핑 유지
+    - 여러 워커 프로세스가 같은 파일을 공유하며, 잠금을 잡은 한 프로세스만 API를 호출
+    """
+    
+    # 갱신 실패 후 첫 재시도 간격 (초, 실패할 때마다 두 배로 늘려 TTL까지)
+    RETRY_DELAY_SECONDS = 30.0
+    
+    def __init__(self, source: ApiJiraFieldMappingProvider, cache_file: str, ttl_seconds: float = 3600.0,
+                 initial_wait_seconds: float = 10.0, logger: logging.Logger = None):
+        """CachedJiraFieldMappingProvider 초기화
+        
+        Args:
+            source: 실제 매핑을 가져올 제공자 (fetch_field_mapping 지원)
+            cache_file: 캐시 파일 경로 (워커 간 공유)
+            ttl_seconds: 매핑을 다시 가져오기까지의 시간 (초)
+            initial_wait_seconds: 캐시 파일이 없을 때 첫 갱신을 기다릴 최대 시간 (초, 제공자당 한 번만 기다림)
+            logger: 로거 인스턴스
+        """
+        self.source = source
+        self.cache_file = cache_file
+        self.ttl_seconds = ttl_seconds
+        self.initial_wait_seconds = initial_wait_seconds
+        self.logger = logger or logging.getLogger(__name__)
+        self.field_mappings: Dict[str, str] = {}
+        self.fetched_at = 0.0
+        self._loaded = threading.Event()
+        self._initial_wait_done = threading.Event()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = None
+        
+        if self._load_from_file():
+            self._loaded.set()
+    
+    def get_field_mapping(self) -> Dict[str, str]:
+        if not self._loaded.is_set():
+            # 캐시 파일이 없는 첫 실행: 백그라운드 갱신을 한 번만 잠시 기다리고,
+            # 그 뒤로는 갱신이 계속 실패해도 기다리지 않고 빈 매핑을 반환
+            self.start()
+            if not self._initial_wait_done.is_set():
+                self._loaded.wait(self.initial_wait_seconds)
+                self._initial_wait_done.set()
+        elif self.is_stale():
+            self.start()
+        return self.field_mappings
+    
+    def is_stale(self) -> bool:
+        """TTL이 지났는지 여부"""
+        return (time.time() - self.fetched_at) >= self.ttl_seconds
+    
+    def start(self) -> None:
+        """백그라운드 갱신 스레드 시작 (이미 실행 중이면 무시)"""
+        with self._refresh_lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name="jira-field-mapping-refresh", daemon=True)
+            self._thread.start()
+    
+    def stop(self) -> None:
+        """백그라운드 갱신 스레드 중지"""
+        self._stop.set()
+    
+    def _run(self) -> None:
+        """TTL 주기로 갱신 (실패하면 RETRY_DELAY_SECONDS부터 두 배씩 늘려 TTL까지 재시도 간격을 늘림)"""
+        failures = 0
+        while not self._stop.is_set():
+            if self.is_stale() or not self._loaded.is_set():
+                failures = 0 if self.refresh() else failures + 1
+            if failures:
+                wait = min(self.RETRY_DELAY_SECONDS * 2 ** (failures - 1),
+                           max(self.ttl_seconds, self.RETRY_DELAY_SECONDS))
+            else:
+                wait = max(1.0, self.ttl_seconds - (time.time() - self.fetched_at))
+            self._stop.wait(wait)
+    
+    def refresh(self) -> bool:
+        """원본 제공자에서 매핑을 가져와 파일과 메모리에 반영 (실패 시 기존 매핑 유지)
+        
+        Returns:
+            bool: 최신 매핑을 반영했으면 True, 갱신에 실패했으면 False
+        """
+        try:
+            with self._file_lock():
+                # 잠금을 기다리는 동안 다른 워커가 갱신했을 수 있음
+                if self._load_from_file() and not self.is_stale():
+                    self._loaded.set()
+                    return True
+                mappings = self.source.fetch_field_mapping()
+                if not mappings:
+                    raise ValueError("Jira returned an empty field list")
+                self._write_file(mappings)
+                self._swap(mappings, time.time())
+            self.logger.info("Field mappings refreshed (%d fields)", len(mappings))
+            return True
+        except Exception as e:
+            self.logger.error("Failed to refresh field mappings, keeping cached copy (%d fields): %s",
+                              len(self.field_mappings), str(e))
+            return False
+    
+    def _swap(self, mappings: Dict[str, str], fetched_at: float) -> None:
+        """매핑 참조를 통째로 교체 (읽는 쪽은 잠금 없이 이전 또는 새 매핑 중 하나를 봄)"""
+        self.field_mappings = mappings
+        self.fetched_at = fetched_at
+        self._loaded.set()
+    
+    def _load_from_file(self) -> bool:
+        """캐시 파일 로드 (파일이 없거나 손상되면 False)"""
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            mappings = cached["mappings"]
+            fetched_at = float(cached["fetched_at"])
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            self.logger.warning("Ignoring unreadable field mapping cache %s: %s", self.cache_file, str(e))
+            return False
+        if fetched_at > self.fetched_at or not self.field_mappings:
+            self._swap(mappings, fetched_at)
+            self.logger.debug("Field mappings loaded from cache file (%d fields)", len(mappings))
+        return True
+    
+    def _write_file(self, mappings: Dict[str, str]) -> None:
+        """임시 파일에 쓴 뒤 원자적으로 교체"""
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".field_mapping.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({"fetched_at": time.time(), "mappings": mappings}, f, ensure_ascii=False)
+            os.replace(tmp_path, self.cache_file)
+        except Exception:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+    
+    @contextmanager
+    def _file_lock(self):
+        """프로세스 간 갱신 잠금 (fcntl.flock)"""
+        if fcntl is None:
+            yield
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(self.cache_file)), exist_ok=True)
+        with open(f"{self.cache_file}.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+@dataclass(frozen=True)
+class FieldMappingIndex:
+    """한 버전의 필드 매핑을 컴파일한 불변 양방향 인덱스"""
+    source: Dict[str, str]                  # 컴파일에 사용한 매핑 (버전 식별용)
+    id_to_name: Mapping[str, str]
+    name_to_id: Mapping[str, str]
+    rename: Mapping[str, str]               # 응답 변환용 키 이름 변경 계획 (customfield_*만)
+    
+    @classmethod
+    def compile(cls, mappings: Dict[str, str]) -> "FieldMappingIndex":
+        mappings = mappings or {}
+        return cls(
+            source=mappings,
+            id_to_name=MappingProxyType(dict(mappings)),
+            name_to_id=MappingProxyType({v: k for k, v in mappings.items()}),
+            rename=MappingProxyType({k: v for k, v in mappings.items() if k.startswith('customfield_')}),
+        )
+
+
 class JiraFieldMapperimpl(JiraFieldMapper):
     """Jira 필드 ID를 사람이 읽을 수 있는 이름으로 매핑"""
     
     def __init__(self, mapping_provider: JiraFieldMappingProvider = None, logger: logging.Logger = None):
         self.mapping_provider = mapping_provider
         self.logger = logger or logging.getLogger(__name__)
+        self._index = FieldMappingIndex.compile({})
+        self._index_lock = threading.Lock()
     
     def set_mapping_provider(self, provider: JiraFieldMappingProvider):
         """런타임에 매핑 제공자 변경"""
         self.mapping_provider = provider
+        self._index = FieldMappingIndex.compile({})
+    
+    def _get_index(self) -> FieldMappingIndex:
+        """현재 매핑 버전의 인덱스 반환
+        
+        제공자는 갱신 시 매핑 딕셔너리를 통째로 교체하므로, 객체가 바뀌었을 때만 다시 컴파일한다.
+        """
+        mappings = self.mapping_provider.get_field_mapping() if self.mapping_provider else {}
+        index = self._index
+        if mappings is not index.source:
+            with self._index_lock:
+                index = self._index
+                if mappings is not index.source:
+                    index = FieldMappingIndex.compile(mappings)
+                    self._index = index
+                    self.logger.debug("Compiled field mapping index (%d fields)", len(index.id_to_name))
+        return index
     
     def map_field_id_to_name(self, field_id: str) -> str:
         """필드 ID를 이름으로 변환"""
         if not field_id.startswith('customfield_'):
             return field_id
-            
-        mappings = self.mapping_provider.get_field_mapping()
-        return mappings.get(field_id, field_id)
+        return self._get_index().rename.get(field_id, field_id)
     
     def map_field_name_to_id(self, field_name: str) -> str:
         """이름을 필드 ID로 변환 (역매핑)"""
-        mappings = self.mapping_provider.get_field_mapping()
-        reverse_mapping = {v: k for k, v in mappings.items()}
-        return reverse_mapping.get(field_name, field_name)
+        return self._get_index().name_to_id.get(field_name, field_name)
     
     def transform_response(self, response_data: Dict[str, Any]) -> Dict[str, Any]:
         """응답 데이터의 필드 키를 변환"""
+        return self._transform(response_data, self._get_index().rename)
+    
+    def transform_many(self, issues: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """여러 이슈의 필드 키를 일괄 변환 (JQL 검색 결과 페이지 등)
+        
+        매핑 인덱스를 한 번만 조회하고 이슈마다 fields 딕셔너리 하나만 새로 만든다.
+        """
+        rename = self._get_index().rename
+        return [self._transform(issue, rename) for issue in issues]
+    
+    @staticmethod
+    def _transform(response_data: Dict[str, Any], rename: Mapping[str, str]) -> Dict[str, Any]:
         if 'fields' not in response_data:
             return response_data
-            
-        transformed = response_data.copy()
-        mapped_fields = {}
         
-        for field_id, value in response_data['fields'].items():
-            if field_id.startswith('customfield_'):
-                field_name = self.map_field_id_to_name(field_id)
-                mapped_fields[field_name] = value
-            else:
-                mapped_fields[field_id] = value
-                
-        transformed['fields'] = mapped_fields
+        transformed = response_data.copy()
+        transformed['fields'] = {rename.get(k, k): v for k, v in response_data['fields'].items()}
         return transformed
     
     def refresh_mappings(self):
         """매핑 데이터 새로고침"""
-        self.mapping_provider.refresh()
\ No newline at end of file
+        self.mapping_provider.refresh()
@@ -1,7 +1,7 @@
 import os
 import yaml
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 class MappingConfigLoader:
     """YAML 설정 파일을 로드하고 처리하는 클래스"""
@@ -101,6 +101,50 @@ class MappingConfigLoader:
             self.logger.error("Error getting items mapping: %s", str(e), exc_info=True)
             return {}
     
+    def get_issue_projection(self, document_type: str,
+                             template_fields: Optional[List[str]] = None) -> Optional[Dict[str, list]]:
+        """문서 유형별 Jira 조회 필드/expand 목록 반환
+        
+        Args:
+            document_type: 문서 유형 (예: "회의록")
+            template_fields: 문서 유형의 템플릿이 사용하는 필드 (설정된 목록에 더해서 요청)
+            
+        Returns:
+            {"fields": [...], "expand": [...]} 또는 선언되지 않은 유형이고 템플릿 필드도 없으면 None (전체 조회)
+        """
+        try:
+            issue_fields = self.config.get('issue_fields', {})
+            type_config = issue_fields.get(document_type)
+            if type_config is None and not template_fields:
+                self.logger.debug("No issue field projection for document type: %s", document_type)
+                return None
+            
+            type_config = dict(type_config or {})
+            type_config['fields'] = list(type_config.get('fields') or []) + list(template_fields or [])
+            default = issue_fields.get('default', {})
+            projection = {}
+            for key in ('fields', 'expand'):
+                merged = []
+                for value in (default.get(key) or []) + (type_config.get(key) or []):
+                    if value not in merged:
+                        merged.append(value)
+                projection[key] = merged
+            self.logger.debug("Retrieved issue projection for %s: %s", document_type, projection)
+            return projection
+        except Exception as e:
+            self.logger.error("Error getting issue projection: %s", str(e), exc_info=True)
+            return None
+    
+    def get_preprocessing_config(self) -> Dict[str, Dict[str, list]]:
+        """문서 유형별 전처리 단계 설정 반환
+        
+        Returns:
+            {"default": {"stages": [...]}, "회의록": {"stages": [...]}, ...} (설정이 없으면 빈 딕셔너리)
+        """
+        config = self.config.get('preprocessing') or {}
+        self.logger.debug("Retrieved preprocessing config: %s", config)
+        return config
+    
     def get_nested_value(self, data: Dict[str, Any], path: str, default: Any = None) -> Any:
         """중첩된 딕셔너리에서 값을 추출
         
@@ -1,42 +1,207 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterable, Optional, Callable, Tuple, TypedDict
+from dataclasses import dataclass, field
+from decimal import Decimal, InvalidOperation
+import datetime
 import re
 
+
+class TableColumn(TypedDict):
+    name: str
+    key: str
+    type: str
+
+
+@dataclass
+class MalformedRow:
+    """파싱하지 못했거나 값 변환에 실패한 행"""
+    line_number: int
+    line: str
+    reason: str
+    column: Optional[str] = None
+
+
+@dataclass
+class TableParseResult:
+    """테이블 파싱 결과 (정상 행 + 문제 행 목록)"""
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    errors: List[MalformedRow] = field(default_factory=list)
+
+
+def _to_int(value: str) -> int:
+    return int(value.replace(',', ''))
+
+
+def _to_decimal(value: str) -> Decimal:
+    try:
+        return Decimal(value.replace(',', ''))
+    except InvalidOperation:
+        raise ValueError(f"invalid decimal: {value!r}")
+
+
+def _to_date(value: str) -> datetime.date:
+    try:
+        return datetime.date.fromisoformat(value)
+    except ValueError:
+        # 2024.05.01. / 2024/05/01 형식
+        return datetime.date.fromisoformat(value.rstrip('.').replace('.', '-').replace('/', '-'))
+
+
+# 컬럼 타입별 변환 함수
+COLUMN_CONVERTERS: Dict[str, Callable[[str], Any]] = {
+    "str": str,
+    "int": _to_int,
+    "decimal": _to_decimal,
+    "date": _to_date,
+}
+
+SEPARATOR_CELL_PATTERN = re.compile(r'^:?-+:?$')
+# 셀 분리 전에 '\|' 를 잠시 치환해 두는 문자
+ESCAPED_PIPE_PLACEHOLDER = '\x00'
+
+
 class MarkdownTableParser:
     """마크다운 테이블을 파싱하는 유틸리티 클래스"""
-    
+
     @staticmethod
-    def parse_table(markdown_text: str) -> List[Dict[str, str]]:
+    def parse_table(markdown_text: str, schema: Optional[List[TableColumn]] = None) -> List[Dict[str, Any]]:
         """
         마크다운 테이블을 파싱하여 딕셔너리 리스트로 변환
-        
+
         Args:
             markdown_text (str): 마크다운 테이블 텍스트
-            
+            schema (Optional[List[TableColumn]]): 컬럼 스키마 (없으면 모든 값을 문자열로 반환)
+
         Returns:
-            List[Dict[str, str]]: 파싱된 데이터의 리스트
+            List[Dict[str, Any]]: 파싱된 데이터의 리스트
         """
         if not markdown_text:
             return []
-            
-        # 줄 단위로 분리
-        lines = markdown_text.strip().split('\n')
-        if len(lines) < 2:
-            return []
-            
-        # 헤더 추출 및 정리
-        headers = [h.strip() for h in lines[0].strip('|').split('|')]
-        
-        # 구분선 제거 (두 번째 줄)
-        
-        # 데이터 행 처리
-        result = []
-        for line in lines[1:]:  # 구분선 이후의 행들만 처리
-            if not line.strip():  # 빈 줄 무시
+        return MarkdownTableParser.parse_lines(markdown_text.splitlines(), schema).rows
+
+    @staticmethod
+    def parse_lines(lines: Iterable[str], schema: Optional[List[TableColumn]] = None) -> TableParseResult:
+        """
+        줄 단위 이터레이터에서 마크다운 테이블을 파싱
+
+        첫 번째 비어 있지 않은 줄을 헤더로 사용하고(Jira 위키 형식 '||헤더||' 포함), 바로 다음의
+        구분선(':---:' 정렬 표기 포함)은 건너뛴다. '\\|' 는 셀 안의 '|' 문자로 취급한다.
+        스키마에 지정된 컬럼은 파싱과 동시에 타입을 변환하며, 셀 개수가 맞지 않는 행과 변환에
+        실패한 값은 errors에 기록한다(변환 실패 값은 원래 문자열 유지).
+
+        Args:
+            lines (Iterable[str]): 테이블 텍스트의 각 줄
+            schema (Optional[List[TableColumn]]): 컬럼 스키마 (name: 헤더 이름, key: 결과 키, type: str/int/decimal/date)
+
+        Returns:
+            TableParseResult: 파싱된 행과 문제 행 목록
+
+        Raises:
+            ValueError: 스키마에 지원하지 않는 타입이 있는 경우
+        """
+        result = TableParseResult()
+        rows = result.rows
+        errors = result.errors
+        split_row = MarkdownTableParser._split_row
+        numbered_lines = enumerate(lines, start=1)
+
+        # 헤더: 첫 번째 비어 있지 않은 줄
+        headers = None
+        for _, raw_line in numbered_lines:
+            line = raw_line.strip()
+            if line:
+                if line.startswith('||'):
+                    headers = [h.strip() for h in line.strip('|').split('||')]
+                else:
+                    headers = split_row(line)
+                break
+        if headers is None:
+            return result
+
+        keys, conversions = MarkdownTableParser._compile_schema(headers, schema)
+        column_count = len(keys)
+        expect_separator = True
+
+        for line_number, raw_line in numbered_lines:
+            line = raw_line.strip()
+            if not line:
+                continue
+
+            if '\\|' in line:
+                cells = split_row(line)
+            else:
+                # 이스케이프가 없는 일반 행은 문자열 복사 없이 인라인으로 분리 (대용량 테이블 처리 속도)
+                parts = line.split('|')
+                if line[0] == '|':
+                    del parts[0]
+                if line[-1] == '|' and parts:
+                    parts.pop()
+                cells = [cell.strip() for cell in parts]
+
+            if expect_separator:
+                expect_separator = False
+                if all(SEPARATOR_CELL_PATTERN.match(cell) for cell in cells):
+                    continue
+
+            if len(cells) != column_count:
+                errors.append(MalformedRow(line_number, raw_line,
+                                           f"expected {column_count} cells, got {len(cells)}"))
+                continue
+            if not any(cells):  # 모든 값이 비어 있는 행은 무시
+                continue
+
+            row = dict(zip(keys, cells))
+            for index, key, type_name, convert in conversions:
+                value = cells[index]
+                if not value:
+                    row[key] = None
+                    continue
+                try:
+                    row[key] = convert(value)
+                except ValueError:
+                    errors.append(MalformedRow(line_number, raw_line,
+                                               f"invalid {type_name}: {value!r}", column=headers[index]))
+            rows.append(row)
+
+        return result
+
+    @staticmethod
+    def _split_row(line: str) -> List[str]:
+        """앞뒤 '|' 를 제거하고 셀 단위로 분리 ('\\|' 는 셀 내용으로 유지)"""
+        escaped = '\\|' in line
+        if escaped:
+            line = line.replace('\\|', ESCAPED_PIPE_PLACEHOLDER)
+        if line.startswith('|'):
+            line = line[1:]
+        if line.endswith('|'):
+            line = line[:-1]
+        cells = [cell.strip() for cell in line.split('|')]
+        if escaped:
+            return [cell.replace(ESCAPED_PIPE_PLACEHOLDER, '|') for cell in cells]
+        return cells
+
+    @staticmethod
+    def _compile_schema(headers: List[str], schema: Optional[List[TableColumn]]):
+        """헤더와 스키마로 결과 키 목록과 (인덱스, 키, 타입, 변환 함수) 목록 생성"""
+        if not schema:
+            return list(headers), []
+
+        columns = {}
+        for column in schema:
+            type_name = column.get("type", "str")
+            if type_name not in COLUMN_CONVERTERS:
+                raise ValueError(f"Unsupported column type '{type_name}' for column '{column['name']}'")
+            columns[column["name"]] = column
+
+        keys = []
+        conversions = []
+        for index, header in enumerate(headers):
+            column = columns.get(header)
+            if column is None:
+                keys.append(header)
                 continue
-            values = [v.strip() for v in line.strip('|').split('|')]
-            if len(values) == len(headers):
-                row_dict = dict(zip(headers, values))
-                if any(row_dict.values()):  # 모든 값이 비어있지 않은 경우만 추가
-                    result.append(row_dict)
-                    
-        return result 
\ No newline at end of file
+            key = column.get("key") or header
+            keys.append(key)
+            type_name = column.get("type", "str")
+            if type_name != "str":
+                conversions.append((index, key, type_name, COLUMN_CONVERTERS[type_name]))
+        return keys, conversions
@@ -0,0 +1,227 @@
+"""
+데이터베이스 연결 풀
+
+스레드마다 별도 연결을 빌려 쓰기 위한 크기 제한 풀.
+풀이 가득 차면 checkout_timeout 동안 반납을 기다리고, 그래도 없으면 DatabaseError를 발생시킨다.
+빌려줄 때 오래 쉬었던 연결은 상태를 확인하고, 끊긴 연결이나 수명이 지난 연결은 새 연결로 교체한다.
+"""
+
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import threading
+import time
+import logging
+from app.source.core.exceptions import DatabaseError
+
+
+class ConnectionPool:
+    """스레드 안전 연결 풀"""
+
+    def __init__(self, connect: Callable[[], Any], max_size: int = 10, checkout_timeout: float = 30.0,
+                 min_size: int = 0, max_lifetime: Optional[float] = None, health_check_after: float = 5.0,
+                 check: Optional[Callable[[Any], None]] = None, reset: Optional[Callable[[Any], None]] = None,
+                 logger: Optional[logging.Logger] = None):
+        """ConnectionPool 초기화
+
+        Args:
+            connect (Callable[[], Any]): 새 연결 생성 함수
+            max_size (int): 최대 연결 수 (빌려준 연결 + 유휴 연결)
+            checkout_timeout (float): 연결을 빌릴 때 기다리는 최대 시간 (초)
+            min_size (int): prefill()로 미리 만들어 둘 연결 수
+            max_lifetime (float, optional): 연결 최대 수명 (초, None이면 제한 없음)
+            health_check_after (float): 이 시간(초) 이상 쉬었던 연결은 빌려주기 전에 check 실행
+            check (Callable[[Any], None], optional): 연결 상태 확인 함수 (예외 발생 시 연결 교체)
+            reset (Callable[[Any], None], optional): 반납 시 연결 상태 초기화 함수 (예외 발생 시 연결 폐기)
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        if not 0 <= min_size <= max_size:
+            raise ValueError("min_size must be between 0 and max_size")
+        self._connect = connect
+        self.max_size = max_size
+        self.min_size = min_size
+        self.checkout_timeout = checkout_timeout
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self._check = check
+        self._reset = reset
+        self.logger = logger or logging.getLogger(__name__)
+        # 유휴 연결: (연결, 반납 시각), 연결 id -> 생성 시각
+        self._idle: List[Tuple[Any, float]] = []
+        self._created_at: Dict[int, float] = {}
+        self._size = 0
+        self._condition = threading.Condition()
+        self._stats = {
+            "acquisitions": 0, "in_use": 0, "timeouts": 0, "created": 0, "discarded": 0, "health_check_failures": 0,
+            "total_wait_seconds": 0.0, "max_wait_seconds": 0.0, "peak_in_use": 0,
+        }
+
+    def prefill(self) -> int:
+        """min_size까지 연결을 미리 생성 (실패는 경고로만 기록)
+
+        Returns:
+            int: 새로 만든 연결 수
+        """
+        created = 0
+        while True:
+            with self._condition:
+                if self._size >= self.min_size:
+                    return created
+                self._size += 1
+            try:
+                connection = self._open()
+            except DatabaseError as e:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                self.logger.warning("Could not prefill connection pool: %s", str(e))
+                return created
+            with self._condition:
+                self._idle.append((connection, time.monotonic()))
+                self._condition.notify()
+            created += 1
+
+    def acquire(self, timeout: Optional[float] = None) -> Any:
+        """연결 빌리기 (유휴 연결 우선, 없으면 새로 연결)
+
+        Args:
+            timeout (float, optional): 기다리는 최대 시간 (기본값: checkout_timeout)
+
+        Returns:
+            Any: 데이터베이스 연결
+
+        Raises:
+            DatabaseError: 대기 시간 안에 연결을 얻지 못하거나 연결 생성 실패 시
+        """
+        started = time.monotonic()
+        deadline = started + (self.checkout_timeout if timeout is None else timeout)
+        connection, released_at = self._reserve(deadline)
+        if connection is not None and not self._usable(connection, released_at):
+            self._discard(connection, keep_slot=True)
+            connection = None
+        if connection is None:
+            try:
+                connection = self._open()
+            except DatabaseError:
+                with self._condition:
+                    self._size -= 1
+                    self._condition.notify()
+                raise
+        self._record_checkout(time.monotonic() - started)
+        return connection
+
+    def release(self, connection: Any, discard: bool = False) -> None:
+        """연결 반납
+
+        Args:
+            connection (Any): acquire로 빌린 연결
+            discard (bool): True이면 풀에 돌려놓지 않고 닫음
+        """
+        with self._condition:
+            self._in_use_delta(-1)
+        if not discard and not getattr(connection, "closed", False) and not self._expired(connection):
+            try:
+                if self._reset:
+                    self._reset(connection)
+                with self._condition:
+                    self._idle.append((connection, time.monotonic()))
+                    self._condition.notify()
+                return
+            except Exception as e:
+                self.logger.warning("Discarding connection that could not be reset: %s", str(e))
+        self._discard(connection)
+
+    def close_all(self) -> None:
+        """유휴 연결 모두 닫기 (빌려준 연결은 반납 시 풀로 돌아옴)"""
+        with self._condition:
+            idle, self._idle = self._idle, []
+        for connection, _ in idle:
+            self._discard(connection)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """풀 사용 통계 (대기 시간, 사용률 등) 반환"""
+        with self._condition:
+            stats = dict(self._stats)
+            in_use = self._stats["in_use"]
+            stats.update({
+                "size": self._size,
+                "idle": len(self._idle),
+                "max_size": self.max_size,
+                "utilization": in_use / self.max_size,
+                "avg_wait_ms": (stats["total_wait_seconds"] * 1000 / stats["acquisitions"]) if stats["acquisitions"] else 0.0,
+                "max_wait_ms": stats["max_wait_seconds"] * 1000,
+            })
+            return stats
+
+    def _reserve(self, deadline: float) -> Tuple[Optional[Any], float]:
+        """유휴 연결 하나를 꺼내거나 새 연결 자리를 확보 (자리만 확보하면 연결은 None)"""
+        with self._condition:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if self._size < self.max_size:
+                    self._size += 1
+                    return None, 0.0
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._stats["timeouts"] += 1
+                    raise DatabaseError(f"Timed out waiting for a database connection (max_size={self.max_size})")
+                self._condition.wait(remaining)
+
+    def _usable(self, connection: Any, released_at: float) -> bool:
+        """유휴 연결을 빌려줘도 되는지 확인 (닫힘, 수명 초과, 상태 확인 실패 시 False)"""
+        if getattr(connection, "closed", False) or self._expired(connection):
+            return False
+        if self._check and time.monotonic() - released_at >= self.health_check_after:
+            try:
+                self._check(connection)
+            except Exception as e:
+                self.logger.warning("Pooled connection failed health check, reconnecting: %s", str(e))
+                with self._condition:
+                    self._stats["health_check_failures"] += 1
+                return False
+        return True
+
+    def _expired(self, connection: Any) -> bool:
+        if self.max_lifetime is None:
+            return False
+        created_at = self._created_at.get(id(connection))
+        return created_at is not None and time.monotonic() - created_at >= self.max_lifetime
+
+    def _open(self) -> Any:
+        """새 연결 생성 (자리는 호출자가 확보)"""
+        try:
+            connection = self._connect()
+        except Exception as e:
+            raise DatabaseError(f"Database connection failed: {str(e)}")
+        with self._condition:
+            self._created_at[id(connection)] = time.monotonic()
+            self._stats["created"] += 1
+        self.logger.debug("Opened pooled database connection (%d/%d)", self._size, self.max_size)
+        return connection
+
+    def _discard(self, connection: Any, keep_slot: bool = False) -> None:
+        """연결 닫기 (keep_slot이면 자리를 유지해 호출자가 새 연결을 만듦)"""
+        try:
+            connection.close()
+        except Exception as e:
+            self.logger.warning("Failed to close pooled connection: %s", str(e))
+        with self._condition:
+            self._created_at.pop(id(connection), None)
+            self._stats["discarded"] += 1
+            if not keep_slot:
+                self._size -= 1
+                self._condition.notify()
+
+    def _record_checkout(self, waited: float) -> None:
+        with self._condition:
+            self._stats["acquisitions"] += 1
+            self._stats["total_wait_seconds"] += waited
+            self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+            self._in_use_delta(1)
+
+    def _in_use_delta(self, delta: int) -> None:
+        """빌려준 연결 수 갱신 (self._condition 보유 상태에서 호출)"""
+        in_use = self._stats["in_use"] + delta
+        self._stats["in_use"] = in_use
+        self._stats["peak_in_use"] = max(self._stats["peak_in_use"], in_use)
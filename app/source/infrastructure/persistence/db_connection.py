@@ -1,119 +1,350 @@
 import psycopg2
+import psycopg2.errorcodes
+import psycopg2.extensions
 import psycopg2.extras
+from contextlib import contextmanager
 from typing import List, Dict, Any, Tuple, Optional
 from app.source.core.interfaces import UnitOfWork
 from app.source.core.exceptions import DatabaseError
+from app.source.infrastructure.persistence.connection_pool import ConnectionPool
+import hashlib
 import logging
+import re
+import threading
+import weakref
+
+# 서버 측 준비 문장 변환용 자리표시자 (%s -> $n, %% -> %)
+_PLACEHOLDER = re.compile(r"%[s%]")
+
 
 class DatabaseConnection:
-    """데이터베이스 연결 클래스"""
+    """데이터베이스 연결 클래스 - 스레드 안전 연결 풀 기반
+    
+    connection_scope()(요청, 단위 작업, 보강 작업 스레드) 안의 쿼리는 빌린 연결 하나를 함께 사용하고,
+    범위 밖의 쿼리는 쿼리마다 풀에서 연결을 빌렸다가 바로 반납한다.
+    
+    config의 prepared_statements가 켜져 있으면 execute_query(prepare=True)로 실행한 쿼리를
+    연결마다 한 번 PREPARE 해 두고 이후에는 EXECUTE로 재사용한다 (파싱/계획 생략).
+    """
     
     def __init__(self, config: dict, logger: Optional[logging.Logger] = None):
         self.config = config
-        self.connection = None
         self.logger = logger or logging.getLogger(__name__)
-        self.logger.info("DatabaseConnection initialized")
+        self.prepared_statements = bool(config.get("prepared_statements", False))
+        self._pool = None
+        self._pool_lock = threading.Lock()
+        self._local = threading.local()
+        # 쿼리 -> (문장 이름, PREPARE 문, 파라미터 수), 연결 -> 그 연결에 준비된 문장 이름
+        self._statements: Dict[str, Tuple[str, str, int]] = {}
+        self._prepared: "weakref.WeakKeyDictionary[Any, set]" = weakref.WeakKeyDictionary()
+        self._prepared_lock = threading.Lock()
+        self.logger.info("DatabaseConnection initialized (prepared_statements=%s)", self.prepared_statements)
+    
+    def _open_connection(self):
+        """새 데이터베이스 연결 생성"""
+        return psycopg2.connect(
+            host=self.config.get("host"),
+            user=self.config.get("user"),
+            password=self.config.get("password"),
+            dbname=self.config.get("database"),
+            port=self.config.get("port", 5432)
+        )
+    
+    @staticmethod
+    def _check_connection(connection) -> None:
+        """빌려주기 전 연결 상태 확인 (실패 시 예외)"""
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
+        connection.rollback()
+    
+    @staticmethod
+    def _reset_connection(connection) -> None:
+        """반납 시 끝나지 않은 트랜잭션 정리 (상태를 알 수 없으면 예외)"""
+        status = connection.get_transaction_status()
+        if status == psycopg2.extensions.TRANSACTION_STATUS_UNKNOWN:
+            raise DatabaseError("Connection is in an unknown state")
+        if status != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+            connection.rollback()
+    
+    @property
+    def pool(self) -> ConnectionPool:
+        """연결 풀 (처음 사용할 때 생성하고 min_size까지 미리 연결)"""
+        if self._pool is None:
+            with self._pool_lock:
+                if self._pool is None:
+                    pool_config = self.config.get("pool", {})
+                    pool = ConnectionPool(
+                        self._open_connection,
+                        max_size=pool_config.get("max_size", 10),
+                        checkout_timeout=pool_config.get("checkout_timeout", 30.0),
+                        min_size=pool_config.get("min_size", 0),
+                        max_lifetime=pool_config.get("max_lifetime"),
+                        health_check_after=pool_config.get("health_check_after", 5.0),
+                        check=self._check_connection,
+                        reset=self._reset_connection,
+                        logger=self.logger
+                    )
+                    pool.prefill()
+                    self._pool = pool
+        return self._pool
+    
+    @contextmanager
+    def connection_scope(self, transactional: bool = False):
+        """풀에서 연결을 빌려 현재 스레드의 쿼리가 범위 안에서 사용하게 함
+        
+        이미 범위 안이면 바깥 범위의 연결(과 트랜잭션)을 그대로 사용한다.
+        바깥 범위가 쿼리마다 커밋하는 범위이면 안쪽 트랜잭션을 원자적으로 실행할 수 없으므로 오류를 발생시킨다.
+        
+        Args:
+            transactional: True이면 범위 안의 쿼리를 하나의 트랜잭션으로 묶어
+                정상 종료 시 커밋, 예외 발생 시 롤백
+        
+        Yields:
+            데이터베이스 연결
+            
+        Raises:
+            DatabaseError: 풀에서 연결을 얻지 못했거나, 트랜잭션이 아닌 범위 안에서 트랜잭션 범위를 연 경우
+        """
+        scoped = getattr(self._local, "connection", None)
+        if scoped is not None:
+            if transactional and not getattr(self._local, "transactional", False):
+                raise DatabaseError("Cannot open a transactional scope inside a non-transactional connection scope")
+            yield scoped
+            return
+        
+        connection = self.pool.acquire()
+        self._local.connection = connection
+        self._local.transactional = transactional
+        try:
+            yield connection
+            if transactional:
+                connection.commit()
+        except BaseException:
+            if transactional and not connection.closed:
+                connection.rollback()
+            raise
+        finally:
+            self._local.connection = None
+            self._local.transactional = False
+            self.pool.release(connection)
+    
+    def in_transaction(self) -> bool:
+        """현재 스레드가 트랜잭션 범위 안인지 여부"""
+        return getattr(self._local, "connection", None) is not None and getattr(self._local, "transactional", False)
     
     def connect(self):
-        """데이터베이스 연결"""
-        if not self.connection:
-            try:
-                self.connection = psycopg2.connect(
-                    host=self.config.get("host"),
-                    user=self.config.get("user"),
-                    password=self.config.get("password"),
-                    dbname=self.config.get("database"),
-                    port=self.config.get("port", 5432)
-                )
-                self.logger.debug("Database connection established")
-            except Exception as e:
-                self.logger.error("Database connection failed: %s", str(e))
-                raise DatabaseError(f"Database connection failed: {str(e)}")
-        return self.connection
+        """현재 범위에서 사용하는 연결 반환
+        
+        Raises:
+            DatabaseError: connection_scope() 밖에서 호출한 경우
+        """
+        scoped = getattr(self._local, "connection", None)
+        if scoped is None:
+            raise DatabaseError("No connection checked out; use connection_scope()")
+        return scoped
+    
+    def commit(self):
+        """현재 범위의 트랜잭션 커밋"""
+        self.connect().commit()
+    
+    def rollback(self):
+        """현재 범위의 트랜잭션 롤백"""
+        self.connect().rollback()
     
     def close(self):
-        """데이터베이스 연결 종료"""
-        if self.connection:
-            try:
-                self.connection.close()
-                self.connection = None
-                self.logger.debug("Database connection closed")
-            except Exception as e:
-                self.logger.error("Failed to close database connection: %s", str(e))
-                raise DatabaseError(f"Failed to close database connection: {str(e)}")
+        """풀의 유휴 연결 종료"""
+        if self._pool is not None:
+            self._pool.close_all()
+            self.logger.debug("Database connection pool closed")
     
-    def execute_query(self, query: str, params: Tuple = None) -> List[Dict[str, Any]]:
-        """쿼리 실행 및 결과 반환"""
-        conn = self.connect()
-        cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
-        
+    def get_pool_stats(self) -> Dict[str, Any]:
+        """연결 풀 대기 시간, 사용률 통계 반환 (준비 문장 수 포함)"""
+        stats = self.pool.get_stats()
+        stats["prepared_statements"] = len(self._statements)
+        return stats
+    
+    def _statement(self, query: str) -> Tuple[str, str, int]:
+        """쿼리의 준비 문장 이름, PREPARE 문, 파라미터 수 (쿼리 문자열별로 한 번만 변환)"""
+        statement = self._statements.get(query)
+        if statement is None:
+            count = 0
+            
+            def number(match) -> str:
+                nonlocal count
+                if match.group() == "%%":
+                    return "%"
+                count += 1
+                return f"${count}"
+            
+            body = _PLACEHOLDER.sub(number, query)
+            name = "stmt_" + hashlib.sha1(query.encode("utf-8")).hexdigest()[:16]
+            statement = (name, f"PREPARE {name} AS {body}", count)
+            self._statements[query] = statement
+        return statement
+    
+    def _execute_prepared(self, conn, cursor, query: str, params) -> None:
+        """현재 연결에 준비된 문장으로 실행 (처음이면 PREPARE 후 EXECUTE)"""
+        name, prepare_sql, count = self._statement(query)
+        with self._prepared_lock:
+            prepared = self._prepared.setdefault(conn, set())
+        if name not in prepared:
+            self.logger.debug("Preparing statement %s: %s", name, query)
+            cursor.execute(prepare_sql)
+            prepared.add(name)
         try:
-            self.logger.debug("Executing query: %s, params: %s", query, params)
-            cursor.execute(query, params)
+            if count:
+                cursor.execute(f"EXECUTE {name} ({', '.join(['%s'] * count)})", params)
+            else:
+                cursor.execute(f"EXECUTE {name}")
+        except psycopg2.Error as e:
+            if e.pgcode == psycopg2.errorcodes.INVALID_SQL_STATEMENT_NAME:
+                # 서버에서 문장이 사라진 경우 (DISCARD ALL 등) 다음 실행 때 다시 준비
+                prepared.discard(name)
+            raise
+    
+    def execute_query(self, query: str, params: Tuple = None, prepare: bool = False) -> List[Dict[str, Any]]:
+        """쿼리 실행 및 결과 반환 (트랜잭션 범위 밖이면 쿼리마다 커밋)
+        
+        Args:
+            query: %s 자리표시자를 사용하는 SQL
+            params: 쿼리 파라미터
+            prepare: 반복 실행되는 쿼리 여부 (prepared_statements 설정이 켜져 있으면 서버 측 준비 문장 사용)
+        """
+        with self.connection_scope() as conn:
+            transactional = self.in_transaction()
+            cursor = conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
             
-            # SELECT 쿼리인 경우 결과 반환
-            if query.strip().upper().startswith("SELECT"):
-                result = cursor.fetchall()
-                # DictCursor 결과를 일반 딕셔너리로 변환
-                result = [dict(row) for row in result]
-                self.logger.debug("Query executed successfully, rows affected: %d", len(result))
+            try:
+                self.logger.debug("Executing query: %s, params: %s", query, params)
+                if prepare and self.prepared_statements:
+                    self._execute_prepared(conn, cursor, query, params)
+                else:
+                    cursor.execute(query, params)
+                
+                # 결과 행이 있는 쿼리 (SELECT, INSERT/UPDATE/DELETE ... RETURNING)는 결과 반환
+                result = []
+                if cursor.description is not None:
+                    # DictCursor 결과를 일반 딕셔너리로 변환
+                    result = [dict(row) for row in cursor.fetchall()]
+                
+                # 서버가 돌려준 명령 태그가 SELECT가 아니면 커밋 (트랜잭션 범위 안이면 범위 종료 시 커밋)
+                if not transactional and not (cursor.statusmessage or "").startswith("SELECT"):
+                    conn.commit()
+                self.logger.debug("Query executed successfully, rows affected: %d", cursor.rowcount)
                 return result
-            
-            # INSERT, UPDATE, DELETE 쿼리인 경우 커밋
-            conn.commit()
-            self.logger.debug("Query executed successfully, rows affected: %d", cursor.rowcount)
-            return []
-        except Exception as e:
-            conn.rollback()
-            self.logger.error("Query execution failed: %s (query: %s, params: %s)", str(e), query, params)
-            raise DatabaseError(f"Query execution failed: {str(e)}")
-        finally:
-            cursor.close()
+            except Exception as e:
+                if not transactional and not conn.closed:
+                    conn.rollback()
+                self.logger.error("Query execution failed: %s (query: %s, params: %s)", str(e), query, params)
+                raise DatabaseError(f"Query execution failed: {str(e)}")
+            finally:
+                cursor.close()
     
     def execute_many(self, query: str, params_list: List[Tuple]) -> int:
         """여러 쿼리 실행"""
-        conn = self.connect()
-        cursor = conn.cursor()
+        with self.connection_scope() as conn:
+            transactional = self.in_transaction()
+            cursor = conn.cursor()
+            
+            try:
+                self.logger.debug("Executing multiple queries: %s, params count: %d", query, len(params_list))
+                cursor.executemany(query, params_list)
+                if not transactional:
+                    conn.commit()
+                self.logger.debug("Multiple queries executed successfully, rows affected: %d", cursor.rowcount)
+                return cursor.rowcount
+            except Exception as e:
+                if not transactional and not conn.closed:
+                    conn.rollback()
+                self.logger.error("Multiple query execution failed: %s (query: %s)", str(e), query)
+                raise DatabaseError(f"Multiple query execution failed: {str(e)}")
+            finally:
+                cursor.close()
+
+    def execute_autocommit(self, query: str, params: Tuple = None) -> None:
+        """트랜잭션 블록 밖에서 실행해야 하는 문장 실행 (CREATE INDEX CONCURRENTLY 등)
         
-        try:
-            self.logger.debug("Executing multiple queries: %s, params count: %d", query, len(params_list))
-            cursor.executemany(query, params_list)
-            conn.commit()
-            self.logger.debug("Multiple queries executed successfully, rows affected: %d", cursor.rowcount)
-            return cursor.rowcount
-        except Exception as e:
-            conn.rollback()
-            self.logger.error("Multiple query execution failed: %s (query: %s)", str(e), query)
-            raise DatabaseError(f"Multiple query execution failed: {str(e)}")
-        finally:
-            cursor.close()
+        Raises:
+            DatabaseError: 트랜잭션 범위 안에서 호출했거나 실행에 실패한 경우
+        """
+        if self.in_transaction():
+            raise DatabaseError("Autocommit statements cannot run inside a transaction scope")
+        
+        with self.connection_scope() as conn:
+            # 범위 안의 이전 조회가 열어 둔 트랜잭션 정리 (쓰기는 이미 커밋됨)
+            if conn.get_transaction_status() != psycopg2.extensions.TRANSACTION_STATUS_IDLE:
+                conn.rollback()
+            conn.autocommit = True
+            cursor = conn.cursor()
+            
+            try:
+                self.logger.debug("Executing autocommit statement: %s", query)
+                cursor.execute(query, params)
+            except Exception as e:
+                self.logger.error("Autocommit statement failed: %s (query: %s)", str(e), query)
+                raise DatabaseError(f"Query execution failed: {str(e)}")
+            finally:
+                cursor.close()
+                if not conn.closed:
+                    conn.autocommit = False
+    
+    def copy_from(self, query: str, file) -> int:
+        """COPY ... FROM STDIN 실행 (트랜잭션 범위 밖이면 커밋)
+        
+        Args:
+            query: COPY ... FROM STDIN SQL
+            file: 읽을 파일 객체 (read() 지원)
+        
+        Returns:
+            읽어 들인 행 수
+        """
+        with self.connection_scope() as conn:
+            transactional = self.in_transaction()
+            cursor = conn.cursor()
+            
+            try:
+                self.logger.debug("Executing copy: %s", query)
+                cursor.copy_expert(query, file)
+                if not transactional:
+                    conn.commit()
+                self.logger.debug("Copy executed successfully, rows copied: %d", cursor.rowcount)
+                return cursor.rowcount
+            except Exception as e:
+                if not transactional and not conn.closed:
+                    conn.rollback()
+                self.logger.error("Copy execution failed: %s (query: %s)", str(e), query)
+                raise DatabaseError(f"Copy execution failed: {str(e)}")
+            finally:
+                cursor.close()
 
 class DatabaseUnitOfWork(UnitOfWork):
-    """데이터베이스 단위 작업 구현"""
+    """데이터베이스 단위 작업 구현 - 작업 동안 풀 연결 하나를 빌려 하나의 트랜잭션으로 실행"""
     
     def __init__(self, connection: DatabaseConnection, logger: Optional[logging.Logger] = None):
         self.connection = connection
         self.logger = logger or logging.getLogger(__name__)
-        self._transaction = None
+        # 같은 인스턴스를 여러 스레드가 사용하므로 범위는 스레드별로 보관
+        self._local = threading.local()
     
     def __enter__(self):
         """트랜잭션 시작"""
-        self.connection.connect()
-        self.connection.autocommit = False
+        scope = self.connection.connection_scope(transactional=True)
+        scope.__enter__()
+        self._local.scope = scope
         self.logger.debug("Transaction started")
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """트랜잭션 종료"""
+        """트랜잭션 종료 (예외 시 롤백, 아니면 커밋)"""
+        scope = self._local.scope
+        self._local.scope = None
         if exc_type:
-            self.rollback()
             self.logger.warning("Transaction rolled back due to exception: %s (%s)", 
                           exc_type.__name__, str(exc_val))
-        else:
-            self.commit()
+        scope.__exit__(exc_type, exc_val, exc_tb)
+        if not exc_type:
             self.logger.debug("Transaction committed")
-        
-        self.connection.autocommit = True
+        return False
     
     def commit(self):
         """변경사항 커밋"""
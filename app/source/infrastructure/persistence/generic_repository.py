@@ -4,11 +4,13 @@
 스키마 정의를 기반으로 DB 작업을 수행하는 공통 레포지토리 구현
 """
 
-from typing import Dict, List, Any, Optional, Type, TypeVar, Generic, Tuple
+from typing import Dict, List, Any, Iterable, Optional, Type, TypeVar, Generic, Tuple
 from app.source.core.exceptions import DatabaseError
+import io
 import logging
 from app.source.infrastructure.persistence.schema_definition import TableSchema, SchemaRegistry
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.reference_cache import ReferenceDataCache
 
 logger = logging.getLogger(__name__)
 
@@ -16,10 +18,20 @@ logger = logging.getLogger(__name__)
 T = TypeVar('T')
 
 class GenericRepository(Generic[T]):
-    """제네릭 레포지토리 - 스키마 기반 DB 작업 수행"""
+    """제네릭 레포지토리 - 스키마 기반 DB 작업 수행
+    
+    스키마가 생성한 반복 쿼리는 prepare=True로 실행해 서버 측 준비 문장을 재사용할 수 있게 한다.
+    cache가 주어지면 ID 조회, 단일 컬럼 조건 조회, 컬럼 값 목록 조회 결과를 (컬럼, 값) 단위로 캐시한다.
+    """
+    
+    # warm() 시 캐시를 채울 조회 컬럼 (기본키는 항상 포함)
+    CACHE_KEY_COLUMNS: Tuple[str, ...] = ()
+    
+    # bulk_upsert 시 COPY 한 번에 보내는 행 수
+    BULK_BATCH_SIZE = 5000
     
     def __init__(self, db_connection: DatabaseConnection, schema: TableSchema, 
-                 entity_class: Type[T], logger=None):
+                 entity_class: Type[T], logger=None, cache: Optional[ReferenceDataCache] = None):
         """초기화
         
         Args:
@@ -27,11 +39,13 @@ class GenericRepository(Generic[T]):
             schema: 테이블 스키마
             entity_class: 엔티티 클래스
             logger: 로거 인스턴스 (기본값: None, None인 경우 기본 로거 사용)
+            cache: 조회 결과 캐시 (기본값: None, None인 경우 캐시 사용 안 함)
         """
         self.db = db_connection
         self.schema = schema
         self.entity_class = entity_class
         self.logger = logger or logging.getLogger(__name__)
+        self.cache = cache
         self.logger.debug(f"GenericRepository initialized for {schema.table_name}")
     
     def find_by_id(self, id_value: str) -> Optional[T]:
@@ -47,13 +61,17 @@ class GenericRepository(Generic[T]):
             DatabaseError: 데이터베이스 조회 중 오류 발생 시
         """
         try:
-            query = self.schema.select_by_id_sql()
-            params = (id_value,)
-            
-            self.logger.debug("Finding entity by ID in table %s (id=%s, query=%s)", 
-                         self.schema.table_name, id_value, query)
-            
-            result = self.db.execute_query(query, params)
+            result = self._cached_rows(self.schema.primary_key.name, id_value)
+            if result is None:
+                query = self.schema.select_by_id_sql()
+                params = (id_value,)
+                
+                self.logger.debug("Finding entity by ID in table %s (id=%s, query=%s)", 
+                             self.schema.table_name, id_value, query)
+                
+                generation = self.cache.generation if self.cache else None
+                result = self.db.execute_query(query, params, prepare=True)
+                self._cache_rows(self.schema.primary_key.name, id_value, result, generation)
             
             if not result:
                 self.logger.warning("Entity not found in table %s (id=%s)", 
@@ -85,13 +103,19 @@ class GenericRepository(Generic[T]):
             DatabaseError: 데이터베이스 조회 중 오류 발생 시
         """
         try:
-            # 원래 코드로 복구
-            query, params = self.schema.select_by_criteria_sql(criteria)
-            
-            self.logger.debug("Finding entities by criteria in table %s (criteria=%s, query=%s)", 
-                         self.schema.table_name, criteria, query)
-            
-            result = self.db.execute_query(query, params)
+            cache_key = self._criteria_cache_key(criteria)
+            result = self._cached_rows(*cache_key) if cache_key else None
+            if result is None:
+                # 원래 코드로 복구
+                query, params = self.schema.select_by_criteria_sql(criteria)
+                
+                self.logger.debug("Finding entities by criteria in table %s (criteria=%s, query=%s)", 
+                             self.schema.table_name, criteria, query)
+                
+                generation = self.cache.generation if self.cache else None
+                result = self.db.execute_query(query, params, prepare=True)
+                if cache_key:
+                    self._cache_rows(*cache_key, result, generation)
             
             if not result:
                 self.logger.warning("Entities not found in table %s (criteria=%s)", 
@@ -110,6 +134,79 @@ class GenericRepository(Generic[T]):
                          error_msg, self.schema.table_name, criteria, str(e))
             raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
     
+    def find_many_by_column(self, column: str, values: List[Any]) -> Dict[Any, T]:
+        """컬럼 값 목록으로 엔티티를 한 번에 조회
+        
+        Args:
+            column: 조회할 컬럼명
+            values: 조회할 값 목록 (중복, None 제외)
+            
+        Returns:
+            컬럼 값 -> 엔티티 딕셔너리 (같은 값이 여러 행이면 첫 번째 행)
+            
+        Raises:
+            DatabaseError: 데이터베이스 조회 중 오류 발생 시
+        """
+        keys = list(dict.fromkeys(value for value in values if value is not None))
+        if not keys:
+            return {}
+        
+        try:
+            entities = {}
+            missing = keys
+            if self.cache is not None:
+                missing = []
+                for key in keys:
+                    cached = self.cache.get(column, key)
+                    if cached is None:
+                        missing.append(key)
+                    elif cached:
+                        entities[key] = self._map_to_entity(cached[0])
+            
+            if missing:
+                query = self.schema.select_by_any_sql(column)
+                
+                self.logger.debug("Finding entities by %s in table %s (%d values)", 
+                             column, self.schema.table_name, len(missing))
+                
+                generation = self.cache.generation if self.cache else None
+                result = self.db.execute_query(query, (missing,), prepare=True)
+                
+                grouped = {key: [] for key in missing}
+                for row in result or []:
+                    if row[column] in grouped:
+                        grouped[row[column]].append(row)
+                    if row[column] not in entities:
+                        entities[row[column]] = self._map_to_entity(row)
+                
+                if self.cache is not None:
+                    # 찾지 못한 값도 빈 결과로 캐시
+                    self.cache.put_many([((column, key), tuple(rows)) for key, rows in grouped.items()], generation)
+            
+            self.logger.debug("Entities found in table %s: %d of %d value(s)", 
+                         self.schema.table_name, len(entities), len(keys))
+            return entities
+            
+        except Exception as e:
+            error_msg = f"Database error while finding entities by {column}"
+            self.logger.error("%s in table %s (values=%s): %s", 
+                         error_msg, self.schema.table_name, keys, str(e))
+            raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
+    
+    def find_many_by_id(self, id_values: List[str]) -> Dict[str, T]:
+        """ID 목록으로 엔티티를 한 번에 조회
+        
+        Args:
+            id_values: 조회할 엔티티 ID 목록
+            
+        Returns:
+            ID -> 엔티티 딕셔너리
+            
+        Raises:
+            DatabaseError: 데이터베이스 조회 중 오류 발생 시
+        """
+        return self.find_many_by_column(self.schema.primary_key.name, id_values)
+    
     def exists_by_id(self, id_value: str) -> bool:
         """ID로 엔티티 존재 여부 확인
         
@@ -123,13 +220,9 @@ class GenericRepository(Generic[T]):
             DatabaseError: 데이터베이스 조회 중 오류 발생 시
         """
         try:
-            primary_key = self.schema.primary_key
-            if not primary_key:
-                raise ValueError(f"Primary key not found in {self.schema.table_name}")
-                
-            query = f"SELECT 1 FROM {self.schema.table_name} WHERE {primary_key.name} = %s LIMIT 1"
+            query = self.schema.exists_sql()
             
-            result = self.db.execute_query(query, (id_value,))
+            result = self.db.execute_query(query, (id_value,), prepare=True)
             
             # 결과가 None이 아니고 비어 있지 않으면 존재
             return result is not None and len(result) > 0
@@ -143,25 +236,36 @@ class GenericRepository(Generic[T]):
             raise e
     
     def save(self, entity: T) -> T:
-        """엔티티 저장 (INSERT 또는 UPDATE)
+        """엔티티 저장 (INSERT ... ON CONFLICT DO UPDATE 한 번으로 추가 또는 수정)
         
         Args:
             entity: 저장할 엔티티
             
         Returns:
-            저장된 엔티티
+            저장된 엔티티 (RETURNING으로 돌려받은 행, 기본값이 채워진 컬럼 포함)
             
         Raises:
             DatabaseError: 데이터베이스 저장 중 오류 발생 시
         """
         try:
             id_value = getattr(entity, self.schema.primary_key.name)
-            exists = self.exists_by_id(id_value) if id_value else False
-            
-            if exists:
-                return self._update(entity)
-            else:
+            if not id_value:
                 return self._insert(entity)
+            
+            query = self.schema.upsert_sql()
+            params = self.schema.get_insert_params(entity)
+            
+            self.logger.debug("Upserting entity into table %s (id=%s)", 
+                         self.schema.table_name, id_value)
+            
+            result = self.db.execute_query(query, params, prepare=True)
+            self._invalidate_cache("upsert")
+            
+            name_value = getattr(entity, 'name', None)
+            self.logger.info("Entity saved in table %s (id=%s, name=%s)", 
+                        self.schema.table_name, id_value, name_value)
+            
+            return self._map_to_entity(result[0]) if result else entity
                 
         except Exception as e:
             if not isinstance(e, DatabaseError):  # 이미 래핑된 예외는 다시 래핑하지 않음
@@ -171,70 +275,123 @@ class GenericRepository(Generic[T]):
                 raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
             raise e
     
-    def _insert(self, entity: T) -> T:
-        """엔티티 추가
+    def save_many(self, entities: Iterable[T]) -> int:
+        """여러 엔티티를 한 번에 저장 (bulk_upsert로 모든 컬럼 저장)
         
         Args:
-            entity: 추가할 엔티티
+            entities: 저장할 엔티티 목록
             
         Returns:
-            추가된 엔티티
+            저장한 행 수
             
         Raises:
-            DatabaseError: 데이터베이스 추가 중 오류 발생 시
+            DatabaseError: 데이터베이스 저장 중 오류 발생 시
         """
-        try:
-            query = self.schema.insert_sql()
-            params = self.schema.get_insert_params(entity)
-            id_value = getattr(entity, self.schema.primary_key.name)
-            
-            self.logger.debug("Inserting entity into table %s (id=%s)", 
-                         self.schema.table_name, id_value)
+        return self.bulk_upsert(entities)
+    
+    def bulk_upsert(self, rows: Iterable[Any], columns: Optional[List[str]] = None, 
+                    batch_size: Optional[int] = None) -> int:
+        """여러 행을 COPY로 임시 테이블에 보낸 뒤 INSERT ... ON CONFLICT 한 번으로 병합
+        
+        rows는 순회하면서 batch_size 행씩 CSV로 변환해 보내므로 전체를 메모리에 올리지 않는다.
+        전체가 하나의 트랜잭션이라 실패하면 아무 행도 반영되지 않는다.
+        
+        Args:
+            rows: 엔티티 또는 컬럼명 -> 값 딕셔너리
+            columns: 저장할 컬럼 (기본값: 모든 컬럼, 지정하지 않은 컬럼은 기존 행의 값 유지)
+            batch_size: COPY 한 번에 보낼 행 수 (기본값: BULK_BATCH_SIZE)
             
-            self.db.execute_query(query, params)
+        Returns:
+            병합한 행 수 (같은 기본키가 여러 번 나오면 마지막 행만 반영)
             
-            name_value = getattr(entity, 'name', None)
-            self.logger.info("Entity created in table %s (id=%s, name=%s)", 
-                        self.schema.table_name, id_value, name_value)
+        Raises:
+            ValueError: 없는 컬럼이 있거나 기본키, NOT NULL 컬럼이 빠진 경우
+            DatabaseError: 데이터베이스 저장 중 오류 발생 시
+        """
+        columns = self.schema.bulk_columns(columns)
+        batch_size = batch_size or self.BULK_BATCH_SIZE
+        staging = f"{self.schema.table_name}_staging"
+        copy_sql = self.schema.copy_staging_sql(staging, columns)
+        
+        try:
+            with self.db.connection_scope(transactional=True):
+                self.db.execute_query(self.schema.create_staging_sql(staging, columns))
+                
+                copied = 0
+                buffer, pending = io.StringIO(), 0
+                for row in rows:
+                    buffer.write(self._csv_line(row, columns))
+                    pending += 1
+                    if pending >= batch_size:
+                        copied += self._copy_batch(copy_sql, buffer)
+                        buffer, pending = io.StringIO(), 0
+                if pending:
+                    copied += self._copy_batch(copy_sql, buffer)
+                
+                result = self.db.execute_query(self.schema.merge_staging_sql(staging, columns))
+                # 바깥 트랜잭션 안에서 다시 호출할 수 있도록 바로 삭제
+                self.db.execute_query(f"DROP TABLE {staging}")
             
-            return entity
+            merged = result[0]["count"] if result else 0
+            self._invalidate_cache("bulk_upsert")
+            self.logger.info("Bulk upserted into table %s: %d row(s) copied, %d row(s) merged", 
+                        self.schema.table_name, copied, merged)
+            return merged
             
         except Exception as e:
-            error_msg = "Database error while inserting entity"
-            self.logger.error("%s in table %s (entity=%s): %s", 
-                         error_msg, self.schema.table_name, str(entity), str(e))
-            raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
+            if not isinstance(e, DatabaseError):
+                error_msg = "Database error while bulk upserting entities"
+                self.logger.error("%s in table %s: %s", error_msg, self.schema.table_name, str(e))
+                raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
+            raise e
     
-    def _update(self, entity: T) -> T:
-        """엔티티 수정
+    def _copy_batch(self, copy_sql: str, buffer: io.StringIO) -> int:
+        """버퍼에 모은 CSV 행을 COPY로 전송"""
+        buffer.seek(0)
+        copied = self.db.copy_from(copy_sql, buffer)
+        self.logger.debug("Copied %d row(s) into staging table for %s", copied, self.schema.table_name)
+        return copied
+    
+    @staticmethod
+    def _csv_line(row: Any, columns: Tuple[str, ...]) -> str:
+        """행을 COPY용 CSV 한 줄로 변환 (None은 \\N, 값은 항상 따옴표로 감싸 빈 문자열과 구분)"""
+        values = []
+        for column in columns:
+            value = row.get(column) if isinstance(row, dict) else getattr(row, column, None)
+            values.append("\\N" if value is None else '"' + str(value).replace('"', '""') + '"')
+        return ",".join(values) + "\n"
+    
+    def _insert(self, entity: T) -> T:
+        """엔티티 추가
         
         Args:
-            entity: 수정할 엔티티
+            entity: 추가할 엔티티
             
         Returns:
-            수정된 엔티티
+            추가된 엔티티
             
         Raises:
-            DatabaseError: 데이터베이스 수정 중 오류 발생 시
+            DatabaseError: 데이터베이스 추가 중 오류 발생 시
         """
         try:
-            query = self.schema.update_sql()
-            params = self.schema.get_update_params(entity)
+            query = self.schema.insert_sql()
+            params = self.schema.get_insert_params(entity)
             id_value = getattr(entity, self.schema.primary_key.name)
             
-            self.logger.debug("Updating entity in table %s (id=%s)", 
+            self.logger.debug("Inserting entity into table %s (id=%s)", 
                          self.schema.table_name, id_value)
             
-            self.db.execute_query(query, params)
+            self.db.execute_query(query, params, prepare=True)
+            self._invalidate_cache("insert")
             
             name_value = getattr(entity, 'name', None)
-            self.logger.info("Entity updated in table %s (id=%s, name=%s)", 
+            self.logger.info("Entity created in table %s (id=%s, name=%s)", 
                         self.schema.table_name, id_value, name_value)
             
             return entity
             
         except Exception as e:
-            error_msg = "Database error while updating entity"
+            error_msg = "Database error while inserting entity"
             self.logger.error("%s in table %s (entity=%s): %s", 
                          error_msg, self.schema.table_name, str(entity), str(e))
             raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
@@ -252,20 +409,19 @@ class GenericRepository(Generic[T]):
             DatabaseError: 데이터베이스 삭제 중 오류 발생 시
         """
         try:
-            # 엔티티 존재 확인 - 원래대로 복구
-            exists = self.exists_by_id(id_value)
-            
-            if not exists:
-                self.logger.warning("Cannot delete: Entity not found in table %s (id=%s)", 
-                               self.schema.table_name, id_value)
-                return False
-            
             query = self.schema.delete_sql()
             
             self.logger.debug("Deleting entity from table %s (id=%s)", 
                          self.schema.table_name, id_value)
             
-            self.db.execute_query(query, (id_value,))
+            # 삭제된 행이 없으면 (RETURNING 결과 없음) 존재하지 않는 엔티티
+            deleted = self.db.execute_query(query, (id_value,), prepare=True)
+            if not deleted:
+                self.logger.warning("Cannot delete: Entity not found in table %s (id=%s)", 
+                               self.schema.table_name, id_value)
+                return False
+            
+            self._invalidate_cache("delete")
             
             self.logger.info("Entity deleted from table %s (id=%s)", 
                         self.schema.table_name, id_value)
@@ -278,6 +434,75 @@ class GenericRepository(Generic[T]):
                          error_msg, self.schema.table_name, id_value, str(e))
             raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
     
+    def connection_scope(self):
+        """이 레포지토리의 쿼리가 현재 스레드 전용 풀 연결을 사용하는 범위 (DatabaseConnection.connection_scope)"""
+        return self.db.connection_scope()
+    
+    def warm(self) -> int:
+        """테이블 전체를 한 번에 읽어 캐시 채우기 (기본키와 CACHE_KEY_COLUMNS 기준)
+        
+        Returns:
+            읽은 행 수 (캐시를 사용하지 않으면 0)
+            
+        Raises:
+            DatabaseError: 데이터베이스 조회 중 오류 발생 시
+        """
+        if self.cache is None:
+            return 0
+        
+        try:
+            generation = self.cache.generation
+            columns = ', '.join(self.schema.column_names)
+            result = self.db.execute_query(f"SELECT {columns} FROM {self.schema.table_name}") or []
+            
+            items = []
+            for column in dict.fromkeys((self.schema.primary_key.name,) + tuple(self.CACHE_KEY_COLUMNS)):
+                grouped: Dict[Any, List[Dict[str, Any]]] = {}
+                for row in result:
+                    if row.get(column) is not None:
+                        grouped.setdefault(row[column], []).append(row)
+                items.extend(((column, key), tuple(rows)) for key, rows in grouped.items())
+            self.cache.put_many(items, generation)
+            
+            self.logger.info("Warmed cache for table %s: %d row(s), %d key(s)", 
+                        self.schema.table_name, len(result), len(items))
+            return len(result)
+            
+        except Exception as e:
+            error_msg = "Database error while warming cache"
+            self.logger.error("%s for table %s: %s", error_msg, self.schema.table_name, str(e))
+            raise DatabaseError(f"{error_msg} in {self.schema.table_name}: {str(e)}")
+    
+    def _criteria_cache_key(self, criteria: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+        """단일 컬럼 조건이면 캐시 키 반환 (캐시 미사용, 복합 조건, 해시 불가 값이면 None)"""
+        if self.cache is None or len(criteria) != 1:
+            return None
+        column, value = next(iter(criteria.items()))
+        if column not in self.schema.column_names:
+            return None
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return column, value
+    
+    def _cached_rows(self, column: str, value: Any) -> Optional[tuple]:
+        """캐시된 조회 결과 행 (캐시 미사용 또는 캐시에 없으면 None)"""
+        if self.cache is None:
+            return None
+        return self.cache.get(column, value)
+    
+    def _cache_rows(self, column: str, value: Any, rows: Optional[List[Dict[str, Any]]], 
+                    generation: Optional[int]) -> None:
+        """조회 결과 행 캐시 (빈 결과 포함)"""
+        if self.cache is not None:
+            self.cache.put(column, value, rows or (), generation)
+    
+    def _invalidate_cache(self, reason: str) -> None:
+        """이 프로세스에서 쓰기가 일어나면 NOTIFY를 기다리지 않고 바로 무효화"""
+        if self.cache is not None:
+            self.cache.invalidate(reason)
+    
     def _map_to_entity(self, row: Dict[str, Any]) -> T:
         """DB 로우를 엔티티로 변환
         
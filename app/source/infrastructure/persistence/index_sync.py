@@ -0,0 +1,106 @@
+"""
+인덱스 동기화
+
+TableSchema에 선언한 인덱스 중 데이터베이스에 없는 것을 CREATE INDEX CONCURRENTLY로 만든다.
+여러 번 실행해도 같은 결과이며, 이미 있는 인덱스는 카탈로그 조회 한 번으로 건너뛴다.
+CONCURRENTLY 생성이 중간에 실패해 남은 무효(invalid) 인덱스는 삭제 후 다시 만든다.
+여러 프로세스가 동시에 실행해도 다른 프로세스가 만들고 있는 인덱스를 삭제하지 않도록
+세션 advisory lock을 잡은 프로세스만 동기화하고, 생성 중(pg_stat_progress_create_index)인 인덱스는 건너뛴다.
+"""
+
+from typing import Dict, Iterable, List, Optional
+import logging
+from app.source.core.exceptions import DatabaseError
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.schema_definition import TableSchema
+
+# 인덱스 동기화 advisory lock 키
+LOCK_KEY = "app.source.index_sync"
+
+# 현재 스키마에서 테이블별 인덱스 이름, 유효 여부, 다른 세션에서 생성 중인지 여부
+EXISTING_INDEXES_SQL = """
+    SELECT c.relname AS name, i.indisvalid AS valid,
+           EXISTS (SELECT 1 FROM pg_stat_progress_create_index p WHERE p.index_relid = i.indexrelid) AS building
+    FROM pg_index i
+    JOIN pg_class c ON c.oid = i.indexrelid
+    JOIN pg_class t ON t.oid = i.indrelid
+    WHERE t.relname = ANY(%s) AND t.relnamespace = current_schema()::regnamespace
+"""
+
+
+def sync_indexes(db: DatabaseConnection, schemas: Iterable[TableSchema], concurrently: bool = True,
+                 logger: Optional[logging.Logger] = None) -> List[str]:
+    """스키마에 선언된 인덱스 중 없는 인덱스 생성
+
+    다른 프로세스가 이미 동기화 중이면 아무것도 하지 않는다.
+    필요한 확장(pg_trgm 등)을 만들 수 없으면 그 확장을 쓰는 인덱스만 건너뛰고,
+    인덱스 하나의 생성 실패는 경고로 기록한 뒤 나머지를 계속 만든다.
+
+    Args:
+        db (DatabaseConnection): 데이터베이스 연결
+        schemas (Iterable[TableSchema]): 동기화할 테이블 스키마
+        concurrently (bool): CREATE INDEX CONCURRENTLY 사용 여부 (쓰기를 막지 않음)
+        logger (logging.Logger, optional): 로거 인스턴스
+
+    Returns:
+        List[str]: 새로 만든 인덱스 이름 목록
+
+    Raises:
+        DatabaseError: 기존 인덱스 목록을 조회하지 못한 경우
+    """
+    logger = logger or logging.getLogger(__name__)
+    schemas = [schema for schema in schemas if schema.indexes]
+    if not schemas:
+        return []
+
+    # advisory lock은 세션 단위이므로 잠금, 조회, 생성, 해제를 같은 연결에서 실행
+    with db.connection_scope():
+        # 기다리면 상대의 CREATE INDEX CONCURRENTLY가 이 세션의 트랜잭션을 기다려 교착되므로 시도만 한다
+        rows = db.execute_query("SELECT pg_try_advisory_lock(hashtext(%s)) AS locked", (LOCK_KEY,))
+        if not rows or not rows[0]["locked"]:
+            logger.info("Index synchronization is already running in another process, skipping")
+            return []
+        try:
+            return _sync_indexes(db, schemas, concurrently, logger)
+        finally:
+            try:
+                db.execute_query("SELECT pg_advisory_unlock(hashtext(%s))", (LOCK_KEY,))
+            except DatabaseError as e:
+                logger.warning("Could not release index synchronization lock: %s", str(e))
+
+
+def _sync_indexes(db: DatabaseConnection, schemas: List[TableSchema], concurrently: bool,
+                  logger: logging.Logger) -> List[str]:
+    """잠금을 잡은 상태에서 없는 인덱스 생성 (sync_indexes 참고)"""
+    unavailable = set()
+    for extension in dict.fromkeys(ext for schema in schemas for ext in schema.required_extensions):
+        try:
+            db.execute_query(f"CREATE EXTENSION IF NOT EXISTS {extension}")
+        except DatabaseError as e:
+            logger.warning("Extension %s is not available, skipping its indexes: %s", extension, str(e))
+            unavailable.add(extension)
+
+    rows = db.execute_query(EXISTING_INDEXES_SQL, ([schema.table_name for schema in schemas],)) or []
+    existing: Dict[str, bool] = {row["name"]: row["valid"] for row in rows}
+    building = {row["name"] for row in rows if row.get("building")}
+
+    created = []
+    for schema in schemas:
+        for index in schema.indexes:
+            if existing.get(index.name) or index.required_extension in unavailable:
+                continue
+            if index.name in building:
+                logger.info("Index %s on %s is being built by another session, skipping", index.name, schema.table_name)
+                continue
+            try:
+                if index.name in existing:
+                    logger.warning("Rebuilding invalid index %s on %s", index.name, schema.table_name)
+                    db.execute_autocommit(
+                        f"DROP INDEX {'CONCURRENTLY ' if concurrently else ''}IF EXISTS {index.name}")
+                db.execute_autocommit(index.get_sql_definition(schema.table_name, concurrently))
+                created.append(index.name)
+                logger.info("Created index %s on %s", index.name, schema.table_name)
+            except DatabaseError as e:
+                logger.warning("Could not create index %s on %s: %s", index.name, schema.table_name, str(e))
+
+    return created
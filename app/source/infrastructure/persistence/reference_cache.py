@@ -0,0 +1,260 @@
+"""
+기준 데이터(직원/회사/연구 과제/전문가) 읽기 캐시
+
+GenericRepository 조회 결과를 (컬럼, 값) 단위로 보관하는 테이블별 LRU + TTL 캐시.
+조회 결과가 없는 값도 빈 결과로 보관(부정 캐시)해 알 수 없는 Jira 계정 등이 매번 재조회되지 않게 한다.
+테이블 변경은 Postgres LISTEN/NOTIFY 트리거로 전달받아 해당 테이블 캐시 전체를 무효화한다.
+"""
+
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple, Iterable
+import select
+import threading
+import time
+import logging
+
+NOTIFY_CHANNEL = "reference_data_changed"
+NOTIFY_FUNCTION = "notify_reference_data_change"
+
+
+class ReferenceDataCache:
+    """테이블 단위의 스레드 안전 읽기 캐시 (LRU + TTL + 부정 캐시)"""
+
+    def __init__(self, table_name: str, ttl_seconds: float = 300.0, max_entries: int = 10000,
+                 logger: logging.Logger = None):
+        """ReferenceDataCache 초기화
+
+        Args:
+            table_name (str): 테이블 이름 (NOTIFY payload와 같은 값)
+            ttl_seconds (float): 항목 유효 시간 (초)
+            max_entries (int): 최대 보관 항목 수
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        self.table_name = table_name
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.logger = logger or logging.getLogger(__name__)
+        self._entries: "OrderedDict[Tuple[str, Any], Tuple[float, tuple]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._generation = 0
+        self._hits = 0
+        self._negative_hits = 0
+        self._misses = 0
+        self._invalidations = 0
+        self._evictions = 0
+
+    @property
+    def generation(self) -> int:
+        """무효화 횟수 식별자 (조회 전에 읽어 두었다가 put에 전달)"""
+        return self._generation
+
+    def get(self, column: str, value: Any) -> Optional[tuple]:
+        """캐시 조회
+
+        Args:
+            column (str): 조회 컬럼
+            value (Any): 조회 값
+
+        Returns:
+            Optional[tuple]: 엔티티 튜플 (빈 튜플은 '없음'으로 캐시된 값), 캐시에 없으면 None
+        """
+        key = (column, value)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or time.monotonic() - entry[0] >= self.ttl_seconds:
+                if entry is not None:
+                    del self._entries[key]
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            if entry[1]:
+                self._hits += 1
+            else:
+                self._negative_hits += 1
+            return entry[1]
+
+    def put(self, column: str, value: Any, entities: Iterable[Any], generation: Optional[int] = None) -> None:
+        """조회 결과 저장 (빈 결과도 저장)
+
+        Args:
+            column (str): 조회 컬럼
+            value (Any): 조회 값
+            entities (Iterable[Any]): 조회된 엔티티 목록
+            generation (int, optional): 조회 전에 읽은 generation (그 사이 무효화됐으면 저장하지 않음)
+        """
+        self.put_many([((column, value), tuple(entities))], generation)
+
+    def put_many(self, items: List[Tuple[Tuple[str, Any], tuple]], generation: Optional[int] = None) -> None:
+        """여러 조회 결과 저장
+
+        Args:
+            items (List[Tuple[Tuple[str, Any], tuple]]): ((컬럼, 값), 엔티티 튜플) 목록
+            generation (int, optional): 조회 전에 읽은 generation
+        """
+        now = time.monotonic()
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                self.logger.debug("Skipping stale cache fill for %s", self.table_name)
+                return
+            for key, entities in items:
+                self._entries[key] = (now, entities)
+                self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, reason: str = "") -> None:
+        """테이블 캐시 전체 무효화"""
+        with self._lock:
+            self._entries.clear()
+            self._generation += 1
+            self._invalidations += 1
+        self.logger.info("Reference data cache invalidated: %s (%s)", self.table_name, reason or "manual")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """캐시 통계 반환"""
+        with self._lock:
+            lookups = self._hits + self._negative_hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "hits": self._hits,
+                "negative_hits": self._negative_hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "evictions": self._evictions,
+                "hit_rate": ((self._hits + self._negative_hits) / lookups) if lookups else 0.0,
+            }
+
+
+def create_notify_triggers_sql(table_names: List[str], channel: str = NOTIFY_CHANNEL) -> str:
+    """테이블 변경 시 NOTIFY를 보내는 트리거 DDL 생성 (payload는 테이블 이름)
+
+    Args:
+        table_names (List[str]): 대상 테이블
+        channel (str): NOTIFY 채널
+
+    Returns:
+        str: 함수 및 트리거 생성 SQL
+    """
+    statements = [
+        f"""CREATE OR REPLACE FUNCTION {NOTIFY_FUNCTION}() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('{channel}', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;"""
+    ]
+    for table_name in table_names:
+        trigger_name = f"{table_name}_reference_data_notify"
+        statements.append(f"DROP TRIGGER IF EXISTS {trigger_name} ON {table_name};")
+        statements.append(
+            f"CREATE TRIGGER {trigger_name} AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON {table_name} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {NOTIFY_FUNCTION}();"
+        )
+    return "\n".join(statements)
+
+
+class ReferenceDataListener:
+    """LISTEN 전용 연결로 테이블 변경 알림을 받아 캐시를 무효화하는 백그라운드 스레드
+
+    연결될 때마다(재연결 포함) 그 전의 알림을 놓쳤을 수 있으므로 모든 캐시를 무효화한다.
+    """
+
+    def __init__(self, db_config: Dict[str, Any], caches: Dict[str, ReferenceDataCache],
+                 channel: str = NOTIFY_CHANNEL, poll_timeout: float = 5.0, reconnect_delay: float = 5.0,
+                 logger: logging.Logger = None):
+        """ReferenceDataListener 초기화
+
+        Args:
+            db_config (Dict[str, Any]): 데이터베이스 접속 설정 (DatabaseConnection과 동일)
+            caches (Dict[str, ReferenceDataCache]): 테이블 이름 -> 캐시
+            channel (str): LISTEN 채널
+            poll_timeout (float): 알림 대기 주기 (초)
+            reconnect_delay (float): 재연결 대기 시간 (초)
+            logger (logging.Logger, optional): 로거 인스턴스
+        """
+        self.db_config = db_config
+        self.caches = caches
+        self.channel = channel
+        self.poll_timeout = poll_timeout
+        self.reconnect_delay = reconnect_delay
+        self.logger = logger or logging.getLogger(__name__)
+        self._stop_event = threading.Event()
+        self._listening = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, wait_seconds: float = 5.0) -> bool:
+        """리스너 스레드 시작
+
+        Args:
+            wait_seconds (float): LISTEN 등록까지 기다릴 최대 시간 (초)
+
+        Returns:
+            bool: 대기 시간 안에 LISTEN이 등록되었는지 여부
+        """
+        if self._thread is None or not self._thread.is_alive():
+            self._stop_event.clear()
+            self._thread = threading.Thread(target=self._run, name="reference-data-listener", daemon=True)
+            self._thread.start()
+        return self._listening.wait(wait_seconds)
+
+    def stop(self) -> None:
+        """리스너 스레드 종료"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.poll_timeout + 1)
+
+    def _connect(self):
+        import psycopg2
+        import psycopg2.extensions
+        connection = psycopg2.connect(
+            host=self.db_config.get("host"),
+            user=self.db_config.get("user"),
+            password=self.db_config.get("password"),
+            dbname=self.db_config.get("database"),
+            port=self.db_config.get("port", 5432)
+        )
+        connection.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+        with connection.cursor() as cursor:
+            cursor.execute(f"LISTEN {self.channel};")
+        return connection
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            connection = None
+            try:
+                connection = self._connect()
+                # 연결 전(또는 끊긴 동안)에 채워진 항목은 알림 없이 바뀌었을 수 있음
+                self.invalidate_all("listener connected")
+                self._listening.set()
+                self.logger.info("Listening for reference data changes on channel %s", self.channel)
+
+                while not self._stop_event.is_set():
+                    if select.select([connection], [], [], self.poll_timeout) == ([], [], []):
+                        continue
+                    connection.poll()
+                    while connection.notifies:
+                        self.handle_notification(connection.notifies.pop(0).payload)
+            except Exception as e:
+                self._listening.clear()
+                self.logger.warning("Reference data listener error: %s (reconnecting in %ss)", str(e), self.reconnect_delay)
+                self._stop_event.wait(self.reconnect_delay)
+            finally:
+                if connection is not None:
+                    try:
+                        connection.close()
+                    except Exception:
+                        pass
+
+    def handle_notification(self, payload: str) -> None:
+        """NOTIFY payload(테이블 이름)에 해당하는 캐시 무효화 (알 수 없는 값이면 전체 무효화)"""
+        cache = self.caches.get(payload)
+        if cache is None:
+            self.invalidate_all(f"notification for {payload!r}")
+        else:
+            cache.invalidate("notification")
+
+    def invalidate_all(self, reason: str) -> None:
+        """모든 캐시 무효화"""
+        for cache in self.caches.values():
+            cache.invalidate(reason)
@@ -4,7 +4,7 @@
 도메인 모델과 데이터베이스 스키마 간 일관성을 유지합니다.
 """
 
-from typing import Dict, List, Any, Optional, Tuple, Set
+from typing import Callable, Dict, List, Any, Optional, Tuple, Set
 import logging
 
 logger = logging.getLogger(__name__)
@@ -39,12 +39,66 @@ class ColumnDefinition:
         return self.get_sql_definition()
 
 
+class IndexDefinition:
+    """데이터베이스 인덱스 정의
+    
+    method="gin", opclass="gin_trgm_ops"이면 pg_trgm 트라이그램 인덱스 (ILIKE '%검색어%' 검색용).
+    동기화는 이름으로 존재 여부만 확인하므로 정의를 바꿀 때는 이름도 바꿔야 한다.
+    """
+    def __init__(self, columns: List[str], name: Optional[str] = None, unique: bool = False,
+                 where: Optional[str] = None, method: str = "btree", opclass: Optional[str] = None):
+        self.columns = list(columns)
+        self.name = name
+        self.unique = unique
+        self.where = where
+        self.method = method
+        self.opclass = opclass
+    
+    @classmethod
+    def trigram(cls, column: str, name: Optional[str] = None) -> "IndexDefinition":
+        """부분 문자열 검색용 pg_trgm GIN 인덱스 정의"""
+        return cls([column], name=name, method="gin", opclass="gin_trgm_ops")
+    
+    @property
+    def required_extension(self) -> Optional[str]:
+        """인덱스에 필요한 확장 (없으면 None)"""
+        return "pg_trgm" if self.opclass in ("gin_trgm_ops", "gist_trgm_ops") else None
+    
+    def default_name(self, table_name: str) -> str:
+        """이름을 지정하지 않은 경우의 인덱스 이름"""
+        suffix = "_trgm" if self.required_extension == "pg_trgm" else ""
+        return f"ix_{table_name}_{'_'.join(self.columns)}{suffix}"
+    
+    def get_sql_definition(self, table_name: str, concurrently: bool = False) -> str:
+        """인덱스 생성 SQL 반환 (IF NOT EXISTS)"""
+        columns = ', '.join(f"{col} {self.opclass}" if self.opclass else col for col in self.columns)
+        sql = "CREATE UNIQUE INDEX" if self.unique else "CREATE INDEX"
+        if concurrently:
+            sql += " CONCURRENTLY"
+        sql += f" IF NOT EXISTS {self.name or self.default_name(table_name)} ON {table_name}"
+        if self.method != "btree":
+            sql += f" USING {self.method}"
+        sql += f" ({columns})"
+        if self.where:
+            sql += f" WHERE {self.where}"
+        return sql
+
+
 class TableSchema:
-    """데이터베이스 테이블 스키마 정의"""
-    def __init__(self, table_name: str, columns: List[ColumnDefinition], logger=None):
+    """데이터베이스 테이블 스키마 정의
+    
+    생성한 SQL 문자열은 (문장 종류, 조건 컬럼) 단위로 캐시한다.
+    컬럼 목록을 바꾼 뒤에는 clear_sql_cache()를 호출해야 한다.
+    """
+    def __init__(self, table_name: str, columns: List[ColumnDefinition], logger=None,
+                 indexes: Optional[List[IndexDefinition]] = None):
         self.table_name = table_name
         self.columns = columns
         self.logger = logger or logging.getLogger(__name__)
+        self.indexes = list(indexes or [])
+        for index in self.indexes:
+            index.name = index.name or index.default_name(table_name)
+        self._sql_cache: Dict[Tuple[str, ...], str] = {}
         self._validate_schema()
         self.logger.debug(f"TableSchema created for {table_name}")
         
@@ -59,6 +113,15 @@ class TableSchema:
         column_names = [col.name for col in self.columns]
         if len(column_names) != len(set(column_names)):
             raise ValueError(f"Table {self.table_name} has duplicate column names")
+        
+        # 인덱스 컬럼이 존재하고 인덱스 이름이 중복되지 않는지 확인
+        for index in self.indexes:
+            unknown = [col for col in index.columns if col not in column_names]
+            if not index.columns or unknown:
+                raise ValueError(f"Index {index.name} on {self.table_name} has unknown columns: {unknown}")
+        index_names = [index.name for index in self.indexes]
+        if len(index_names) != len(set(index_names)):
+            raise ValueError(f"Table {self.table_name} has duplicate index names")
     
     @property
     def primary_key(self) -> ColumnDefinition:
@@ -74,6 +137,18 @@ class TableSchema:
         """모든 컬럼 이름 목록 반환"""
         return [col.name for col in self.columns]
     
+    def clear_sql_cache(self) -> None:
+        """캐시된 SQL 문자열 삭제"""
+        self._sql_cache.clear()
+    
+    def _cached_sql(self, key: Tuple[str, ...], build: Callable[[], str]) -> str:
+        """캐시된 SQL 반환 (없으면 생성해 캐시, 동시에 생성해도 결과가 같으므로 잠금 없음)"""
+        sql = self._sql_cache.get(key)
+        if sql is None:
+            sql = build()
+            self._sql_cache[key] = sql
+        return sql
+    
     def get_column_by_name(self, name: str) -> Optional[ColumnDefinition]:
         """이름으로 컬럼 찾기"""
         for col in self.columns:
@@ -91,39 +166,129 @@ class TableSchema:
         """
         return sql
     
+    def create_indexes_sql(self, concurrently: bool = False) -> List[str]:
+        """인덱스 생성 SQL 목록 생성"""
+        return [index.get_sql_definition(self.table_name, concurrently) for index in self.indexes]
+    
+    @property
+    def required_extensions(self) -> List[str]:
+        """인덱스에 필요한 확장 목록"""
+        return list(dict.fromkeys(index.required_extension for index in self.indexes if index.required_extension))
+    
     def insert_sql(self) -> str:
         """INSERT SQL 템플릿 생성"""
-        columns = ', '.join(self.column_names)
-        placeholders = ', '.join(['%s'] * len(self.column_names))
-        return f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})"
+        def build() -> str:
+            columns = ', '.join(self.column_names)
+            placeholders = ', '.join(['%s'] * len(self.column_names))
+            return f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders})"
+        return self._cached_sql(("insert",), build)
     
     def update_sql(self) -> str:
         """UPDATE SQL 템플릿 생성"""
-        set_clause = ', '.join([f"{col} = %s" for col in self.column_names if col != self.primary_key.name])
-        return f"UPDATE {self.table_name} SET {set_clause} WHERE {self.primary_key.name} = %s"
+        def build() -> str:
+            set_clause = ', '.join([f"{col} = %s" for col in self.column_names if col != self.primary_key.name])
+            return f"UPDATE {self.table_name} SET {set_clause} WHERE {self.primary_key.name} = %s"
+        return self._cached_sql(("update",), build)
+    
+    def upsert_sql(self) -> str:
+        """INSERT ... ON CONFLICT (기본키) DO UPDATE ... RETURNING SQL 생성 (파라미터는 get_insert_params)"""
+        def build() -> str:
+            columns = ', '.join(self.column_names)
+            placeholders = ', '.join(['%s'] * len(self.column_names))
+            pk = self.primary_key.name
+            updates = [col for col in self.column_names if col != pk] or [pk]
+            set_clause = ', '.join(f"{col} = EXCLUDED.{col}" for col in updates)
+            return (f"INSERT INTO {self.table_name} ({columns}) VALUES ({placeholders}) "
+                    f"ON CONFLICT ({pk}) DO UPDATE SET {set_clause} RETURNING {columns}")
+        return self._cached_sql(("upsert",), build)
     
     def select_by_id_sql(self) -> str:
         """ID로 SELECT SQL 생성"""
-        columns = ', '.join(self.column_names)
-        return f"SELECT {columns} FROM {self.table_name} WHERE {self.primary_key.name} = %s"
+        def build() -> str:
+            columns = ', '.join(self.column_names)
+            return f"SELECT {columns} FROM {self.table_name} WHERE {self.primary_key.name} = %s"
+        return self._cached_sql(("select_by_id",), build)
+    
+    def exists_sql(self) -> str:
+        """ID로 존재 여부 확인 SQL 생성"""
+        return self._cached_sql(
+            ("exists",),
+            lambda: f"SELECT 1 FROM {self.table_name} WHERE {self.primary_key.name} = %s LIMIT 1")
     
     def select_by_criteria_sql(self, criteria: Dict[str, Any]) -> Tuple[str, List[Any]]:
-        """조건으로 SELECT SQL 생성"""
-        columns = ', '.join(self.column_names)
-        where_clauses = []
-        params = []
+        """조건으로 SELECT SQL 생성 (SQL은 조건 컬럼 구성별로 캐시)"""
+        column_names = self.column_names
+        keys = tuple(key for key in criteria if key in column_names)
+        params = [criteria[key] for key in keys]
         
-        for key, value in criteria.items():
-            if key in self.column_names:
-                where_clauses.append(f"{key} = %s")
-                params.append(value)
+        def build() -> str:
+            columns = ', '.join(column_names)
+            where_clause = ' AND '.join(f"{key} = %s" for key in keys)
+            return f"SELECT {columns} FROM {self.table_name} WHERE {where_clause}"
+        return self._cached_sql(("select_by_criteria",) + keys, build), params
+    
+    def select_by_any_sql(self, column: str) -> str:
+        """컬럼 값 목록으로 SELECT SQL 생성 (값 배열 하나를 파라미터로 사용)"""
+        if column not in self.column_names:
+            raise ValueError(f"Column {column} not found in {self.table_name}")
         
-        where_clause = ' AND '.join(where_clauses)
-        return f"SELECT {columns} FROM {self.table_name} WHERE {where_clause}", params
+        def build() -> str:
+            columns = ', '.join(self.column_names)
+            return f"SELECT {columns} FROM {self.table_name} WHERE {column} = ANY(%s)"
+        return self._cached_sql(("select_by_any", column), build)
     
     def delete_sql(self) -> str:
-        """DELETE SQL 템플릿 생성"""
-        return f"DELETE FROM {self.table_name} WHERE {self.primary_key.name} = %s"
+        """DELETE SQL 템플릿 생성 (삭제된 행의 기본키 반환)"""
+        return self._cached_sql(
+            ("delete",),
+            lambda: f"DELETE FROM {self.table_name} WHERE {self.primary_key.name} = %s "
+                    f"RETURNING {self.primary_key.name}")
+    
+    def bulk_columns(self, columns: Optional[List[str]] = None) -> Tuple[str, ...]:
+        """대량 upsert 대상 컬럼 검증 (기본값: 모든 컬럼)
+        
+        Raises:
+            ValueError: 없는 컬럼이 있거나 기본키, NOT NULL 컬럼이 빠진 경우
+        """
+        if columns is None:
+            return tuple(self.column_names)
+        unknown = [col for col in columns if col not in self.column_names]
+        if unknown:
+            raise ValueError(f"Unknown columns for {self.table_name}: {', '.join(unknown)}")
+        required = [col.name for col in self.columns if (col.primary_key or not col.nullable) and col.name not in columns]
+        if required:
+            raise ValueError(f"Missing required columns for {self.table_name}: {', '.join(required)}")
+        return tuple(dict.fromkeys(columns))
+    
+    def create_staging_sql(self, staging_table: str, columns: Tuple[str, ...]) -> str:
+        """대량 upsert용 임시 테이블 생성 SQL (제약 조건 없음, 입력 순서 보존용 행 번호 포함)"""
+        def build() -> str:
+            column_defs = ', '.join(f"{col} {self.get_column_by_name(col).data_type}" for col in columns)
+            return f"CREATE TEMP TABLE {staging_table} (_row_number BIGSERIAL, {column_defs}) ON COMMIT DROP"
+        return self._cached_sql(("create_staging", staging_table) + columns, build)
+    
+    def copy_staging_sql(self, staging_table: str, columns: Tuple[str, ...]) -> str:
+        """임시 테이블로 CSV를 읽는 COPY SQL (\\N은 NULL)"""
+        return self._cached_sql(
+            ("copy_staging", staging_table) + columns,
+            lambda: f"COPY {staging_table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+    
+    def merge_staging_sql(self, staging_table: str, columns: Tuple[str, ...]) -> str:
+        """임시 테이블 내용을 INSERT ... ON CONFLICT 한 번으로 병합하고 병합한 행 수를 반환하는 SQL
+        
+        같은 기본키가 여러 번 나오면 마지막 행을 사용한다.
+        """
+        def build() -> str:
+            pk = self.primary_key.name
+            column_list = ', '.join(columns)
+            updates = [col for col in columns if col != pk] or [pk]
+            set_clause = ', '.join(f"{col} = EXCLUDED.{col}" for col in updates)
+            return (f"WITH merged AS ("
+                    f"INSERT INTO {self.table_name} ({column_list}) "
+                    f"SELECT DISTINCT ON ({pk}) {column_list} FROM {staging_table} ORDER BY {pk}, _row_number DESC "
+                    f"ON CONFLICT ({pk}) DO UPDATE SET {set_clause} RETURNING 1"
+                    f") SELECT COUNT(*) AS count FROM merged")
+        return self._cached_sql(("merge_staging", staging_table) + columns, build)
     
     def get_insert_params(self, entity: Any) -> List[Any]:
         """엔티티에서 INSERT 파라미터 추출"""
@@ -153,7 +318,14 @@ def create_company_schema() -> TableSchema:
         ColumnDefinition("fax", "VARCHAR(20)"),
         ColumnDefinition("rep_stamp", "TEXT")
     ]
-    return TableSchema("companies", columns)
+    indexes = [
+        # 보강 조회 (사업자_선택)
+        IndexDefinition(["company_name"]),
+        # search()의 ILIKE '%검색어%'
+        IndexDefinition.trigram("company_name"),
+        IndexDefinition.trigram("address"),
+    ]
+    return TableSchema("companies", columns, indexes=indexes)
 
 def create_employee_schema() -> TableSchema:
     """직원 테이블 스키마 생성"""
@@ -174,7 +346,16 @@ def create_employee_schema() -> TableSchema:
         ColumnDefinition("address", "VARCHAR(200)"),
         ColumnDefinition("fax", "VARCHAR(20)")
     ]
-    return TableSchema("employees", columns)
+    indexes = [
+        # 보강 조회 (Jira 사용자 필드), 계정이 연결되지 않은 직원은 제외
+        IndexDefinition(["jira_account_id"], where="jira_account_id IS NOT NULL"),
+        IndexDefinition(["email"]),
+        # search()의 ILIKE '%검색어%'
+        IndexDefinition.trigram("name"),
+        IndexDefinition.trigram("email"),
+        IndexDefinition.trigram("department"),
+    ]
+    return TableSchema("employees", columns, indexes=indexes)
 
 def create_research_schema() -> TableSchema:
     """연구 과제 테이블 스키마 생성"""
@@ -189,7 +370,14 @@ def create_research_schema() -> TableSchema:
         ColumnDefinition("budget", "INTEGER"),
         ColumnDefinition("status", "VARCHAR(20)")
     ]
-    return TableSchema("research_projects", columns)
+    indexes = [
+        # 보강 조회 (연구과제_선택_key)
+        IndexDefinition(["project_code"]),
+        # search()의 ILIKE '%검색어%'
+        IndexDefinition.trigram("project_name"),
+        IndexDefinition.trigram("project_code"),
+    ]
+    return TableSchema("research_projects", columns, indexes=indexes)
 
 def create_expert_schema() -> TableSchema:
     """전문가 테이블 스키마 생성"""
@@ -202,7 +390,10 @@ def create_expert_schema() -> TableSchema:
         ColumnDefinition("phone", "VARCHAR(20)"),
         ColumnDefinition("specialty", "VARCHAR(100)")
     ]
-    return TableSchema("experts", columns)
+    indexes = [
+        IndexDefinition(["name"]),
+    ]
+    return TableSchema("experts", columns, indexes=indexes)
 
 # 스키마 등록 및 관리
 class SchemaRegistry:
@@ -240,9 +431,13 @@ class SchemaRegistry:
     
     @classmethod
     def generate_create_all_tables_sql(cls) -> str:
-        """모든 테이블 생성 SQL 생성"""
-        sql_statements = [schema.create_table_sql() for schema in cls._schemas.values()]
-        return '\n'.join(sql_statements)
+        """모든 테이블과 인덱스 생성 SQL 생성 (필요한 확장 포함)"""
+        schemas = list(cls._schemas.values())
+        extensions = dict.fromkeys(ext for schema in schemas for ext in schema.required_extensions)
+        sql_statements = [f"CREATE EXTENSION IF NOT EXISTS {ext}" for ext in extensions]
+        sql_statements += [schema.create_table_sql().strip() for schema in schemas]
+        sql_statements += [sql for schema in schemas for sql in schema.create_indexes_sql()]
+        return '\n'.join(f"{sql};" for sql in sql_statements)
 
 # 스키마 등록
 SchemaRegistry.register(create_company_schema())
@@ -241,6 +241,10 @@ class JinjaDocumentRenderer(DocumentRenderer):
                 except Exception as e:
                     self.logger.error("Problem with context key %s: %s", key, str(e))
     
+    def resolve_template(self, document_type: str) -> str:
+        """문서 유형을 렌더링할 때 사용할 템플릿 이름 반환"""
+        return self._get_template_path(document_type)
+    
     def _get_template_path(self, document_type: str) -> str:
         """문서 유형에 맞는 템플릿 파일 경로 찾기"""
         # 우선순위별 템플릿 경로 시도
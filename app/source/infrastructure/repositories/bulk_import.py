@@ -0,0 +1,115 @@
+"""
+기준 데이터 대량 가져오기 CLI
+
+CSV(헤더 필수) 또는 JSONL 파일을 한 줄씩 읽어 GenericRepository.bulk_upsert로 저장한다.
+파일 전체를 메모리에 올리지 않으며, 파일에 있는 컬럼만 저장하고 나머지 컬럼은 기존 값을 유지한다.
+
+    python -m app.source.infrastructure.repositories.bulk_import companies companies.csv
+    python -m app.source.infrastructure.repositories.bulk_import employees employees.jsonl --batch-size 2000
+"""
+
+import argparse
+import csv
+import itertools
+import json
+import logging
+import time
+from typing import Any, Dict, Iterator, List, Tuple
+
+# 테이블명 -> DIContainer 레포지토리 속성
+REPOSITORIES = {
+    "companies": "company_repo",
+    "employees": "employee_repo",
+    "research_projects": "research_repo",
+    "experts": "expert_repo",
+}
+
+
+def read_csv(path: str) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+    """CSV 파일의 컬럼과 행 반복자 반환 (빈 칸은 None)
+
+    Raises:
+        ValueError: 헤더가 없는 경우
+    """
+    f = open(path, newline="", encoding="utf-8-sig")
+    reader = csv.DictReader(f)
+    if not reader.fieldnames:
+        f.close()
+        raise ValueError(f"CSV file has no header: {path}")
+
+    def rows():
+        with f:
+            for row in reader:
+                yield {key: (value if value != "" else None) for key, value in row.items()}
+
+    return list(reader.fieldnames), rows()
+
+
+def read_jsonl(path: str) -> Tuple[List[str], Iterator[Dict[str, Any]]]:
+    """JSONL 파일의 컬럼(첫 행의 키)과 행 반복자 반환
+
+    Raises:
+        ValueError: 빈 파일인 경우
+    """
+    f = open(path, encoding="utf-8")
+    records = (json.loads(line) for line in f if line.strip())
+    first = next(records, None)
+    if first is None:
+        f.close()
+        raise ValueError(f"JSONL file is empty: {path}")
+
+    def rows():
+        with f:
+            yield from itertools.chain([first], records)
+
+    return list(first), rows()
+
+
+class CountingIterator:
+    """읽은 행 수를 세는 반복자"""
+
+    def __init__(self, rows: Iterator[Dict[str, Any]]):
+        self.rows = rows
+        self.count = 0
+
+    def __iter__(self):
+        for row in self.rows:
+            self.count += 1
+            yield row
+
+
+def main():
+    parser = argparse.ArgumentParser(description="기준 데이터 대량 가져오기 (COPY + INSERT ... ON CONFLICT)")
+    parser.add_argument("table", choices=sorted(REPOSITORIES), help="대상 테이블")
+    parser.add_argument("path", help="CSV 또는 JSONL 파일 경로")
+    parser.add_argument("--format", choices=["csv", "jsonl"], help="파일 형식 (기본값: 확장자로 판단)")
+    parser.add_argument("--batch-size", type=int, default=None, help="COPY 한 번에 보낼 행 수")
+    parser.add_argument("--log-level", default="INFO", help="로거 레벨")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    # DIContainer는 렌더러 등 무거운 의존성을 함께 가져오므로 인자 검증 후에 불러옴
+    from app.source.config.app_config import load_config
+    from app.source.config.di_container import DIContainer
+
+    file_format = args.format or ("jsonl" if args.path.endswith((".jsonl", ".ndjson")) else "csv")
+    columns, rows = (read_jsonl if file_format == "jsonl" else read_csv)(args.path)
+
+    container = DIContainer(load_config())
+    repo = getattr(container, REPOSITORIES[args.table])
+    counted = CountingIterator(rows)
+
+    start = time.perf_counter()
+    try:
+        merged = repo.bulk_upsert(counted, columns=columns, batch_size=args.batch_size)
+    finally:
+        container.db_connection.close()
+    elapsed = time.perf_counter() - start
+
+    print(f"{args.table}: {counted.count} row(s) read, {merged} row(s) upserted in {elapsed:.2f}s "
+          f"({counted.count / elapsed if elapsed else 0:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,7 @@ from app.source.core.exceptions import DatabaseError
 import logging
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection
 from app.source.infrastructure.persistence.generic_repository import GenericRepository
+from app.source.infrastructure.persistence.reference_cache import ReferenceDataCache
 from app.source.infrastructure.persistence.schema_definition import SchemaRegistry, create_company_schema
 
 logger = logging.getLogger(__name__)
@@ -15,19 +16,38 @@ logger = logging.getLogger(__name__)
 class CompanyRepositoryV2(GenericRepository[Company]):
     """회사 저장소 - 제네릭 레포지토리 기반"""
     
-    def __init__(self, db_connection: DatabaseConnection, logger=None):
+    # 캐시 워밍 시 채울 조회 컬럼
+    CACHE_KEY_COLUMNS = ("company_name",)
+    
+    def __init__(self, db_connection: DatabaseConnection, logger=None, 
+                 cache: Optional[ReferenceDataCache] = None):
         """초기화
         
         Args:
             db_connection: 데이터베이스 연결 객체
             logger: 로거 인스턴스 (기본값: None, None인 경우 기본 로거 사용)
+            cache: 조회 결과 캐시 (기본값: None, None인 경우 캐시 사용 안 함)
         """
         self.logger = logger or logging.getLogger(__name__)
         # 스키마 가져오기 또는 생성
         schema = SchemaRegistry.get("companies") or create_company_schema()
-        super().__init__(db_connection, schema, Company, self.logger)
+        super().__init__(db_connection, schema, Company, self.logger, cache)
         self.logger.debug("CompanyRepositoryV2 initialized")
     
+    def find_many_by_name(self, company_names: List[str]) -> Dict[str, Company]:
+        """회사명 목록으로 회사를 한 번에 검색
+        
+        Args:
+            company_names: 검색할 회사명 목록
+            
+        Returns:
+            회사명 -> 회사 객체 딕셔너리 (찾지 못한 회사명은 포함되지 않음)
+            
+        Raises:
+            DatabaseError: 데이터베이스 조회 중 오류 발생 시
+        """
+        return self.find_many_by_column("company_name", company_names)
+    
     def find_by_name(self, company_name: str) -> Optional[Company]:
         """회사명으로 회사 검색
         
@@ -1,6 +1,10 @@
 from typing import Dict, Any, Optional
+import argparse
+import logging
 from app.source.config.di_container import DIContainer
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.index_sync import sync_indexes
+from app.source.infrastructure.persistence.reference_cache import create_notify_triggers_sql
 from app.source.infrastructure.persistence.schema_definition import SchemaRegistry, create_company_schema, create_employee_schema, create_research_schema, create_expert_schema, TableSchema
 from app.source.infrastructure.repositories.company_repo_v2 import CompanyRepositoryV2
 from app.source.infrastructure.repositories.employee_repo_v2 import EmployeeRepositoryV2
@@ -8,7 +12,7 @@ from app.source.infrastructure.repositories.research_repo_v2 import ResearchRepo
 from app.source.infrastructure.repositories.expert_repo_v2 import ExpertRepositoryV2
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection
 from app.source.config.settings import Settings
-from app.source.main import load_config
+from app.source.config.app_config import load_config
 
 def get_db_connection() -> DatabaseConnection:
     """데이터베이스 연결 가져오기"""
@@ -68,7 +72,40 @@ def create_expert_table() -> TableSchema:
 def create_all_tables() -> None:
     """모든 테이블 생성"""
     create_employee_table()
-    
+    sync_all_indexes()
+
+def sync_all_indexes() -> list:
+    """스키마에 선언된 인덱스 중 db에 없는 인덱스 생성"""
+    schemas = [get_company_repo().schema, get_employee_repo().schema, get_research_repo().schema, get_expert_repo().schema]
+    return sync_indexes(get_db_connection(), schemas)
+
+def install_reference_triggers() -> None:
+    """기준 데이터 테이블에 변경 알림(NOTIFY) 트리거 설치 (기준 데이터 캐시 리스너용)"""
+    get_db_connection().execute_query(create_notify_triggers_sql(list(DIContainer.REFERENCE_TABLES)))
+
+
+def main():
+    """스키마 관리 CLI (앱 시작과 분리된 마이그레이션 단계)
+
+        python -m app.source.infrastructure.repositories.db_helper create-tables
+        python -m app.source.infrastructure.repositories.db_helper sync-indexes
+        python -m app.source.infrastructure.repositories.db_helper install-triggers
+    """
+    parser = argparse.ArgumentParser(description="데이터베이스 스키마 관리")
+    parser.add_argument("command", nargs="?", default="create-tables",
+                        choices=["create-tables", "sync-indexes", "install-triggers"],
+                        help="create-tables: 테이블과 인덱스 생성, sync-indexes: 없는 인덱스만 CONCURRENTLY로 생성, "
+                             "install-triggers: 기준 데이터 변경 알림 트리거 설치")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(levelname)s %(name)s: %(message)s")
+
+    if args.command == "sync-indexes":
+        print(f"created index(es): {sync_all_indexes() or 'none'}")
+    elif args.command == "install-triggers":
+        install_reference_triggers()
+    else:
+        create_all_tables()
+
 
 if __name__ == "__main__":
-    create_all_tables()
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -8,6 +8,7 @@ from app.source.core.exceptions import DatabaseError
 import logging
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection
 from app.source.infrastructure.persistence.generic_repository import GenericRepository
+from app.source.infrastructure.persistence.reference_cache import ReferenceDataCache
 from app.source.infrastructure.persistence.schema_definition import SchemaRegistry, create_employee_schema
 
 logger = logging.getLogger(__name__)
@@ -15,17 +16,22 @@ logger = logging.getLogger(__name__)
 class EmployeeRepositoryV2(GenericRepository[Employee]):
     """직원 저장소 - 제네릭 레포지토리 기반"""
     
-    def __init__(self, db_connection: DatabaseConnection, logger=None):
+    # 캐시 워밍 시 채울 조회 컬럼
+    CACHE_KEY_COLUMNS = ("jira_account_id", "email")
+    
+    def __init__(self, db_connection: DatabaseConnection, logger=None, 
+                 cache: Optional[ReferenceDataCache] = None):
         """초기화
         
         Args:
             db_connection: 데이터베이스 연결 객체
             logger: 로거 인스턴스 (기본값: None, None인 경우 기본 로거 사용)
+            cache: 조회 결과 캐시 (기본값: None, None인 경우 캐시 사용 안 함)
         """
         self.logger = logger or logging.getLogger(__name__)
         # 스키마 가져오기 또는 생성
         schema = SchemaRegistry.get("employees") or create_employee_schema()
-        super().__init__(db_connection, schema, Employee, self.logger)
+        super().__init__(db_connection, schema, Employee, self.logger, cache)
         self.logger.debug("EmployeeRepositoryV2 initialized")
     
     def find_by_email(self, email: str) -> Optional[Employee]:
@@ -74,6 +80,20 @@ class EmployeeRepositoryV2(GenericRepository[Employee]):
                 raise DatabaseError(f"{error_msg}: {str(e)}")
             raise e
     
+    def find_many_by_jira_account_id(self, account_ids: List[str]) -> Dict[str, Employee]:
+        """Jira 계정 ID 목록으로 직원을 한 번에 검색
+        
+        Args:
+            account_ids: 검색할 Jira 계정 ID 목록
+            
+        Returns:
+            Jira 계정 ID -> 직원 객체 딕셔너리 (찾지 못한 ID는 포함되지 않음)
+            
+        Raises:
+            DatabaseError: 데이터베이스 조회 중 오류 발생 시
+        """
+        return self.find_many_by_column("jira_account_id", account_ids)
+    
     def find_by_department(self, department: str) -> List[Employee]:
         """부서로 직원 목록 검색
         
@@ -8,6 +8,7 @@ from app.source.core.exceptions import DatabaseError
 import logging
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection
 from app.source.infrastructure.persistence.generic_repository import GenericRepository
+from app.source.infrastructure.persistence.reference_cache import ReferenceDataCache
 from app.source.infrastructure.persistence.schema_definition import SchemaRegistry, create_expert_schema
 
 logger = logging.getLogger(__name__)
@@ -15,17 +16,19 @@ logger = logging.getLogger(__name__)
 class ExpertRepositoryV2(GenericRepository[Expert]):
     """전문가 저장소 - 제네릭 레포지토리 기반"""
     
-    def __init__(self, db_connection: DatabaseConnection, logger=None):
+    def __init__(self, db_connection: DatabaseConnection, logger=None, 
+                 cache: Optional[ReferenceDataCache] = None):
         """초기화
         
         Args:
             db_connection: 데이터베이스 연결 객체
             logger: 로거 인스턴스 (기본값: None, None인 경우 기본 로거 사용)
+            cache: 조회 결과 캐시 (기본값: None, None인 경우 캐시 사용 안 함)
         """
         self.logger = logger or logging.getLogger(__name__)
         # 스키마 가져오기 또는 생성
         schema = SchemaRegistry.get("experts") or create_expert_schema()
-        super().__init__(db_connection, schema, Expert, self.logger)
+        super().__init__(db_connection, schema, Expert, self.logger, cache)
         self.logger.debug("ExpertRepositoryV2 initialized")
     
     def find_by_id(self, expert_id: str) -> Optional[Expert]:
@@ -111,8 +114,8 @@ class ExpertRepositoryV2(GenericRepository[Expert]):
             query = """
                 SELECT * FROM experts 
                 WHERE name ILIKE %s 
-                OR expertise ILIKE %s
-                OR organization ILIKE %s
+                OR specialty ILIKE %s
+                OR affiliation ILIKE %s
             """
             search_pattern = f"%{keywords}%"
             params = (search_pattern, search_pattern, search_pattern)
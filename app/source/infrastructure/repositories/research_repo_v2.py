@@ -8,6 +8,7 @@ from app.source.core.exceptions import DatabaseError
 import logging
 from app.source.infrastructure.persistence.db_connection import DatabaseConnection
 from app.source.infrastructure.persistence.generic_repository import GenericRepository
+from app.source.infrastructure.persistence.reference_cache import ReferenceDataCache
 from app.source.infrastructure.persistence.schema_definition import SchemaRegistry, create_research_schema
 
 logger = logging.getLogger(__name__)
@@ -15,17 +16,22 @@ logger = logging.getLogger(__name__)
 class ResearchRepositoryV2(GenericRepository[Research]):
     """연구 과제 저장소 - 제네릭 레포지토리 기반"""
     
-    def __init__(self, db_connection: DatabaseConnection, logger=None):
+    # 캐시 워밍 시 채울 조회 컬럼
+    CACHE_KEY_COLUMNS = ("project_code",)
+    
+    def __init__(self, db_connection: DatabaseConnection, logger=None, 
+                 cache: Optional[ReferenceDataCache] = None):
         """초기화
         
         Args:
             db_connection: 데이터베이스 연결 객체
             logger: 로거 인스턴스 (기본값: None, None인 경우 기본 로거 사용)
+            cache: 조회 결과 캐시 (기본값: None, None인 경우 캐시 사용 안 함)
         """
         self.logger = logger or logging.getLogger(__name__)
         # 스키마 가져오기 또는 생성
         schema = SchemaRegistry.get("research_projects") or create_research_schema()
-        super().__init__(db_connection, schema, Research, self.logger)
+        super().__init__(db_connection, schema, Research, self.logger, cache)
         self.logger.debug("ResearchRepositoryV2 initialized")
     
     def find_by_project_code(self, project_code: str) -> Optional[Research]:
@@ -95,6 +101,20 @@ class ResearchRepositoryV2(GenericRepository[Research]):
                 self.logger.error("%s: %s (code=%s)", error_msg, str(e), code)
                 raise DatabaseError(f"{error_msg}: {str(e)}")
     
+    def find_many_by_code(self, codes: List[str]) -> Dict[str, Research]:
+        """코드 목록으로 연구 과제를 한 번에 검색
+        
+        Args:
+            codes: 검색할 프로젝트 코드 목록
+            
+        Returns:
+            프로젝트 코드 -> 연구 과제 객체 딕셔너리 (찾지 못한 코드는 포함되지 않음)
+            
+        Raises:
+            DatabaseError: 데이터베이스 조회 중 오류 발생 시
+        """
+        return self.find_many_by_column("project_code", codes)
+    
     def find_by_status(self, status: str) -> List[Research]:
         """상태로 연구 과제 목록 검색
         
@@ -118,7 +138,9 @@ class ResearchRepositoryV2(GenericRepository[Research]):
             raise e
     
     def search(self, keywords: str) -> List[Research]:
-        """키워드로 연구 과제 검색 (프로젝트명, 프로젝트 코드, 설명)
+        """키워드로 연구 과제 검색 (프로젝트명, 프로젝트 코드)
+        
+        두 컬럼 모두 트라이그램 인덱스가 있어 '%검색어%' 조건도 BitmapOr 인덱스 스캔으로 처리된다.
         
         Args:
             keywords: 검색 키워드
@@ -134,10 +156,9 @@ class ResearchRepositoryV2(GenericRepository[Research]):
                 SELECT * FROM research_projects 
                 WHERE project_name ILIKE %s 
                 OR project_code ILIKE %s
-                OR description ILIKE %s
             """
             search_pattern = f"%{keywords}%"
-            params = (search_pattern, search_pattern, search_pattern)
+            params = (search_pattern, search_pattern)
             
             self.logger.debug("Searching research projects with keywords: %s", keywords)
             
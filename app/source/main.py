@@ -2,9 +2,10 @@ import os
 import sys
 import argparse
 import logging
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from app.source.application.dto.document_dto import DocumentRequestDTO, DocumentResponseDTO
 from app.source.config.settings import get_settings
+from app.source.config.app_config import load_config
 from app.source.config.di_container import DIContainer
 from app.source.core.exceptions import DocumentAutomationError, RenderingError
 from flask import Flask, request, jsonify, abort
@@ -12,6 +13,7 @@ from flask_cors import CORS
 import logging.handlers
 from datetime import datetime
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from pathlib import Path
 
@@ -103,32 +105,6 @@ def setup_logging(level: str = "INFO", log_dir_env: Optional[str] = None) -> log
 
     return root_logger
 
-def load_config() -> Dict[str, Any]:
-    """설정 로드"""
-    config = {
-        "schema_path": os.path.join("app", "source", "schemas", "IntegratedDocumentSchema.json"),
-        "template_dir": os.path.join("app", "source", "templates"),
-        "static_dir": os.path.abspath(os.path.join("app", "resources")),
-        "output_dir": os.path.join("output/Paperworks/Paperworks/00. 연구비 증빙서류"),
-        "dir_name_format": "{research_project}/{parent_issue_subject}/{date}_{parent_issue_key}_{parent_title}",
-        "file_name_format": "{summary}",
-        "database": {
-            "host": os.environ.get("DB_HOST", "db"),
-            "port": int(os.environ.get("DB_PORT", 5432)),
-            "user": os.environ.get("DB_USER", "myuser"),
-            "password": os.environ.get("DB_PASSWORD", "mypassword"),
-            "database": os.environ.get("DB_NAME", "mydb")
-        },
-        "jira": {
-            "base_url": os.environ.get("JIRA_BASE_URL"),
-            "username": os.environ.get("JIRA_USERNAME"),
-            "api_token": os.environ.get("JIRA_API_TOKEN"),
-            "download_dir": os.path.join("downloads"),
-            "field_mapping_source": "api"  # or "file"
-        }
-    }
-    return config
-
 def process_jira_issue_with_data(container: DIContainer, issue_data: dict) -> Optional[Dict[str, Any]]:
     """Jira 이슈 데이터 처리"""
     logger = container.logger
@@ -138,8 +114,8 @@ def process_jira_issue_with_data(container: DIContainer, issue_data: dict) -> Op
     mapped_jira_data = container.jira_client.map_issue(jira_data)
     
     logger.info("Mapping Jira data to document data")
-    # Jira 데이터 preprocess
-    document_data = container.jira_document_mapper.preprocess_fields(mapped_jira_data)
+    # Jira 데이터 preprocess는 DocumentService의 전처리기(PipelineJiraPreprocessor)가 문서 유형별 단계로 수행
+    document_data = mapped_jira_data
 
     document_type = container.document_service.get_document_type(document_data)
     document_data['document_type'] = document_type
@@ -161,13 +137,17 @@ def process_jira_issue_with_data(container: DIContainer, issue_data: dict) -> Op
     #    shutil.copy(result['full_path'], output_path)
     #    logger.info("Document saved to: %s", output_path)
     
-    process_save_document(document_data, result)
+    save_report = process_save_document(document_data, result)
     # PDF 바이트 데이터를 제외한 응답 생성
     response_data = {
         "document_type": result['document_type'],
         "issue_key": issue_key,
-        "status": "success"
+        "status": "error" if save_report["errors"] else "success",
+        "saved_path": save_report["path"],
+        "sinks": save_report["sinks"],
     }
+    if save_report["errors"]:
+        response_data["errors"] = save_report["errors"]
     
     return response_data
 
@@ -219,12 +199,21 @@ def _get_document_name(issue_data: dict, extension: str = "pdf") -> str:
     logger.debug(f"name: {name}")
     return f"{name}.{extension}"
 
-def process_jira_issue(container: DIContainer, issue_key: str) -> Optional[Dict[str, Any]]:
+def _get_issue_projection(container: DIContainer, document_type: Optional[str]) -> Optional[Dict[str, list]]:
+    """문서 유형의 Jira 조회 필드 (mapping_config.yaml의 issue_fields 목록 + 템플릿이 사용하는 필드)"""
+    if not document_type:
+        return None
+    plan = container.enrichment_plan_compiler.get_plan(document_type)
+    return container.mapping_config_loader.get_issue_projection(
+        document_type, plan.issue_fields() if plan else None)
+
+def process_jira_issue(container: DIContainer, issue_key: str, document_type: Optional[str] = None) -> Optional[Dict[str, Any]]:
     """Jira 이슈 처리 및 문서 생성
     
     Args:
         container: DI 컨테이너
         issue_key: Jira 이슈 키
+        document_type: 문서 유형 (지정하면 해당 유형의 템플릿과 issue_fields에 선언된 필드만 조회)
         
     Returns:
         생성된 문서 정보 또는 None
@@ -232,7 +221,11 @@ def process_jira_issue(container: DIContainer, issue_key: str) -> Optional[Dict[
     logger = container.logger
     # Jira 이슈 데이터 가져오기
     logger.info("Fetching Jira issue: %s", issue_key)
-    jira_data = container.jira_client.get_issue(issue_key)
+    projection = _get_issue_projection(container, document_type)
+    if projection:
+        jira_data = container.jira_client.get_issue(issue_key, fields=projection["fields"], expand=projection["expand"])
+    else:
+        jira_data = container.jira_client.get_issue(issue_key)
     logger.debug(f"Jira issue data: {jira_data}")
     result = process_jira_issue_with_data(container, jira_data)
     return result
@@ -241,39 +234,90 @@ def process_jira_issue(container: DIContainer, issue_key: str) -> Optional[Dict[
     #    logger.error("Error processing Jira issue")
     #    return None
     
+def process_jira_issues_by_jql(container: DIContainer, jql: str, document_type: Optional[str] = None, page_size: int = 100) -> List[Dict[str, Any]]:
+    """JQL로 조회한 이슈들의 문서를 일괄 생성 (페이지 단위 스트리밍)
+    
+    Args:
+        container: DI 컨테이너
+        jql: JQL 쿼리
+        document_type: 문서 유형 (지정하면 해당 유형에 필요한 필드만 조회)
+        page_size: 페이지당 이슈 수
+        
+    Returns:
+        생성된 문서 정보 목록 (실패한 이슈 제외)
+    """
+    logger = container.logger
+    projection = _get_issue_projection(container, document_type)
+    fields = projection["fields"] if projection else None
+    expand = projection["expand"] if projection else None
+    
+    results = []
+    for jira_data in container.jira_client.search(jql, fields=fields, page_size=page_size, expand=expand):
+        try:
+            result = process_jira_issue_with_data(container, jira_data)
+            if result:
+                results.append(result)
+        except Exception as e:
+            logger.error("Error processing issue %s: %s", jira_data.get("key"), str(e), exc_info=True)
+    logger.info("Generated %d documents for JQL: %s", len(results), jql)
+    return results
+
 
 #TODO: 문서 저장 경로 추출, 문서 저장 처리(jira 이슈에 첨부, sharepoint 혹은 onedrive 에 저장)
-def process_save_document(request_data: Dict[str, Any], result: Dict[str, Any]):
+def process_save_document(request_data: Dict[str, Any], result: Dict[str, Any]) -> Dict[str, Any]:
     """
     요청 데이터에서 문서 저장 경로를 추출하고, 문서를 저장합니다.
+    
+    생성 문서의 Jira 업로드와 출력 디렉토리 보관은 동시에 실행하고,
+    두 작업의 결과를 하나의 보고서로 반환합니다.
+    
+    Returns:
+        Dict[str, Any]: 작업별 결과 {"path": ..., "sinks": {이름: {"status", "error"}}, "errors": [...]}
     """
     logger = container.logger
     strategy_type = result.get("strategy_type", DocumentStrategyType.GENERATION.value)
     logger.debug(f"result: {result}")
-    import shutil
-    from pathlib import Path
+    sinks = {}
     if strategy_type == DocumentStrategyType.GENERATION.value:
-        # Jira에 업로드
-        container.jira_client.upload_attachment(request_data['key'], result['full_path'])
-        # 생성된 PDF 파일 저장
         path = os.path.join(_get_document_path(request_data),  _get_document_name(request_data))
         logger.debug(f"path: {path}")
-        # destination directory 생성
-        Path(_get_document_path(request_data)).mkdir(parents=True, exist_ok=True)
-        # 기존 파일이 존재하면 삭제
-        if os.path.exists(path):
-            os.remove(path)
-        shutil.copy(result['full_path'], path)
+        # Jira에 업로드 / 생성된 PDF 파일 저장
+        sinks["jira_upload"] = lambda: container.jira_client.upload_attachment(request_data['key'], result['full_path'])
+        sinks["archive"] = lambda: _archive_document(result['full_path'], path, shutil.copy)
     
     elif strategy_type == DocumentStrategyType.DOWNLOAD.value:
         # 다운로드된 파일은 이미 Jira에 있으므로 업로드 불필요
         path = os.path.join(_get_document_path(request_data),  _get_document_name(request_data, result['extension']))
-        # destination directory 생성
-        os.makedirs(os.path.dirname(path), exist_ok=True)
         logger.debug(f"result['file_path']: {result['file_path']}, path: {path}")
-        shutil.copy2(result['full_path'], path)
+        sinks["archive"] = lambda: _archive_document(result['full_path'], path, shutil.copy2)
+    else:
+        return {"path": None, "sinks": {}, "errors": []}
+    
+    report = {"path": path, "sinks": {}, "errors": []}
+    with ThreadPoolExecutor(max_workers=len(sinks), thread_name_prefix="save-sink") as executor:
+        futures = {name: executor.submit(sink) for name, sink in sinks.items()}
+        for name, future in futures.items():
+            try:
+                future.result()
+                report["sinks"][name] = {"status": "success"}
+            except Exception as e:
+                logger.error("Failed to save document (%s): %s", name, str(e), exc_info=True)
+                report["sinks"][name] = {"status": "error", "error": str(e)}
+                report["errors"].append(f"{name}: {str(e)}")
     
-    logger.info("Document saved to: %s", path)
+    if not report["errors"]:
+        logger.info("Document saved to: %s", path)
+    return report
+
+
+def _archive_document(source_path: str, path: str, copy_func) -> None:
+    """생성된 문서를 출력 디렉토리 트리에 복사"""
+    # destination directory 생성
+    Path(os.path.dirname(path)).mkdir(parents=True, exist_ok=True)
+    # 기존 파일이 존재하면 삭제
+    if os.path.exists(path):
+        os.remove(path)
+    copy_func(source_path, path)
 
 
 
@@ -291,6 +335,7 @@ def initialize_app(log_level: str = "INFO") -> Flask:
     # 3) DIContainer
     global container
     container = DIContainer(config, logger)
+    container.initialize_reference_cache()
 
     # 4) Flask
     app = create_flask_app(config, logger)
@@ -304,12 +349,17 @@ def main():
     """메인 함수"""
     # 명령행 인자 파싱
     parser = argparse.ArgumentParser(description="Jira 이슈에서 문서 생성")
-    parser.add_argument("issue_key", help="Jira 이슈 키 (예: ACCO-74)")
+    parser.add_argument("issue_key", nargs="?", help="Jira 이슈 키 (예: ACCO-74)")
+    parser.add_argument("--jql", help="JQL로 조회한 이슈 전체에 대해 문서 생성 (issue_key 대신 사용)")
+    parser.add_argument("--page-size", type=int, default=100, help="--jql 사용 시 페이지당 이슈 수")
     parser.add_argument("--output-dir", help="출력 디렉토리 경로")
+    parser.add_argument("--document-type", help="문서 유형 (예: 회의록) - 해당 유형에 필요한 필드만 조회")
     parser.add_argument("--log-level", default="INFO", 
                        choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"],
                        help="로깅 레벨 설정")
     args = parser.parse_args()
+    if not args.issue_key and not args.jql:
+        parser.error("issue_key 또는 --jql 중 하나를 지정해야 합니다")
     
     try:
         # 로깅 설정
@@ -329,16 +379,28 @@ def main():
         # DI 컨테이너 초기화
         global container
         container = DIContainer(config, logger)
+        container.initialize_reference_cache()
         
         # Jira 이슈 처리
-        result = process_jira_issue(container, args.issue_key)
-        
-        if result:
-            logger.info("Document generation completed successfully")
-            sys.exit(0)
+        if args.jql:
+            result = process_jira_issues_by_jql(container, args.jql, args.document_type, args.page_size)
         else:
+            result = process_jira_issue(container, args.issue_key, args.document_type)
+        
+        if not result:
             logger.error("Document generation failed")
             sys.exit(1)
+        
+        # 문서는 만들었지만 저장(Jira 업로드, 출력 디렉토리 보관)에 실패한 경우도 실패로 종료
+        results = result if isinstance(result, list) else [result]
+        failed = [item for item in results if item.get("status") == "error"]
+        if failed:
+            for item in failed:
+                logger.error("Failed to save document for %s: %s", item.get("issue_key"), "; ".join(item.get("errors", [])))
+            sys.exit(1)
+        
+        logger.info("Document generation completed successfully")
+        sys.exit(0)
             
     except Exception as e:
         logger.error("Unexpected error: %s", str(e), exc_info=True)
@@ -354,11 +416,17 @@ def create_document():
         logger.debug("Request Content-Type: %s", request.content_type)
         logger.debug("Request Body: %s", request.get_data(as_text=True))
             
-        result = process_jira_issue_with_data(get_container(), request_data['issue'])
+        current = get_container()
+        # 웹훅으로 받은 원본 이슈만 캐시에 등록 (같은 이슈 재조회 시 API 호출 생략)
+        # get_issue/search 결과는 이미 매핑/투영된 데이터이므로 등록하지 않음
+        current.jira_client.seed_issue(request_data['issue'])
+        result = process_jira_issue_with_data(current, request_data['issue'])
         
         if not result:
             return jsonify({"error": "Failed to process Jira issue"}), 500
-            
+        if result.get("errors"):
+            # 업로드/보관 중 일부가 실패한 경우 전체 결과와 함께 오류 반환
+            return jsonify(result), 500
         
         return jsonify(result)
     
@@ -366,6 +434,19 @@ def create_document():
         app.logger.error(f"Error creating document: {str(e)}", exc_info=True)
         return jsonify({"error": str(e)}), 500
 
+@app.route("/api/debug/db-stats", methods=['GET'])
+def db_stats():
+    """데이터베이스 연결 풀, 기준 데이터 캐시 통계 API"""
+    try:
+        current = get_container()
+        return jsonify({
+            "pool": current.db_connection.get_pool_stats(),
+            "reference_cache": current.get_reference_cache_stats()
+        })
+    except Exception as e:
+        app.logger.error(f"Error collecting database stats: {str(e)}", exc_info=True)
+        return jsonify({"error": str(e)}), 500
+
 @app.route("/api/debug/file-check", methods=['GET'])
 def check_files():
     """파일 시스템 디버깅 API"""
@@ -0,0 +1,81 @@
+"""마크다운 테이블 파서 벤치마크
+
+10k 행 지출 테이블을 기존 방식(문자열 분할 후 문자열 값 반환 + 금액 재파싱)과
+스키마 기반 파싱(파싱 중 타입 변환)으로 처리하는 시간을 비교한다.
+
+    python -m app.source.tests.benchmarks.bench_markdown_parser --rows 10000
+"""
+import argparse
+import time
+from app.source.infrastructure.mapping.markdown_parser import MarkdownTableParser
+
+EXPENSE_SCHEMA = [
+    {"name": "date", "key": "date", "type": "date"},
+    {"name": "amount", "key": "amount", "type": "int"},
+]
+
+
+def build_expense_table(rows, escaped_pipes=False):
+    """지출 테이블 생성 (escaped_pipes: 적요에 '\\|' 포함 - 기존 파서는 이 행들을 버림)"""
+    separator = "\\|" if escaped_pipes else "-"
+    lines = ["| date | category | detail | amount |", "|:---|:---:|---|---:|"]
+    for i in range(rows):
+        lines.append(f"| 2024-05-{i % 28 + 1:02d} | 교통비 | KTX {separator} 왕복 {i} | {(i % 500 + 1) * 1000:,} |")
+    return "\n".join(lines)
+
+
+def legacy_parse(markdown_text):
+    """기존 MarkdownTableParser.parse_table 구현 + 금액 재파싱"""
+    lines = markdown_text.strip().split('\n')
+    headers = [h.strip() for h in lines[0].strip('|').split('|')]
+    result = []
+    for line in lines[1:]:
+        if not line.strip():
+            continue
+        values = [v.strip() for v in line.strip('|').split('|')]
+        if len(values) == len(headers):
+            row_dict = dict(zip(headers, values))
+            if any(row_dict.values()):
+                result.append(row_dict)
+    total = 0
+    for row in result:
+        try:
+            total += int(row['amount'].replace(',', ''))
+        except ValueError:
+            pass
+    return total
+
+
+def typed_parse(markdown_text):
+    rows = MarkdownTableParser.parse_table(markdown_text, EXPENSE_SCHEMA)
+    return sum(row['amount'] or 0 for row in rows)
+
+
+def measure(func, text, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(text)
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="마크다운 테이블 파서 벤치마크")
+    parser.add_argument("--rows", type=int, default=10000, help="테이블 행 수")
+    parser.add_argument("--repeat", type=int, default=5, help="반복 횟수 (최소값 사용)")
+    args = parser.parse_args()
+
+    text = build_expense_table(args.rows)
+    legacy_ms = measure(legacy_parse, text, args.repeat)
+    typed_ms = measure(typed_parse, text, args.repeat)
+    escaped_ms = measure(typed_parse, build_expense_table(args.rows, escaped_pipes=True), args.repeat)
+
+    print(f"rows: {args.rows}")
+    print(f"legacy (strings + re-parse)    : {legacy_ms:8.2f} ms")
+    print(f"typed schema parse             : {typed_ms:8.2f} ms")
+    print(f"typed schema parse, '\\|' cells : {escaped_ms:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Jira 전처리 벤치마크
+
+기록된 페이로드(tests/fixtures/preprocessing)에 대해 기존 2단계 처리
+(JiraDocumentMapper.preprocess_fields + JiraPreprocessor.preprocess)와
+FusedJiraPreprocessor의 이슈당 처리 시간을 비교한다.
+
+    python -m app.source.tests.benchmarks.bench_preprocessing --iterations 2000
+"""
+import argparse
+import copy
+import glob
+import json
+import logging
+import os
+import time
+from app.source.application.services.preprocessor import JiraPreprocessor
+from app.source.application.services.fused_preprocessor import FusedJiraPreprocessor
+from app.source.infrastructure.mapping.jira_document_mapper import JiraDocumentMapper
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "preprocessing")
+
+
+def load_payloads(fixtures_dir=FIXTURES_DIR):
+    payloads = []
+    for path in sorted(glob.glob(os.path.join(fixtures_dir, "*.json"))):
+        with open(path, encoding="utf-8") as f:
+            payloads.append(json.load(f))
+    return payloads
+
+
+def measure(process, payloads, iterations):
+    """이슈 1건당 평균 처리 시간(마이크로초) 반환 (입력 복사 시간 제외)"""
+    elapsed = 0.0
+    for _ in range(iterations):
+        batch = [copy.deepcopy(payload) for payload in payloads]
+        start = time.perf_counter()
+        for payload in batch:
+            process(payload)
+        elapsed += time.perf_counter() - start
+    return elapsed / (iterations * len(payloads)) * 1_000_000
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Jira 전처리 벤치마크")
+    parser.add_argument("--iterations", type=int, default=1000, help="반복 횟수")
+    parser.add_argument("--log-level", default="INFO", help="벤치마크 중 로거 레벨 (운영 환경과 동일하게 INFO)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, handlers=[logging.NullHandler()])
+    payloads = load_payloads()
+
+    mapper = JiraDocumentMapper()
+    legacy = JiraPreprocessor()
+    fused = FusedJiraPreprocessor()
+
+    legacy_us = measure(lambda data: legacy.preprocess(mapper.preprocess_fields(data)), payloads, args.iterations)
+    fused_us = measure(fused.preprocess, payloads, args.iterations)
+
+    print(f"payloads: {len(payloads)}, iterations: {args.iterations}")
+    print(f"legacy (mapper + preprocessor): {legacy_us:8.1f} us/issue")
+    print(f"fused                         : {fused_us:8.1f} us/issue")
+    print(f"speedup                       : {legacy_us / fused_us:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""레포지토리 조회 벤치마크
+
+1) SQL 문자열 생성: 매번 생성(캐시 비움)과 TableSchema SQL 캐시의 호출당 시간을 비교한다 (DB 불필요).
+2) 조회 지연: 실제 데이터베이스(DB_HOST 등 config.app_config.load_config와 같은 환경 변수)의 employees 행을 대상으로
+   find_by_id / find_many_by_column 1회당 지연을 일반 실행과 준비 문장(PREPARE/EXECUTE) 실행으로 비교한다.
+   조회 결과 캐시는 사용하지 않는다.
+
+    python -m app.source.tests.benchmarks.bench_repository_lookup --iterations 2000
+    python -m app.source.tests.benchmarks.bench_repository_lookup --sql-only
+"""
+import argparse
+import logging
+import os
+import time
+from app.source.core.domain import Employee
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.generic_repository import GenericRepository
+from app.source.infrastructure.persistence.schema_definition import create_employee_schema
+
+
+def db_config(prepared_statements):
+    return {
+        "host": os.environ.get("DB_HOST", "localhost"),
+        "port": int(os.environ.get("DB_PORT", 5432)),
+        "user": os.environ.get("DB_USER", "myuser"),
+        "password": os.environ.get("DB_PASSWORD", "mypassword"),
+        "database": os.environ.get("DB_NAME", "mydb"),
+        "prepared_statements": prepared_statements,
+        "pool": {"min_size": 1, "max_size": 1},
+    }
+
+
+def measure(call, iterations):
+    """호출 1회당 평균 시간(마이크로초) 반환"""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        call()
+    return (time.perf_counter() - start) / iterations * 1_000_000
+
+
+def bench_sql(iterations):
+    schema = create_employee_schema()
+    criteria = {"email": "hong@example.com"}
+
+    def build_all():
+        schema.select_by_id_sql()
+        schema.select_by_criteria_sql(criteria)
+        schema.select_by_any_sql("jira_account_id")
+        schema.update_sql()
+
+    def rebuild_all():
+        schema.clear_sql_cache()
+        build_all()
+
+    rebuilt_us = measure(rebuild_all, iterations)
+    cached_us = measure(build_all, iterations)
+    print(f"SQL generation (4 statements), iterations: {iterations}")
+    print(f"rebuilt every call : {rebuilt_us:8.2f} us")
+    print(f"cached             : {cached_us:8.2f} us")
+    print(f"speedup            : {rebuilt_us / cached_us:8.2f}x")
+
+
+def bench_lookups(iterations, sample_size):
+    results = {}
+    for prepared in (False, True):
+        db = DatabaseConnection(db_config(prepared))
+        repo = GenericRepository(db, create_employee_schema(), Employee)
+        try:
+            with db.connection_scope():
+                rows = db.execute_query(f"SELECT id, email FROM employees ORDER BY id LIMIT {int(sample_size)}")
+                if not rows:
+                    print("employees table is empty, skipping lookup benchmark")
+                    return
+                ids = [row["id"] for row in rows]
+                emails = [row["email"] for row in rows]
+                # 준비 비용은 연결당 한 번이므로 측정 전에 한 번 실행
+                repo.find_by_id(ids[0])
+                repo.find_many_by_column("email", emails)
+
+                lookups = iter(range(iterations * 2))
+                by_id_us = measure(lambda: repo.find_by_id(ids[next(lookups) % len(ids)]), iterations)
+                many_us = measure(lambda: repo.find_many_by_column("email", emails), iterations)
+                results[prepared] = (by_id_us, many_us)
+        finally:
+            db.close()
+
+    print(f"lookups against {db_config(False)['host']}, iterations: {iterations}, sample rows: {sample_size}")
+    print(f"{'':18} {'find_by_id':>12} {'find_many':>12}")
+    for prepared, label in ((False, "plain"), (True, "prepared")):
+        by_id_us, many_us = results[prepared]
+        print(f"{label:18} {by_id_us:9.1f} us {many_us:9.1f} us")
+    plain, prepared = results[False], results[True]
+    print(f"{'speedup':18} {plain[0] / prepared[0]:10.2f}x {plain[1] / prepared[1]:10.2f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="레포지토리 조회 벤치마크")
+    parser.add_argument("--iterations", type=int, default=1000, help="반복 횟수")
+    parser.add_argument("--sample-size", type=int, default=20, help="조회에 사용할 employees 행 수")
+    parser.add_argument("--sql-only", action="store_true", help="SQL 생성 비용만 측정 (DB 불필요)")
+    parser.add_argument("--log-level", default="INFO", help="벤치마크 중 로거 레벨 (운영 환경과 동일하게 INFO)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=args.log_level, handlers=[logging.NullHandler()])
+    bench_sql(args.iterations * 10)
+    if not args.sql_only:
+        print()
+        bench_lookups(args.iterations, args.sample_size)
+
+
+if __name__ == "__main__":
+    main()
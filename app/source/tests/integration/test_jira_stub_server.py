@@ -0,0 +1,83 @@
+import os
+import shutil
+import tempfile
+import unittest
+from app.source.infrastructure.integrations.jira_client import JiraClient
+from app.source.infrastructure.integrations.http_session import PooledHttpSession
+from app.source.infrastructure.integrations.issue_cache import IssueCache
+from app.source.infrastructure.integrations.rate_limiter import RateLimitConfig, RateLimiter
+from app.source.infrastructure.mapping.jira_field_mapper import ApiJiraFieldMappingProvider, JiraFieldMapperimpl
+from app.source.tests.util.jira_stub_server import JiraStubServer, FaultConfig
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "jira")
+
+
+class TestJiraClientAgainstStub(unittest.TestCase):
+    """로컬 Jira 대역 서버를 상대로 한 JiraClient 통합 테스트"""
+
+    def setUp(self):
+        # 업로드 테스트가 fixture를 건드리지 않도록 복사본 사용
+        self.temp_dir = tempfile.mkdtemp()
+        self.fixtures_dir = os.path.join(self.temp_dir, "jira")
+        shutil.copytree(FIXTURES_DIR, self.fixtures_dir)
+        self.stub = JiraStubServer(self.fixtures_dir).start()
+        self.client = self._create_client()
+
+    def tearDown(self):
+        self.client.close()
+        self.stub.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _create_client(self, **kwargs):
+        client = JiraClient(self.stub.base_url, "user", "token",
+                            download_dir=os.path.join(self.temp_dir, "downloads"), **kwargs)
+        client.field_mapper = JiraFieldMapperimpl(ApiJiraFieldMappingProvider(client))
+        return client
+
+    def test_get_issue_with_projection(self):
+        """매핑된 필드 이름으로 일부 필드만 조회"""
+        issue = self.client.get_issue("ACCO-2", fields=["summary", "회의_목적"])
+
+        self.assertEqual(issue["fields"], {"summary": "회의록 - 5월 정기 회의", "회의_목적": "공정 데이터 분석 결과 공유"})
+
+    def test_etag_revalidation(self):
+        """TTL 만료 후 304 재검증"""
+        client = self._create_client(issue_cache=IssueCache(ttl_seconds=0))
+        client.get_issue("ACCO-2")
+        issue = client.get_issue("ACCO-2")
+
+        self.assertEqual(issue["key"], "ACCO-2")
+        self.assertEqual(client.issue_cache.get_stats()["revalidations"], 1)
+        client.close()
+
+    def test_search_pages(self):
+        """JQL 검색 페이지 순회"""
+        keys = [issue["key"] for issue in self.client.search("project = ACCO", fields=["summary"], page_size=1)]
+
+        self.assertEqual(keys, ["ACCO-1", "ACCO-2"])
+
+    def test_download_and_upload_attachment(self):
+        """첨부 파일 다운로드 후 다시 업로드"""
+        files = self.client.download_attachments("ACCO-2")
+        self.assertEqual(len(files), 1)
+        self.assertEqual(os.path.getsize(files[0]), 2048)
+
+        result = self.client.upload_attachment("ACCO-1", files[0])
+        self.assertEqual(result[0]["filename"], "meeting_photo.jpg")
+        self.assertEqual(result[0]["size"], 2048)
+        self.assertEqual(len(self.client.get_issue("ACCO-1")["fields"]["attachment"]), 1)
+
+    def test_rate_limited_requests_are_retried(self):
+        """429가 주입되어도 속도 제한기를 거치면 요청이 성공"""
+        self.stub.faults = FaultConfig(rate_429=0.5, retry_after=0, seed=1)
+        limiter = RateLimiter(RateLimitConfig(requests_per_second=1000, burst=100, max_retries=20))
+        client = self._create_client(http_session=PooledHttpSession(rate_limiter=limiter))
+
+        for _ in range(5):
+            self.assertEqual(client.get_issue("ACCO-1")["key"], "ACCO-1")
+        self.assertGreater(limiter.get_stats()["throttled"], 0)
+        client.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
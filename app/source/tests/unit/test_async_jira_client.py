@@ -0,0 +1,93 @@
+import asyncio
+import os
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock
+from app.source.infrastructure.integrations.async_jira_client import AsyncJiraClient, ConcurrentJiraClient
+
+
+class TestAsyncJiraClient(unittest.TestCase):
+    
+    def setUp(self):
+        self.client = ConcurrentJiraClient('https://test.atlassian.net', 'user', 'token', max_concurrency=3)
+        self.attachments = [
+            {"content": f"https://test.atlassian.net/attachment/{i}", "filename": f"receipt_{i}.jpg"}
+            for i in range(8)
+        ]
+        self.client.get_issue = MagicMock(return_value={"fields": {"attachment": self.attachments}})
+    
+    def tearDown(self):
+        self.client.close()
+    
+    def test_download_attachments_runs_concurrently_with_bound(self):
+        """세마포어 한도 내에서 병렬 다운로드되는지 테스트"""
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+        
+        def fake_download(url, save_path, **kwargs):
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.05)
+            with lock:
+                state["active"] -= 1
+        
+        self.client._download_file = fake_download
+        files = self.client.download_attachments("TEST-1")
+        
+        self.assertEqual([os.path.basename(f) for f in files], [a["filename"] for a in self.attachments])
+        self.assertGreater(state["peak"], 1)
+        self.assertLessEqual(state["peak"], 3)
+    
+    def test_failed_attachment_is_skipped(self):
+        """실패한 첨부 파일은 결과에서 제외되는지 테스트"""
+        def fake_download(url, save_path, **kwargs):
+            if url.endswith("/3"):
+                raise Exception("boom")
+        
+        self.client._download_file = fake_download
+        files = self.client.download_attachments("TEST-1")
+        
+        self.assertEqual(len(files), 7)
+        self.assertNotIn("receipt_3.jpg", [os.path.basename(f) for f in files])
+    
+    def test_same_filename_attachments_do_not_share_path(self):
+        """파일명이 같은 첨부도 첨부 id별로 다른 경로에 저장되는지 테스트"""
+        attachments = [
+            {"id": str(i), "content": f"https://test.atlassian.net/attachment/{i}", "filename": "receipt.jpg"}
+            for i in range(4)
+        ]
+        self.client.get_issue = MagicMock(return_value={"fields": {"attachment": attachments}})
+        
+        def fake_download(url, save_path, **kwargs):
+            with open(save_path, "w") as f:
+                f.write(url)
+        
+        self.client._download_file = fake_download
+        files = self.client.download_attachments("TEST-1")
+        
+        self.assertEqual(len(set(files)), 4)
+        self.assertEqual({os.path.basename(f) for f in files}, {"receipt.jpg"})
+        for attachment, path in zip(attachments, files):
+            with open(path) as f:
+                self.assertEqual(f.read(), attachment["content"])
+    
+    def test_sync_wrapper_inside_running_loop(self):
+        """이벤트 루프 안에서 동기 래퍼를 호출해도 동작하는지 테스트"""
+        self.client._download_file = lambda url, save_path, **kwargs: None
+        
+        async def call():
+            return self.client.download_attachments("TEST-1")
+        
+        self.assertEqual(len(asyncio.run(call())), 8)
+    
+    def test_async_get_issue(self):
+        """async get_issue 테스트"""
+        async_client = AsyncJiraClient(self.client, max_concurrency=2)
+        try:
+            result = asyncio.run(async_client.get_issue("TEST-1"))
+        finally:
+            async_client.close()
+        self.assertIn("attachment", result["fields"])
+        self.client.get_issue.assert_called_once_with("TEST-1", fields=None, expand=None)
@@ -0,0 +1,77 @@
+import os
+import shutil
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+from app.source.infrastructure.integrations.attachment_cache import AttachmentCache
+from app.source.infrastructure.integrations.jira_client import JiraClient
+
+
+class TestAttachmentCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.cache = AttachmentCache(self.cache_dir, max_bytes=250, min_age_seconds=0)
+    
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
+    
+    def _attachment(self, attachment_id, size=100, filename="photo.jpg"):
+        return {"id": attachment_id, "size": size, "created": "2024-05-01T10:00:00.000+0900",
+                "filename": filename, "content": f"https://x/attachment/{attachment_id}"}
+    
+    def _fetch(self, size=100):
+        def fetch(path):
+            with open(path, "wb") as f:
+                f.write(b"x" * size)
+        return MagicMock(side_effect=fetch)
+    
+    def test_hit_does_not_fetch_again(self):
+        """두 번째 조회는 fetch 없이 같은 경로 반환"""
+        fetch = self._fetch()
+        first = self.cache.get_or_fetch(self._attachment("1"), fetch)
+        second = self.cache.get_or_fetch(self._attachment("1"), fetch)
+        
+        self.assertEqual(first, second)
+        self.assertEqual(os.path.basename(first), "photo.jpg")
+        fetch.assert_called_once()
+        stats = self.cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"]), (1, 1))
+        self.assertEqual(stats["hit_rate"], 0.5)
+    
+    def test_key_changes_with_created_timestamp(self):
+        """같은 id라도 created가 다르면 다른 항목"""
+        changed = dict(self._attachment("1"), created="2024-06-01T10:00:00.000+0900")
+        self.assertNotEqual(AttachmentCache.cache_key(self._attachment("1")), AttachmentCache.cache_key(changed))
+        self.assertIsNone(AttachmentCache.cache_key({"filename": "a.jpg"}))
+    
+    def test_lru_eviction_by_byte_budget(self):
+        """예산 초과 시 가장 오래 사용되지 않은 항목부터 삭제"""
+        path1 = self.cache.get_or_fetch(self._attachment("1"), self._fetch())
+        path2 = self.cache.get_or_fetch(self._attachment("2"), self._fetch())
+        old = time.time() - 100
+        os.utime(path1, (old, old))
+        os.utime(path2, (old + 10, old + 10))
+        # 1번 재사용 → 2번이 가장 오래된 항목이 됨
+        self.cache.get_or_fetch(self._attachment("1"), self._fetch())
+        path3 = self.cache.get_or_fetch(self._attachment("3"), self._fetch())
+        
+        self.assertTrue(os.path.exists(path1))
+        self.assertFalse(os.path.exists(path2))
+        self.assertTrue(os.path.exists(path3))
+        self.assertEqual(self.cache.get_stats()["evictions"], 1)
+    
+    def test_jira_client_returns_cached_path_without_network(self):
+        """캐시 적중 시 JiraClient가 다운로드 요청을 하지 않음"""
+        client = JiraClient('https://test.atlassian.net', 'user', 'token', attachment_cache=self.cache)
+        attachment = self._attachment("10", size=3)
+        client.get_issue = MagicMock(return_value={"fields": {"attachment": [attachment]}})
+        client._download_file = MagicMock(side_effect=lambda url, path, **kwargs: open(path, "wb").write(b"abc"))
+        
+        first = client.download_attachments("TEST-1")
+        second = client.download_attachments("TEST-1")
+        
+        self.assertEqual(first, second)
+        client._download_file.assert_called_once()
+        self.assertEqual(client.get_attachment_cache_stats()["hits"], 1)
@@ -0,0 +1,86 @@
+import re
+import unittest
+from unittest.mock import MagicMock
+from app.source.application.services.data_enricher import SelectiveFieldEnricher
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.repositories.company_repo_v2 import CompanyRepositoryV2
+from app.source.infrastructure.repositories.employee_repo_v2 import EmployeeRepositoryV2
+from app.source.infrastructure.repositories.research_repo_v2 import ResearchRepositoryV2
+from app.source.infrastructure.repositories.expert_repo_v2 import ExpertRepositoryV2
+
+ANY_QUERY = re.compile(r"FROM (\w+) WHERE (\w+) = ANY\(%s\)")
+
+
+def employee_row(i):
+    return {
+        "id": f"EMP-{i:03d}", "name": f"직원{i}", "email": f"emp{i}@example.com", "jira_account_id": f"acc-{i}",
+        "affiliation": "연구소", "department": "개발팀", "position": "연구원", "phone": "010-0000-0000",
+        "signature": None, "stamp": None, "bank_name": None, "account_number": None, "birth_date": None,
+        "address": None, "fax": None,
+    }
+
+
+class FakeDatabase:
+    """WHERE <컬럼> = ANY(%s) 쿼리만 처리하는 DB 대역 (실행한 쿼리 기록)"""
+
+    def __init__(self, tables):
+        self.tables = tables
+        self.queries = []
+
+    def execute_query(self, query, params=None, prepare=False):
+        self.queries.append(query)
+        match = ANY_QUERY.search(query)
+        if not match:
+            raise AssertionError(f"Unexpected per-row query: {query}")
+        table, column = match.groups()
+        return [row for row in self.tables.get(table, []) if row[column] in params[0]]
+
+
+class TestBatchedEnrichment(unittest.TestCase):
+
+    def setUp(self):
+        self.db = FakeDatabase({
+            "employees": [employee_row(i) for i in range(20)],
+            "research_projects": [{
+                "id": "R-1", "project_name": "공정 최적화", "project_code": "R-2024-001", "project_period": None,
+                "project_manager": "홍길동", "project_start_date": None, "project_end_date": None,
+                "budget": 1000, "status": "진행",
+            }],
+        })
+        connection = MagicMock(spec=DatabaseConnection)
+        connection.execute_query.side_effect = self.db.execute_query
+        self.enricher = SelectiveFieldEnricher(
+            CompanyRepositoryV2(connection), EmployeeRepositoryV2(connection),
+            ResearchRepositoryV2(connection), ExpertRepositoryV2(connection),
+        )
+
+    def test_one_query_per_domain_type(self):
+        """참석자 15명 + 작성자/담당자 + 연구과제가 도메인 타입당 한 번의 쿼리로 보강"""
+        data = {"fields": {
+            "내부_인원": [{"accountId": f"acc-{i}"} for i in range(15)] + [{"accountId": "unknown"}],
+            "creator": {"accountId": "acc-16"},
+            "assignee": {"accountId": "acc-0"},
+            "연구과제_선택_key": "R-2024-001",
+        }}
+
+        fields = self.enricher.enrich("회의록", data)["fields"]
+
+        self.assertEqual(len(self.db.queries), 2)
+        self.assertEqual(fields["내부_인원"][14]["name"], "직원14")
+        self.assertNotIn("name", fields["내부_인원"][15])
+        self.assertEqual(fields["creator"]["department"], "개발팀")
+        self.assertEqual(fields["assignee"]["name"], "직원0")
+        self.assertEqual(fields["연구과제_선택_key"], {
+            "value": "R-2024-001", "id": "R-1", "project_name": "공정 최적화", "project_code": "R-2024-001",
+            "project_manager": "홍길동", "status": "진행", "budget": 1000,
+        })
+
+    def test_no_queries_without_lookup_keys(self):
+        """보강 대상 필드가 없으면 조회하지 않음"""
+        self.enricher.enrich("회의록", {"fields": {"summary": "회의", "내부_인원": []}})
+
+        self.assertEqual(self.db.queries, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
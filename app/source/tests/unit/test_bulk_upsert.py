@@ -0,0 +1,110 @@
+import csv
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+from app.source.core.domain import Company
+from app.source.core.exceptions import DatabaseError
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.generic_repository import GenericRepository
+from app.source.infrastructure.persistence.reference_cache import ReferenceDataCache
+from app.source.infrastructure.persistence.schema_definition import create_company_schema
+from app.source.infrastructure.repositories.bulk_import import read_csv, read_jsonl
+
+
+def company(i, **overrides):
+    values = dict(id=f"C-{i}", company_name=f"회사{i}", biz_id=f"000-00-{i:05d}", rep_name=None,
+                  address=None, phone=None)
+    values.update(overrides)
+    return Company(**values)
+
+
+class TestBulkUpsert(unittest.TestCase):
+
+    def setUp(self):
+        self.db = MagicMock(spec=DatabaseConnection)
+        self.copied = []
+
+        def copy_from(query, file):
+            lines = file.read().splitlines()
+            self.copied.append(lines)
+            return len(lines)
+
+        self.db.copy_from.side_effect = copy_from
+        self.db.execute_query.side_effect = lambda query, params=None, prepare=False: (
+            [{"count": 3}] if query.startswith("WITH merged") else [])
+        self.cache = ReferenceDataCache("companies")
+        self.repo = GenericRepository(self.db, create_company_schema(), Company, cache=self.cache)
+
+    def test_rows_are_copied_in_batches_and_merged_once(self):
+        self.cache.put("id", "C-0", [])
+        rows = (company(i) for i in range(5))
+        self.assertEqual(self.repo.bulk_upsert(rows, batch_size=2), 3)
+
+        self.assertEqual([len(batch) for batch in self.copied], [2, 2, 1])
+        self.db.connection_scope.assert_called_once_with(transactional=True)
+        queries = [call.args[0] for call in self.db.execute_query.call_args_list]
+        self.assertTrue(queries[0].startswith("CREATE TEMP TABLE companies_staging (_row_number BIGSERIAL"))
+        self.assertIn("SELECT DISTINCT ON (id)", queries[1])
+        self.assertIn("ON CONFLICT (id) DO UPDATE SET company_name = EXCLUDED.company_name", queries[1])
+        self.assertEqual(queries[2], "DROP TABLE companies_staging")
+        self.assertIsNone(self.cache.get("id", "C-0"))
+
+    def test_partial_columns_and_csv_encoding(self):
+        self.repo.bulk_upsert([{"id": "C-1", "company_name": 'A "B"', "biz_id": "", "phone": None}],
+                              columns=["id", "company_name", "biz_id", "phone"])
+        copy_sql = self.db.copy_from.call_args.args[0]
+        self.assertEqual(copy_sql, "COPY companies_staging (id, company_name, biz_id, phone) "
+                                   "FROM STDIN WITH (FORMAT csv, NULL '\\N')")
+        self.assertEqual(self.copied[0], ['"C-1","A ""B""","",\\N'])
+        # 실제 CSV로 읽으면 원래 값과 같음
+        self.assertEqual(next(csv.reader(io.StringIO(self.copied[0][0]))), ["C-1", 'A "B"', "", "\\N"])
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            self.repo.bulk_upsert([], columns=["id", "company_name", "biz_id", "unknown"])
+        with self.assertRaises(ValueError):
+            self.repo.bulk_upsert([], columns=["id", "phone"])
+        self.db.connection_scope.assert_not_called()
+
+    def test_copy_failure_is_wrapped(self):
+        self.db.copy_from.side_effect = Exception("invalid input syntax")
+        with self.assertRaises(DatabaseError):
+            self.repo.save_many([company(1)])
+
+
+class TestImportReaders(unittest.TestCase):
+
+    def write(self, suffix, content):
+        fd, path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+        self.addCleanup(os.remove, path)
+        return path
+
+    def test_csv_blank_cells_are_null(self):
+        columns, rows = read_csv(self.write(".csv", "id,company_name,phone\nC-1,에이사,\n"))
+        self.assertEqual(columns, ["id", "company_name", "phone"])
+        self.assertEqual(list(rows), [{"id": "C-1", "company_name": "에이사", "phone": None}])
+
+    def test_jsonl_columns_from_first_record(self):
+        lines = [json.dumps({"id": f"C-{i}", "company_name": "x"}) for i in range(3)]
+        columns, rows = read_jsonl(self.write(".jsonl", "\n".join(lines) + "\n\n"))
+        self.assertEqual(columns, ["id", "company_name"])
+        self.assertEqual([row["id"] for row in rows], ["C-0", "C-1", "C-2"])
+
+    def test_config_import_has_no_app_side_effects(self):
+        # CLI가 설정을 읽을 때 main(앱 생성, DIContainer)을 불러오지 않아야 함
+        code = ("import sys; from app.source.config.app_config import load_config; load_config(); "
+                "print(any(name in sys.modules for name in ('app.source.main', 'app.source.config.di_container')))")
+        output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                                cwd=os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", "..", "..")))
+        self.assertEqual(output.stdout.strip(), "False")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import sys
+import unittest
+from unittest.mock import MagicMock, patch
+
+
+class TestCliExitStatus(unittest.TestCase):
+    """문서는 만들었지만 저장에 실패한 경우 CLI가 실패 코드로 종료하는지 확인"""
+
+    def setUp(self):
+        try:
+            import app.source.main as main_module
+        except Exception as e:  # 렌더링 네이티브 라이브러리가 없는 환경
+            self.skipTest(f"main module is not importable here: {e}")
+        self.main = main_module
+        for name in ("setup_logging", "DIContainer"):
+            patcher = patch.object(main_module, name, MagicMock())
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        patcher = patch.object(main_module.os, "makedirs")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def run_cli(self, argv, result, target="process_jira_issue"):
+        with patch.object(sys, "argv", ["main"] + argv), patch.object(self.main, target, return_value=result):
+            with self.assertRaises(SystemExit) as exit_info:
+                self.main.main()
+        return exit_info.exception.code
+
+    def test_sink_error_exits_with_failure(self):
+        result = {"issue_key": "T-1", "status": "error", "errors": ["jira_upload: 403"]}
+        self.assertEqual(self.run_cli(["T-1"], result), 1)
+
+    def test_success_exits_with_zero(self):
+        self.assertEqual(self.run_cli(["T-1"], {"issue_key": "T-1", "status": "success"}), 0)
+
+    def test_any_failed_issue_in_jql_run_fails(self):
+        results = [{"issue_key": "T-1", "status": "success"},
+                   {"issue_key": "T-2", "status": "error", "errors": ["archive: disk full"]}]
+        self.assertEqual(self.run_cli(["--jql", "project = T"], results, "process_jira_issues_by_jql"), 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from app.source.infrastructure.persistence.connection_pool import ConnectionPool
+
+MONOTONIC = "app.source.infrastructure.persistence.connection_pool.time.monotonic"
+
+
+class TestConnectionPoolHealth(unittest.TestCase):
+
+    def test_failed_health_check_reconnects(self):
+        check = MagicMock()
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=1, health_check_after=0, check=check)
+        first = pool.acquire()
+        pool.release(first)
+
+        check.side_effect = Exception("server closed the connection unexpectedly")
+        second = pool.acquire()
+        self.assertIsNot(second, first)
+        first.close.assert_called_once_with()
+        stats = pool.get_stats()
+        self.assertEqual((stats["created"], stats["discarded"], stats["health_check_failures"]), (2, 1, 1))
+
+    def test_recently_used_connection_skips_health_check(self):
+        check = MagicMock()
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=1, health_check_after=60, check=check)
+        pool.release(pool.acquire())
+        pool.acquire()
+        check.assert_not_called()
+
+    def test_connection_past_max_lifetime_is_replaced(self):
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=1, max_lifetime=100)
+        with patch(MONOTONIC, return_value=0.0):
+            old = pool.acquire()
+        with patch(MONOTONIC, return_value=150.0):
+            pool.release(old)
+            new = pool.acquire()
+        self.assertIsNot(new, old)
+        old.close.assert_called_once_with()
+
+    def test_reset_failure_discards_connection(self):
+        reset = MagicMock(side_effect=Exception("unknown transaction state"))
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=1, reset=reset)
+        broken = pool.acquire()
+        pool.release(broken)
+        self.assertIsNot(pool.acquire(), broken)
+
+    def test_prefill_and_utilization(self):
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=4, min_size=2)
+        self.assertEqual(pool.prefill(), 2)
+        held = [pool.acquire(), pool.acquire()]
+        stats = pool.get_stats()
+        self.assertEqual((stats["size"], stats["in_use"], stats["created"]), (2, 2, 2))
+        self.assertEqual(stats["utilization"], 0.5)
+        for connection in held:
+            pool.release(connection)
+        self.assertEqual(pool.get_stats()["peak_in_use"], 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
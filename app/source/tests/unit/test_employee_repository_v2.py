@@ -189,35 +189,41 @@ class TestEmployeeRepositoryV2(unittest.TestCase):
     def test_save_insert(self):
         """저장 (삽입) 테스트"""
         # mock 설정
-        self.mock_db.execute_query.side_effect = [[], None]  # exists_by_id=False, _insert
+        self.mock_db.execute_query.return_value = [self.test_row]  # INSERT ... RETURNING
         
         # 메서드 호출
-        self.repo.save(self.test_employee)
+        result = self.repo.save(self.test_employee)
         
-        # 검증
-        self.assertEqual(self.mock_db.execute_query.call_count, 2)
+        # 검증 - 존재 확인 없이 한 번에 upsert
+        self.mock_db.execute_query.assert_called_once()
+        query = self.mock_db.execute_query.call_args[0][0]
+        self.assertIn("ON CONFLICT (id) DO UPDATE", query)
+        self.assertEqual(result.id, "EMP-001")
     
     def test_save_update(self):
         """저장 (업데이트) 테스트"""
         # mock 설정
-        self.mock_db.execute_query.side_effect = [[self.test_row], None]  # exists_by_id=True, _update
+        self.mock_db.execute_query.return_value = [dict(self.test_row, phone="02-0000-0000")]  # DO UPDATE ... RETURNING
         
         # 메서드 호출
-        self.repo.save(self.test_employee)
+        result = self.repo.save(self.test_employee)
         
-        # 검증
-        self.assertEqual(self.mock_db.execute_query.call_count, 2)
+        # 검증 - 저장된 행으로 엔티티 반환
+        self.mock_db.execute_query.assert_called_once()
+        self.assertEqual(result.phone, "02-0000-0000")
     
     def test_delete(self):
         """삭제 테스트"""
-        # mock 설정 - exists_by_id 호출 시 True 반환하도록 설정
-        self.mock_db.execute_query.side_effect = [[{"id": "EMP-001"}], None]  # exists_by_id=True, delete
+        # mock 설정 - DELETE ... RETURNING으로 삭제된 기본키 반환
+        self.mock_db.execute_query.return_value = [{"id": "EMP-001"}]
         
         # 메서드 호출
-        self.repo.delete("EMP-001")
+        result = self.repo.delete("EMP-001")
         
         # 검증
-        self.assertEqual(self.mock_db.execute_query.call_count, 2)
+        self.assertTrue(result)
+        self.mock_db.execute_query.assert_called_once()
+
     
     def test_count(self):
         """개수 조회 테스트"""
@@ -0,0 +1,103 @@
+import unittest
+from unittest.mock import MagicMock
+from jinja2 import DictLoader, Environment
+from app.source.application.services.data_enricher import SelectiveFieldEnricher
+from app.source.application.services.enrichment_plan import ALL_COLUMNS, EnrichmentPlanCompiler, analyze_template
+from app.source.core.domain import Employee
+from app.source.infrastructure.config.field_mapping_config import FieldMappingConfig
+from app.source.infrastructure.mapping.mapping_config_loader import MappingConfigLoader
+from app.source.infrastructure.rendering.document_renderer import JinjaDocumentRenderer
+
+
+class TestAnalyzeTemplate(unittest.TestCase):
+
+    def setUp(self):
+        self.env = Environment()
+
+    def test_attribute_access_and_loop_aliases(self):
+        usage = analyze_template(self.env, (
+            "{{ 서명인.name }}{{ image_to_base64(서명인.stamp) }}"
+            "{% for p in 내부_인원 %}{{ p.position }}{{ p['affiliation'] }}{% endfor %}"
+            "{% set signer = assignee %}{{ signer.email }}"
+        ))
+        self.assertEqual(usage["서명인"], {"name", "stamp"})
+        self.assertEqual(usage["내부_인원"], {"position", "affiliation"})
+        self.assertEqual(usage["assignee"], {"email"})
+
+    def test_count_and_presence_checks_need_no_columns(self):
+        usage = analyze_template(self.env, "{{ 내부_인원|length }}{% if creator is not none %}x{% endif %}")
+        self.assertEqual(usage["내부_인원"], set())
+        self.assertEqual(usage["creator"], set())
+
+    def test_whole_object_use(self):
+        usage = analyze_template(self.env, "{{ creator }}{{ assignee|default('') }}")
+        self.assertIn(ALL_COLUMNS, usage["creator"])
+        self.assertIn(ALL_COLUMNS, usage["assignee"])
+
+
+class TestEnrichmentPlanCompiler(unittest.TestCase):
+
+    def setUp(self):
+        self.config = FieldMappingConfig()
+
+    def compiler(self, templates):
+        return EnrichmentPlanCompiler(Environment(loader=DictLoader(templates)), self.config)
+
+    def test_intersects_template_usage_with_field_mapping(self):
+        plan = self.compiler({"회의록.html": "{{ 서명인.name }}{{ 서명인.unknown }}{{ 내부_인원|length }}"}).get_plan("회의록")
+        columns = plan.columns()
+        self.assertEqual(columns["서명인"], ["name"])
+        self.assertNotIn("내부_인원", columns)
+        self.assertNotIn("creator", columns)
+        # 저장 경로에 사용하는 연구과제 컬럼은 항상 포함
+        self.assertEqual(sorted(columns["연구과제_선택_key"]), ["project_code", "project_name"])
+
+    def test_unparsable_or_missing_template_has_no_plan(self):
+        compiler = self.compiler({"발주서.html": "{{ 증빙 일자 }}"})
+        self.assertIsNone(compiler.get_plan("발주서"))
+        self.assertIsNone(compiler.get_plan("없는문서"))
+
+    def test_repository_templates(self):
+        renderer = JinjaDocumentRenderer("app/source/templates", "app/resources")
+        compiler = EnrichmentPlanCompiler(renderer.template_env, self.config, renderer.resolve_template)
+        columns = compiler.get_plan("출장정산신청서").columns()
+        self.assertEqual(sorted(columns["출장_참석자"]), ["account_number", "bank_name", "name", "position", "stamp"])
+        self.assertNotIn("creator", columns)
+
+    def test_issue_fields_follow_template(self):
+        renderer = JinjaDocumentRenderer("app/source/templates", "app/resources")
+        compiler = EnrichmentPlanCompiler(renderer.template_env, self.config, lambda document_type: document_type)
+        fields = compiler.get_plan("전문가 자문확인서.html").issue_fields()
+        for name in ("전문가_활용구분", "생년월일", "주소", "은행", "계좌번호", "연구과제_선택"):
+            self.assertIn(name, fields)
+        self.assertNotIn("연구과제_선택_key", fields)
+
+        projection = MappingConfigLoader().get_issue_projection("전문가자문확인서", ["계좌번호", "새_필드"])
+        self.assertIn("새_필드", projection["fields"])
+        self.assertEqual(len(projection["fields"]), len(set(projection["fields"])))
+
+
+class TestPlannedEnrichment(unittest.TestCase):
+
+    def test_only_planned_fields_and_columns_are_enriched(self):
+        employee = Employee(id="EMP-001", name="홍길동", email="hong@example.com", department="개발팀",
+                            position="연구원", phone="010-0000-0000", stamp="hong.png", bank_name="은행", account_number="123")
+        employee_repo = MagicMock()
+        employee_repo.find_many_by_jira_account_id.return_value = {"acc-1": employee}
+        compiler = EnrichmentPlanCompiler(
+            Environment(loader=DictLoader({"회의록.html": "{{ 서명인.name }} {{ 서명인.stamp }}"})),
+            FieldMappingConfig())
+        enricher = SelectiveFieldEnricher(MagicMock(), employee_repo, MagicMock(), MagicMock(), plan_compiler=compiler)
+
+        fields = enricher.enrich("회의록", {"fields": {
+            "서명인": {"accountId": "acc-1"},
+            "creator": {"accountId": "acc-2"},
+        }})["fields"]
+
+        self.assertEqual(fields["서명인"], {"accountId": "acc-1", "name": "홍길동", "stamp": "hong.png"})
+        self.assertEqual(fields["creator"], {"accountId": "acc-2"})
+        employee_repo.find_many_by_jira_account_id.assert_called_once_with(["acc-1"])
+
+
+if __name__ == "__main__":
+    unittest.main()
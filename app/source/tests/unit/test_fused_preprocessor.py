@@ -0,0 +1,117 @@
+import copy
+import glob
+import json
+import os
+import re
+import unittest
+from app.source.application.services.fused_preprocessor import FusedJiraPreprocessor
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "preprocessing")
+
+# baseline/: 단일 패스 전처리 도입 전 JiraDocumentMapper + JiraPreprocessor 결과 (다시 생성하지 말 것)
+# 구분선/빈 열/숫자 타입 외에 의도적으로 바뀐 결과 ((section, key), section=None이면 최상위)
+BASELINE_CHANGES = {
+    # 기존 파서가 끝의 빈 열 때문에 두 번째 데이터 행을 잃어 합계도 달라짐
+    "expense_settlement.json": [("fields", "expense_list_data"), ("fields", "amount_summary")],
+    # 기존 파서가 표로 판정하고도 빈 결과를 반환하던 필드
+    "meeting_minutes.json": [("fields", "외부_인원_data")],
+}
+
+NUMBER = re.compile(r"^\d{1,3}(,\d{3})+$|^\d+$")
+SEPARATOR = re.compile(r"^:?-+:?$")
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def dump(data):
+    return json.dumps(data, ensure_ascii=False)
+
+
+def is_separator_row(row):
+    """마크다운 구분선(|---|---|)이 데이터 행으로 파싱된 결과"""
+    values = [value for key, value in row.items() if key != "" or value != ""] if isinstance(row, dict) else []
+    return bool(values) and all(isinstance(value, str) and SEPARATOR.match(value) for value in values)
+
+
+class TestFusedJiraPreprocessor(unittest.TestCase):
+    """기록된 Jira 페이로드에 대해 단일 패스 전처리 결과가 고정된 기존 2단계 처리 결과와 같은지 확인"""
+
+    def setUp(self):
+        self.payload_files = sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.json")))
+        self.assertTrue(self.payload_files)
+
+    def _fused(self, payload):
+        return FusedJiraPreprocessor().preprocess(copy.deepcopy(payload))
+
+    def test_matches_golden_output(self):
+        """골든 파일과 키 순서까지 동일"""
+        for path in self.payload_files:
+            with self.subTest(payload=os.path.basename(path)):
+                golden = load_json(os.path.join(FIXTURES_DIR, "golden", os.path.basename(path)))
+                self.assertEqual(dump(self._fused(load_json(path))), dump(golden))
+
+    def test_matches_frozen_baseline(self):
+        """변경 전 2단계 처리(JiraDocumentMapper + JiraPreprocessor) 결과를 고정한 baseline 파일과 비교
+
+        이후 의도적으로 바꾼 동작(구분선 행 제외, 빈 열 제외, 숫자 열 타입 변환)만 차이로 허용한다.
+        """
+        for path in self.payload_files:
+            name = os.path.basename(path)
+            with self.subTest(payload=name):
+                baseline = load_json(os.path.join(FIXTURES_DIR, "baseline", name))
+                fused = self._fused(load_json(path))
+                for section, key in BASELINE_CHANGES.get(name, ()):
+                    baseline.get(section, baseline).pop(key, None)
+                    fused.get(section, fused).pop(key, None)
+                self.assertBaselineEqual(fused, baseline, "")
+
+    def assertBaselineEqual(self, actual, expected, path):
+        if isinstance(expected, dict):
+            self.assertIsInstance(actual, dict, path)
+            expected = {key: value for key, value in expected.items() if key != "" or value != ""}
+            self.assertEqual(list(actual), list(expected), path)
+            for key, value in expected.items():
+                self.assertBaselineEqual(actual[key], value, f"{path}/{key}")
+        elif isinstance(expected, list):
+            self.assertIsInstance(actual, list, path)
+            expected = [row for row in expected if not is_separator_row(row)]
+            self.assertEqual(len(actual), len(expected), path)
+            for i, (item, value) in enumerate(zip(actual, expected)):
+                self.assertBaselineEqual(item, value, f"{path}[{i}]")
+        elif isinstance(actual, int) and isinstance(expected, str) and NUMBER.match(expected):
+            self.assertEqual(actual, int(expected.replace(",", "")), path)
+        else:
+            self.assertEqual(actual, expected, path)
+
+    def test_mutates_fields_in_place_like_legacy(self):
+        """원본 fields 딕셔너리를 직접 수정하는 동작 유지 (문서 경로 계산이 이에 의존)"""
+        payload = load_json(os.path.join(FIXTURES_DIR, "meeting_minutes.json"))
+        FusedJiraPreprocessor().preprocess(payload)
+
+        self.assertEqual(payload["fields"]["연구과제_선택_key"], "R-2024-001")
+        self.assertIn("외부_인원_data", payload["fields"])
+
+    def test_research_key_without_parentheses_raises(self):
+        """연구과제 키가 없으면 기존 처리와 마찬가지로 예외 발생"""
+        payload = {"fields": {"연구과제_선택": {"value": "괄호 없는 과제명"}}}
+
+        with self.assertRaises(ValueError):
+            self._fused(payload)
+
+    def test_table_detection_matches_baseline(self):
+        """문자열 분할 없는 테이블 판정이 변경 전 _looks_like_markdown_table 결과와 동일"""
+        samples = {
+            "": False, "|": False, "a | b": False, "a | b\n| c |": False, "|a|\n|b|\n|c|": True,
+            "  \n|a|\n|b|\nc": True, "|a|\nb\n|c|": False, "a\n|b|\n|c|": False,
+            "\r\n|a|b|\r\n|-|-|\r\n|1|2|\r\n": True, "|a|\n\n|b|": False, "x\ny\nz": False, "|a|\n|b|\n": False,
+        }
+        for sample, expected in samples.items():
+            with self.subTest(sample=sample):
+                self.assertEqual(bool(FusedJiraPreprocessor._is_markdown_table(sample)), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,148 @@
+import re
+import unittest
+from unittest.mock import MagicMock, patch
+from app.source.core.exceptions import DatabaseError
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.index_sync import sync_indexes
+from app.source.infrastructure.persistence.schema_definition import (
+    ColumnDefinition, IndexDefinition, SchemaRegistry, TableSchema, create_employee_schema, create_research_schema
+)
+from app.source.infrastructure.repositories.research_repo_v2 import ResearchRepositoryV2
+
+
+class TestIndexDefinition(unittest.TestCase):
+
+    def test_sql_definitions(self):
+        self.assertEqual(
+            IndexDefinition(["email"], unique=True, where="email IS NOT NULL").get_sql_definition("employees"),
+            "CREATE UNIQUE INDEX IF NOT EXISTS ix_employees_email ON employees (email) WHERE email IS NOT NULL")
+        self.assertEqual(
+            IndexDefinition.trigram("name").get_sql_definition("employees", concurrently=True),
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_employees_name_trgm ON employees USING gin (name gin_trgm_ops)")
+
+    def test_schema_validates_index_columns_and_names(self):
+        columns = [ColumnDefinition("id", "VARCHAR(50)", primary_key=True), ColumnDefinition("name", "VARCHAR(50)")]
+        with self.assertRaises(ValueError):
+            TableSchema("t", columns, indexes=[IndexDefinition(["missing"])])
+        with self.assertRaises(ValueError):
+            TableSchema("t", columns, indexes=[IndexDefinition(["name"]), IndexDefinition(["id"], name="ix_t_name")])
+
+    def test_lookup_columns_are_indexed(self):
+        schema = create_employee_schema()
+        self.assertIn("ix_employees_jira_account_id", [index.name for index in schema.indexes])
+        self.assertEqual(schema.required_extensions, ["pg_trgm"])
+
+    def test_research_search_uses_only_trigram_indexed_columns(self):
+        schema = create_research_schema()
+        db = MagicMock(spec=DatabaseConnection)
+        db.execute_query.return_value = []
+        with patch.object(SchemaRegistry, "get", return_value=schema):
+            ResearchRepositoryV2(db).search("과제")
+        searched = set(re.findall(r"(\w+) ILIKE", db.execute_query.call_args.args[0]))
+        trigram = {index.columns[0] for index in schema.indexes if index.required_extension == "pg_trgm"}
+        self.assertEqual(searched, {"project_name", "project_code"})
+        self.assertLessEqual(searched, trigram)
+
+    def test_create_all_sql_orders_extensions_tables_indexes(self):
+        sql = SchemaRegistry.generate_create_all_tables_sql()
+        extension = sql.index("CREATE EXTENSION IF NOT EXISTS pg_trgm;")
+        table = sql.index("CREATE TABLE IF NOT EXISTS employees")
+        index = sql.index("CREATE INDEX IF NOT EXISTS ix_employees_name_trgm")
+        self.assertLess(extension, table)
+        self.assertLess(table, index)
+
+
+class TestSyncIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = create_employee_schema()
+        self.db = MagicMock(spec=DatabaseConnection)
+        self.existing = []
+        self.locked = True
+        self.db.execute_query.side_effect = self.execute_query
+
+    def execute_query(self, query, params=None, prepare=False):
+        if "pg_try_advisory_lock" in query:
+            return [{"locked": self.locked}]
+        return self.existing if "pg_index" in query else []
+
+    def queries(self):
+        return [call.args[0] for call in self.db.execute_query.call_args_list]
+
+    def statements(self):
+        return [call.args[0] for call in self.db.execute_autocommit.call_args_list]
+
+    def test_creates_only_missing_indexes_concurrently(self):
+        self.existing = [{"name": index.name, "valid": True} for index in self.schema.indexes[1:]]
+        created = sync_indexes(self.db, [self.schema])
+        self.assertEqual(created, ["ix_employees_jira_account_id"])
+        self.assertEqual(self.statements(), [self.schema.indexes[0].get_sql_definition("employees", True)])
+
+        self.existing = [{"name": index.name, "valid": True} for index in self.schema.indexes]
+        self.db.execute_autocommit.reset_mock()
+        self.assertEqual(sync_indexes(self.db, [self.schema]), [])
+        self.db.execute_autocommit.assert_not_called()
+
+    def test_invalid_index_is_rebuilt(self):
+        self.existing = [{"name": index.name, "valid": index.name != "ix_employees_email"}
+                         for index in self.schema.indexes]
+        self.assertEqual(sync_indexes(self.db, [self.schema]), ["ix_employees_email"])
+        self.assertEqual(self.statements()[0], "DROP INDEX CONCURRENTLY IF EXISTS ix_employees_email")
+
+    def test_index_being_built_elsewhere_is_not_dropped(self):
+        self.existing = [{"name": index.name, "valid": index.name != "ix_employees_email",
+                          "building": index.name == "ix_employees_email"} for index in self.schema.indexes]
+        self.assertEqual(sync_indexes(self.db, [self.schema]), [])
+        self.db.execute_autocommit.assert_not_called()
+
+    def test_runs_under_advisory_lock(self):
+        sync_indexes(self.db, [self.schema])
+        self.db.connection_scope.assert_called_once_with()
+        self.assertIn("pg_try_advisory_lock", self.queries()[0])
+        self.assertIn("pg_advisory_unlock", self.queries()[-1])
+
+    def test_skips_when_another_process_holds_the_lock(self):
+        self.locked = False
+        self.assertEqual(sync_indexes(self.db, [self.schema]), [])
+        self.assertEqual(len(self.queries()), 1)
+        self.db.execute_autocommit.assert_not_called()
+
+    def test_missing_extension_and_failures_do_not_stop_sync(self):
+        def execute_query(query, params=None, prepare=False):
+            if query.startswith("CREATE EXTENSION"):
+                raise DatabaseError("permission denied to create extension")
+            return self.execute_query(query, params, prepare)
+
+        def execute_autocommit(query, params=None):
+            if "ix_employees_email " in query:
+                raise DatabaseError("lock timeout")
+
+        self.db.execute_query.side_effect = execute_query
+        self.db.execute_autocommit.side_effect = execute_autocommit
+        self.assertEqual(sync_indexes(self.db, [self.schema]), ["ix_employees_jira_account_id"])
+        self.assertFalse(any("gin_trgm_ops" in statement for statement in self.statements()))
+
+
+class TestExecuteAutocommit(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseConnection({"pool": {"max_size": 1}})
+        patcher = patch.object(self.db, "_open_connection", side_effect=lambda: MagicMock(closed=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_runs_outside_transaction_block(self):
+        with self.db.connection_scope() as connection:
+            self.db.execute_autocommit("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix ON t (c)")
+        connection.cursor.return_value.execute.assert_called_once_with(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix ON t (c)", None)
+        self.assertFalse(connection.autocommit)
+
+    def test_refused_inside_transaction_scope(self):
+        with self.db.connection_scope(transactional=True):
+            with self.assertRaises(DatabaseError):
+                self.db.execute_autocommit("CREATE INDEX CONCURRENTLY ix ON t (c)")
+
+
+if __name__ == "__main__":
+    unittest.main()
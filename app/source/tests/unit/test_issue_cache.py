@@ -0,0 +1,169 @@
+import unittest
+from unittest.mock import MagicMock, patch
+from app.source.infrastructure.integrations.issue_cache import IssueCache
+from app.source.infrastructure.integrations.jira_client import JiraClient
+
+
+def make_issue(key="TEST-1", updated="2024-05-01T10:00:00.000+0900", summary="Test"):
+    return {"key": key, "fields": {"updated": updated, "summary": summary, "creator": {"accountId": "a"}}}
+
+
+def make_response(status_code, body=None, etag=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json.return_value = body
+    response.headers = {"ETag": etag} if etag else {}
+    return response
+
+
+class RenamingFieldMapper:
+    """customfield_10010 <-> 회의_목적 매핑만 하는 필드 매퍼 대역"""
+    
+    def map_field_name_to_id(self, field_name):
+        return "customfield_10010" if field_name == "회의_목적" else field_name
+    
+    def transform_response(self, data):
+        data = dict(data)
+        data["fields"] = {("회의_목적" if k == "customfield_10010" else k): v for k, v in data["fields"].items()}
+        return data
+
+
+class TestIssueCache(unittest.TestCase):
+    
+    def test_older_update_does_not_overwrite(self):
+        """더 오래된 updated 값으로는 덮어쓰지 않음"""
+        cache = IssueCache()
+        self.assertTrue(cache.put(make_issue(updated="2024-05-02T10:00:00.000+0900", summary="new")))
+        self.assertFalse(cache.put(make_issue(updated="2024-05-01T10:00:00.000+0900", summary="old")))
+        self.assertEqual(cache.lookup("TEST-1").data["fields"]["summary"], "new")
+    
+    def test_size_bound_evicts_least_recently_used(self):
+        """크기 제한 초과 시 LRU 항목 제거"""
+        cache = IssueCache(max_entries=2)
+        cache.put(make_issue("A-1"))
+        cache.put(make_issue("A-2"))
+        cache.lookup("A-1")
+        cache.put(make_issue("A-3"))
+        self.assertIsNotNone(cache.lookup("A-1"))
+        self.assertIsNone(cache.lookup("A-2"))
+    
+    def test_stored_copy_is_isolated(self):
+        """저장된 데이터는 호출자의 변경에 영향받지 않음"""
+        cache = IssueCache()
+        issue = make_issue()
+        cache.put(issue)
+        issue["fields"]["creator"]["name"] = "mutated"
+        self.assertNotIn("name", cache.lookup("TEST-1").data["fields"]["creator"])
+
+
+class TestJiraClientIssueCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.cache = IssueCache(ttl_seconds=60)
+        self.client = JiraClient('https://test.atlassian.net', 'user', 'token', issue_cache=self.cache)
+    
+    def test_seeded_issue_costs_no_round_trip(self):
+        """웹훅으로 등록된 이슈는 API 호출 없이 반환"""
+        self.client.http.get = MagicMock()
+        self.client.seed_issue(make_issue("PARENT-1"))
+        
+        for _ in range(3):
+            result = self.client.get_issue("PARENT-1")
+            result["fields"]["summary"] = "changed by caller"
+        
+        self.client.http.get.assert_not_called()
+        self.assertEqual(self.client.get_issue("PARENT-1")["fields"]["summary"], "Test")
+    
+    def test_expired_entry_revalidated_with_etag(self):
+        """TTL 만료 후 ETag로 조건부 재검증"""
+        self.client.http.get = MagicMock(side_effect=[
+            make_response(200, make_issue(), etag='"v1"'),
+            make_response(304),
+        ])
+        self.client.get_issue("TEST-1")
+        self.cache.ttl_seconds = 0
+        result = self.client.get_issue("TEST-1")
+        
+        self.assertEqual(result["fields"]["summary"], "Test")
+        second_headers = self.client.http.get.call_args_list[1].kwargs["headers"]
+        self.assertEqual(second_headers["If-None-Match"], '"v1"')
+        self.assertEqual(self.cache.get_stats()["revalidations"], 1)
+    
+    def test_upload_invalidates_issue(self):
+        """첨부 파일 업로드 후 캐시 무효화"""
+        import tempfile
+        self.client.seed_issue(make_issue())
+        self.client.http.post = MagicMock(return_value=make_response(200, [{"id": "1"}]))
+        with tempfile.NamedTemporaryFile(suffix=".pdf") as f:
+            self.client.upload_attachment("TEST-1", f.name)
+        self.assertIsNone(self.cache.lookup("TEST-1"))
+    
+    def test_projected_fetch_served_from_full_entry(self):
+        """전체 이슈가 캐시에 있으면 fields 지정 조회도 API 호출 없이 반환"""
+        self.client.seed_issue(make_issue())
+        self.client.http.get = MagicMock()
+        result = self.client.get_issue("TEST-1", fields=["summary"])
+        
+        self.client.http.get.assert_not_called()
+        self.assertEqual(result["fields"], {"summary": "Test"})
+    
+    def test_projection_cached_as_separate_variant(self):
+        """fields 지정 조회 결과는 전체 이슈와 별도 항목으로 저장"""
+        self.client.http.get = MagicMock(return_value=make_response(200, {"key": "TEST-1", "fields": {"summary": "Test"}}))
+        self.client.get_issue("TEST-1", fields=["summary"])
+        self.client.get_issue("TEST-1", fields=["summary"])
+        
+        self.assertEqual(self.client.http.get.call_count, 1)
+        self.assertIsNone(self.cache.lookup("TEST-1"))
+        self.cache.invalidate("TEST-1")
+        self.assertIsNone(self.cache.lookup("TEST-1", "fields=summary"))
+    
+    def test_projected_lookup_records_single_event(self):
+        """fields 지정 조회는 전체/변형 항목을 함께 확인해도 적중/실패를 한 번만 기록"""
+        self.client.http.get = MagicMock(return_value=make_response(200, {"key": "TEST-1", "fields": {"summary": "Test"}}))
+        self.client.get_issue("TEST-1", fields=["summary"])
+        self.assertEqual((self.cache.get_stats()["hits"], self.cache.get_stats()["misses"]), (0, 1))
+        
+        self.client.get_issue("TEST-1", fields=["summary"])
+        self.client.seed_issue(make_issue())
+        self.client.get_issue("TEST-1", fields=["summary"])
+        self.assertEqual((self.cache.get_stats()["hits"], self.cache.get_stats()["misses"]), (2, 1))
+
+
+class TestIssueCacheAfterProcessing(unittest.TestCase):
+    """get_issue/search로 받아 처리한 뒤 같은 이슈를 다시 조회해도 원본 기준 결과를 반환하는지 확인"""
+    
+    def setUp(self):
+        self.cache = IssueCache(ttl_seconds=60)
+        self.client = JiraClient('https://test.atlassian.net', 'user', 'token',
+                                 field_mapper=RenamingFieldMapper(), issue_cache=self.cache)
+        raw = make_issue()
+        raw["fields"]["customfield_10010"] = "예산 검토"
+        self.client.http.get = MagicMock(return_value=make_response(200, raw))
+    
+    def test_get_issue_then_get_issue_again(self):
+        mapped = self.client.get_issue("TEST-1")
+        self.assertEqual(mapped["fields"]["회의_목적"], "예산 검토")
+        
+        again = self.client.get_issue("TEST-1")
+        projected = self.client.get_issue("TEST-1", fields=["회의_목적"])
+        
+        self.assertEqual(self.client.http.get.call_count, 1)
+        self.assertEqual(again["fields"]["회의_목적"], "예산 검토")
+        self.assertEqual(projected["fields"], {"회의_목적": "예산 검토"})
+        self.assertIn("customfield_10010", self.cache.lookup("TEST-1").data["fields"])
+    
+    def test_process_jira_issue_does_not_seed_mapped_data(self):
+        try:
+            import app.source.main as main_module
+        except Exception as e:  # 렌더링 네이티브 라이브러리가 없는 환경
+            self.skipTest(f"main module is not importable here: {e}")
+        container = MagicMock()
+        container.jira_client = self.client
+        container.mapping_config_loader.get_issue_projection.return_value = None
+        with patch.object(main_module, "process_save_document", return_value={"errors": [], "path": None, "sinks": []}):
+            main_module.process_jira_issue(container, "TEST-1")
+        
+        projected = self.client.get_issue("TEST-1", fields=["회의_목적"])
+        self.assertEqual(projected["fields"], {"회의_목적": "예산 검토"})
+        self.assertIn("customfield_10010", self.cache.lookup("TEST-1").data["fields"])
@@ -0,0 +1,48 @@
+import json
+import unittest
+from array import array
+from decimal import Decimal
+from app.source.application.services.item_table import ItemTable, calculate_vat
+
+
+class TestItemTable(unittest.TestCase):
+
+    def test_amounts_written_to_row_view(self):
+        """컬럼 단위로 계산한 금액이 행 딕셔너리에도 반영"""
+        rows = [
+            {"name": "센서", "quantity": 4, "unit_price": 125000},
+            {"name": "케이블", "quantity": "10", "unit_price": "3,300"},
+            {"name": "설치비", "quantity": 1, "unit_price": "abc"},
+            {"name": "기존 금액", "amount": "7,000"},
+        ]
+        table = ItemTable.from_rows(rows)
+
+        self.assertEqual(table.calculate_amounts(), 2)
+        self.assertEqual(rows[0]["amount"], 500000)
+        self.assertEqual(rows[1]["amount"], 33000)
+        self.assertNotIn("amount", rows[2])
+        self.assertIsInstance(table.columns["amount"].values, array)
+        self.assertEqual(table.amount_summary(), {"total_amount": 540000, "vat": 54000, "grand_total": 594000})
+        self.assertEqual(json.loads(json.dumps(table)), rows)
+
+    def test_vat_is_exact(self):
+        """부가세는 부동소수점 없이 원 미만 절사"""
+        total = 366849294494085735
+        self.assertNotEqual(int(total * 0.1), total // 10)
+        self.assertEqual(calculate_vat(total), total // 10)
+        self.assertEqual(calculate_vat(Decimal("1234.56")), 123)
+
+    def test_decimal_and_large_values_fall_back_to_list(self):
+        """64비트 정수가 아닌 값은 list 컬럼으로 정확히 계산"""
+        table = ItemTable([
+            {"quantity": 2, "unit_price": Decimal("10.25")},
+            {"quantity": 2 ** 40, "unit_price": 2 ** 40},
+        ])
+        table.calculate_amounts()
+
+        self.assertIsInstance(table.columns["amount"].values, list)
+        self.assertEqual(table.amount_summary()["total_amount"], Decimal("20.50") + 2 ** 80)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
+import os
 import unittest
 from unittest.mock import patch, MagicMock
+import requests
 from app.source.infrastructure.integrations.jira_client import JiraClient
 
 class TestJiraClient(unittest.TestCase):
@@ -14,7 +16,7 @@ class TestJiraClient(unittest.TestCase):
         client = JiraClient()
         self.assertEqual(client.jira_base_url, 'https://msimul.atlassian.net')
     
-    @patch('requests.get')
+    @patch('requests.Session.request')
     def test_get_issue(self, mock_get):
         """이슈 조회 테스트"""
         # Mock 응답 설정
@@ -31,4 +33,208 @@ class TestJiraClient(unittest.TestCase):
         self.assertEqual(result['fields']['summary'], 'Test Issue')
         mock_get.assert_called_once()
     
+    @patch('requests.Session.request')
+    def test_requests_share_pooled_session(self, mock_request):
+        """모든 요청이 같은 풀링 어댑터를 사용하는지 테스트"""
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = b'[]'
+        mock_response.json.return_value = []
+        mock_request.return_value = mock_response
+        
+        client = JiraClient('https://test.atlassian.net', 'user', 'token',
+                            http_config={'pool_maxsize': 4, 'max_retries': 2})
+        client._make_request('GET', '/rest/api/2/field')
+        client._make_request('POST', '/rest/api/2/search', {'jql': 'project = TEST'})
+        
+        self.assertEqual(mock_request.call_count, 2)
+        self.assertIs(client.http.session.get_adapter('https://test.atlassian.net'), client.http.adapter)
+        self.assertEqual(client.http.adapter.max_retries.total, 2)
+        self.assertEqual(client.http.adapter._pool_maxsize, 4)
+        # timeout 기본값 적용
+        self.assertEqual(mock_request.call_args.kwargs['timeout'], client.http.config.timeout)
+    
+    def test_session_per_thread_shares_adapter(self):
+        """스레드별 세션이 하나의 커넥션 풀을 공유하는지 테스트"""
+        import threading
+        client = JiraClient('https://test.atlassian.net', 'user', 'token')
+        sessions = []
+        thread = threading.Thread(target=lambda: sessions.append(client.http.session))
+        thread.start()
+        thread.join()
+        
+        self.assertIsNot(sessions[0], client.http.session)
+        self.assertIs(sessions[0].get_adapter('https://x'), client.http.session.get_adapter('https://x'))
+        stats = client.get_pool_stats()
+        self.assertEqual(stats['requests'], 0)
+        self.assertEqual(stats['hit_rate'], 0.0)
+    
+    def test_get_issue_with_fields_and_expand(self):
+        """fields/expand 파라미터 전달 및 필드 이름 -> ID 변환 테스트"""
+        field_mapper = MagicMock()
+        field_mapper.map_field_name_to_id.side_effect = lambda name: {'회의_목적': 'customfield_10113'}.get(name, name)
+        field_mapper.transform_response.side_effect = lambda data: data
+        client = JiraClient('https://test.atlassian.net', 'user', 'token', field_mapper=field_mapper)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'key': 'TEST-1', 'fields': {'summary': 'S'}}
+        client.http.get = MagicMock(return_value=response)
+        
+        client.get_issue('TEST-1', fields=['summary', '회의_목적'], expand=['renderedFields'])
+        
+        params = client.http.get.call_args.kwargs['params']
+        self.assertEqual(params, {'fields': 'summary,customfield_10113', 'expand': 'renderedFields'})
+    
+    def test_download_attachments_requests_attachment_field_only(self):
+        """첨부 파일 다운로드 시 attachment 필드만 조회"""
+        client = JiraClient('https://test.atlassian.net', 'user', 'token')
+        response = MagicMock(status_code=200)
+        response.json.return_value = {'key': 'TEST-1', 'fields': {'attachment': []}}
+        client.http.get = MagicMock(return_value=response)
+        
+        self.assertEqual(client.download_attachments('TEST-1'), [])
+        self.assertEqual(client.http.get.call_args.kwargs['params'], {'fields': 'attachment'})
+    
+    def test_issue_projection_from_mapping_config(self):
+        """mapping_config.yaml의 문서 유형별 조회 필드 병합 테스트"""
+        from app.source.infrastructure.mapping.mapping_config_loader import MappingConfigLoader
+        loader = MappingConfigLoader()
+        projection = loader.get_issue_projection('회의록')
+        
+        self.assertIn('summary', projection['fields'])
+        self.assertIn('회의_목적', projection['fields'])
+        self.assertEqual(len(projection['fields']), len(set(projection['fields'])))
+        self.assertIsNone(loader.get_issue_projection('없는문서'))
+    
+    def test_search_pages_lazily_with_prefetch(self):
+        """search가 페이지를 순서대로 가져오고 다음 페이지를 미리 요청하는지 테스트"""
+        client = JiraClient('https://test.atlassian.net', 'user', 'token')
+        pages = {
+            0: {'startAt': 0, 'total': 3, 'issues': [{'key': 'T-1', 'fields': {}}, {'key': 'T-2', 'fields': {}}]},
+            2: {'startAt': 2, 'total': 3, 'issues': [{'key': 'T-3', 'fields': {}}]},
+        }
+        requested = []
+        
+        def fake_request(method, path, data=None, params=None):
+            requested.append(data['startAt'])
+            return pages[data['startAt']]
+        client._make_request = MagicMock(side_effect=fake_request)
+        
+        results = client.search('project = T', fields=['summary'], page_size=2)
+        first = next(results)
+        self.assertEqual(first['key'], 'T-1')
+        keys = [first['key']] + [issue['key'] for issue in results]
+        
+        self.assertEqual(keys, ['T-1', 'T-2', 'T-3'])
+        self.assertEqual(requested, [0, 2])
+        body = client._make_request.call_args.args[2]
+        self.assertEqual(body['fields'], ['summary'])
+        self.assertEqual(body['maxResults'], 2)
+    
+    def test_upload_attachment_streams_multipart_body(self):
+        """첨부 파일 업로드 시 본문을 스트리밍 multipart로 전송하는지 테스트"""
+        import email
+        import tempfile
+        from app.source.infrastructure.integrations.multipart import StreamingMultipartBody
+        client = JiraClient('https://test.atlassian.net', 'user', 'token')
+        payload = os.urandom(200 * 1024)
+        sent = {}
+        
+        def fake_post(url, headers=None, auth=None, data=None):
+            self.assertIsInstance(data, StreamingMultipartBody)
+            sent['headers'] = headers
+            sent['body'] = b''.join(iter(lambda: data.read(8192), b''))
+            data.seek(0)
+            sent['length'] = len(data.read())
+            return MagicMock(status_code=200, json=MagicMock(return_value=[{'id': '1'}]))
+        client.http.post = MagicMock(side_effect=fake_post)
+        
+        with tempfile.TemporaryDirectory() as tmp:
+            file_path = os.path.join(tmp, 'doc.pdf')
+            with open(file_path, 'wb') as f:
+                f.write(payload)
+            client.upload_attachment('TEST-1', file_path)
+        
+        self.assertEqual(int(sent['headers']['Content-Length']), len(sent['body']))
+        self.assertEqual(sent['length'], len(sent['body']))
+        self.assertEqual(sent['headers']['X-Atlassian-Token'], 'no-check')
+        message = email.message_from_bytes(
+            b'Content-Type: ' + sent['headers']['Content-Type'].encode() + b'\r\n\r\n' + sent['body'])
+        part = message.get_payload()[0]
+        self.assertEqual(part.get_filename(), 'doc.pdf')
+        self.assertEqual(part.get_content_type(), 'application/pdf')
+        self.assertEqual(part.get_payload(decode=True), payload)
+    
     # 다른 메서드에 대한 테스트...
+
+
+class TestJiraClientStreamingDownload(unittest.TestCase):
+    """첨부 파일 스트리밍/이어받기 다운로드 테스트"""
+    
+    def setUp(self):
+        import tempfile
+        self.tmp_dir = tempfile.mkdtemp()
+        self.save_path = os.path.join(self.tmp_dir, 'scan.pdf')
+        self.payload = b'0123456789' * 100
+        self.client = JiraClient('https://test.atlassian.net', 'user', 'token', download_chunk_size=64)
+    
+    def tearDown(self):
+        import shutil
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+    
+    def _response(self, status_code, body, fail_after=None):
+        response = MagicMock()
+        response.status_code = status_code
+        
+        def iter_content(chunk_size):
+            for start in range(0, len(body), chunk_size):
+                if fail_after is not None and start >= fail_after:
+                    raise requests.exceptions.ChunkedEncodingError("connection reset")
+                yield body[start:start + chunk_size]
+        
+        response.iter_content.side_effect = iter_content
+        return response
+    
+    def test_streams_in_chunks_and_renames(self):
+        """청크 스트리밍 후 최종 경로로 이름 변경"""
+        self.client.http.get = MagicMock(return_value=self._response(200, self.payload))
+        
+        self.client._download_file('https://x/att', self.save_path, expected_size=len(self.payload))
+        
+        with open(self.save_path, 'rb') as f:
+            self.assertEqual(f.read(), self.payload)
+        self.assertFalse(os.path.exists(self.save_path + '.part'))
+        self.client.http.get.return_value.iter_content.assert_called_once_with(chunk_size=64)
+    
+    def test_resumes_with_range_after_interruption(self):
+        """중단된 다운로드를 Range 요청으로 이어받기"""
+        first = self._response(200, self.payload, fail_after=256)
+        second = self._response(206, self.payload[256:])
+        self.client.http.get = MagicMock(side_effect=[first, second])
+        
+        self.client._download_file('https://x/att', self.save_path, expected_size=len(self.payload))
+        
+        with open(self.save_path, 'rb') as f:
+            self.assertEqual(f.read(), self.payload)
+        resume_headers = self.client.http.get.call_args_list[1].kwargs['headers']
+        self.assertEqual(resume_headers['Range'], 'bytes=256-')
+    
+    def test_size_mismatch_removes_partial_file(self):
+        """크기 불일치 시 예외 발생 및 임시 파일 삭제"""
+        self.client.http.get = MagicMock(return_value=self._response(200, self.payload))
+        
+        with self.assertRaises(Exception):
+            self.client._download_file('https://x/att', self.save_path, expected_size=len(self.payload) + 1)
+        self.assertFalse(os.path.exists(self.save_path))
+        self.assertFalse(os.path.exists(self.save_path + '.part'))
+    
+    def test_checksum_verification(self):
+        """체크섬 검증"""
+        import hashlib
+        checksum = 'sha256:' + hashlib.sha256(self.payload).hexdigest()
+        self.client.http.get = MagicMock(return_value=self._response(200, self.payload))
+        self.client._download_file('https://x/att', self.save_path, expected_checksum=checksum)
+        self.assertTrue(os.path.exists(self.save_path))
+        
+        self.client.http.get = MagicMock(return_value=self._response(200, self.payload))
+        with self.assertRaises(Exception):
+            self.client._download_file('https://x/att', self.save_path, expected_checksum='md5:deadbeef')
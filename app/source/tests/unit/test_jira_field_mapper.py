@@ -0,0 +1,156 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock
+from app.source.infrastructure.mapping.jira_field_mapper import (
+    ApiJiraFieldMappingProvider, CachedJiraFieldMappingProvider, JiraFieldMapperimpl
+)
+
+
+class TestCachedJiraFieldMappingProvider(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_file = os.path.join(self.tmp.name, "field_mapping.json")
+        self.source = MagicMock(spec=ApiJiraFieldMappingProvider)
+        self.source.fetch_field_mapping.return_value = {"customfield_10113": "회의_목적"}
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _write_cache(self, mappings, age_seconds=0):
+        with open(self.cache_file, "w", encoding="utf-8") as f:
+            json.dump({"fetched_at": time.time() - age_seconds, "mappings": mappings}, f)
+
+    def test_loads_from_cache_file_without_api_call(self):
+        """캐시 파일이 유효하면 API 호출 없이 즉시 로드"""
+        self._write_cache({"customfield_1": "cached"})
+        provider = CachedJiraFieldMappingProvider(self.source, self.cache_file, ttl_seconds=3600)
+
+        self.assertEqual(provider.get_field_mapping(), {"customfield_1": "cached"})
+        self.source.fetch_field_mapping.assert_not_called()
+
+    def test_cold_start_fetches_and_persists(self):
+        """캐시 파일이 없으면 첫 갱신 결과를 파일에 저장"""
+        provider = CachedJiraFieldMappingProvider(self.source, self.cache_file, ttl_seconds=3600)
+        try:
+            self.assertEqual(provider.get_field_mapping(), {"customfield_10113": "회의_목적"})
+        finally:
+            provider.stop()
+        with open(self.cache_file, encoding="utf-8") as f:
+            self.assertEqual(json.load(f)["mappings"], {"customfield_10113": "회의_목적"})
+
+    def test_failed_refresh_keeps_stale_copy(self):
+        """갱신 실패 시 오래된 매핑 유지"""
+        self._write_cache({"customfield_1": "stale"}, age_seconds=7200)
+        self.source.fetch_field_mapping.side_effect = Exception("503")
+        provider = CachedJiraFieldMappingProvider(self.source, self.cache_file, ttl_seconds=3600)
+
+        provider.refresh()
+
+        self.assertEqual(provider.field_mappings, {"customfield_1": "stale"})
+        self.assertTrue(provider.is_stale())
+
+    def test_failing_cold_start_waits_only_once(self):
+        """캐시 파일 없이 갱신이 계속 실패해도 처음 한 번만 기다림"""
+        self.source.fetch_field_mapping.side_effect = Exception("503")
+        provider = CachedJiraFieldMappingProvider(self.source, self.cache_file, initial_wait_seconds=0.3)
+        try:
+            self.assertEqual(provider.get_field_mapping(), {})
+            start = time.perf_counter()
+            self.assertEqual(provider.get_field_mapping(), {})
+            self.assertLess(time.perf_counter() - start, 0.1)
+        finally:
+            provider.stop()
+
+    def test_failed_refresh_backs_off(self):
+        """갱신 실패 후 재시도 간격은 두 배씩 늘어 TTL에서 멈춤"""
+        self.source.fetch_field_mapping.side_effect = Exception("503")
+        provider = CachedJiraFieldMappingProvider(self.source, self.cache_file, ttl_seconds=100)
+        waits = []
+
+        def wait(seconds):
+            waits.append(seconds)
+            if len(waits) == 4:
+                provider.stop()
+            return False
+
+        provider._stop = MagicMock(is_set=lambda: len(waits) >= 4, wait=wait)
+        provider._run()
+        self.assertEqual(waits, [30.0, 60.0, 100, 100])
+        self.assertEqual(self.source.fetch_field_mapping.call_count, 4)
+
+    def test_refresh_uses_newer_file_from_other_worker(self):
+        """다른 워커가 이미 갱신한 파일이 있으면 API를 호출하지 않음"""
+        self._write_cache({"customfield_1": "old"}, age_seconds=7200)
+        provider = CachedJiraFieldMappingProvider(self.source, self.cache_file, ttl_seconds=3600)
+        self._write_cache({"customfield_1": "new"})
+
+        provider.refresh()
+
+        self.assertEqual(provider.field_mappings, {"customfield_1": "new"})
+        self.source.fetch_field_mapping.assert_not_called()
+
+
+class TestApiJiraFieldMappingProvider(unittest.TestCase):
+
+    def test_failed_refresh_keeps_previous_mapping(self):
+        """API 실패 시 이전 매핑 유지"""
+        client = MagicMock()
+        client._make_request.return_value = [{"key": "customfield_1", "name": "회의 목적"}]
+        provider = ApiJiraFieldMappingProvider(client)
+        self.assertEqual(provider.get_field_mapping(), {"customfield_1": "회의_목적"})
+
+        client._make_request.side_effect = Exception("timeout")
+        provider.refresh()
+        self.assertEqual(provider.get_field_mapping(), {"customfield_1": "회의_목적"})
+
+
+class TestJiraFieldMapperimpl(unittest.TestCase):
+
+    def setUp(self):
+        self.provider = MagicMock()
+        self.provider.get_field_mapping.return_value = {
+            "customfield_10113": "회의_목적",
+            "customfield_10112": "회의_장소",
+            "summary": "요약",
+        }
+        self.mapper = JiraFieldMapperimpl(self.provider)
+
+    def test_bidirectional_lookup(self):
+        """ID <-> 이름 양방향 조회 (customfield가 아닌 ID는 그대로)"""
+        self.assertEqual(self.mapper.map_field_id_to_name("customfield_10113"), "회의_목적")
+        self.assertEqual(self.mapper.map_field_id_to_name("summary"), "summary")
+        self.assertEqual(self.mapper.map_field_name_to_id("회의_장소"), "customfield_10112")
+        self.assertEqual(self.mapper.map_field_name_to_id("unknown"), "unknown")
+
+    def test_index_compiled_once_per_mapping_version(self):
+        """매핑 객체가 바뀔 때만 인덱스를 다시 만듦"""
+        first = self.mapper._get_index()
+        self.mapper.map_field_name_to_id("회의_장소")
+        self.assertIs(self.mapper._get_index(), first)
+
+        self.provider.get_field_mapping.return_value = {"customfield_10113": "목적"}
+        self.assertEqual(self.mapper.map_field_id_to_name("customfield_10113"), "목적")
+        self.assertIsNot(self.mapper._get_index(), first)
+        with self.assertRaises(TypeError):
+            first.name_to_id["x"] = "y"
+
+    def test_transform_many_matches_transform_response(self):
+        """일괄 변환 결과가 단건 변환과 동일"""
+        issues = [
+            {"key": f"T-{i}", "fields": {"customfield_10113": f"목적 {i}", "summary": "s", "customfield_9": 1}}
+            for i in range(3)
+        ] + [{"key": "T-x"}]
+
+        batch = self.mapper.transform_many(issues)
+
+        self.assertEqual(batch, [self.mapper.transform_response(issue) for issue in issues])
+        self.assertEqual(batch[0]["fields"], {"회의_목적": "목적 0", "summary": "s", "customfield_9": 1})
+        self.assertIn("customfield_10113", issues[0]["fields"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+import datetime
+import unittest
+from decimal import Decimal
+from app.source.infrastructure.mapping.markdown_parser import MarkdownTableParser
+
+
+class TestMarkdownTableParser(unittest.TestCase):
+
+    def test_alignment_separator_is_skipped(self):
+        """':---:' 정렬 구분선은 데이터 행으로 취급하지 않음"""
+        rows = MarkdownTableParser.parse_table("| a | b |\n|:---|---:|\n| 1 | 2 |")
+
+        self.assertEqual(rows, [{"a": "1", "b": "2"}])
+
+    def test_escaped_pipe_stays_in_cell(self):
+        """'\\|' 는 셀 안의 문자로 유지"""
+        rows = MarkdownTableParser.parse_table("|식|비고|\n|---|---|\n|a \\| b|x|")
+
+        self.assertEqual(rows, [{"식": "a | b", "비고": "x"}])
+
+    def test_jira_wiki_header(self):
+        """'||헤더||' 형식의 Jira 위키 테이블"""
+        rows = MarkdownTableParser.parse_table("||성명||소속||\n|김철수|한국대학교|")
+
+        self.assertEqual(rows, [{"성명": "김철수", "소속": "한국대학교"}])
+
+    def test_schema_converts_types_and_renames(self):
+        """스키마에 지정된 컬럼은 파싱 중 변환, 나머지는 문자열 유지"""
+        schema = [
+            {"name": "수량", "key": "quantity", "type": "int"},
+            {"name": "단가", "key": "unit_price", "type": "decimal"},
+            {"name": "일자", "key": "date", "type": "date"},
+        ]
+        result = MarkdownTableParser.parse_lines(iter([
+            "|품명|수량|단가|일자|",
+            "|---|---|---|---|",
+            "|센서|1,200|3,300.50|2024.05.01.|",
+            "|케이블||10|2024-05-02|",
+        ]), schema)
+
+        self.assertEqual(result.errors, [])
+        self.assertEqual(result.rows[0], {
+            "품명": "센서", "quantity": 1200, "unit_price": Decimal("3300.50"), "date": datetime.date(2024, 5, 1)
+        })
+        self.assertIsNone(result.rows[1]["quantity"])
+
+    def test_malformed_rows_are_reported(self):
+        """셀 개수 불일치 행은 제외, 변환 실패 값은 원문 유지 후 보고"""
+        schema = [{"name": "amount", "key": "amount", "type": "int"}]
+        result = MarkdownTableParser.parse_lines("|date|amount|\n|---|---|\n|05-01|abc|\n|05-02|\n|05-03|10|".splitlines(), schema)
+
+        self.assertEqual(result.rows, [{"date": "05-01", "amount": "abc"}, {"date": "05-03", "amount": 10}])
+        self.assertEqual([(e.line_number, e.column) for e in result.errors], [(3, "amount"), (4, None)])
+
+    def test_unsupported_type_raises(self):
+        """지원하지 않는 타입은 설정 오류"""
+        with self.assertRaises(ValueError):
+            MarkdownTableParser.parse_table("|a|\n|---|\n|1|", [{"name": "a", "key": "a", "type": "float"}])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from app.source.application.services.data_enricher import SelectiveFieldEnricher
+from app.source.core.domain import Company, Employee, Research
+from app.source.core.exceptions import DatabaseError, EnrichmentError
+from app.source.infrastructure.persistence.connection_pool import ConnectionPool
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+
+
+class TestConnectionPool(unittest.TestCase):
+
+    def test_reuses_released_connections(self):
+        pool = ConnectionPool(MagicMock(side_effect=lambda: MagicMock(closed=0)), max_size=2)
+        first = pool.acquire()
+        pool.release(first)
+        self.assertIs(pool.acquire(), first)
+
+    def test_checkout_times_out_when_exhausted(self):
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=1, checkout_timeout=0.05)
+        pool.acquire()
+        with self.assertRaises(DatabaseError):
+            pool.acquire()
+
+    def test_waiting_checkout_gets_released_connection(self):
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=1, checkout_timeout=2)
+        held = pool.acquire()
+        threading.Timer(0.05, pool.release, args=(held,)).start()
+        self.assertIs(pool.acquire(), held)
+
+    def test_closed_connection_is_replaced(self):
+        pool = ConnectionPool(lambda: MagicMock(closed=0), max_size=1)
+        broken = pool.acquire()
+        broken.closed = 1
+        pool.release(broken)
+        self.assertIsNot(pool.acquire(), broken)
+
+
+class TestConnectionScope(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseConnection({"pool": {"max_size": 2}})
+        patcher = patch.object(self.db, "_open_connection", side_effect=lambda: MagicMock(closed=0))
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_scope_binds_pooled_connection_to_thread(self):
+        with self.assertRaises(DatabaseError):
+            self.db.connect()
+        with self.db.connection_scope() as scoped:
+            self.assertIs(self.db.connect(), scoped)
+            with self.db.connection_scope() as nested:
+                self.assertIs(nested, scoped)
+
+            other = []
+
+            def worker():
+                with self.db.connection_scope() as connection:
+                    other.append(connection)
+
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+            self.assertIsNot(other[0], scoped)
+        self.assertEqual(self.db.get_pool_stats()["in_use"], 0)
+
+    def test_transactional_scope_commits_once(self):
+        with self.db.connection_scope(transactional=True) as connection:
+            self.db.execute_query("UPDATE employees SET name = %s", ("a",))
+            self.db.execute_query("UPDATE employees SET name = %s", ("b",))
+            connection.commit.assert_not_called()
+        connection.commit.assert_called_once_with()
+
+    def test_returning_rows_are_fetched_and_committed(self):
+        with self.db.connection_scope() as connection:
+            cursor = connection.cursor.return_value
+            cursor.description = [("id",)]
+            cursor.fetchall.return_value = [{"id": "E-1"}]
+            cursor.statusmessage = "INSERT 0 1"
+            rows = self.db.execute_query("INSERT INTO employees (id) VALUES (%s) RETURNING id", ("E-1",))
+            self.assertEqual(rows, [{"id": "E-1"}])
+            connection.commit.assert_called_once_with()
+
+            cursor.statusmessage = "SELECT 1"
+            self.db.execute_query("SELECT id FROM employees")
+            connection.commit.assert_called_once_with()
+
+            cursor.description = None
+            cursor.statusmessage = "DELETE 0"
+            self.assertEqual(self.db.execute_query("DELETE FROM employees WHERE id = %s", ("E-2",)), [])
+            self.assertEqual(connection.commit.call_count, 2)
+
+    def test_transactional_scope_inside_non_transactional_scope_is_refused(self):
+        with self.db.connection_scope() as connection:
+            with self.assertRaises(DatabaseError):
+                with self.db.connection_scope(transactional=True):
+                    self.fail("nested transactional scope must not run")
+            self.assertFalse(self.db.in_transaction())
+        connection.commit.assert_not_called()
+        self.assertEqual(self.db.get_pool_stats()["in_use"], 0)
+
+        with self.db.connection_scope(transactional=True) as outer:
+            with self.db.connection_scope(transactional=True) as nested:
+                self.assertIs(nested, outer)
+                self.assertTrue(self.db.in_transaction())
+        outer.commit.assert_called_once_with()
+
+    def test_transactional_scope_rolls_back_on_error(self):
+        with self.assertRaises(ValueError):
+            with self.db.connection_scope(transactional=True) as connection:
+                raise ValueError("boom")
+        connection.commit.assert_not_called()
+        connection.rollback.assert_called()
+
+
+def slow_repo(method, entities, delay):
+    repo = MagicMock()
+
+    def find_many(keys):
+        time.sleep(delay)
+        return {key: entities[key] for key in keys if key in entities}
+
+    getattr(repo, method).side_effect = find_many
+    return repo
+
+
+class TestParallelEnrichment(unittest.TestCase):
+
+    def setUp(self):
+        self.company = Company(id="C-1", company_name="에이사", biz_id="123-45-67890", address="서울",
+                               rep_name="대표", phone="02")
+        self.employee = Employee(id="E-1", name="홍길동", email="hong@example.com", department="개발팀",
+                                 position="연구원", phone="010")
+        self.research = Research(id="R-1", project_name="과제", project_code="R-2024-001", project_period=None,
+                                 project_manager=None, project_start_date=None, project_end_date=None,
+                                 budget=None, status="진행")
+        self.data = {"fields": {
+            "사업자_선택": {"value": "에이사"},
+            "서명인": {"accountId": "acc-1"},
+            "연구과제_선택_key": "R-2024-001",
+        }}
+
+    def enricher(self, delays, timeout_seconds=5.0):
+        return SelectiveFieldEnricher(
+            slow_repo("find_many_by_name", {"에이사": self.company}, delays[0]),
+            slow_repo("find_many_by_jira_account_id", {"acc-1": self.employee}, delays[1]),
+            slow_repo("find_many_by_code", {"R-2024-001": self.research}, delays[2]),
+            MagicMock(), timeout_seconds=timeout_seconds)
+
+    def test_domain_types_are_resolved_concurrently(self):
+        enricher = self.enricher((0.2, 0.2, 0.2))
+        start = time.perf_counter()
+        fields = enricher.enrich("", self.data)["fields"]
+        self.assertLess(time.perf_counter() - start, 0.5)
+
+        self.assertEqual(fields["사업자_선택"]["address"], "서울")
+        self.assertEqual(fields["서명인"]["name"], "홍길동")
+        self.assertEqual(fields["연구과제_선택_key"]["project_name"], "과제")
+        enricher.employee_repo.connection_scope.assert_called_once_with()
+
+    def test_slow_domain_type_times_out(self):
+        enricher = self.enricher((0.0, 1.0, 0.0), timeout_seconds=0.2)
+        with self.assertRaisesRegex(EnrichmentError, "employee"):
+            enricher.enrich("", self.data)
+        # 시간 초과를 조회 결과 없음으로 취급해 보강되지 않은 데이터를 남기지 않음
+        self.assertEqual(self.data["fields"]["서명인"], {"accountId": "acc-1"})
+
+    def test_sequential_when_single_worker(self):
+        enricher = self.enricher((0.0, 0.0, 0.0))
+        enricher.max_workers = 1
+        fields = enricher.enrich("", self.data)["fields"]
+        self.assertEqual(fields["서명인"]["name"], "홍길동")
+        enricher.employee_repo.connection_scope.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
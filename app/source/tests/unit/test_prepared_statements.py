@@ -0,0 +1,98 @@
+import unittest
+from unittest.mock import MagicMock, patch
+import psycopg2
+from app.source.core.exceptions import DatabaseError
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.schema_definition import create_employee_schema
+
+
+class MissingStatement(psycopg2.Error):
+    pgcode = "26000"
+
+
+class TestSchemaSqlCache(unittest.TestCase):
+
+    def setUp(self):
+        self.schema = create_employee_schema()
+
+    def test_statements_are_built_once(self):
+        self.assertIs(self.schema.select_by_id_sql(), self.schema.select_by_id_sql())
+        self.assertIs(self.schema.update_sql(), self.schema.update_sql())
+        self.assertIs(self.schema.select_by_any_sql("email"), self.schema.select_by_any_sql("email"))
+        self.assertIsNot(self.schema.select_by_any_sql("email"), self.schema.select_by_any_sql("name"))
+
+    def test_criteria_sql_is_cached_per_shape(self):
+        first, params = self.schema.select_by_criteria_sql({"email": "a@example.com", "unknown": 1})
+        second, other_params = self.schema.select_by_criteria_sql({"email": "b@example.com"})
+        self.assertIs(first, second)
+        self.assertEqual((params, other_params), (["a@example.com"], ["b@example.com"]))
+
+        swapped, params = self.schema.select_by_criteria_sql({"department": "개발팀", "name": "홍길동"})
+        self.assertTrue(swapped.endswith("WHERE department = %s AND name = %s"))
+        self.assertEqual(params, ["개발팀", "홍길동"])
+
+
+class TestPreparedStatements(unittest.TestCase):
+
+    def setUp(self):
+        self.db = DatabaseConnection({"prepared_statements": True, "pool": {"max_size": 2}})
+        self.connections = []
+
+        def open_connection():
+            connection = MagicMock(closed=0)
+            connection.cursor.return_value.fetchall.return_value = []
+            self.connections.append(connection)
+            return connection
+
+        patcher = patch.object(self.db, "_open_connection", side_effect=open_connection)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def executed(self, connection):
+        return [call.args for call in connection.cursor.return_value.execute.call_args_list]
+
+    def test_prepares_once_per_connection(self):
+        query = "SELECT id FROM employees WHERE email = %s AND name LIKE '50%%'"
+        self.db.execute_query(query, ("a@example.com",), prepare=True)
+        self.db.execute_query(query, ("b@example.com",), prepare=True)
+
+        name = self.db._statement(query)[0]
+        self.assertEqual(self.executed(self.connections[0]), [
+            (f"PREPARE {name} AS SELECT id FROM employees WHERE email = $1 AND name LIKE '50%'",),
+            (f"EXECUTE {name} (%s)", ("a@example.com",)),
+            (f"EXECUTE {name} (%s)", ("b@example.com",)),
+        ])
+
+        # 다른 연결에서는 따로 준비
+        with self.db.connection_scope():
+            second = self.db.pool.acquire()
+            self.db._execute_prepared(second, second.cursor(), query, ("c@example.com",))
+            self.db.pool.release(second)
+        self.assertTrue(self.executed(second)[0][0].startswith(f"PREPARE {name} AS "))
+
+    def test_unprepared_queries_and_disabled_mode_run_directly(self):
+        self.db.execute_query("SELECT 1 WHERE %s", (True,))
+        self.db.prepared_statements = False
+        self.db.execute_query("SELECT 2 WHERE %s", (True,), prepare=True)
+        self.assertEqual(self.executed(self.connections[0]), [
+            ("SELECT 1 WHERE %s", (True,)),
+            ("SELECT 2 WHERE %s", (True,)),
+        ])
+
+    def test_missing_statement_is_prepared_again(self):
+        query = "DELETE FROM employees WHERE id = %s"
+        self.db.execute_query(query, ("E-1",), prepare=True)
+
+        cursor = self.connections[0].cursor.return_value
+        cursor.execute.side_effect = [MissingStatement("prepared statement does not exist")]
+        with self.assertRaises(DatabaseError):
+            self.db.execute_query(query, ("E-2",), prepare=True)
+        cursor.execute.side_effect = None
+        cursor.execute.reset_mock()
+
+        self.db.execute_query(query, ("E-3",), prepare=True)
+        self.assertTrue(self.executed(self.connections[0])[0][0].startswith("PREPARE "))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,74 @@
+import copy
+import glob
+import json
+import os
+import unittest
+from unittest.mock import MagicMock
+from app.source.core.exceptions import ConfigurationError
+from app.source.application.services.preprocessing_pipeline import PipelineJiraPreprocessor, compile_plan
+from app.source.infrastructure.mapping.mapping_config_loader import MappingConfigLoader
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fixtures", "preprocessing")
+
+
+def load_json(path):
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def make_loader(config):
+    loader = MagicMock(spec=MappingConfigLoader)
+    loader.get_preprocessing_config.return_value = config
+    return loader
+
+
+class TestPipelineJiraPreprocessor(unittest.TestCase):
+
+    def test_default_plan_matches_golden_output(self):
+        """전체 단계 실행 결과가 기존 전처리 골든 파일과 동일"""
+        preprocessor = PipelineJiraPreprocessor()
+        for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "*.json"))):
+            with self.subTest(payload=os.path.basename(path)):
+                golden = load_json(os.path.join(FIXTURES_DIR, "golden", os.path.basename(path)))
+                self.assertEqual(preprocessor.preprocess(load_json(path)), golden)
+
+    def test_document_type_plan_and_timings(self):
+        """문서 유형별 단계만 실행하고 단계별 시간 기록"""
+        preprocessor = PipelineJiraPreprocessor(make_loader({
+            "회의록": {"stages": ["markdown_tables", "research_key"]},
+        }))
+        payload = load_json(os.path.join(FIXTURES_DIR, "meeting_minutes.json"))
+
+        result = preprocessor.preprocess(copy.deepcopy(payload))
+
+        self.assertNotIn("internal_participants", result["fields"])
+        self.assertEqual(result["fields"]["연구과제_선택_key"], "R-2024-001")
+        self.assertEqual([t.stage for t in preprocessor.last_timings()], ["markdown_tables", "research_key"])
+        self.assertEqual(preprocessor.get_stats()["회의록"]["research_key"]["runs"], 1)
+
+    def test_stages_without_inputs_are_skipped(self):
+        """입력 필드가 없는 단계는 건너뜀"""
+        preprocessor = PipelineJiraPreprocessor()
+        preprocessor.preprocess({"fields": {"issuetype": {"name": "견적서"}, "summary": "s"}})
+
+        skipped = {t.stage for t in preprocessor.last_timings() if t.skipped}
+        self.assertEqual(skipped, {"mapper_tables", "research_key", "item_amounts", "amount_summary"})
+        self.assertEqual(preprocessor.get_stats()["견적서"]["amount_summary"]["skipped"], 1)
+
+    def test_invalid_plans_are_rejected(self):
+        """등록되지 않은 단계, 뒤 단계가 쓰는 필드를 읽는 순서는 설정 오류"""
+        with self.assertRaises(ConfigurationError):
+            compile_plan(["markdown_tables", "unknown"])
+        with self.assertRaises(ConfigurationError):
+            compile_plan(["amount_summary", "markdown_tables"])
+
+    def test_shipped_config_is_valid(self):
+        """mapping_config.yaml의 preprocessing 섹션이 유효"""
+        preprocessor = PipelineJiraPreprocessor(MappingConfigLoader())
+
+        self.assertEqual([stage.name for stage in preprocessor.get_plan("회의록")], ["markdown_tables", "research_key"])
+        self.assertEqual(len(preprocessor.get_plan("없는_유형")), 5)
+
+
+if __name__ == '__main__':
+    unittest.main()
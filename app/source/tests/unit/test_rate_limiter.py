@@ -0,0 +1,111 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+from app.source.infrastructure.integrations.http_session import PooledHttpSession
+from app.source.infrastructure.integrations.rate_limiter import (
+    RateLimitConfig, RateLimiter, TokenBucket, AdaptiveConcurrencyLimiter
+)
+
+
+def make_response(status_code, headers=None):
+    response = MagicMock()
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+class TestTokenBucket(unittest.TestCase):
+
+    def test_burst_then_rate(self):
+        """버스트 이후에는 충전 속도만큼만 허용"""
+        bucket = TokenBucket(rate=1000.0, capacity=3)
+        for _ in range(3):
+            self.assertEqual(bucket._try_acquire(), 0.0)
+        self.assertGreater(bucket._try_acquire(), 0.0)
+
+    def test_block_until_pauses_requests(self):
+        """서버 지정 시각까지 토큰 발급 중지"""
+        bucket = TokenBucket(rate=1000.0, capacity=10)
+        bucket.block_until(time.time() + 30)
+        self.assertGreater(bucket._try_acquire(), 29.0)
+
+    def test_state_shared_through_file(self):
+        """state_file을 지정하면 다른 인스턴스(프로세스)와 토큰을 공유"""
+        with tempfile.TemporaryDirectory() as tmp:
+            state_file = os.path.join(tmp, "jira_rate.json")
+            first = TokenBucket(rate=0.001, capacity=2, state_file=state_file)
+            second = TokenBucket(rate=0.001, capacity=2, state_file=state_file)
+            if first.state_file is None:
+                self.skipTest("fcntl not available")
+            self.assertEqual(first._try_acquire(), 0.0)
+            self.assertEqual(second._try_acquire(), 0.0)
+            self.assertGreater(first._try_acquire(), 0.0)
+
+
+class TestRateLimiter(unittest.TestCase):
+
+    def test_retry_after_blocks_and_halves_concurrency(self):
+        """429 + Retry-After 처리"""
+        limiter = RateLimiter(RateLimitConfig(max_concurrency=8))
+        throttled = limiter.observe(make_response(429, {"Retry-After": "12"}), 0.1)
+
+        self.assertTrue(throttled)
+        self.assertEqual(limiter.concurrency.limit, 4)
+        self.assertGreater(limiter.bucket._try_acquire(), 11.0)
+
+    def test_quota_exhausted_waits_for_reset(self):
+        """X-RateLimit-Remaining: 0 이면 Reset 시각까지 정지"""
+        limiter = RateLimiter()
+        reset = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(time.time() + 60))
+        throttled = limiter.observe(
+            make_response(200, {"X-RateLimit-Remaining": "0", "X-RateLimit-Reset": reset}), 0.1)
+
+        self.assertFalse(throttled)
+        self.assertGreater(limiter.bucket._try_acquire(), 50.0)
+
+    def test_adaptive_concurrency(self):
+        """느린 응답에는 감소, 빠른 응답에는 점진적 증가"""
+        concurrency = AdaptiveConcurrencyLimiter(max_limit=8, min_limit=1, target_latency=1.0)
+        concurrency.on_success(5.0)
+        self.assertEqual(concurrency.limit, 4)
+        concurrency.on_success(0.1)
+        self.assertEqual(concurrency.limit, 4.25)
+        for _ in range(40):
+            concurrency.on_success(0.1)
+        self.assertEqual(concurrency.limit, 8)
+
+    def test_session_retries_throttled_request(self):
+        """풀링 세션이 429 응답을 대기 후 재시도"""
+        limiter = RateLimiter(RateLimitConfig(requests_per_second=1000, burst=10))
+        session = PooledHttpSession(rate_limiter=limiter)
+        responses = [make_response(429, {"Retry-After": "0"}), make_response(200)]
+        body = MagicMock()
+
+        with patch('requests.Session.request', side_effect=responses) as mock_request:
+            response = session.post('https://test.atlassian.net/rest/api/2/search', data=body)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(mock_request.call_count, 2)
+        body.seek.assert_called_once_with(0)
+        self.assertEqual(limiter.get_stats()["throttled"], 1)
+
+    def test_streaming_response_holds_slot_until_closed(self):
+        """스트리밍 응답은 본문을 닫을 때까지 동시성 슬롯 점유"""
+        limiter = RateLimiter(RateLimitConfig(requests_per_second=1000, burst=10))
+        session = PooledHttpSession(rate_limiter=limiter)
+
+        with patch('requests.Session.request', side_effect=lambda *a, **k: make_response(200)):
+            streamed = session.get('https://test.atlassian.net/secure/attachment/1', stream=True)
+            self.assertEqual(limiter.concurrency._in_flight, 1)
+            session.get('https://test.atlassian.net/rest/api/2/issue/T-1')
+            self.assertEqual(limiter.concurrency._in_flight, 1)
+
+        streamed.close()
+        streamed.close()
+        self.assertEqual(limiter.concurrency._in_flight, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
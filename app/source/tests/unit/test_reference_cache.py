@@ -0,0 +1,159 @@
+import re
+import unittest
+from unittest.mock import MagicMock, patch
+from app.source.infrastructure.persistence.db_connection import DatabaseConnection
+from app.source.infrastructure.persistence.reference_cache import (
+    ReferenceDataCache, ReferenceDataListener, create_notify_triggers_sql
+)
+from app.source.infrastructure.repositories.employee_repo_v2 import EmployeeRepositoryV2
+
+INSERT_QUERY = re.compile(r"^INSERT INTO employees \(([^)]*)\)")
+SELECT_QUERY = re.compile(r"FROM employees(?: WHERE (\w+) = (ANY\(%s\)|%s))?$")
+
+
+def employee_row(i):
+    return {
+        "id": f"EMP-{i:03d}", "name": f"직원{i}", "email": f"emp{i}@example.com", "jira_account_id": f"acc-{i}",
+        "affiliation": "연구소", "department": "개발팀", "position": "연구원", "phone": "010-0000-0000",
+        "signature": None, "stamp": None, "bank_name": None, "account_number": None, "birth_date": None,
+        "address": None, "fax": None,
+    }
+
+
+class FakeEmployeeTable:
+    """employees 테이블 SELECT/upsert만 처리하는 DB 대역 (실행한 쿼리 기록)"""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.queries = []
+
+    def execute_query(self, query, params=None, prepare=False):
+        self.queries.append(query)
+        if query.startswith("INSERT"):
+            written = dict(zip(INSERT_QUERY.match(query).group(1).split(", "), params))
+            stored = next(row for row in self.rows if row["id"] == written["id"])
+            stored.update(written)
+            return [dict(stored)]
+        match = SELECT_QUERY.search(query)
+        if not match:
+            raise AssertionError(f"Unexpected query: {query}")
+        column, operator = match.groups()
+        if column is None:
+            return [dict(row) for row in self.rows]
+        if operator == "%s":
+            return [dict(row) for row in self.rows if row[column] == params[0]]
+        return [dict(row) for row in self.rows if row[column] in params[0]]
+
+
+class TestReferenceDataCache(unittest.TestCase):
+
+    def test_hit_miss_and_negative_entries(self):
+        cache = ReferenceDataCache("employees")
+        self.assertIsNone(cache.get("email", "a@example.com"))
+        cache.put("email", "a@example.com", [{"id": "1"}])
+        cache.put("email", "none@example.com", [])
+
+        self.assertEqual(cache.get("email", "a@example.com"), ({"id": "1"},))
+        self.assertEqual(cache.get("email", "none@example.com"), ())
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["negative_hits"], stats["misses"]), (1, 1, 1))
+        self.assertAlmostEqual(stats["hit_rate"], 2 / 3)
+
+    def test_ttl_expiry(self):
+        cache = ReferenceDataCache("employees", ttl_seconds=10)
+        with patch("app.source.infrastructure.persistence.reference_cache.time.monotonic", return_value=100.0):
+            cache.put("id", "EMP-1", [{"id": "EMP-1"}])
+        with patch("app.source.infrastructure.persistence.reference_cache.time.monotonic", return_value=109.0):
+            self.assertIsNotNone(cache.get("id", "EMP-1"))
+        with patch("app.source.infrastructure.persistence.reference_cache.time.monotonic", return_value=110.0):
+            self.assertIsNone(cache.get("id", "EMP-1"))
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_lru_eviction(self):
+        cache = ReferenceDataCache("employees", max_entries=2)
+        cache.put("id", 1, [])
+        cache.put("id", 2, [])
+        cache.get("id", 1)
+        cache.put("id", 3, [])
+        self.assertIsNone(cache.get("id", 2))
+        self.assertIsNotNone(cache.get("id", 1))
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+
+    def test_fill_started_before_invalidation_is_dropped(self):
+        cache = ReferenceDataCache("employees")
+        generation = cache.generation
+        cache.invalidate("notification")
+        cache.put("id", "EMP-1", [{"id": "EMP-1"}], generation)
+        self.assertIsNone(cache.get("id", "EMP-1"))
+        self.assertEqual(cache.get_stats()["invalidations"], 1)
+
+
+class TestReferenceDataListener(unittest.TestCase):
+
+    def test_notification_invalidates_matching_table(self):
+        caches = {name: ReferenceDataCache(name) for name in ("employees", "companies")}
+        for cache in caches.values():
+            cache.put("id", "x", [])
+        listener = ReferenceDataListener({}, caches)
+
+        listener.handle_notification("employees")
+        self.assertIsNone(caches["employees"].get("id", "x"))
+        self.assertIsNotNone(caches["companies"].get("id", "x"))
+
+        listener.handle_notification("unknown_table")
+        self.assertIsNone(caches["companies"].get("id", "x"))
+
+    def test_trigger_sql_covers_all_tables(self):
+        sql = create_notify_triggers_sql(["employees", "experts"])
+        self.assertIn("pg_notify('reference_data_changed', TG_TABLE_NAME)", sql)
+        self.assertIn("AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON employees", sql)
+        self.assertIn("AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON experts", sql)
+
+
+class TestCachedRepository(unittest.TestCase):
+
+    def setUp(self):
+        self.db = FakeEmployeeTable([employee_row(i) for i in range(5)])
+        connection = MagicMock(spec=DatabaseConnection)
+        connection.execute_query.side_effect = self.db.execute_query
+        self.cache = ReferenceDataCache("employees")
+        self.repo = EmployeeRepositoryV2(connection, cache=self.cache)
+
+    def test_read_through_and_negative_caching(self):
+        self.assertEqual(self.repo.find_by_jira_account_id("acc-1").id, "EMP-001")
+        self.assertIsNone(self.repo.find_by_jira_account_id("unknown"))
+        self.assertEqual(self.repo.find_by_jira_account_id("acc-1").id, "EMP-001")
+        self.assertIsNone(self.repo.find_by_jira_account_id("unknown"))
+        self.assertEqual(len(self.db.queries), 2)
+
+    def test_batch_lookup_queries_only_misses(self):
+        self.repo.find_by_jira_account_id("acc-1")
+        found = self.repo.find_many_by_jira_account_id(["acc-1", "acc-2", "unknown"])
+        self.assertEqual(sorted(found), ["acc-1", "acc-2"])
+
+        found = self.repo.find_many_by_jira_account_id(["acc-1", "acc-2", "unknown"])
+        self.assertEqual(sorted(found), ["acc-1", "acc-2"])
+        self.assertEqual(len(self.db.queries), 2)
+
+    def test_warm_loads_table_once(self):
+        self.assertEqual(self.repo.warm(), 5)
+        self.assertEqual(self.repo.find_by_id("EMP-003").name, "직원3")
+        self.assertEqual(self.repo.find_by_email("emp4@example.com").id, "EMP-004")
+        self.assertEqual(self.repo.find_many_by_jira_account_id(["acc-0", "acc-1"])["acc-0"].id, "EMP-000")
+        self.assertEqual(len(self.db.queries), 1)
+
+    def test_write_invalidates_cache(self):
+        self.repo.warm()
+        employee = self.repo.find_by_id("EMP-001")
+        self.repo.save(employee)
+        self.repo.find_by_id("EMP-001")
+        self.assertEqual(len(self.db.queries), 3)
+
+    def test_cached_entities_are_not_shared(self):
+        self.repo.warm()
+        self.repo.find_by_id("EMP-001").name = "변경"
+        self.assertEqual(self.repo.find_by_id("EMP-001").name, "직원1")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,464 @@
+#!/usr/bin/env python3
+"""
+로컬 Jira REST 대역 서버
+
+기록된 fixture로 Jira Cloud REST API 일부를 흉내 내어 실제 Atlassian 사이트 없이
+JiraClient와 /api/documents 전체 흐름을 테스트/부하 측정할 수 있게 한다.
+
+지원 엔드포인트:
+    GET  /rest/api/2/issue/<key>[?fields=&expand=]
+    GET  /rest/api/2/field
+    POST /rest/api/2/search, GET /rest/api/2/search?jql=
+    GET  /secure/attachment/<id>/<filename>   (Range 지원)
+    POST /rest/api/2/issue/<key>/attachments
+
+fixture 디렉토리 구조:
+    fields.json                     필드 목록 (/rest/api/2/field 응답)
+    issues/<KEY>.json               이슈 응답 (fields 전체)
+    attachments/<id>/<filename>     첨부 파일 본문
+
+JSON 안의 {{JIRA_BASE_URL}} 은 서버 주소로 바뀌어 응답된다 (첨부 content URL 등).
+
+사용 예:
+    # fixture로 서비스
+    python -m app.source.tests.util.jira_stub_server --fixtures app/source/tests/fixtures/jira --port 8089 \\
+        --latency 0.05 --jitter 0.02 --rate-429 0.05
+    # 실제 사이트 응답을 fixture로 기록
+    python -m app.source.tests.util.jira_stub_server --fixtures /tmp/jira --record-from https://x.atlassian.net
+    # 이후 JIRA_BASE_URL=http://127.0.0.1:8089 로 실행
+"""
+
+from dataclasses import dataclass
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Any, List, Optional
+from urllib.parse import urlsplit, parse_qs, unquote
+import argparse
+import email
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import logging
+
+import requests
+
+BASE_URL_PLACEHOLDER = "{{JIRA_BASE_URL}}"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FaultConfig:
+    """주입할 지연/오류 설정"""
+    latency: float = 0.0            # 기본 응답 지연 (초)
+    jitter: float = 0.0             # 지연에 더할 무작위 편차 최대값 (초)
+    rate_429: float = 0.0           # 429 응답 확률 (0~1)
+    retry_after: float = 1.0        # 429 응답의 Retry-After (초)
+    failure_rate: float = 0.0       # 500 응답 확률 (0~1)
+    seed: Optional[int] = None      # 재현 가능한 난수 시드
+
+
+class JiraFixtureStore:
+    """fixture 디렉토리 읽기/쓰기"""
+
+    def __init__(self, fixtures_dir: str):
+        self.fixtures_dir = fixtures_dir
+        self.issues_dir = os.path.join(fixtures_dir, "issues")
+        self.attachments_dir = os.path.join(fixtures_dir, "attachments")
+        self._lock = threading.Lock()
+        self._uploaded: Dict[str, List[Dict[str, Any]]] = {}
+        self._next_attachment_id = 900000
+
+    def load_json(self, relative_path: str) -> Optional[Any]:
+        path = os.path.join(self.fixtures_dir, relative_path)
+        if not os.path.exists(path):
+            return None
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    def save_json(self, relative_path: str, data: Any) -> None:
+        path = os.path.join(self.fixtures_dir, relative_path)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(data, f, ensure_ascii=False, indent=2)
+
+    def get_issue(self, issue_key: str) -> Optional[Dict[str, Any]]:
+        issue = self.load_json(os.path.join("issues", f"{issue_key}.json"))
+        if issue is None:
+            return None
+        with self._lock:
+            uploaded = list(self._uploaded.get(issue_key, []))
+        if uploaded:
+            issue.setdefault("fields", {}).setdefault("attachment", [])
+            issue["fields"]["attachment"] = issue["fields"]["attachment"] + uploaded
+        return issue
+
+    def list_issues(self) -> List[Dict[str, Any]]:
+        if not os.path.isdir(self.issues_dir):
+            return []
+        keys = sorted(name[:-5] for name in os.listdir(self.issues_dir) if name.endswith(".json"))
+        return [self.get_issue(key) for key in keys]
+
+    def attachment_path(self, attachment_id: str, filename: str) -> str:
+        return os.path.join(self.attachments_dir, attachment_id, os.path.basename(filename))
+
+    def add_attachment(self, issue_key: str, filename: str, content: bytes) -> Dict[str, Any]:
+        """업로드된 첨부 파일 저장 (서버 실행 중에만 이슈에 반영)"""
+        with self._lock:
+            self._next_attachment_id += 1
+            attachment_id = str(self._next_attachment_id)
+        path = self.attachment_path(attachment_id, filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "wb") as f:
+            f.write(content)
+        attachment = {
+            "id": attachment_id,
+            "filename": os.path.basename(filename),
+            "size": len(content),
+            "created": time.strftime("%Y-%m-%dT%H:%M:%S.000+0000", time.gmtime()),
+            "mimeType": "application/octet-stream",
+            "content": f"{BASE_URL_PLACEHOLDER}/secure/attachment/{attachment_id}/{os.path.basename(filename)}",
+        }
+        with self._lock:
+            self._uploaded.setdefault(issue_key, []).append(attachment)
+        return attachment
+
+
+class JiraStubHandler(BaseHTTPRequestHandler):
+    """Jira REST 요청 처리기"""
+
+    server_version = "JiraStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    ISSUE_PATH = re.compile(r"^/rest/api/2/issue/([^/]+)$")
+    UPLOAD_PATH = re.compile(r"^/rest/api/2/issue/([^/]+)/attachments$")
+    ATTACHMENT_PATH = re.compile(r"^/secure/attachment/([^/]+)/(.+)$")
+
+    @property
+    def stub(self) -> "JiraStubServer":
+        return self.server.stub
+
+    def log_message(self, format: str, *args) -> None:
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        url = urlsplit(self.path)
+        path = unquote(url.path)
+        query = {k: v[-1] for k, v in parse_qs(url.query).items()}
+        body = self._read_body()
+
+        if self.stub.inject_fault(self):
+            return
+
+        if self.stub.record_from:
+            self._proxy(method, url, body)
+            return
+
+        match = self.ISSUE_PATH.match(path)
+        if method == "GET" and match:
+            return self._get_issue(match.group(1), query)
+        if method == "GET" and path == "/rest/api/2/field":
+            return self._send_json(200, self.stub.store.load_json("fields.json") or [])
+        if path == "/rest/api/2/search":
+            params = json.loads(body or b"{}") if method == "POST" else query
+            return self._search(params)
+        match = self.ATTACHMENT_PATH.match(path)
+        if method == "GET" and match:
+            return self._get_attachment(match.group(1), match.group(2))
+        match = self.UPLOAD_PATH.match(path)
+        if method == "POST" and match:
+            return self._upload(match.group(1), body)
+        self._send_json(404, {"errorMessages": [f"No stub for {method} {path}"]})
+
+    # --- 엔드포인트 ---
+
+    def _get_issue(self, issue_key: str, query: Dict[str, str]) -> None:
+        issue = self.stub.store.get_issue(issue_key)
+        if issue is None:
+            return self._send_json(404, {"errorMessages": ["Issue does not exist or you do not have permission to see it."]})
+        issue = self._project(issue, query.get("fields"))
+        self._send_json(200, issue, etag=True)
+
+    def _search(self, params: Dict[str, Any]) -> None:
+        issues = [issue for issue in self.stub.store.list_issues() if self._matches(issue, params.get("jql", ""))]
+        start_at = int(params.get("startAt", 0))
+        max_results = int(params.get("maxResults", 50))
+        fields = params.get("fields")
+        if isinstance(fields, list):
+            fields = ",".join(fields)
+        page = [self._project(issue, fields) for issue in issues[start_at:start_at + max_results]]
+        self._send_json(200, {"startAt": start_at, "maxResults": max_results, "total": len(issues), "issues": page})
+
+    def _get_attachment(self, attachment_id: str, filename: str) -> None:
+        path = self.stub.store.attachment_path(attachment_id, filename)
+        if not os.path.exists(path):
+            return self._send_json(404, {"errorMessages": ["Attachment not found"]})
+        with open(path, "rb") as f:
+            content = f.read()
+        total = len(content)
+
+        range_header = self.headers.get("Range")
+        match = re.match(r"bytes=(\d+)-(\d*)$", range_header or "")
+        if match:
+            start = int(match.group(1))
+            end = int(match.group(2)) if match.group(2) else total - 1
+            if start >= total:
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{total}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            chunk = content[start:end + 1]
+            self.send_response(206)
+            self.send_header("Content-Range", f"bytes {start}-{start + len(chunk) - 1}/{total}")
+        else:
+            chunk = content
+            self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(len(chunk)))
+        self.end_headers()
+        self.wfile.write(chunk)
+
+    def _upload(self, issue_key: str, body: bytes) -> None:
+        if self.headers.get("X-Atlassian-Token") != "no-check":
+            return self._send_json(403, {"errorMessages": ["XSRF check failed"]})
+        if self.stub.store.get_issue(issue_key) is None:
+            return self._send_json(404, {"errorMessages": ["Issue does not exist"]})
+        message = email.message_from_bytes(
+            b"Content-Type: " + self.headers.get("Content-Type", "").encode("latin-1") + b"\r\n\r\n" + body
+        )
+        attachments = []
+        for part in message.get_payload() if message.is_multipart() else []:
+            filename = part.get_param("filename", header="Content-Disposition") or "upload.bin"
+            if isinstance(filename, bytes):
+                filename = filename.decode("utf-8", "replace")
+            # RFC 7578: UTF-8 파일명을 latin-1로 해석한 경우 복원
+            try:
+                filename = filename.encode("latin-1").decode("utf-8")
+            except (UnicodeEncodeError, UnicodeDecodeError):
+                pass
+            attachments.append(self.stub.store.add_attachment(issue_key, filename, part.get_payload(decode=True) or b""))
+        self._send_json(200, attachments)
+
+    # --- 헬퍼 ---
+
+    @staticmethod
+    def _project(issue: Dict[str, Any], fields: Optional[str]) -> Dict[str, Any]:
+        """fields= 파라미터 반영 (*all, *navigable, -field 지원)"""
+        if not fields:
+            return issue
+        requested = [f for f in fields.split(",") if f]
+        if any(f in ("*all", "*navigable") for f in requested):
+            selected = dict(issue.get("fields", {}))
+        else:
+            selected = {k: v for k, v in issue.get("fields", {}).items() if k in requested}
+        for f in requested:
+            if f.startswith("-"):
+                selected.pop(f[1:], None)
+        return {**issue, "fields": selected}
+
+    @staticmethod
+    def _matches(issue: Dict[str, Any], jql: str) -> bool:
+        """간단한 JQL 필터 (project = X, key in (...), parent = X). 그 밖의 조건은 무시"""
+        for project in re.findall(r"project\s*=\s*\"?([\w-]+)\"?", jql, re.IGNORECASE):
+            if not issue["key"].startswith(f"{project}-"):
+                return False
+        for keys in re.findall(r"key\s+in\s*\(([^)]*)\)", jql, re.IGNORECASE):
+            if issue["key"] not in [k.strip().strip('"') for k in keys.split(",")]:
+                return False
+        for parent in re.findall(r"parent\s*=\s*\"?([\w-]+)\"?", jql, re.IGNORECASE):
+            if (issue.get("fields", {}).get("parent") or {}).get("key") != parent:
+                return False
+        return True
+
+    def _read_body(self) -> bytes:
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+    def _send_json(self, status: int, data: Any, etag: bool = False, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(data, ensure_ascii=False).replace(BASE_URL_PLACEHOLDER, self.stub.base_url).encode("utf-8")
+        if etag:
+            tag = '"%s"' % hashlib.sha1(payload).hexdigest()
+            if self.headers.get("If-None-Match") == tag:
+                self.send_response(304)
+                self.send_header("ETag", tag)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json;charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        if etag:
+            self.send_header("ETag", tag)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def _proxy(self, method: str, url, body: bytes) -> None:
+        """기록 모드: 실제 Jira로 전달하고 응답을 fixture로 저장"""
+        forward_headers = {k: v for k, v in self.headers.items() if k.lower() in ("authorization", "accept", "content-type", "range", "x-atlassian-token")}
+        upstream = self.stub.record_from
+        response = requests.request(method, upstream + url.path + (f"?{url.query}" if url.query else ""),
+                                    headers=forward_headers, data=body or None, timeout=60)
+        content = response.content
+        if response.status_code in (200, 206):
+            self.stub.record(method, unquote(url.path), url.query, body, response)
+        if "json" in response.headers.get("Content-Type", ""):
+            content = content.replace(upstream.encode("utf-8"), self.stub.base_url.encode("utf-8"))
+        self.send_response(response.status_code)
+        for name in ("Content-Type", "Content-Range", "ETag", "Retry-After", "X-RateLimit-Remaining", "X-RateLimit-Reset"):
+            if name in response.headers:
+                self.send_header(name, response.headers[name])
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+class JiraStubServer:
+    """Jira 대역 서버 (테스트에서는 with 문으로 사용)
+
+    Example:
+        with JiraStubServer(fixtures_dir, faults=FaultConfig(latency=0.01)) as stub:
+            client = JiraClient(stub.base_url, "user", "token")
+    """
+
+    def __init__(self, fixtures_dir: str, host: str = "127.0.0.1", port: int = 0,
+                 faults: Optional[FaultConfig] = None, record_from: Optional[str] = None):
+        """JiraStubServer 초기화
+
+        Args:
+            fixtures_dir (str): fixture 디렉토리 (기록 모드에서는 저장 위치)
+            host (str): 바인드 주소
+            port (int): 포트 (0이면 임의의 빈 포트)
+            faults (FaultConfig, optional): 지연/오류 주입 설정
+            record_from (str, optional): 기록 모드에서 요청을 전달할 실제 Jira 주소
+        """
+        self.store = JiraFixtureStore(fixtures_dir)
+        self._random_lock = threading.Lock()
+        self.faults = faults or FaultConfig()
+        self.record_from = record_from.rstrip("/") if record_from else None
+        self._httpd = ThreadingHTTPServer((host, port), JiraStubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self
+        self._thread = None
+        self.stats = {"requests": 0, "throttled": 0, "failed": 0}
+
+    @property
+    def faults(self) -> FaultConfig:
+        return self._faults
+
+    @faults.setter
+    def faults(self, faults: FaultConfig) -> None:
+        """실행 중에 지연/오류 설정 변경 (난수 시드도 다시 적용)"""
+        with self._random_lock:
+            self._faults = faults
+            self._random = random.Random(faults.seed)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "JiraStubServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="jira-stub", daemon=True)
+        self._thread.start()
+        logger.info("Jira stub server listening on %s (fixtures=%s)", self.base_url, self.store.fixtures_dir)
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def __enter__(self) -> "JiraStubServer":
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    def inject_fault(self, handler: JiraStubHandler) -> bool:
+        """설정에 따라 지연을 주고 429/500 응답을 보냄 (응답을 보냈으면 True)"""
+        with self._random_lock:
+            self.stats["requests"] += 1
+            delay = self.faults.latency + (self._random.uniform(0, self.faults.jitter) if self.faults.jitter else 0.0)
+            roll = self._random.random()
+        if delay > 0:
+            time.sleep(delay)
+        if roll < self.faults.rate_429:
+            with self._random_lock:
+                self.stats["throttled"] += 1
+            handler._send_json(429, {"errorMessages": ["Rate limit exceeded"]},
+                               headers={"Retry-After": str(self.faults.retry_after)})
+            return True
+        if roll < self.faults.rate_429 + self.faults.failure_rate:
+            with self._random_lock:
+                self.stats["failed"] += 1
+            handler._send_json(500, {"errorMessages": ["Injected failure"]})
+            return True
+        return False
+
+    def record(self, method: str, path: str, query: str, body: bytes, response: requests.Response) -> None:
+        """기록 모드에서 받은 응답을 fixture로 저장"""
+        upstream = self.record_from
+        if path == "/rest/api/2/field":
+            self.store.save_json("fields.json", response.json())
+        elif JiraStubHandler.ISSUE_PATH.match(path) and method == "GET" and not query:
+            # fields 전체가 있는 응답만 저장 (projection 응답은 서비스 시 잘라서 만듦)
+            self.store.save_json(os.path.join("issues", f"{path.rsplit('/', 1)[-1]}.json"),
+                                 self._placeholder(response.json(), upstream))
+        elif path == "/rest/api/2/search":
+            for issue in response.json().get("issues", []):
+                if not self.store.load_json(os.path.join("issues", f"{issue['key']}.json")):
+                    self.store.save_json(os.path.join("issues", f"{issue['key']}.json"),
+                                         self._placeholder(issue, upstream))
+        elif JiraStubHandler.ATTACHMENT_PATH.match(path) and response.status_code == 200:
+            match = JiraStubHandler.ATTACHMENT_PATH.match(path)
+            target = self.store.attachment_path(match.group(1), match.group(2))
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            with open(target, "wb") as f:
+                f.write(response.content)
+        logger.info("Recorded %s %s", method, path)
+
+    @staticmethod
+    def _placeholder(data: Any, upstream: str) -> Any:
+        """실제 Jira 주소를 {{JIRA_BASE_URL}} 로 치환"""
+        return json.loads(json.dumps(data, ensure_ascii=False).replace(upstream, BASE_URL_PLACEHOLDER))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="로컬 Jira REST 대역 서버")
+    parser.add_argument("--fixtures", required=True, help="fixture 디렉토리")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--record-from", help="기록 모드: 요청을 전달할 실제 Jira 주소")
+    parser.add_argument("--latency", type=float, default=0.0, help="응답 지연 (초)")
+    parser.add_argument("--jitter", type=float, default=0.0, help="지연 편차 최대값 (초)")
+    parser.add_argument("--rate-429", type=float, default=0.0, help="429 응답 확률 (0~1)")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="429 응답의 Retry-After (초)")
+    parser.add_argument("--failure-rate", type=float, default=0.0, help="500 응답 확률 (0~1)")
+    parser.add_argument("--seed", type=int, help="난수 시드")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    faults = FaultConfig(args.latency, args.jitter, args.rate_429, args.retry_after, args.failure_rate, args.seed)
+    server = JiraStubServer(args.fixtures, args.host, args.port, faults=faults, record_from=args.record_from)
+    server.start()
+    print(f"JIRA_BASE_URL={server.base_url}")
+    try:
+        server._thread.join()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()